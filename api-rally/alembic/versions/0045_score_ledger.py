@@ -0,0 +1,128 @@
+"""score_ledger + teams.ledger_total/checkpoint_totals
+
+Adds the append-only score ledger (one signed delta per change to a result's
+final score or an award's points) and the running totals teams keep alongside
+it, so a score write applies a delta instead of re-summing every result.
+
+Existing scores are backfilled as one opening row per counted fact (completed,
+scored results on a checkpoint; active awards; ``count_delta`` 1), and the
+running totals — points and counted facts per checkpoint — are seeded from
+those rows.
+
+Revision ID: 0045
+Revises: 0044
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from alembic.migration_utils import add_missing_columns, drop_present_columns, table_exists
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "0045"
+down_revision: str | None = "0044"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SCHEMA = settings.SCHEMA_NAME
+TABLE = "score_ledger"
+
+
+def _team_columns() -> dict[str, sa.Column]:
+    return {
+        "ledger_total": sa.Column("ledger_total", sa.Float(), nullable=False, server_default="0"),
+        "checkpoint_totals": sa.Column(
+            "checkpoint_totals", sa.JSON(), nullable=False, server_default="{}"
+        ),
+    }
+
+
+def upgrade() -> None:
+    if not table_exists(TABLE, SCHEMA):
+        op.create_table(
+            TABLE,
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column(
+                "team_id",
+                sa.Integer(),
+                sa.ForeignKey(f"{SCHEMA}.teams.id", ondelete="CASCADE"),
+                nullable=False,
+                index=True,
+            ),
+            sa.Column("source", sa.String(32), nullable=False),
+            sa.Column("source_id", sa.Integer(), nullable=False),
+            sa.Column("checkpoint_id", sa.Integer(), nullable=True),
+            sa.Column("delta", sa.Float(), nullable=False),
+            sa.Column("count_delta", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+            ),
+            schema=SCHEMA,
+        )
+        op.create_index("ix_score_ledger_fact", TABLE, ["source", "source_id"], schema=SCHEMA)
+    add_missing_columns("teams", _team_columns(), SCHEMA)
+
+    bind = op.get_bind()
+    if bind.execute(sa.text(f"SELECT EXISTS (SELECT 1 FROM {SCHEMA}.{TABLE})")).scalar():
+        return
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO {SCHEMA}.{TABLE}
+                   (team_id, source, source_id, checkpoint_id, delta, count_delta)
+            SELECT r.team_id, 'activity_result', r.id, a.checkpoint_id, r.final_score, 1
+              FROM {SCHEMA}.activity_results AS r
+              JOIN {SCHEMA}.activities AS a ON a.id = r.activity_id
+             WHERE r.is_completed
+               AND r.final_score IS NOT NULL
+               AND a.checkpoint_id IS NOT NULL
+            UNION ALL
+            SELECT w.team_id, 'award', w.id, NULL, w.points, 1
+              FROM {SCHEMA}.dynamic_awards AS w
+             WHERE w.is_active
+            """
+        )
+    )
+    op.execute(
+        sa.text(
+            f"""
+            WITH per_checkpoint AS (
+                SELECT team_id, checkpoint_id, SUM(delta) AS score, SUM(count_delta) AS facts
+                  FROM {SCHEMA}.{TABLE}
+                 GROUP BY team_id, checkpoint_id
+            ), per_team AS (
+                SELECT team_id,
+                       SUM(score) AS total,
+                       COALESCE(
+                           json_object_agg(
+                               checkpoint_id::text,
+                               json_build_object('points', score, 'facts', facts)
+                           ) FILTER (WHERE checkpoint_id IS NOT NULL),
+                           '{{}}'::json
+                       ) AS checkpoints
+                  FROM per_checkpoint
+                 GROUP BY team_id
+            )
+            UPDATE {SCHEMA}.teams AS t
+               SET ledger_total = p.total,
+                   checkpoint_totals = p.checkpoints
+              FROM per_team AS p
+             WHERE t.id = p.team_id
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    if table_exists("teams", SCHEMA):
+        drop_present_columns("teams", _team_columns(), SCHEMA)
+    if table_exists(TABLE, SCHEMA):
+        op.drop_index("ix_score_ledger_fact", table_name=TABLE, schema=SCHEMA)
+        op.drop_table(TABLE, schema=SCHEMA)
@@ -0,0 +1,50 @@
+"""event_outbox
+
+Adds the transactional outbox: events staged by a write in its own
+transaction, published to Redis by the outbox relay worker.
+
+Revision ID: 0046
+Revises: 0045
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from alembic.migration_utils import table_exists
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "0046"
+down_revision: str | None = "0045"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SCHEMA = settings.SCHEMA_NAME
+TABLE = "event_outbox"
+
+
+def upgrade() -> None:
+    if table_exists(TABLE, SCHEMA):
+        return
+    op.create_table(
+        TABLE,
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("event_type", sa.String(64), nullable=False),
+        sa.Column("channel", sa.String(128), nullable=False),
+        sa.Column("data", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    if table_exists(TABLE, SCHEMA):
+        op.drop_table(TABLE, schema=SCHEMA)
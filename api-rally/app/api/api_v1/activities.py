@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.api.abac_deps import Action, Resource, require
+from app.api.conditional import RankingETagDep
 from app.api.deps import get_db
 from app.core.exceptions import RallyNotFoundError, RallyValidationError
 from app.crud.crud_activity import activity, activity_result
@@ -29,6 +30,7 @@ from app.schemas.activity import (
 )
 from app.services.activity_service import ActivityService
 from app.services.deps import get_activity_service, get_scoring_service
+from app.services.route_graph import route_changed
 from app.services.scoring_service import ScoringService
 
 # Error message constants
@@ -200,6 +202,7 @@ class ActivityController:
             raise RallyNotFoundError(ACTIVITY_NOT_FOUND)
 
         db_activity = await activity.update(db=db, db_obj=db_activity, obj_in=activity_in)
+        await route_changed()
         return ActivityResponse.model_validate(db_activity)
 
     async def delete_activity(
@@ -215,6 +218,7 @@ class ActivityController:
             raise RallyNotFoundError(ACTIVITY_NOT_FOUND)
 
         await activity.remove(db=db, id=activity_id)
+        await route_changed()
         return {"message": "Activity deleted successfully"}
 
     async def create_activity_result(
@@ -328,6 +332,7 @@ class ActivityController:
         db: Annotated[AsyncSession, Depends(get_db)],
         activity_id: int,
         _: Annotated[None, Depends(require(Action.VIEW_ACTIVITY_RESULT, Resource.ACTIVITY_RESULT))],
+        _etag: RankingETagDep,
         service: Annotated[ScoringService, Depends(get_scoring_service)],
     ) -> ActivityRanking:
         """Get ranking for a specific activity"""
@@ -345,6 +350,7 @@ class ActivityController:
         self,
         *,
         _: Annotated[None, Depends(require(Action.VIEW_ACTIVITY_RESULT, Resource.ACTIVITY_RESULT))],
+        _etag: RankingETagDep,
         service: Annotated[ScoringService, Depends(get_scoring_service)],
     ) -> GlobalRanking:
         """Get global team ranking"""
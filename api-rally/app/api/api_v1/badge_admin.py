@@ -12,7 +12,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
 from app.crud.crud_badge_definition import badge_definition as crud_def
-from app.crud.crud_rally_settings import rally_settings
 from app.models.badge import TeamBadge
 from app.schemas.badge import TeamBadgeRead
 from app.schemas.badge_definition import (
@@ -25,6 +24,7 @@ from app.schemas.user import DetailedUser
 from app.services import badge_service
 from app.services.audit_service import AuditActor, record_audit
 from app.services.image_upload import ALLOWED_PHOTO_CONTENT_TYPES, validate_and_store
+from app.services.settings_snapshot import current_settings
 
 BADGE_DEFINITION_NOT_FOUND = "Badge definition not found"
 
@@ -108,7 +108,7 @@ class BadgeAdminController:
         The catalog list (GET) stays reachable so an admin can still inspect
         definitions, but every mutation is refused while the kill-switch is off.
         """
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         if not settings.badges_enabled:
             raise HTTPException(status_code=403, detail="Badges feature is disabled")
 
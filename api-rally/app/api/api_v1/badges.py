@@ -10,7 +10,6 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
-from app.crud.crud_rally_settings import rally_settings
 from app.schemas.badge import (
     BadgeDefinitionLite,
     BadgeShowcaseResponse,
@@ -18,6 +17,7 @@ from app.schemas.badge import (
     TeamBadgeRead,
 )
 from app.services import badge_service
+from app.services.settings_snapshot import current_settings
 
 
 class BadgesController:
@@ -46,7 +46,7 @@ class BadgesController:
 
     async def _badges_enabled(self, db: AsyncSession) -> bool:
         """Whether the badges feature is switched on for the current event."""
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         return bool(settings.badges_enabled)
 
     async def list_all_badges(
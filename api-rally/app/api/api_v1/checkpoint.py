@@ -18,7 +18,6 @@ from app.core.exceptions import (
     RallyUnauthorizedError,
     RallyValidationError,
 )
-from app.crud.crud_rally_settings import rally_settings
 from app.schemas.checkpoint import (
     AdminCheckPoint,
     CheckPointCreate,
@@ -32,6 +31,8 @@ from app.schemas.user import DetailedUser
 from app.services.checkpoint_service import CheckpointService
 from app.services.deps import get_checkpoint_service
 from app.services.image_upload import ALLOWED_PHOTO_CONTENT_TYPES, validate_and_store
+from app.services.route_graph import route_changed
+from app.services.settings_snapshot import current_settings
 from app.services.storage import storage_client
 
 _team_bearer = HTTPBearer(auto_error=False)
@@ -128,7 +129,7 @@ class CheckpointController:
         service: Annotated[CheckpointService, Depends(get_checkpoint_service)],
     ) -> list[DetailedCheckPoint]:
         """Return visible checkpoints based on settings and the requesting user's role."""
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
 
         if curr_user:
             scopes = getattr(curr_user, "scopes", [])
@@ -154,7 +155,7 @@ class CheckpointController:
         """Return the total number of checkpoints."""
         if not curr_user and not curr_team:
             # Optional: Allow public access if settings permit, otherwise 401
-            settings = await rally_settings.get_or_create(db)
+            settings = await current_settings(db)
             if not settings.public_access_enabled:
                 raise RallyUnauthorizedError(AUTH_REQUIRED)
 
@@ -186,7 +187,7 @@ class CheckpointController:
         if not team_id:
             raise RallyUnauthorizedError(f"{AUTH_REQUIRED} (User with Team or Team Token)")
 
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         if is_privileged:
             checkpoint = await crud.checkpoint.get_next(db=db, team_id=team_id)
             if checkpoint is None:
@@ -246,6 +247,7 @@ class CheckpointController:
         # A post created straight into draft state (or a published one added
         # after existing drafts) would leave the published route with a gap.
         await crud.checkpoint.resequence(db)
+        await route_changed()
         await db.refresh(cp)
         return AdminCheckPoint.model_validate(cp)
 
@@ -262,6 +264,7 @@ class CheckpointController:
             # A reorder that interleaved drafts with published posts would
             # leave gaps in the running route; drafts always settle at the end.
             await crud.checkpoint.resequence(db)
+            await route_changed()
             return {"message": "Checkpoints reordered successfully"}
         except Exception as e:
             raise RallyValidationError(f"Cannot reorder checkpoints: {str(e)}") from e
@@ -291,6 +294,7 @@ class CheckpointController:
             fields.pop("is_placeholder", None)
         rest = CheckPointUpdate(**fields)
         updated = await crud.checkpoint.update(db=db, id=id, obj_in=rest, commit=True)
+        await route_changed()
         return AdminCheckPoint.model_validate(updated)
 
     async def get_route_status(
@@ -305,7 +309,7 @@ class CheckpointController:
         and the challenge brief, which are answers as far as a team is
         concerned.
         """
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         return await service.route_status(settings)
 
     async def upload_clue_image(
@@ -14,11 +14,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
 from app.crud import crud_activity
-from app.crud.crud_rally_settings import rally_settings
 from app.schemas.team_auth import TeamTokenData
 from app.services.audit_service import AuditActor, record_audit
 from app.services.checkpoint_arrival_service import CheckpointArrivalService
 from app.services.deps import get_checkpoint_arrival_service
+from app.services.settings_snapshot import current_settings
 
 
 class ArriveRequest(BaseModel):
@@ -70,7 +70,7 @@ class CheckpointArriveController:
         service: Annotated[CheckpointArrivalService, Depends(get_checkpoint_arrival_service)],
     ) -> ArriveResponse:
         event = await crud_activity.rally_event.get_current(db)
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         if not event or not settings.gps_checkin_enabled:
             raise HTTPException(
                 status_code=400, detail="GPS check-in is not enabled for this event"
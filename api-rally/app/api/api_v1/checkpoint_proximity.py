@@ -17,7 +17,8 @@ from app.services.deps import get_proximity_service
 from app.services.proximity_service import ProximityService
 
 # Generous for a team walking around and tapping the button, restrictive for a
-# script trying to trilaterate a post it cannot see.
+# script trying to trilaterate a post it cannot see. A token bucket lets a team
+# tap in quick succession on arrival and then paces a sustained script.
 _PROXIMITY_LIMIT = 30
 _PROXIMITY_WINDOW_SECONDS = 60
 
@@ -36,7 +37,14 @@ class CheckpointProximityController:
             methods=["POST"],
             name="read_checkpoint_proximity",
             dependencies=[
-                Depends(rate_limit("proximity", _PROXIMITY_LIMIT, _PROXIMITY_WINDOW_SECONDS))
+                Depends(
+                    rate_limit(
+                        "proximity",
+                        _PROXIMITY_LIMIT,
+                        _PROXIMITY_WINDOW_SECONDS,
+                        policy="token_bucket",
+                    )
+                )
             ],
             responses={
                 400: {"description": "Not enabled, not the team's checkpoint, or no coordinates"},
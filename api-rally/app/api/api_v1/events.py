@@ -15,6 +15,7 @@ from app import crud
 from app.api.auth import AuthData, api_nei_auth
 from app.api.deps import get_admin, get_db
 from app.core.exceptions import RallyNotFoundError
+from app.events import CurrentEventChangedEvent, CurrentEventChangedPayload, publish_event
 from app.schemas.activity import (
     RallyEventCreate,
     RallyEventResponse,
@@ -23,10 +24,18 @@ from app.schemas.activity import (
 from app.schemas.user import DetailedUser
 from app.services.deps import get_event_service
 from app.services.event_service import EVENT_NOT_FOUND, EventService
+from app.services.settings_snapshot import settings_changed
 
 EVENT_NOT_FOUND_RESPONSES: dict[int | str, dict[str, Any]] = {404: {"description": EVENT_NOT_FOUND}}
 
 
+async def _announce_current_event(event_id: int | None) -> None:
+    """Tell the other processes to drop their cached current event."""
+    await publish_event(
+        CurrentEventChangedEvent(payload=CurrentEventChangedPayload(event_id=event_id))
+    )
+
+
 class RotationScheduleResponse(BaseModel):
     event_id: int
     rounds: list[list[dict[str, Any]]]
@@ -128,6 +137,8 @@ class EventController:
     ) -> RallyEventResponse:
         """Create a new event edition (admin/manager only)."""
         event = await crud.rally_event.create(db, obj_in=event_in)
+        if event.is_current:
+            await _announce_current_event(event.id)
         return RallyEventResponse.model_validate(event)
 
     async def update_event(
@@ -142,6 +153,10 @@ class EventController:
         if event is None:
             raise RallyNotFoundError(EVENT_NOT_FOUND)
         updated = await crud.rally_event.update(db, db_obj=event, obj_in=event_in)
+        if "is_current" in event_in.model_fields_set:
+            await _announce_current_event(updated.id if updated.is_current else None)
+        # The settings snapshot mirrors the event's timing and type.
+        await settings_changed(updated.id)
         return RallyEventResponse.model_validate(updated)
 
     async def set_current_event(
@@ -155,6 +170,7 @@ class EventController:
         event = await crud.rally_event.set_current(db, event_id=event_id)
         if event is None:
             raise RallyNotFoundError(EVENT_NOT_FOUND)
+        await _announce_current_event(event.id)
         return RallyEventResponse.model_validate(event)
 
     async def generate_rotation_schedule(
@@ -18,7 +18,6 @@ from app.api import deps
 from app.api.auth import AuthData, api_nei_auth
 from app.api.deps import get_guide
 from app.core.exceptions import RallyForbiddenError, RallyNotFoundError, RallyValidationError
-from app.crud.crud_rally_settings import rally_settings
 from app.crud.crud_team import CRUDTeam
 from app.crud.deps import get_team_crud
 from app.schemas.team import PrivilegedDetailedTeam
@@ -27,6 +26,7 @@ from app.services.audit_service import AuditActor, record_audit
 from app.services.checkpoint_arrival_service import CheckpointArrivalService
 from app.services.deps import get_checkpoint_arrival_service, get_guide_service, get_team_service
 from app.services.guide_service import GuideService
+from app.services.settings_snapshot import current_settings
 from app.services.team_service import TeamService
 
 
@@ -59,6 +59,10 @@ class GuideTeamAtCheckpoint(BaseModel):
     # Which of this checkpoint's indications the team already paid to unlock,
     # so the guide does not read out a hint they just bought.
     revealed_indication_ids: list[int]
+    # The order of the post the team is working on now, and that post's
+    # activities it has not completed yet.
+    current_checkpoint_number: int = 0
+    pending_activity_ids: list[int] = []
 
 
 class GuideArrivalRequest(BaseModel):
@@ -235,7 +239,7 @@ class GuideController:
             if assigned_team_id != body.team_id:
                 raise RallyForbiddenError("Not this guide's team")
 
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         if not getattr(settings, "guide_manual_arrival_enabled", True):
             raise RallyValidationError("Guide-recorded arrivals are not enabled for this event")
 
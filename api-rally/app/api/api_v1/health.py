@@ -15,7 +15,7 @@ from fastapi import APIRouter, Depends, Response, status
 from app.api.deps import get_admin
 from app.core.config import settings
 from app.core.metrics import collect_summary, set_worker_last_beat_age
-from app.core.redis import check_redis_health
+from app.core.redis import check_redis_health, node_id
 from app.db.session import check_db_health
 from app.schemas.health import MetricsSummary, Readiness, WorkerHealth
 from app.schemas.user import DetailedUser
@@ -51,6 +51,9 @@ class HealthController:
     async def readiness_check(self, response: Response) -> Readiness:
         """Readiness probe: aggregates DB, Redis and worker liveness.
 
+        Each worker also reports whether this node runs it or stands by, and
+        which node holds its leader lease.
+
         Returns 503 when any checked dependency is unhealthy so a silently
         stale leaderboard (dead worker) or a database/Redis outage surfaces to
         ops. Not wired to the container healthcheck — see ``health_check`` in
@@ -69,7 +72,13 @@ class HealthController:
             for worker in get_workers():
                 alive = worker.is_alive
                 workers.append(
-                    WorkerHealth(name=worker.name, alive=alive, last_beat=worker.last_beat)
+                    WorkerHealth(
+                        name=worker.name,
+                        alive=alive,
+                        last_beat=worker.last_beat,
+                        active=worker.active,
+                        leader=worker.leader,
+                    )
                 )
                 ready = ready and alive
                 age = 0.0 if not worker.last_beat else time.monotonic() - worker.last_beat
@@ -82,6 +91,7 @@ class HealthController:
             status="ready" if ready else "not_ready",
             db="up" if db_up else "down",
             redis=redis_state,
+            node=node_id(),
             workers=workers,
         )
 
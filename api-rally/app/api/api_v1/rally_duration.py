@@ -9,6 +9,7 @@ from app.api.deps import get_db, get_participant
 from app.core.exceptions import RallyNotFoundError
 from app.crud.crud_team import team
 from app.schemas.user import DetailedUser
+from app.services.settings_snapshot import current_settings
 from app.utils.rally_duration import get_rally_duration_info, get_team_duration_info
 
 
@@ -49,7 +50,7 @@ class RallyDurationController:
             time remaining/elapsed, and progress percentage.
         """
         validate_settings_view_access(curr_user, auth)
-        return await get_rally_duration_info(db)
+        return get_rally_duration_info(await current_settings(db))
 
     async def get_team_rally_duration(
         self,
@@ -76,7 +77,7 @@ class RallyDurationController:
             raise RallyNotFoundError("Team not found or has no checkpoint times")
 
         team_start_time = team_obj.times[0]  # First checkpoint time
-        return await get_team_duration_info(db, team_start_time)
+        return get_team_duration_info(await current_settings(db), team_start_time)
 
 
 router = RallyDurationController().router
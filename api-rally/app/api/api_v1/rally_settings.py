@@ -18,6 +18,7 @@ from app.services.image_upload import (
     MAX_DOCUMENT_SIZE_BYTES,
 )
 from app.services.rally_settings_service import RallySettingsService
+from app.services.settings_snapshot import current_settings, settings_changed
 
 INVALID_FILE_ERROR = "Invalid file"
 NOT_AUTHORIZED_ERROR = "Not authorized"
@@ -178,6 +179,7 @@ class RallySettingsController:
             target_id=str(updated.id),
             event_id=updated.event_id,  # type: ignore[arg-type]
         )
+        await settings_changed(updated.event_id)  # type: ignore[arg-type]
         return await service.build_response(updated)
 
     async def view_rally_settings(
@@ -185,21 +187,17 @@ class RallySettingsController:
         db: Annotated[AsyncSession, Depends(get_db)],
         curr_user: Annotated[DetailedUser, Depends(get_participant)],
         auth: Annotated[AuthData, Security(api_nei_auth, scopes=[])],
-        service: Annotated[RallySettingsService, Depends(get_rally_settings_service)],
     ) -> RallySettingsResponse:
         """View rally settings"""
         validate_settings_view_access(curr_user, auth)
-        settings = await rally_settings.get_or_create(db)
-        return await service.build_response(settings)
+        return await current_settings(db)
 
     async def view_rally_settings_public(
         self,
         db: Annotated[AsyncSession, Depends(get_db)],
-        service: Annotated[RallySettingsService, Depends(get_rally_settings_service)],
     ) -> RallySettingsResponse:
         """View rally settings (public access - no authentication required)"""
-        settings = await rally_settings.get_or_create(db)
-        return await service.build_response(settings)
+        return await current_settings(db)
 
     async def upload_rally_banner(
         self,
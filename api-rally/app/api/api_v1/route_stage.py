@@ -17,6 +17,7 @@ from app.core.exceptions import RallyValidationError
 from app.models.route_stage import RouteStage
 from app.schemas.route_stage import RouteStageCreate, RouteStageResponse, RouteStageUpdate
 from app.schemas.user import DetailedUser
+from app.services.route_graph import route_changed
 
 
 class RouteStageController:
@@ -96,6 +97,7 @@ class RouteStageController:
         # Stage order decides checkpoint order, so a new stage renumbers the
         # route the moment posts are assigned to it.
         await crud.checkpoint.resequence(db)
+        await route_changed()
         return (await self._to_response(db, [stage]))[0]
 
     async def update_stage(
@@ -116,6 +118,7 @@ class RouteStageController:
                 raise RallyValidationError(f"A stage with order {stage_in.order} already exists")
         stage = await crud.route_stage.update(db, id=id, obj_in=stage_in, commit=True)
         await crud.checkpoint.resequence(db)
+        await route_changed()
         return (await self._to_response(db, [stage]))[0]
 
     async def delete_stage(
@@ -129,6 +132,7 @@ class RouteStageController:
         rule must not delete the places."""
         await crud.route_stage.remove(db, id=id, commit=True)
         await crud.checkpoint.resequence(db)
+        await route_changed()
         return {"message": "Route stage deleted successfully"}
 
 
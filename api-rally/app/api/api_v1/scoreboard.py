@@ -2,69 +2,96 @@
 
 Both endpoints are public (the scoreboard is a public-facing view) and only
 operate when the realtime subsystem is enabled. The worker keeps the cached
-ranking fresh and signals refreshes on a Redis channel; the SSE stream forwards
-those signals so the SPA can refetch without polling.
+ranking fresh and publishes each change as a versioned delta on a Redis
+channel; the SSE stream forwards those deltas so the SPA can update without
+polling, and every SSE client of a process shares one Redis subscription
+(``app.events.hub``). Besides the full board, the cache serves top-N and
+"window around a team" slices straight from its sorted set, and both reads
+answer a matching ``If-None-Match`` with 304 (``app.api.conditional``).
 """
 
+import json
 from collections.abc import AsyncIterator
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
-from redis.asyncio.client import PubSub
 
-from app.core.config import SettingsDep
+from app.api.conditional import RankingETagDep
+from app.core.config import Settings, SettingsDep
+from app.core.exceptions import RallyNotFoundError
 from app.core.redis import get_async_redis_client
 from app.events.channels import Channels
-from app.services import leaderboard_cache
+from app.events.hub import get_hub
+from app.services import leaderboard_cache, leaderboard_recompute
 from app.services.deps import get_scoring_service
 from app.services.scoring_service import ScoringService
 
-# Seconds between SSE heartbeats; keeps proxies from dropping an idle connection.
-_HEARTBEAT_SECONDS = 15.0
+# Set (to "true") on a scoreboard read served from a stale fallback board.
+STALE_HEADER = "X-Leaderboard-Stale"
 
+# Bounds for the sliced scoreboard reads.
+_MAX_LIMIT = 500
+_MAX_RADIUS = 50
 
-def decode_value(value: str | bytes) -> str:
-    return value.decode() if isinstance(value, bytes) else value
 
+async def _pmessage_event_stream(request: Request) -> AsyncIterator[str]:
+    patterns = (Channels.ALL_ACTIVITY_RESULT_EVENTS, Channels.ALL_TEAM_EVENTS)
+    async with get_hub().subscribe(*patterns) as sub:
+        yield ": connected\n\n"
+        async for message in sub:
+            if await request.is_disconnected():
+                break
+            if message is None:
+                yield ": ping\n\n"
+            else:
+                yield f"event: {message.channel}\ndata: {message.data}\n\n"
 
-async def _next_message(pubsub: PubSub) -> dict[str, Any] | None:
-    """Await the next pubsub message, or None once the heartbeat interval passes.
 
-    The ``timeout`` argument is what makes this a blocking wait: without it
-    ``get_message`` polls the socket and returns None immediately, so the
-    surrounding ``while True`` becomes a hot loop that burns a full CPU core and
-    floods the client with heartbeats for as long as one SSE client is attached.
-    """
+def _delta_version(data: str) -> int | None:
+    """The version of a published leaderboard delta (None for a bare signal)."""
     try:
-        message: dict[str, Any] | None = await pubsub.get_message(
-            ignore_subscribe_messages=True,
-            timeout=_HEARTBEAT_SECONDS,
-        )
-    except TimeoutError:
+        delta = json.loads(data)
+    except json.JSONDecodeError:
         return None
-    return message
+    version = delta.get("version") if isinstance(delta, dict) else None
+    return version if isinstance(version, int) else None
 
 
-async def _pmessage_event_stream(request: Request) -> AsyncIterator[str]:
+def _refresh_frame(data: str) -> str:
+    version = _delta_version(data)
+    if version is None:
+        return f"event: refresh\ndata: {data}\n\n"
+    return f"id: {version}\nevent: refresh\ndata: {data}\n\n"
+
+
+async def _resume_frames(last_event_id: str | None) -> tuple[list[str], int | None]:
+    """Frames catching a reconnecting client up, and the version they reach.
+
+    The deltas after ``last_event_id`` when the history still holds them, else
+    a snapshot of the cached board. Nothing for a fresh client (no id) or
+    while the cache is cold.
+    """
+    if last_event_id is None:
+        return [], None
+    try:
+        last = int(last_event_id)
+    except ValueError:
+        return [], None
     client = get_async_redis_client()
-    pubsub = client.pubsub()
-    await pubsub.psubscribe(Channels.ALL_ACTIVITY_RESULT_EVENTS, Channels.ALL_TEAM_EVENTS)
     try:
-        yield ": connected\n\n"
-        while True:
-            if await request.is_disconnected():
-                break
-            message = await _next_message(pubsub)
-            if message and message.get("type") == "pmessage":
-                channel = decode_value(message["channel"])
-                data = decode_value(message["data"])
-                yield f"event: {channel}\ndata: {data}\n\n"
-            else:
-                yield ": ping\n\n"
+        deltas = await leaderboard_cache.read_deltas_since(client, last)
+        if deltas is not None:
+            versions = [v for delta in deltas if (v := _delta_version(delta)) is not None]
+            return [_refresh_frame(delta) for delta in deltas], max([last, *versions])
+        version = await leaderboard_cache.read_version(client)
+        ranking = await leaderboard_cache.read_global_leaderboard(client)
     finally:
-        await pubsub.aclose()  # type: ignore[no-untyped-call]
         await client.aclose()
+    if ranking is None:
+        return [], None
+    snapshot = json.dumps({"version": version, "ranking": ranking})
+    return [f"id: {version}\nevent: snapshot\ndata: {snapshot}\n\n"], version
 
 
 class ScoreboardController:
@@ -81,6 +108,13 @@ class ScoreboardController:
             methods=["GET"],
             name="get_live_scoreboard",
         )
+        self.router.add_api_route(
+            "/scoreboard/live/teams/{team_id}",
+            self.get_live_scoreboard_around_team,
+            methods=["GET"],
+            name="get_live_scoreboard_around_team",
+            responses={404: {"description": "Team is not on the scoreboard"}},
+        )
         self.router.add_api_route(
             "/scoreboard/stream",
             self.stream_scoreboard,
@@ -94,34 +128,101 @@ class ScoreboardController:
             name="stream_rally_events",
         )
 
+    async def _full_ranking(
+        self, settings: Settings, service: ScoringService, response: Response
+    ) -> list[dict[str, Any]]:
+        """Compute the ranking from Postgres, warming the cache when enabled.
+
+        With the cache enabled this is a cold miss, recomputed single-flight
+        (``leaderboard_recompute``); the cache is only seeded while still empty,
+        since a worker update that lands between the query and the write is
+        newer. A stale fallback board is flagged in ``STALE_HEADER`` and loses
+        its ETag so a later poll cannot pin it with a 304.
+        """
+        if not settings.EVENTS_ENABLED:
+            return await service.get_team_ranking()
+        client = get_async_redis_client()
+        try:
+            ranking, stale = await leaderboard_recompute.recompute_global_ranking(
+                client, service, wait_seconds=settings.LEADERBOARD_RECOMPUTE_WAIT_SECONDS
+            )
+        finally:
+            await client.aclose()
+        if stale:
+            response.headers[STALE_HEADER] = "true"
+            if "etag" in response.headers:
+                del response.headers["etag"]
+        return ranking
+
     async def get_live_scoreboard(
         self,
         settings: SettingsDep,
+        _etag: RankingETagDep,
+        response: Response,
         service: Annotated[ScoringService, Depends(get_scoring_service)],
+        limit: Annotated[int | None, Query(ge=1, le=_MAX_LIMIT)] = None,
     ) -> list[dict[str, Any]]:
-        """Return the cached global ranking, recomputing on a cache miss.
+        """Return the cached global ranking (top ``limit`` rows), recomputing on a miss.
 
         When the realtime subsystem is disabled there is no cache to read and no
         worker keeping it warm, but the ranking is still a plain DB computation —
         serve it directly from Postgres instead of failing the public view.
         """
-        if not settings.EVENTS_ENABLED:
-            return await service.get_team_ranking()
-
-        client = get_async_redis_client()
-        try:
-            cached = await leaderboard_cache.read_global_leaderboard(client)
+        if settings.EVENTS_ENABLED:
+            client = get_async_redis_client()
+            try:
+                cached = await leaderboard_cache.read_global_leaderboard(client, limit=limit)
+            finally:
+                await client.aclose()
             if cached is not None:
                 return cached
-            # Cold cache: compute once, warm the cache, then serve.
-            ranking = await service.get_team_ranking()
-            await leaderboard_cache.write_global_leaderboard(client, ranking)
-            return ranking
-        finally:
-            await client.aclose()
+        # Disabled or cold cache: compute once (warming the cache), then serve.
+        return leaderboard_cache.slice_top(
+            await self._full_ranking(settings, service, response), limit
+        )
+
+    async def get_live_scoreboard_around_team(
+        self,
+        team_id: int,
+        settings: SettingsDep,
+        _etag: RankingETagDep,
+        response: Response,
+        service: Annotated[ScoringService, Depends(get_scoring_service)],
+        radius: Annotated[int, Query(ge=0, le=_MAX_RADIUS)] = 2,
+    ) -> list[dict[str, Any]]:
+        """Return the ranking rows within ``radius`` places of a team.
+
+        Lets a team's phone show "who is just ahead and just behind" without
+        downloading the whole board.
+        """
+        window: list[dict[str, Any]] | None = None
+        if settings.EVENTS_ENABLED:
+            client = get_async_redis_client()
+            try:
+                window = await leaderboard_cache.read_team_window(client, team_id, radius=radius)
+            finally:
+                await client.aclose()
+        if window is None:
+            ranking = await self._full_ranking(settings, service, response)
+            window = leaderboard_cache.slice_team_window(ranking, team_id, radius=radius)
+        if not window:
+            raise RallyNotFoundError(f"Team {team_id} is not on the scoreboard")
+        return window
 
-    def stream_scoreboard(self, request: Request, settings: SettingsDep) -> StreamingResponse:
-        """Server-Sent Events stream that emits a 'refresh' on each leaderboard update."""
+    def stream_scoreboard(
+        self,
+        request: Request,
+        settings: SettingsDep,
+        last_event_id: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+    ) -> StreamingResponse:
+        """Server-Sent Events stream of leaderboard deltas.
+
+        Each update is a 'refresh' event whose data is the delta JSON
+        (``version``, ``changed`` rows with their new total and rank,
+        ``removed`` team ids) and whose SSE id is the version. A client
+        reconnecting with ``Last-Event-ID`` first gets the deltas it missed, or
+        one 'snapshot' event with the whole board when it is too far behind.
+        """
         if not settings.EVENTS_ENABLED:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -129,23 +230,23 @@ class ScoreboardController:
             )
 
         async def event_stream() -> AsyncIterator[str]:
-            client = get_async_redis_client()
-            pubsub = client.pubsub()
-            await pubsub.subscribe(Channels.LEADERBOARD_REFRESHED)
-            try:
+            # Subscribe before reading the history so no delta falls in between;
+            # live deltas the replay already covered are skipped by version.
+            async with get_hub().subscribe(Channels.LEADERBOARD_REFRESHED) as sub:
                 yield ": connected\n\n"
-                while True:
+                frames, sent = await _resume_frames(last_event_id)
+                for frame in frames:
+                    yield frame
+                async for message in sub:
                     if await request.is_disconnected():
                         break
-                    message = await _next_message(pubsub)
-                    if message and message.get("type") == "message":
-                        yield "event: refresh\ndata: 1\n\n"
-                    else:
+                    if message is None:
                         yield ": ping\n\n"
-            finally:
-                # redis does not type the async pubsub aclose under strict mypy.
-                await pubsub.aclose()  # type: ignore[no-untyped-call]
-                await client.aclose()
+                        continue
+                    version = _delta_version(message.data)
+                    if version is not None and sent is not None and version <= sent:
+                        continue
+                    yield _refresh_frame(message.data)
 
         return StreamingResponse(
             event_stream(),
@@ -57,6 +57,7 @@ from app.schemas.checkpoint import DetailedCheckPoint
 from app.schemas.evaluation_history import EvaluationHistoryEntry
 from app.schemas.user import DetailedUser
 from app.services.deps import get_scoring_service
+from app.services.route_progress import teams_progress
 from app.services.scoring_service import EvaluationEditor, ScoringService
 
 _EVALUATE_ENDPOINT = "evaluate_team_activity"
@@ -206,9 +207,15 @@ class StaffEvaluationController:
             )
         )
         teams = (await db.scalars(teams_stmt)).all()
+        progress = await teams_progress(db, teams)
 
         return [
-            await build_team_for_staff(db, team_obj, staff_checkpoint_order=staff_checkpoint_order)
+            await build_team_for_staff(
+                db,
+                team_obj,
+                staff_checkpoint_order=staff_checkpoint_order,
+                progress=progress[team_obj.id],
+            )
             for team_obj in teams
         ]
 
@@ -24,7 +24,6 @@ from app.crud.crud_activity import activity, activity_result
 from app.crud.crud_checkpoint import checkpoint as checkpoint_crud
 from app.crud.crud_team import team
 from app.models.activity import Activity, ActivityResult
-from app.models.checkpoint_skip import CheckpointSkip
 from app.models.team import Team
 from app.schemas.activity import (
     ActivityResultCreate,
@@ -33,6 +32,8 @@ from app.schemas.activity import (
 )
 from app.schemas.team import TeamScoresUpdate
 from app.schemas.user import DetailedUser
+from app.services.route_graph import route_graph
+from app.services.route_progress import CheckpointProgress, checkpoint_progress, load_team_state
 from app.services.scoring_service import ScoringService
 
 # Error message constants
@@ -430,56 +431,24 @@ async def compute_checkpoint_progress(
     """
     Calculate last and current checkpoint numbers plus completed orders for a team.
 
-    Mirrors ``TeamService.compute_checkpoint_progress`` exactly (same rule for
-    skips and no-activity/GPS-auto-complete checkpoints), so a staff view of a
-    team's progress never diverges from what the team itself sees. A checkpoint
+    Runs the same ``route_progress.checkpoint_progress`` walk as
+    ``TeamService.compute_checkpoint_progress`` (same rule for skips and
+    no-activity/GPS-auto-complete checkpoints), so a staff view of a team's
+    progress never diverges from what the team itself sees. A checkpoint
     without an activity used to be silently skipped here regardless of whether
     the team had actually checked in — which meant a peddy-paper post could
     never register as done for staff, and never blocked one either.
     """
-    checkpoints = await checkpoint_crud.get_all_ordered(db)
-    team_results = await activity_result.get_by_team(db, team_id=team_obj.id)
-    completed_activity_ids = {
-        r.activity_id for r in team_results if getattr(r, "is_completed", False)
-    }
-    skipped_ids = set(
-        (
-            await db.scalars(
-                select(CheckpointSkip.checkpoint_id).where(CheckpointSkip.team_id == team_obj.id)
-            )
-        ).all()
+    progress = checkpoint_progress(
+        await route_graph(db),
+        await load_team_state(db, team_obj.id),
+        checked_in_count=len(team_obj.times),
+    )
+    return (
+        progress.last_completed_order,
+        progress.current_order,
+        list(progress.completed_orders),
     )
-    checked_in_count = len(team_obj.times)
-
-    last_completed_order = 0
-    completed_orders: list[int] = []
-    for cp in checkpoints:
-        if cp.id in skipped_ids:
-            last_completed_order = cp.order
-            completed_orders.append(cp.order)
-            continue
-
-        cp_activities = await activity.get_by_checkpoint(db, checkpoint_id=cp.id)
-        active_ids = [a.id for a in cp_activities if a.is_active]
-        if not active_ids:
-            # No activity to judge here: the post counts as done once the
-            # team has checked in (via GPS arrival auto-complete). Otherwise
-            # it is still their current, not-yet-reached post — stop here.
-            if checked_in_count >= cp.order:
-                last_completed_order = cp.order
-                completed_orders.append(cp.order)
-                continue
-            break
-
-        if all(aid in completed_activity_ids for aid in active_ids):
-            last_completed_order = cp.order
-            completed_orders.append(cp.order)
-        else:
-            # Stop at first incomplete checkpoint (teams must complete in order)
-            break
-
-    current_order = determine_current_order(checkpoints, last_completed_order)
-    return last_completed_order, current_order, completed_orders
 
 
 async def checkpoint_has_activities(db: AsyncSession, checkpoint_id: int) -> bool:
@@ -505,18 +474,28 @@ def determine_current_order(checkpoints: Sequence[Any], last_completed_order: in
 
 
 async def build_team_for_staff(
-    db: AsyncSession, team_obj: Team, staff_checkpoint_order: int | None = None
+    db: AsyncSession,
+    team_obj: Team,
+    staff_checkpoint_order: int | None = None,
+    *,
+    progress: CheckpointProgress | None = None,
 ) -> dict[str, Any]:
     """Build team data for staff evaluation.
 
-    The caller must eager-load team_obj.members (accessed below).
+    The caller must eager-load team_obj.members (accessed below). A listing
+    passes each team's ``progress`` from one ``teams_progress`` batch.
     """
 
-    (
-        last_checkpoint_number,
-        current_checkpoint_number,
-        completed_orders,
-    ) = await compute_checkpoint_progress(db, team_obj)
+    if progress is None:
+        (
+            last_checkpoint_number,
+            current_checkpoint_number,
+            completed_orders,
+        ) = await compute_checkpoint_progress(db, team_obj)
+    else:
+        last_checkpoint_number = progress.last_completed_order
+        current_checkpoint_number = progress.current_order
+        completed_orders = list(progress.completed_orders)
 
     return {
         "id": team_obj.id,
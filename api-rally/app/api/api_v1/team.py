@@ -21,9 +21,15 @@ from app.core.exceptions import (
     RallyValidationError,
 )
 from app.crud.crud_checkpoint import CRUDCheckPoint
-from app.crud.crud_rally_settings import rally_settings
 from app.crud.crud_team import CRUDTeam
 from app.crud.deps import get_checkpoint_crud, get_team_crud
+from app.events import (
+    TeamChangedPayload,
+    TeamCreatedEvent,
+    TeamDeletedEvent,
+    TeamUpdatedEvent,
+    publish_event,
+)
 from app.models.activity import ActivityResult
 from app.models.team import Team
 from app.schemas.team import (
@@ -38,6 +44,8 @@ from app.schemas.team_auth import TeamTokenData
 from app.schemas.user import DetailedUser
 from app.services.deps import get_team_service
 from app.services.image_upload import ALLOWED_PHOTO_CONTENT_TYPES, validate_and_store
+from app.services.proximity_targets import team_progress_changed
+from app.services.settings_snapshot import current_settings
 from app.services.storage import storage_client
 from app.services.team_service import TeamService
 
@@ -107,19 +115,14 @@ class TeamController:
         team_crud: Annotated[CRUDTeam, Depends(get_team_crud)],
         curr_user: Annotated[DetailedUser | None, Depends(deps.get_current_user_optional)] = None,
     ) -> list[ListingTeam]:
-        teams = await team_crud.get_multi(db)
-        for team in teams:
-            await db.refresh(team, ["members"])
-        settings = await rally_settings.get_or_create(db)
+        teams = await team_crud.get_multi(db, with_members=True)
+        settings = await current_settings(db)
         is_privileged = bool(curr_user) and deps.is_admin_or_staff(getattr(curr_user, "scopes", []))
-        return [
-            await service.build_listing_team(
-                team,
-                reveal_next_checkpoint=bool(settings.reveal_next_checkpoint),
-                is_privileged=is_privileged,
-            )
-            for team in teams
-        ]
+        return await service.build_listing_teams(
+            teams,
+            reveal_next_checkpoint=bool(settings.reveal_next_checkpoint),
+            is_privileged=is_privileged,
+        )
 
     async def get_own_team(
         self,
@@ -218,6 +221,7 @@ class TeamController:
         require_team_management_permission(auth=auth, curr_user=curr_user)
 
         team_db = await team_crud.create(db=db, obj_in=team_in, commit=True)
+        await publish_event(TeamCreatedEvent(payload=TeamChangedPayload(team_id=team_db.id)))
         # The creator needs the generated access code to hand it to the team.
         return await service.build_detailed_team(team_db, with_access_code=True)
 
@@ -232,6 +236,9 @@ class TeamController:
         team_crud: Annotated[CRUDTeam, Depends(get_team_crud)],
     ) -> DetailedTeam:
         team_db = await team_crud.update(db=db, id=id, obj_in=team_in, commit=True)
+        await publish_event(TeamUpdatedEvent(payload=TeamChangedPayload(team_id=team_db.id)))
+        # An admin edit can rewrite ``times``, i.e. where the team is on the route.
+        await team_progress_changed(team_db.id)
         return await service.build_detailed_team(team_db)
 
     async def upload_team_photo(
@@ -286,6 +293,8 @@ class TeamController:
                 )
 
             await team_crud.remove(db=db, id=id, commit=True)
+            # Post-commit, so the leaderboard drops the team only once it is gone.
+            await publish_event(TeamDeletedEvent(payload=TeamChangedPayload(team_id=id)))
             return {"message": "Team deleted successfully"}
         except (HTTPException, RallyError):
             raise
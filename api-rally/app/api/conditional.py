@@ -0,0 +1,65 @@
+"""Conditional GET (ETag / If-None-Match) for the ranking reads.
+
+Every ranking the API serves — the live scoreboard, the global ranking and the
+per-activity rankings — only changes through scoring writes, a switch of the
+current event or a route edit, and the leaderboard worker bumps a rankings
+version in Redis after applying each one
+(``leaderboard_cache.bump_rankings_version``). That version, together with the
+current event id, is the strong ETag: a poll whose ``If-None-Match`` still
+carries it is answered ``304`` by the dependency, before the endpoint queries
+Postgres or serializes anything. The event id keeps a switch from matching a
+tag issued for the previous event even before the worker has caught up.
+
+No ETag is sent when the realtime subsystem is off, before a worker has
+recorded a first version, or when Redis cannot be read (fails open: the
+response is simply served in full, uncached).
+"""
+
+import logging
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from redis.exceptions import RedisError
+
+from app.api.deps import SessionDep
+from app.core.config import SettingsDep
+from app.core.redis import get_async_redis_client
+from app.crud import current_event_id
+from app.services import leaderboard_cache
+
+logger = logging.getLogger(__name__)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` uses the weak comparison, so ``W/`` prefixes are ignored."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def ranking_etag(
+    request: Request, response: Response, settings: SettingsDep, db: SessionDep
+) -> None:
+    """Tag a ranking response with the current event and rankings version, or
+    end it with 304."""
+    if not settings.EVENTS_ENABLED:
+        return
+    client = get_async_redis_client()
+    try:
+        version = await leaderboard_cache.read_rankings_version(client)
+    except RedisError as exc:
+        logger.warning("Rankings version unavailable, serving without an ETag: %s", exc)
+        return
+    finally:
+        await client.aclose()
+    if version is None:
+        # No worker has applied a change yet, so nothing would ever bump it.
+        return
+    etag = f'"rankings-{await current_event_id(db)}-{version}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+
+RankingETagDep = Annotated[None, Depends(ranking_etag)]
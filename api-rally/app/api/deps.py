@@ -9,10 +9,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.api.auth import AuthData, ScopeEnum, api_nei_auth, api_nei_auth_optional
+from app.api.principal_cache import (
+    Principal,
+    cached_principal,
+    forget_principal,
+    principal_generation,
+    remember_principal,
+)
 from app.core.config import SettingsDep
 from app.crud.crud_rally_guide_assignment import rally_guide_assignment
 from app.crud.crud_rally_staff_assignment import rally_staff_assignment
 from app.db.session import SessionLocal
+from app.models.user import User
 from app.schemas.team_auth import TeamTokenData
 from app.schemas.user import DetailedUser
 
@@ -43,7 +51,8 @@ async def _adopt_email_placeholder(db: AsyncSession, auth: AuthData) -> Any | No
 
 
 async def _sync_scopes(db: AsyncSession, user: Any, auth: AuthData) -> None:
-    if user.scopes == auth.scopes:
+    """Mirror the token's scopes onto the user row, writing only if they differ."""
+    if set(user.scopes or ()) == set(auth.scopes):
         return
     user.scopes = auth.scopes
     db.add(user)
@@ -51,23 +60,61 @@ async def _sync_scopes(db: AsyncSession, user: Any, auth: AuthData) -> None:
     await db.refresh(user)
 
 
-async def _load_checkpoint_assignments(
-    db: AsyncSession, user_id: int, scopes: list[str], detailed_user: DetailedUser
-) -> None:
+async def _resolve_principal(db: AsyncSession, user: Any, scopes: list[str]) -> Principal:
+    """Read the staff checkpoint and guide team the caller's scopes make relevant."""
+    staff_checkpoint_id = user.staff_checkpoint_id
+    guide_team_id = None
     if "rally-staff" in scopes:
-        staff_assignment = await rally_staff_assignment.get_by_user_id(db, user_id)
+        staff_assignment = await rally_staff_assignment.get_by_user_id(db, user.id)
         if staff_assignment:
-            detailed_user.staff_checkpoint_id = staff_assignment.checkpoint_id
+            staff_checkpoint_id = staff_assignment.checkpoint_id
     if "rally-guide" in scopes:
-        guide_assignment = await rally_guide_assignment.get_by_user_id(db, user_id)
+        guide_assignment = await rally_guide_assignment.get_by_user_id(db, user.id)
         if guide_assignment:
-            detailed_user.guide_team_id = guide_assignment.team_id
+            guide_team_id = guide_assignment.team_id
+    return Principal(
+        user_id=user.id, staff_checkpoint_id=staff_checkpoint_id, guide_team_id=guide_team_id
+    )
+
+
+async def _cached_user(db: AsyncSession, auth: AuthData) -> tuple[Any, Principal] | None:
+    """The caller's user row and cached principal, if one is cached and still valid."""
+    principal = cached_principal(auth.oidc_sub, auth.scopes)
+    if principal is None:
+        return None
+    user = await db.get(User, principal.user_id)
+    if user is None or user.authentik_sub != auth.oidc_sub:
+        forget_principal(auth.oidc_sub, auth.scopes)
+        return None
+    return user, principal
+
+
+async def _remembered_principal(
+    db: AsyncSession, auth: AuthData, user: Any, generation: int
+) -> Principal:
+    principal = await _resolve_principal(db, user, auth.scopes)
+    remember_principal(auth.oidc_sub, auth.scopes, principal, generation)
+    return principal
+
+
+def _detailed_user(user: Any, principal: Principal) -> DetailedUser:
+    detailed_user = DetailedUser.model_validate(user)
+    detailed_user.staff_checkpoint_id = principal.staff_checkpoint_id
+    detailed_user.guide_team_id = principal.guide_team_id
+    return detailed_user
 
 
 async def get_current_user(
     auth: Annotated[AuthData, Security(api_nei_auth, scopes=[])],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> DetailedUser:
+    cached = await _cached_user(db, auth)
+    if cached is not None:
+        user, principal = cached
+        await _sync_scopes(db, user, auth)
+        return _detailed_user(user, principal)
+
+    generation = principal_generation()
     user = await crud.user.get_by_authentik_sub(db, authentik_sub=auth.oidc_sub)
     if user is None:
         user = await _adopt_email_placeholder(db, auth)
@@ -92,9 +139,7 @@ async def get_current_user(
     else:
         await _sync_scopes(db, user, auth)
 
-    detailed_user = DetailedUser.model_validate(user)
-    await _load_checkpoint_assignments(db, user.id, auth.scopes, detailed_user)
-    return detailed_user
+    return _detailed_user(user, await _remembered_principal(db, auth, user, generation))
 
 
 async def get_current_user_optional(
@@ -104,6 +149,13 @@ async def get_current_user_optional(
     if not auth:
         return None
 
+    cached = await _cached_user(db, auth)
+    if cached is not None:
+        user, principal = cached
+        await _sync_scopes(db, user, auth)
+        return _detailed_user(user, principal)
+
+    generation = principal_generation()
     user = await crud.user.get_by_authentik_sub(db, authentik_sub=auth.oidc_sub)
     if user is None:
         user = await _adopt_email_placeholder(db, auth)
@@ -111,10 +163,7 @@ async def get_current_user_optional(
         return None
 
     await _sync_scopes(db, user, auth)
-
-    detailed_user = DetailedUser.model_validate(user)
-    await _load_checkpoint_assignments(db, user.id, auth.scopes, detailed_user)
-    return detailed_user
+    return _detailed_user(user, await _remembered_principal(db, auth, user, generation))
 
 
 def get_participant(
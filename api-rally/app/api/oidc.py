@@ -5,10 +5,21 @@ Rally is a OIDC resource server. It validates access tokens issued by the
 identity provider (Authentik) using authlib, with automatic OIDC discovery and
 JWKS fetching. It never mints its own tokens.
 
+Verifying an RS256 signature is measurable CPU, and staff dashboards poll every
+few seconds with the same token, so verified claims are kept in a bounded LRU
+keyed by a hash of the token, never past the token's own ``exp``. Discovery and
+JWKS requests share one keep-alive HTTP client per event loop, and concurrent
+JWKS refreshes after a key rotation coalesce into a single fetch.
+
 Ported from the nei-gamification-system api-game auth module.
 """
 
+import asyncio
+import hashlib
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -34,6 +45,59 @@ class OIDCJWTValidator:
         self._issuer: str | None = None
         self._jwks: dict[str, Any] | None = None
         self._jwks_fetched_at: float = 0.0
+        # Counts JWKS fetches, so a refresh can tell whether the keyset a
+        # caller tried has been replaced since.
+        self._jwks_fetches = 0
+        # sha256(token) -> (claims, monotonic expiry), least recently used first.
+        self._verified: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._verified_lock = threading.Lock()
+        # Both are bound to the loop they were created on.
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._refresh_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _client(self) -> httpx.AsyncClient:
+        """This loop's keep-alive client for discovery and JWKS requests."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = httpx.AsyncClient(timeout=10.0)
+        return client
+
+    async def aclose(self) -> None:
+        """Close the current loop's HTTP client, if it opened one."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _cached_claims(self, key: str) -> dict[str, Any] | None:
+        with self._verified_lock:
+            entry = self._verified.get(key)
+            if entry is None:
+                return None
+            claims, until = entry
+            if time.monotonic() >= until:
+                del self._verified[key]
+                return None
+            self._verified.move_to_end(key)
+            return dict(claims)
+
+    def _remember_claims(self, key: str, claims: dict[str, Any], settings: Settings) -> None:
+        now = time.monotonic()
+        until = now + settings.OIDC_TOKEN_CACHE_SECONDS
+        exp = claims.get("exp")
+        if isinstance(exp, int | float):
+            until = min(until, now + (exp - time.time()))
+        if until <= now or settings.OIDC_TOKEN_CACHE_SIZE <= 0:
+            return
+        with self._verified_lock:
+            self._verified[key] = (claims, until)
+            self._verified.move_to_end(key)
+            while len(self._verified) > settings.OIDC_TOKEN_CACHE_SIZE:
+                self._verified.popitem(last=False)
 
     async def _get_oidc_config(self, settings: Settings) -> dict[str, Any]:
         """Fetch (and cache) the OIDC discovery document.
@@ -49,10 +113,9 @@ class OIDCJWTValidator:
             f"{settings.OIDC_APPLICATION_SLUG}/.well-known/openid-configuration"
         )
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(discovery_url, timeout=10.0)
-                response.raise_for_status()
-                oidc_config = response.json()
+            response = await self._client().get(discovery_url, timeout=10.0)
+            response.raise_for_status()
+            oidc_config = response.json()
 
             self._jwks_uri = oidc_config["jwks_uri"]
             self._issuer = oidc_config["issuer"].replace("host.docker.internal", "localhost")
@@ -64,23 +127,38 @@ class OIDCJWTValidator:
             ) from e
 
     async def _get_jwks(
-        self, jwks_uri: str, settings: Settings, force_refresh: bool = False
+        self,
+        jwks_uri: str,
+        settings: Settings,
+        force_refresh: bool = False,
+        tried: int | None = None,
     ) -> dict[str, Any]:
         """Return the provider JWKS, cached for OIDC_JWKS_CACHE_TTL_SECONDS.
 
         Refetched when the cache is empty, expired, or a caller forces refresh
         (e.g. after an unknown-key verification failure — key rotation).
+        Concurrent refreshes coalesce into one fetch: a caller whose keyset
+        (``tried``, a ``_jwks_fetches`` count; default the current one) was
+        replaced while it waited uses the new one instead of fetching again.
         """
         ttl = settings.OIDC_JWKS_CACHE_TTL_SECONDS
+        seen = self._jwks_fetches if tried is None else tried
         fresh = (time.monotonic() - self._jwks_fetched_at) < ttl
         if self._jwks is not None and fresh and not force_refresh:
             return self._jwks
 
-        async with httpx.AsyncClient() as client:
-            jwks_response = await client.get(jwks_uri, timeout=10.0)
+        loop = asyncio.get_running_loop()
+        lock = self._refresh_locks.get(loop)
+        if lock is None:
+            lock = self._refresh_locks[loop] = asyncio.Lock()
+        async with lock:
+            if self._jwks is not None and self._jwks_fetches != seen:
+                return self._jwks
+            jwks_response = await self._client().get(jwks_uri, timeout=10.0)
             jwks_response.raise_for_status()
             self._jwks = jwks_response.json()
             self._jwks_fetched_at = time.monotonic()
+            self._jwks_fetches += 1
         assert self._jwks is not None
         return self._jwks
 
@@ -90,17 +168,25 @@ class OIDCJWTValidator:
         Verifies the signature against the (cached) provider JWKS using a
         pinned algorithm allowlist, then the issuer and audience (must contain
         OIDC_CLIENT_ID). On a key-not-found error the JWKS is refreshed once to
-        tolerate provider key rotation.
+        tolerate provider key rotation. A token that already passed is served
+        from the verified-claims cache.
         """
+        key = hashlib.sha256(token.encode()).hexdigest()
+        cached = self._cached_claims(key)
+        if cached is not None:
+            return cached
         try:
             oidc_config = await self._get_oidc_config(settings)
             jwks = await self._get_jwks(oidc_config["jwks_uri"], settings)
+            tried = self._jwks_fetches
 
             try:
                 claims = _jwt.decode(token, jwks)
             except JoseError:
                 # Possible key rotation: refresh JWKS once and retry.
-                jwks = await self._get_jwks(oidc_config["jwks_uri"], settings, force_refresh=True)
+                jwks = await self._get_jwks(
+                    oidc_config["jwks_uri"], settings, force_refresh=True, tried=tried
+                )
                 claims = _jwt.decode(token, jwks)
             claims.validate()
 
@@ -123,7 +209,9 @@ class OIDCJWTValidator:
                     detail="Invalid token audience",
                 )
 
-            return dict(claims)
+            verified = dict(claims)
+            self._remember_claims(key, verified, settings)
+            return dict(verified)
 
         except HTTPException:
             raise
@@ -141,5 +229,5 @@ class OIDCJWTValidator:
             ) from e
 
 
-# Global instance (JWKS/issuer cached after first call).
+# Global instance (JWKS/issuer and verified tokens cached after first call).
 jwt_validator = OIDCJWTValidator()
@@ -0,0 +1,92 @@
+"""Per-process cache of resolved principals for ``get_current_user``.
+
+Resolving an OIDC caller used to cost a user lookup by subject, the scope
+sync and one query per role assignment (staff checkpoint, guide team) on
+every authenticated request. What rarely changes is cached here, keyed by the
+token subject and a fingerprint of its scopes: the local user id and the
+assignments those scopes make relevant. A hit leaves one primary-key read of
+the user row, so its name, team and disabled flag stay as fresh as before.
+
+Entries expire after ``settings.PRINCIPAL_CACHE_SECONDS``. Changing an
+assignment drops every process's entries through ``principals_changed``
+(see app.events.invalidation); a token whose scopes change simply misses.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.events.publisher import publish_event
+from app.events.schemas import PrincipalsChangedEvent, PrincipalsChangedPayload
+
+# Past this many entries, expired ones are swept before adding another.
+_SWEEP_AT = 1024
+
+
+@dataclass(frozen=True)
+class Principal:
+    user_id: int
+    staff_checkpoint_id: int | None = None
+    guide_team_id: int | None = None
+
+
+_lock = threading.Lock()
+# (subject, scope fingerprint) -> (principal, monotonic expiry)
+_principals: dict[tuple[str, str], tuple[Principal, float]] = {}
+# Bumped by every invalidation, so a lookup that started before an assignment
+# changed cannot cache what it read before the change.
+_generation = 0
+
+
+def _key(subject: str, scopes: list[str]) -> tuple[str, str]:
+    return subject, ",".join(sorted(set(scopes)))
+
+
+def principal_generation() -> int:
+    return _generation
+
+
+def cached_principal(subject: str, scopes: list[str]) -> Principal | None:
+    """The cached principal for this subject and scope set, if still fresh."""
+    entry = _principals.get(_key(subject, scopes))
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    return entry[0]
+
+
+def remember_principal(
+    subject: str, scopes: list[str], principal: Principal, generation: int
+) -> None:
+    """Cache ``principal``, unless the cache was invalidated since ``generation``."""
+    with _lock:
+        if generation != _generation:
+            return
+        now = time.monotonic()
+        if len(_principals) >= _SWEEP_AT:
+            for key in [key for key, (_, until) in _principals.items() if until <= now]:
+                del _principals[key]
+        _principals[_key(subject, scopes)] = (principal, now + settings.PRINCIPAL_CACHE_SECONDS)
+
+
+def forget_principal(subject: str, scopes: list[str]) -> None:
+    with _lock:
+        _principals.pop(_key(subject, scopes), None)
+
+
+def forget_principals() -> None:
+    """Drop every cached principal."""
+    global _generation
+    with _lock:
+        _principals.clear()
+        _generation += 1
+
+
+async def principals_changed(user_id: int | None = None) -> None:
+    """Drop cached principals everywhere after an assignment changed.
+
+    Call after the commit; ``user_id`` names the user whose assignment
+    changed, if the change concerns a single one.
+    """
+    forget_principals()
+    await publish_event(PrincipalsChangedEvent(payload=PrincipalsChangedPayload(user_id=user_id)))
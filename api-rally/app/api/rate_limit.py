@@ -1,9 +1,18 @@
-"""Reusable fixed-window rate limiting backed by Redis.
+"""Reusable rate limiting backed by Redis Lua scripts.
 
 Best-effort brute-force / abuse guard. Fails **open** when Redis is
 unavailable (logged at WARNING): the limiter only slows abuse, it is never
 the sole authority protecting an endpoint.
 
+Each check is one ``EVALSHA`` of a script that decides and records the hit
+atomically, on the Redis clock, and returns the Retry-After for a denial.
+Two policies are available:
+
+* ``sliding_window`` — at most ``limit`` hits in any ``window_seconds``
+  (a sorted-set log), so there is no boundary where twice the limit passes.
+* ``token_bucket`` — a bucket of ``limit`` tokens refilled evenly over
+  ``window_seconds``, so bursts up to ``limit`` pass and are then paced.
+
 Client identity is resolved with trusted-proxy awareness: ``X-Forwarded-For``
 is honoured only when the direct peer is a configured trusted proxy
 (``settings.TRUSTED_PROXIES``); otherwise the direct peer address is used.
@@ -13,10 +22,14 @@ every client onto the proxy address.
 
 import hashlib
 import logging
+import math
+import secrets
 from collections.abc import Callable, Coroutine
-from typing import Any
+from typing import Any, Literal
 
+import redis.asyncio as aredis
 from fastapi import HTTPException, Request, status
+from redis.exceptions import NoScriptError
 
 from app.core.config import Settings, SettingsDep
 from app.core.metrics import record_rate_limit_rejection
@@ -24,6 +37,70 @@ from app.core.redis import get_async_redis_client
 
 logger = logging.getLogger(__name__)
 
+RateLimitPolicy = Literal["sliding_window", "token_bucket"]
+
+# Both scripts take KEYS[1] and ARGV = limit, window in ms (+ a unique log
+# member for the sliding window) and return {allowed, retry_after_ms}.
+_SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, tonumber(oldest[2]) + window - now}
+"""
+
+_TOKEN_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local last = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - last) * capacity / window)
+local allowed, retry = 0, 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry = math.ceil((1 - tokens) * window / capacity)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], window)
+return {allowed, retry}
+"""
+
+
+class _Script:
+    """A Lua script run by SHA, loaded into the server's cache on first miss."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.sha = hashlib.sha1(source.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    async def __call__(self, client: aredis.Redis, key: str, *args: Any) -> Any:
+        try:
+            return await client.evalsha(self.sha, 1, key, *args)
+        except NoScriptError:
+            await client.script_load(self.source)
+            return await client.evalsha(self.sha, 1, key, *args)
+
+
+_SCRIPTS: dict[RateLimitPolicy, _Script] = {
+    "sliding_window": _Script(_SLIDING_WINDOW_LUA),
+    "token_bucket": _Script(_TOKEN_BUCKET_LUA),
+}
+# The scripts keep a sorted set / hash, so their keys are suffixed to never
+# collide with the plain counters older releases left under the same names.
+_KEY_SUFFIXES: dict[RateLimitPolicy, str] = {"sliding_window": "sw", "token_bucket": "tb"}
+
 
 def resolve_client_ip(request: Request, settings: Settings) -> str:
     """Resolve the caller's IP, trusting X-Forwarded-For only from a proxy."""
@@ -36,44 +113,46 @@ def resolve_client_ip(request: Request, settings: Settings) -> str:
     return peer
 
 
-async def _enforce(key: str, limit: int, window_seconds: int) -> None:
-    """Increment a fixed-window counter and raise 429 when the limit is passed.
+async def _enforce(
+    key: str, limit: int, window_seconds: int, policy: RateLimitPolicy = "sliding_window"
+) -> None:
+    """Record a hit under ``key`` and raise 429 when ``policy`` denies it.
 
     Fails open on any Redis error — the guard is best-effort.
     """
+    args: list[Any] = [limit, window_seconds * 1000]
+    if policy == "sliding_window":
+        args.append(secrets.token_hex(8))
     client = get_async_redis_client()
     try:
-        attempts = await client.incr(key)
-        if attempts == 1:
-            await client.expire(key, window_seconds)
-        if attempts > limit:
-            ttl = await client.ttl(key)
-            if ttl < 0:
-                # Key orphaned without TTL (crash between INCR and EXPIRE):
-                # re-arm so the block cannot last forever.
-                await client.expire(key, window_seconds)
-                ttl = window_seconds
-            # Log the prefix, not the full key — for the login-code counter
-            # the key already carries only a truncated hash, but keep the
-            # prefix-only convention uniform across all rate-limited keys.
-            prefix = key.rsplit(":", 1)[0]
-            logger.warning("Rate limit exceeded for %s (attempt %d/%d)", prefix, attempts, limit)
-            record_rate_limit_rejection(prefix=prefix)
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many requests, try again later",
-                headers={"Retry-After": str(max(ttl, 1))},
-            )
-    except HTTPException:
-        raise
+        allowed, retry_after_ms = await _SCRIPTS[policy](
+            client, f"{key}:{_KEY_SUFFIXES[policy]}", *args
+        )
     except Exception as exc:  # noqa: BLE001 — rate limit is best-effort
         logger.warning("Rate limit unavailable for key %s: %s", key, exc)
+        return
     finally:
         await client.aclose()
+    if allowed:
+        return
+    # Log the prefix, not the full key — for the login-code counter the key
+    # already carries only a truncated hash, but keep the prefix-only
+    # convention uniform across all rate-limited keys.
+    prefix = key.rsplit(":", 1)[0]
+    logger.warning("Rate limit exceeded for %s (%d per %ds)", prefix, limit, window_seconds)
+    record_rate_limit_rejection(prefix=prefix)
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests, try again later",
+        headers={"Retry-After": str(max(math.ceil(int(retry_after_ms) / 1000), 1))},
+    )
 
 
 def rate_limit(
-    prefix: str, limit: int, window_seconds: int
+    prefix: str,
+    limit: int,
+    window_seconds: int,
+    policy: RateLimitPolicy = "sliding_window",
 ) -> Callable[[Request, SettingsDep], Coroutine[Any, Any, None]]:
     """Build a FastAPI dependency enforcing ``limit`` per ``window_seconds``.
 
@@ -84,7 +163,7 @@ def rate_limit(
 
     async def dependency(request: Request, settings: SettingsDep) -> None:
         ip = resolve_client_ip(request, settings)
-        await _enforce(f"rally:ratelimit:{prefix}:{ip}", limit, window_seconds)
+        await _enforce(f"rally:ratelimit:{prefix}:{ip}", limit, window_seconds, policy)
 
     return dependency
 
@@ -92,7 +171,7 @@ def rate_limit(
 async def check_login_rate_limit(request: Request, access_code: str, settings: Settings) -> None:
     """Brute-force guard for team login.
 
-    Enforces two independent fixed-window counters so neither a single IP
+    Enforces two independent sliding windows so neither a single IP
     hammering many codes nor many IPs hammering one code slips through:
 
     * per resolved client IP (throttles one attacker's guess rate)
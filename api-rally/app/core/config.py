@@ -11,6 +11,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 # Project Directories
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 
+# Accepted values of EVENTS_TRANSPORT.
+EVENT_TRANSPORTS = ("pubsub", "streams")
+
 
 def split_comma_list(v: Any) -> list[str] | Any:
     if isinstance(v, str):
@@ -87,6 +90,11 @@ class Settings(BaseSettings):
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_PASSWORD: str | None = os.getenv("REDIS_PASSWORD") or None
     REDIS_CONNECTION_TIMEOUT: int = int(os.getenv("REDIS_CONNECTION_TIMEOUT", "5"))
+    # Async clients share one pool per event loop (the app loop and each
+    # worker loop). A checkout waits up to REDIS_POOL_TIMEOUT_SECONDS for a
+    # free connection once REDIS_POOL_MAX_CONNECTIONS are in use.
+    REDIS_POOL_MAX_CONNECTIONS: int = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", "50"))
+    REDIS_POOL_TIMEOUT_SECONDS: float = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "5"))
     # Event/worker/realtime subsystem. On by default (uniform with the
     # gamification system); EVENTS_FAIL_SILENTLY keeps a Redis outage from
     # breaking requests — publishes are logged and swallowed instead of raised.
@@ -99,6 +107,86 @@ class Settings(BaseSettings):
     # a faster write path, so it stays OFF by default and only takes effect
     # when EVENTS_ENABLED is also set (otherwise no worker would ever catch up).
     RECOMPUTE_OFF_PATH: bool = os.getenv("RECOMPUTE_OFF_PATH", "false").lower() == "true"
+    # Where the background workers run. Embedded (default) starts them in
+    # every API process; set WORKERS_EMBEDDED=false and run
+    # `python -m app.workers` to give them a dedicated process instead.
+    WORKERS_EMBEDDED: bool = os.getenv("WORKERS_EMBEDDED", "true").lower() == "true"
+    # Instances of a worker elect one active leader through a Redis lease of
+    # this many seconds (renewed at a third of it), so embedding the workers in
+    # N API processes does not do the work N times. 0 disables the election.
+    WORKER_LEADER_LEASE_SECONDS: float = float(os.getenv("WORKER_LEADER_LEASE_SECONDS", "15"))
+    # How events reach the workers. "pubsub" (default) is fire-and-forget:
+    # events published while a worker reconnects are lost, and every process
+    # running workers handles every event. "streams" also appends each event
+    # to a Redis Stream read through one consumer group per worker class, so
+    # each event is handled once across processes and survives a worker
+    # restart (entries a crashed consumer left unacknowledged for
+    # EVENTS_STREAM_CLAIM_IDLE_SECONDS are reclaimed). The stream is capped at
+    # roughly EVENTS_STREAM_MAXLEN entries. SSE clients stay on Pub/Sub.
+    EVENTS_TRANSPORT: str = os.getenv("EVENTS_TRANSPORT", "pubsub").lower()
+    EVENTS_STREAM_MAXLEN: int = int(os.getenv("EVENTS_STREAM_MAXLEN", "10000"))
+    EVENTS_STREAM_CLAIM_IDLE_SECONDS: float = float(
+        os.getenv("EVENTS_STREAM_CLAIM_IDLE_SECONDS", "60")
+    )
+    # Transactional outbox. When on, scoring writes stage their events as
+    # event_outbox rows in their own transaction instead of publishing after
+    # the commit, and the outbox relay worker publishes them (oldest first, up
+    # to EVENTS_OUTBOX_BATCH_SIZE per pipeline) every
+    # EVENTS_OUTBOX_POLL_SECONDS. A Redis outage then delays events instead
+    # of dropping them.
+    EVENTS_OUTBOX: bool = os.getenv("EVENTS_OUTBOX", "false").lower() == "true"
+    EVENTS_OUTBOX_BATCH_SIZE: int = int(os.getenv("EVENTS_OUTBOX_BATCH_SIZE", "500"))
+    EVENTS_OUTBOX_POLL_SECONDS: float = float(os.getenv("EVENTS_OUTBOX_POLL_SECONDS", "1"))
+    # SSE clients share one Redis subscription per API process (see
+    # app.events.hub). Each client buffers up to SSE_CLIENT_QUEUE_SIZE pending
+    # messages; a client that falls further behind is disconnected and left to
+    # reconnect rather than buffered without bound.
+    SSE_CLIENT_QUEUE_SIZE: int = int(os.getenv("SSE_CLIENT_QUEUE_SIZE", "64"))
+    # Leaderboard deltas kept in Redis for SSE clients resuming with
+    # Last-Event-ID; a client further behind gets a full snapshot instead.
+    LEADERBOARD_DELTA_HISTORY: int = int(os.getenv("LEADERBOARD_DELTA_HISTORY", "200"))
+    # On a cold leaderboard one process recomputes it; requests elsewhere wait
+    # up to this long for its write before serving their last known board.
+    LEADERBOARD_RECOMPUTE_WAIT_SECONDS: float = float(
+        os.getenv("LEADERBOARD_RECOMPUTE_WAIT_SECONDS", "2")
+    )
+    # Each process caches the current event id this long. Switching the
+    # current event also invalidates every process's copy over Redis pub/sub;
+    # the TTL only bounds staleness when such a broadcast is missed.
+    CURRENT_EVENT_CACHE_SECONDS: float = float(os.getenv("CURRENT_EVENT_CACHE_SECONDS", "60"))
+    # The current event's settings snapshot is cached this long, both per
+    # process and in Redis. Settings writes bump its version and broadcast the
+    # change, so the TTL only bounds a missed broadcast or an out-of-band edit.
+    SETTINGS_CACHE_SECONDS: float = float(os.getenv("SETTINGS_CACHE_SECONDS", "60"))
+    # A caller's resolved principal (local user id, staff checkpoint, guide
+    # team) is cached per process this long, keyed by token subject and
+    # scopes. Assignment changes are broadcast; the TTL bounds the rest.
+    PRINCIPAL_CACHE_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_SECONDS", "30"))
+    # The current event's route graph (published posts, stages, active
+    # activities per post) is cached per process this long. Route writes are
+    # broadcast, so the TTL only bounds a missed broadcast or an external edit.
+    ROUTE_GRAPH_CACHE_SECONDS: float = float(os.getenv("ROUTE_GRAPH_CACHE_SECONDS", "60"))
+    # A team's verified proximity target (a post it may sample, with its
+    # coordinates and radius) is cached per process this long. Arrivals,
+    # skips, check-ins and evaluations are broadcast; the TTL bounds the rest.
+    PROXIMITY_TARGET_CACHE_SECONDS: float = float(os.getenv("PROXIMITY_TARGET_CACHE_SECONDS", "30"))
+    # Workers that opt into coalescing hold an event until its key has been
+    # quiet this long, then handle only the latest (so a burst of evaluations
+    # costs one recompute); the cap bounds how stale a busy key can get.
+    # A window of 0 disables coalescing.
+    WORKER_COALESCE_WINDOW_SECONDS: float = float(
+        os.getenv("WORKER_COALESCE_WINDOW_SECONDS", "0.3")
+    )
+    WORKER_COALESCE_MAX_LATENCY_SECONDS: float = float(
+        os.getenv("WORKER_COALESCE_MAX_LATENCY_SECONDS", "2")
+    )
+    # Score writes move team totals by score-ledger deltas. Every this many
+    # seconds the score ledger worker checks each team of the current event
+    # against a full recompute from the results/awards tables and appends
+    # corrections for any drift. 0 disables the periodic check.
+    SCORE_RECONCILE_INTERVAL_SECONDS: float = float(
+        os.getenv("SCORE_RECONCILE_INTERVAL_SECONDS", "300")
+    )
 
     # Team QR self-check-in. A checkpoint shows a short-lived HMAC-signed QR;
     # a team scans it to check itself into that checkpoint (replacing staff
@@ -151,6 +239,10 @@ class Settings(BaseSettings):
     # When behind a transaction-pooling proxy (pgbouncer), server-side pooling
     # conflicts with SQLAlchemy's pool. Set true to use NullPool instead.
     DB_DISABLE_POOL: bool = os.getenv("DB_DISABLE_POOL", "").lower() in {"1", "true", "yes"}
+    # Each background worker thread keeps its own engine (its event loop owns
+    # the asyncpg pool) and handles one event at a time, so it needs only a
+    # couple of warm connections; DB_MAX_OVERFLOW still covers bursts.
+    WORKER_DB_POOL_SIZE: int = int(os.getenv("WORKER_DB_POOL_SIZE", "2"))
 
     # OIDC authentication
     # Rally is a pure OIDC resource server: it validates access tokens minted
@@ -205,6 +297,12 @@ class Settings(BaseSettings):
     ## keyset instead of refetching it on every token validation; a cache miss
     ## on an unknown signing key forces a refresh to support key rotation.
     OIDC_JWKS_CACHE_TTL_SECONDS: int = int(os.getenv("OIDC_JWKS_CACHE_TTL_SECONDS", "600"))
+    ## Verified token claims are cached (keyed by a hash of the token) so a
+    ## dashboard polling with the same token skips the RSA verification. An
+    ## entry lives at most this long and never past the token's own exp.
+    OIDC_TOKEN_CACHE_SECONDS: float = float(os.getenv("OIDC_TOKEN_CACHE_SECONDS", "60"))
+    ## Most verified tokens kept; the least recently used is evicted first.
+    OIDC_TOKEN_CACHE_SIZE: int = int(os.getenv("OIDC_TOKEN_CACHE_SIZE", "1024"))
     ## Algorithms the resource server accepts for provider tokens. Pinned so a
     ## token cannot dictate its own (alg-confusion / "none" defence).
     OIDC_ALLOWED_ALGORITHMS: list[str] = ["RS256"]
@@ -214,6 +312,13 @@ class Settings(BaseSettings):
     def assemble_oidc_algs(cls, v: Any) -> list[str] | Any:
         return split_comma_list(v)
 
+    @field_validator("EVENTS_TRANSPORT")
+    @classmethod
+    def validate_events_transport(cls, v: str) -> str:
+        if v not in EVENT_TRANSPORTS:
+            raise ValueError(f"EVENTS_TRANSPORT must be one of {', '.join(EVENT_TRANSPORTS)}")
+        return v
+
     @field_validator("TEAM_JWT_SECRET_KEY")
     @classmethod
     def validate_team_jwt_secret_key(cls, v: str | None) -> str:
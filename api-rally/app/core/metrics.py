@@ -45,11 +45,61 @@ rate_limit_rejections_total = Counter(
     ["prefix"],
     registry=registry,
 )
+worker_events_coalesced_total = Counter(
+    "rally_worker_events_coalesced_total",
+    "Events folded into an already-pending event instead of handled separately",
+    ["worker"],
+    registry=registry,
+)
+worker_stream_reclaimed_total = Counter(
+    "rally_worker_stream_reclaimed_total",
+    "Stream entries reclaimed from a consumer that left them unacknowledged",
+    ["worker"],
+    registry=registry,
+)
 scoring_recompute_duration_seconds = Histogram(
     "rally_scoring_recompute_duration_seconds",
     "Duration of an activity-wide score recompute",
     registry=registry,
 )
+score_ledger_corrections_total = Counter(
+    "rally_score_ledger_corrections_total",
+    "Correcting rows appended to the score ledger by reconciliation",
+    registry=registry,
+)
+outbox_relayed_total = Counter(
+    "rally_event_outbox_relayed_total",
+    "Events the outbox relay published from the event_outbox table",
+    registry=registry,
+)
+leaderboard_recomputes_total = Counter(
+    "rally_leaderboard_recomputes_total",
+    "Cold-leaderboard reads by how they were served",
+    ["outcome"],
+    registry=registry,
+)
+sse_clients = Gauge(
+    "rally_sse_clients",
+    "Clients attached to this process's event hub (SSE streams and the cache watcher)",
+    registry=registry,
+)
+sse_clients_dropped_total = Counter(
+    "rally_sse_clients_dropped_total",
+    "SSE clients dropped for falling behind the event hub",
+    registry=registry,
+)
+redis_pool_connections = Gauge(
+    "rally_redis_pool_connections",
+    "Connections held by this process's asyncio Redis pools",
+    ["state"],
+    registry=registry,
+)
+redis_pool_wait_seconds = Histogram(
+    "rally_redis_pool_wait_seconds",
+    "Time spent checking a connection out of an asyncio Redis pool",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0),
+    registry=registry,
+)
 
 
 def record_request(
@@ -69,6 +119,18 @@ def set_worker_last_beat_age(*, worker: str, age_seconds: float) -> None:
     worker_last_beat_age_seconds.labels(worker=worker).set(age_seconds)
 
 
+def record_worker_event_coalesced(*, worker: str) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    worker_events_coalesced_total.labels(worker=worker).inc()
+
+
+def record_worker_stream_reclaimed(*, worker: str, count: int) -> None:
+    if not settings.METRICS_ENABLED or count <= 0:
+        return
+    worker_stream_reclaimed_total.labels(worker=worker).inc(count)
+
+
 def record_event_published(*, event_type: str, outcome: str) -> None:
     if not settings.METRICS_ENABLED:
         return
@@ -87,6 +149,49 @@ def observe_scoring_recompute(duration_seconds: float) -> None:
     scoring_recompute_duration_seconds.observe(duration_seconds)
 
 
+def record_score_ledger_corrections(count: int) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    score_ledger_corrections_total.inc(count)
+
+
+def record_outbox_relayed(count: int) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    outbox_relayed_total.inc(count)
+
+
+def record_leaderboard_recompute(*, outcome: str) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    leaderboard_recomputes_total.labels(outcome=outcome).inc()
+
+
+def set_sse_clients(count: int) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    sse_clients.set(count)
+
+
+def record_sse_client_dropped() -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    sse_clients_dropped_total.inc()
+
+
+def set_redis_pool_connections(*, in_use: int, idle: int) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    redis_pool_connections.labels(state="in_use").set(in_use)
+    redis_pool_connections.labels(state="idle").set(idle)
+
+
+def observe_redis_pool_wait(duration_seconds: float) -> None:
+    if not settings.METRICS_ENABLED:
+        return
+    redis_pool_wait_seconds.observe(duration_seconds)
+
+
 def collect_summary() -> dict[str, float]:
     """Aggregate the registry into the handful of totals the admin panel shows.
 
@@ -4,29 +4,63 @@ Provides two client families that share the same connection settings:
 
 - A *sync* client (``get_redis_client``) for the background worker thread,
   which runs a blocking pub/sub loop outside the asyncio event loop.
-- An *async* client (``get_async_redis``) for request handlers, the event
-  publisher and the SSE stream, so a single ``PUBLISH``/``GET`` never blocks
-  the FastAPI event loop.
+- An *async* client (``get_async_redis_client`` / the ``RedisDep``
+  dependency) for request handlers, the event publisher, the SSE hub and the
+  worker loops, so a single ``PUBLISH``/``GET`` never blocks the FastAPI event
+  loop. Async clients share one connection pool per running event loop, so a
+  request reuses a warm connection instead of paying a TCP handshake.
 
 Everything is feature-gated by ``settings.EVENTS_ENABLED`` at the call sites;
 this module only manages connections.
 """
 
+import asyncio
 import logging
+import os
+import socket
+import threading
+import time
+import weakref
 from collections.abc import AsyncGenerator
+from typing import Annotated, Any
 
 import redis
 import redis.asyncio as aredis
+from fastapi import Depends
 
 from app.core.config import settings
+from app.core.metrics import observe_redis_pool_wait, set_redis_pool_connections
 
 logger = logging.getLogger(__name__)
 
-# Global sync connection pool (initialised lazily on first use). The async
-# clients are intentionally pool-less — see get_async_redis_client.
+# Global sync connection pool (initialised lazily on first use).
 _sync_pool: redis.ConnectionPool | None = None
 
 
+class _InstrumentedPool(aredis.BlockingConnectionPool):
+    """A blocking pool that reports checkout waits and connection counts."""
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)  # type: ignore[no-untyped-call]
+        observe_redis_pool_wait(time.perf_counter() - started)
+        _report_pool_connections()
+        return connection
+
+    async def release(self, connection: Any) -> None:
+        await super().release(connection)
+        _report_pool_connections()
+
+
+# One async pool per event loop: a connection is bound to the loop that opened
+# it, and the app loop and each worker thread's loop are different loops. The
+# lock guards the mapping, which the worker threads touch concurrently.
+_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _InstrumentedPool]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_pools_lock = threading.Lock()
+
+
 def _get_sync_pool() -> redis.ConnectionPool:
     """Get or create the shared synchronous connection pool."""
     global _sync_pool
@@ -43,30 +77,63 @@ def _get_sync_pool() -> redis.ConnectionPool:
     return _sync_pool
 
 
+def node_id() -> str:
+    """Identify this process to the others sharing Redis (stream consumers,
+    worker leases)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
 def get_redis_client() -> redis.Redis:
     """Return a synchronous Redis client (for the worker thread)."""
     return redis.Redis(connection_pool=_get_sync_pool())
 
 
+def _connection_kwargs() -> dict[str, Any]:
+    return {
+        "host": settings.REDIS_HOST,
+        "port": settings.REDIS_PORT,
+        "password": settings.REDIS_PASSWORD,
+        "decode_responses": True,
+        "socket_connect_timeout": settings.REDIS_CONNECTION_TIMEOUT,
+        "socket_timeout": settings.REDIS_CONNECTION_TIMEOUT,
+    }
+
+
+def _report_pool_connections() -> None:
+    with _async_pools_lock:
+        pools = list(_async_pools.values())
+    set_redis_pool_connections(
+        in_use=sum(len(pool._in_use_connections) for pool in pools),
+        idle=sum(len(pool._available_connections) for pool in pools),
+    )
+
+
+def _loop_pool(loop: asyncio.AbstractEventLoop) -> _InstrumentedPool:
+    with _async_pools_lock:
+        pool = _async_pools.get(loop)
+        if pool is None:
+            pool = _InstrumentedPool(
+                max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+                **_connection_kwargs(),
+            )
+            _async_pools[loop] = pool
+    return pool
+
+
 def get_async_redis_client() -> aredis.Redis:
-    """Return a standalone asyncio Redis client (routes/publisher/SSE/workers).
-
-    Deliberately NOT backed by a shared module-level pool: the worker runs each
-    event in its own short-lived loop (``asyncio.run`` per message), and a pool
-    whose connections were bound to an earlier loop raises "got Future attached
-    to a different loop" on reuse. A fresh client per call — always closed via
-    ``aclose()`` by the caller — binds its connections to the current loop and
-    sidesteps that entirely. Callers already create-and-close per use, so the
-    pool gave no reuse benefit here.
+    """Return an asyncio Redis client backed by the running loop's pool.
+
+    The pool is created lazily on first use per loop and lives until
+    ``close_async_pool`` runs on that loop. ``aclose()`` on the client only
+    returns its connection to the pool, so callers keep the create-and-close
+    pattern. Without a running loop the client gets a private pool instead.
     """
-    return aredis.Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        password=settings.REDIS_PASSWORD,
-        decode_responses=True,
-        socket_connect_timeout=settings.REDIS_CONNECTION_TIMEOUT,
-        socket_timeout=settings.REDIS_CONNECTION_TIMEOUT,
-    )
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return aredis.Redis(**_connection_kwargs())
+    return aredis.Redis(connection_pool=_loop_pool(loop))
 
 
 async def get_async_redis() -> AsyncGenerator[aredis.Redis, None]:
@@ -78,6 +145,9 @@ async def get_async_redis() -> AsyncGenerator[aredis.Redis, None]:
         await client.aclose()
 
 
+RedisDep = Annotated[aredis.Redis, Depends(get_async_redis)]
+
+
 async def check_redis_health() -> bool:
     """Return True when Redis answers PING, False on any Redis error."""
     client = get_async_redis_client()
@@ -90,11 +160,19 @@ async def check_redis_health() -> bool:
         await client.aclose()
 
 
+async def close_async_pool() -> None:
+    """Disconnect the running loop's async pool (loop shutdown: app or worker)."""
+    with _async_pools_lock:
+        pool = _async_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
+        _report_pool_connections()
+
+
 def close_pools() -> None:
     """Disconnect the sync pool (called on application shutdown).
 
-    Async clients are pool-less and closed by their callers, so there is no
-    shared async pool to tear down here.
+    Each loop's async pool is closed on that loop by ``close_async_pool``.
     """
     global _sync_pool
     if _sync_pool is not None:
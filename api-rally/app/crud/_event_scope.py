@@ -4,17 +4,76 @@ Teams, checkpoints and activities belong to an event (``event_id``). The
 "current" event is resolved (and lazily bootstrapped) via crud.rally_event, so
 list/count/create operations can transparently restrict themselves to the
 active edition without every caller having to know about events.
+
+Almost every CRUD and service path asks for the current event, so its id is
+cached at two levels: per process for ``settings.CURRENT_EVENT_CACHE_SECONDS``
+and per session (``AsyncSession.info``, i.e. per request or worker event) for
+whatever resolved it first. Switching the current event drops the local copy
+immediately and every other process's through the
+``Channels.EVENT_CURRENT_CHANGED`` broadcast (see app.events.invalidation).
 """
 
+import threading
+import time
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+
+_MEMO_KEY = "rally_current_event_id"
+
+_lock = threading.Lock()
+_cached_id: int | None = None
+_cached_until = 0.0
+# Bumped by every invalidation, so a lookup that started before a switch
+# cannot cache the id it read after the switch dropped the cache.
+_generation = 0
+
+
+def current_event_generation() -> int:
+    return _generation
+
+
+def cached_current_event_id() -> int | None:
+    """The process-wide cached current event id, if still fresh."""
+    event_id = _cached_id
+    if event_id is None or time.monotonic() >= _cached_until:
+        return None
+    return event_id
+
+
+def remember_current_event(event_id: int, generation: int) -> None:
+    """Cache ``event_id``, unless the cache was invalidated since ``generation``."""
+    global _cached_id, _cached_until
+    with _lock:
+        if generation != _generation:
+            return
+        _cached_id = event_id
+        _cached_until = time.monotonic() + settings.CURRENT_EVENT_CACHE_SECONDS
+
+
+def invalidate_current_event(db: AsyncSession | None = None) -> None:
+    """Drop the cached current event id (and ``db``'s memo of it)."""
+    global _cached_id, _generation
+    with _lock:
+        _cached_id = None
+        _generation += 1
+    if db is not None:
+        db.info.pop(_MEMO_KEY, None)
+
 
 async def current_event_id(db: AsyncSession) -> int:
     """Return the id of the current event, creating a default if none exists."""
-    # Local import: avoids circular import with app.crud.crud_activity
-    # (crud_activity imports current_event_id at module level; rally_event
-    # lives in crud_activity, so this side of the cycle must stay lazy).
-    from app.crud.crud_activity import rally_event
+    memo: int | None = db.info.get(_MEMO_KEY)
+    if memo is not None:
+        return memo
+    event_id = cached_current_event_id()
+    if event_id is None:
+        # Local import: avoids circular import with app.crud.crud_activity
+        # (crud_activity imports current_event_id at module level; rally_event
+        # lives in crud_activity, so this side of the cycle must stay lazy).
+        from app.crud.crud_activity import rally_event
 
-    event = await rally_event.ensure_current(db)
-    return event.id
+        event_id = (await rally_event.ensure_current(db)).id
+    db.info[_MEMO_KEY] = event_id
+    return event_id
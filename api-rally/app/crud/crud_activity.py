@@ -10,6 +10,12 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud import current_event_id
+from app.crud._event_scope import (
+    cached_current_event_id,
+    current_event_generation,
+    invalidate_current_event,
+    remember_current_event,
+)
 from app.models.activity import Activity, ActivityResult, EventType, RallyEvent
 from app.schemas.activity import (
     ActivityCreate,
@@ -172,10 +178,18 @@ class CRUDActivityResult:
         stmt = select(ActivityResult).order_by(desc(ActivityResult.completed_at))
         return list((await db.scalars(stmt)).all())
 
-    async def delete(self, db: AsyncSession, *, db_obj: ActivityResult) -> ActivityResult:
-        """Delete a result and commit (no team-score side effects)."""
+    async def delete(
+        self, db: AsyncSession, *, db_obj: ActivityResult, commit: bool = True
+    ) -> ActivityResult:
+        """Delete a result (no team-score side effects).
+
+        Commits by default; pass commit=False to only flush, as with ``persist``.
+        """
         await db.delete(db_obj)
-        await db.commit()
+        if commit:
+            await db.commit()
+        else:
+            await db.flush()
         return db_obj
 
 
@@ -190,7 +204,10 @@ class CRUDRallyEvent:
 
     Exactly one event is ``is_current`` at a time; ``set_current`` enforces
     that. ``ensure_current`` lazily bootstraps a default event so single-event
-    deployments keep working without any explicit event creation.
+    deployments keep working without any explicit event creation. Every write
+    that can change which event is current drops the cached current event id
+    (see app.crud._event_scope); broadcasting the change to other processes is
+    up to the caller.
     """
 
     async def _unique_slug(self, db: AsyncSession, base: str) -> str:
@@ -229,6 +246,8 @@ class CRUDRallyEvent:
         )
         db.add(db_obj)
         await db.commit()
+        if obj_in.is_current:
+            invalidate_current_event(db)
         await db.refresh(db_obj)
         return db_obj
 
@@ -246,10 +265,21 @@ class CRUDRallyEvent:
 
         Bootstraps single-event deployments: the first read materialises a
         "Rally Tascas" event flagged current, so everything that scopes by the
-        current event has something to attach to.
+        current event has something to attach to. With the current event id
+        cached the lookup is an identity-map hit or a primary-key read.
         """
+        generation = current_event_generation()
+        cached_id = cached_current_event_id()
+        if cached_id is not None:
+            cached = await db.get(RallyEvent, cached_id)
+            if cached is not None and cached.is_current:
+                return cached
+            invalidate_current_event(db)
+            generation = current_event_generation()
+
         current = await self.get_current(db)
         if current is not None:
+            remember_current_event(current.id, generation)
             return current
 
         # Adopt an existing non-current event if one exists, else create.
@@ -258,6 +288,7 @@ class CRUDRallyEvent:
             existing.is_current = True
             db.add(existing)
             await db.commit()
+            invalidate_current_event(db)
             await db.refresh(existing)
             return existing
 
@@ -307,6 +338,7 @@ class CRUDRallyEvent:
         target.is_current = True
         db.add(target)
         await db.commit()
+        invalidate_current_event(db)
         await db.refresh(target)
         return target
 
@@ -330,6 +362,8 @@ class CRUDRallyEvent:
             setattr(db_obj, field, value)
         db.add(db_obj)
         await db.commit()
+        if "is_current" in update_data:
+            invalidate_current_event(db)
         await db.refresh(db_obj)
         return db_obj
 
@@ -340,6 +374,8 @@ class CRUDRallyEvent:
             return None
         await db.delete(obj)
         await db.commit()
+        if obj.is_current:
+            invalidate_current_event(db)
         return obj
 
 
@@ -10,6 +10,7 @@ from app.models.rally_settings import RallySettings
 from app.schemas.rally_settings import (
     DEFAULT_HOME_LAYOUT,
     DEFAULT_TICKER_ITEMS,
+    RallySettingsSnapshot,
     RallySettingsUpdate,
     normalize_home_layout,
     normalize_ticker_items,
@@ -19,6 +20,69 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
+def _default_settings(event_id: int, event_type: str) -> RallySettings:
+    """The settings an event starts with, before an admin changes anything."""
+    return RallySettings(
+        event_id=event_id,
+        # Team management
+        max_teams=14,
+        max_members_per_team=10,
+        enable_versus=True,
+        # Rally timing
+        rally_start_time=None,
+        rally_end_time=None,
+        # Scoring system
+        penalty_per_puke=-10,
+        penalty_per_not_drinking=-2,
+        bonus_per_extra_shot=1,
+        max_extra_shots_per_member=5,
+        # Checkpoint behavior
+        checkpoint_order_matters=True,
+        # GPS self-check-in: on by default for peddy paper, where reaching
+        # the post *is* the mechanic; off for formats that check teams in
+        # through staff or QR.
+        gps_checkin_enabled=event_type == EventType.PEDDY_PAPER.value,
+        # Redact next checkpoint until check-in for peddy paper, where the
+        # location itself is the puzzle answer; every other format keeps
+        # today's fully-revealed next checkpoint.
+        reveal_next_checkpoint=event_type != EventType.PEDDY_PAPER.value,
+        # Asking for a hint costs points in a peddy paper (the riddle is
+        # the game); other formats have no hint economy, so it stays free.
+        hint_penalty=-10 if event_type == EventType.PEDDY_PAPER.value else 0,
+        # Giving up forfeits the post's score too, so it costs more than a
+        # hint. Only peddy paper can strand a team on a riddle at all.
+        skip_penalty=-25 if event_type == EventType.PEDDY_PAPER.value else 0,
+        # Staff and scoring
+        enable_staff_scoring=True,
+        # Display settings
+        show_live_leaderboard=True,
+        show_team_details=True,
+        show_checkpoint_map=True,
+        # Peddy paper's participant view is the clue/check-in screen —
+        # equipas belong there by default. Other formats keep the
+        # existing opt-in (staff must switch it on).
+        participant_view_enabled=event_type == EventType.PEDDY_PAPER.value,
+        show_route_mode="focused",
+        show_score_mode="hidden",
+        # Rally customization
+        rally_theme="Rally Tascas - Competição de Equipas",
+        # Universal branding
+        event_name="Rally Tascas",
+        event_subtitle="Competição de Equipas",
+        accent_color="",
+        banner_url="",
+        logo_url="",
+        favicon_url="",
+        rules_pdf_url="",
+        rules_sections=[],
+        # Access control
+        public_access_enabled=True,
+        # Home page layout
+        home_layout=list(DEFAULT_HOME_LAYOUT),
+        ticker_items=list(DEFAULT_TICKER_ITEMS),
+    )
+
+
 class CRUDRallySettings(CRUDBase[RallySettings, RallySettingsUpdate, RallySettingsUpdate]):
     async def get_or_create(self, db: "AsyncSession") -> RallySettings:
         """Return the current event's settings row, creating it if missing.
@@ -62,65 +126,7 @@ class CRUDRallySettings(CRUDBase[RallySettings, RallySettingsUpdate, RallySettin
             legacy = await self._normalize_home_fields(db, legacy)
             return await self._sync_timing_from_event(db, legacy, event)
 
-        settings = RallySettings(
-            event_id=event_id,
-            # Team management
-            max_teams=14,
-            max_members_per_team=10,
-            enable_versus=True,
-            # Rally timing
-            rally_start_time=None,
-            rally_end_time=None,
-            # Scoring system
-            penalty_per_puke=-10,
-            penalty_per_not_drinking=-2,
-            bonus_per_extra_shot=1,
-            max_extra_shots_per_member=5,
-            # Checkpoint behavior
-            checkpoint_order_matters=True,
-            # GPS self-check-in: on by default for peddy paper, where reaching
-            # the post *is* the mechanic; off for formats that check teams in
-            # through staff or QR.
-            gps_checkin_enabled=event.event_type == EventType.PEDDY_PAPER.value,
-            # Redact next checkpoint until check-in for peddy paper, where the
-            # location itself is the puzzle answer; every other format keeps
-            # today's fully-revealed next checkpoint.
-            reveal_next_checkpoint=event.event_type != EventType.PEDDY_PAPER.value,
-            # Asking for a hint costs points in a peddy paper (the riddle is
-            # the game); other formats have no hint economy, so it stays free.
-            hint_penalty=-10 if event.event_type == EventType.PEDDY_PAPER.value else 0,
-            # Giving up forfeits the post's score too, so it costs more than a
-            # hint. Only peddy paper can strand a team on a riddle at all.
-            skip_penalty=-25 if event.event_type == EventType.PEDDY_PAPER.value else 0,
-            # Staff and scoring
-            enable_staff_scoring=True,
-            # Display settings
-            show_live_leaderboard=True,
-            show_team_details=True,
-            show_checkpoint_map=True,
-            # Peddy paper's participant view is the clue/check-in screen —
-            # equipas belong there by default. Other formats keep the
-            # existing opt-in (staff must switch it on).
-            participant_view_enabled=event.event_type == EventType.PEDDY_PAPER.value,
-            show_route_mode="focused",
-            show_score_mode="hidden",
-            # Rally customization
-            rally_theme="Rally Tascas - Competição de Equipas",
-            # Universal branding
-            event_name="Rally Tascas",
-            event_subtitle="Competição de Equipas",
-            accent_color="",
-            banner_url="",
-            logo_url="",
-            favicon_url="",
-            rules_pdf_url="",
-            rules_sections=[],
-            # Access control
-            public_access_enabled=True,
-            # Home page layout
-            home_layout=list(DEFAULT_HOME_LAYOUT),
-            ticker_items=list(DEFAULT_TICKER_ITEMS),
-        )
+        settings = _default_settings(event_id, event.event_type)
         db.add(settings)
         try:
             await db.commit()
@@ -142,6 +148,35 @@ class CRUDRallySettings(CRUDBase[RallySettings, RallySettingsUpdate, RallySettin
 
         return await self._sync_timing_from_event(db, settings, event)
 
+    async def load_snapshot(self, db: "AsyncSession", *, version: int) -> RallySettingsSnapshot:
+        """Read the current event's settings into a snapshot, writing nothing.
+
+        Gives the same values get_or_create would: a legacy unscoped row
+        stands in until it is adopted, an event without a row gets the
+        bootstrap defaults, and the timing and event type come from the event.
+        """
+        event = await rally_event.ensure_current(db)
+        row = await db.scalar(select(RallySettings).where(RallySettings.event_id == event.id))
+        if row is None:
+            row = await db.scalar(select(RallySettings).where(RallySettings.event_id.is_(None)))
+        if row is None:
+            row = _default_settings(event.id, event.event_type)
+        # A default row is never flushed, so its unset columns are still None
+        # rather than their column default; the schema supplies the same ones.
+        values = {
+            column.key: getattr(row, column.key)
+            for column in RallySettings.__table__.columns
+            if column.nullable or getattr(row, column.key) is not None
+        }
+        values.update(
+            event_id=event.id,
+            rally_start_time=event.start_time,
+            rally_end_time=event.end_time,
+            event_type=event.event_type,
+            version=version,
+        )
+        return RallySettingsSnapshot.model_validate(values)
+
     @staticmethod
     async def _reload_event(db: "AsyncSession", event_id: int) -> RallyEvent:
         """Re-load the event after a rollback so its attributes stay usable.
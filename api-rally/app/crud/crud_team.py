@@ -12,7 +12,6 @@ from sqlalchemy.orm import selectinload
 from app.core.exceptions import RallyValidationError
 from app.crud._event_scope import current_event_id
 from app.crud.base import CRUDBase
-from app.crud.crud_rally_settings import rally_settings
 from app.models.checkpoint import CheckPoint
 from app.models.team import Team
 from app.schemas.team import (
@@ -20,6 +19,7 @@ from app.schemas.team import (
     TeamScoresUpdate,
     TeamUpdate,
 )
+from app.services.settings_snapshot import current_settings
 
 locked_arrays = [
     "times",
@@ -89,12 +89,14 @@ class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
         skip: int | None = None,
         limit: int | None = None,
         for_update: bool = False,
+        with_members: bool = False,
     ) -> Sequence[Team]:
         """List teams scoped to the current event.
 
         Ranking and listing operate per-edition: only teams whose event_id
         matches the current event are returned. Legacy rows with event_id NULL
         are folded into the current event so single-event data keeps showing.
+        ``with_members`` eager-loads every team's members in one extra query.
         """
         event_id = await current_event_id(db)
         stmt = (
@@ -103,17 +105,16 @@ class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
             .limit(limit)
             .offset(skip)
         )
+        if with_members:
+            stmt = stmt.options(selectinload(Team.members))
         if for_update:
             # Deterministic lock order (by id) is required here, not
-            # cosmetic: add_checkpoint already holds one team row locked via
-            # its own for_update=True before calling update_classification,
-            # which locks *every* team. Two concurrent check-ins for
-            # different teams each already hold a different single row, then
-            # both try to acquire the full set — without a fixed order,
-            # Postgres can pick a different scan order per transaction and
+            # cosmetic: two callers that each already hold a different team
+            # row and then lock the full set would, without a fixed order,
+            # let Postgres pick a different scan order per transaction and
             # deadlock (each waiting on the row the other already holds).
             # Real DeadlockDetectedError reproduced under concurrent
-            # staff-check-in calls before this fix.
+            # staff check-ins back when classification locked every team.
             stmt = stmt.order_by(Team.id).with_for_update()
         return list((await db.scalars(stmt)).all())
 
@@ -133,13 +134,16 @@ class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
         await TeamService(db, self).update_classification()
 
     async def create(self, db: AsyncSession, *, obj_in: TeamCreate, commit: bool = False) -> Team:
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         event_id = await current_event_id(db)
         # Count teams in the current event only, so max_teams is per-edition.
-        current_team_count = await db.scalar(
-            select(func.count(Team.id)).where(
-                (Team.event_id == event_id) | (Team.event_id.is_(None))
+        current_team_count = (
+            await db.scalar(
+                select(func.count(Team.id)).where(
+                    (Team.event_id == event_id) | (Team.event_id.is_(None))
+                )
             )
+            or 0
         )
 
         if current_team_count >= settings.max_teams:
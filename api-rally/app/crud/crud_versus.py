@@ -9,8 +9,8 @@ from app.core.exceptions import (
     RallyNotFoundError,
     RallyValidationError,
 )
-from app.crud.crud_rally_settings import rally_settings
 from app.models.team import Team
+from app.services.settings_snapshot import current_settings
 
 
 class CRUDVersus:
@@ -22,7 +22,7 @@ class CRUDVersus:
             The group ID (same as team_a_id for simplicity)
         """
 
-        settings = await rally_settings.get_or_create(db)
+        settings = await current_settings(db)
         if not settings.enable_versus:
             raise RallyForbiddenError("Versus mode is not enabled")
 
@@ -1,8 +1,14 @@
-"""Rally event subsystem: channels, typed events and the async publisher."""
+"""Rally event subsystem: channels, typed events, the async publisher and the SSE hub."""
 
 from app.events.channels import Channels
 from app.events.exceptions import EventPublishError
-from app.events.publisher import EVENT_TYPE_TO_CHANNEL, publish_event
+from app.events.hub import close_hub, get_hub
+from app.events.publisher import (
+    EVENT_TYPE_TO_CHANNEL,
+    batched_events,
+    close_publisher,
+    publish_event,
+)
 from app.events.schemas import (
     ActivityResultChangedPayload,
     ActivityResultCreatedEvent,
@@ -11,14 +17,30 @@ from app.events.schemas import (
     BadgeAwardedEvent,
     BadgeAwardedPayload,
     BaseEvent,
+    CurrentEventChangedEvent,
+    CurrentEventChangedPayload,
     EventType,
+    PrincipalsChangedEvent,
+    PrincipalsChangedPayload,
+    ProgressChangedEvent,
+    ProgressChangedPayload,
     RallyEndedEvent,
     RallyLifecyclePayload,
     RallyStartedEvent,
+    RouteChangedEvent,
+    RouteChangedPayload,
+    SettingsChangedEvent,
+    SettingsChangedPayload,
+    TeamChangedPayload,
     TeamCheckpointAdvancedEvent,
     TeamCheckpointAdvancedPayload,
+    TeamCreatedEvent,
+    TeamDeletedEvent,
+    TeamScoresUpdatedEvent,
+    TeamScoresUpdatedPayload,
     TeamScoreUpdatedEvent,
     TeamScoreUpdatedPayload,
+    TeamUpdatedEvent,
 )
 
 __all__ = [
@@ -26,6 +48,10 @@ __all__ = [
     "EventPublishError",
     "EVENT_TYPE_TO_CHANNEL",
     "publish_event",
+    "batched_events",
+    "close_publisher",
+    "get_hub",
+    "close_hub",
     "BaseEvent",
     "EventType",
     "ActivityResultChangedPayload",
@@ -34,11 +60,27 @@ __all__ = [
     "ActivityResultDeletedEvent",
     "TeamScoreUpdatedEvent",
     "TeamScoreUpdatedPayload",
+    "TeamScoresUpdatedEvent",
+    "TeamScoresUpdatedPayload",
     "TeamCheckpointAdvancedEvent",
     "TeamCheckpointAdvancedPayload",
+    "TeamChangedPayload",
+    "TeamCreatedEvent",
+    "TeamUpdatedEvent",
+    "TeamDeletedEvent",
     "RallyStartedEvent",
     "RallyEndedEvent",
     "RallyLifecyclePayload",
     "BadgeAwardedEvent",
     "BadgeAwardedPayload",
+    "CurrentEventChangedEvent",
+    "CurrentEventChangedPayload",
+    "SettingsChangedEvent",
+    "SettingsChangedPayload",
+    "PrincipalsChangedEvent",
+    "PrincipalsChangedPayload",
+    "RouteChangedEvent",
+    "RouteChangedPayload",
+    "ProgressChangedEvent",
+    "ProgressChangedPayload",
 ]
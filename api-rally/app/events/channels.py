@@ -16,7 +16,13 @@ class Channels:
 
     # Team-level changes that affect the leaderboard.
     TEAM_SCORE_UPDATED = f"{PREFIX}.team.score_updated"
+    # Many teams at once, after a rescore that shifted a whole activity.
+    TEAM_SCORES_UPDATED = f"{PREFIX}.team.scores_updated"
     TEAM_CHECKPOINT_ADVANCED = f"{PREFIX}.team.checkpoint_advanced"
+    # Roster changes (a team appears, is renamed or disappears from standings).
+    TEAM_CREATED = f"{PREFIX}.team.created"
+    TEAM_UPDATED = f"{PREFIX}.team.updated"
+    TEAM_DELETED = f"{PREFIX}.team.deleted"
 
     # Rally lifecycle.
     RALLY_STARTED = f"{PREFIX}.rally.started"
@@ -25,9 +31,25 @@ class Channels:
     # A team earned a badge (drives notifications / profile refresh).
     BADGE_AWARDED = f"{PREFIX}.badge.awarded"
 
+    # A different event edition became current (drops per-process caches).
+    EVENT_CURRENT_CHANGED = f"{PREFIX}.event.current_changed"
+    # An event's settings changed (drops per-process settings snapshots).
+    SETTINGS_CHANGED = f"{PREFIX}.settings.changed"
+    # A user's staff or guide assignment changed (drops cached principals).
+    PRINCIPALS_CHANGED = f"{PREFIX}.principals.changed"
+    # A checkpoint, stage or activity changed (drops cached route graphs).
+    ROUTE_CHANGED = f"{PREFIX}.route.changed"
+    # A team arrived at, skipped or checked into a post (drops its cached
+    # proximity targets).
+    PROGRESS_CHANGED = f"{PREFIX}.progress.changed"
+
     # Internal signal: the cached leaderboard was rebuilt (drives the SSE stream).
     LEADERBOARD_REFRESHED = f"{PREFIX}.leaderboard.refreshed"
 
+    # Redis Stream carrying every event when EVENTS_TRANSPORT is "streams"
+    # (see app.events.streams). A key, not a Pub/Sub channel.
+    EVENT_STREAM = f"{PREFIX}:events"
+
     # Pattern subscriptions for workers.
     ALL_EVENTS = f"{PREFIX}.*"
     ALL_ACTIVITY_RESULT_EVENTS = f"{PREFIX}.activity_result.*"
@@ -0,0 +1,219 @@
+"""Per-process fan-out of Redis Pub/Sub messages to Server-Sent Events clients.
+
+Each SSE connection used to open its own Redis client and subscription, so a
+projector plus a few hundred participant phones meant a few hundred Redis
+connections per API process. The hub holds a single pattern subscription per
+event loop and copies every message into a bounded queue per attached client.
+A client whose queue is full is not keeping up: it is dropped (its stream
+ends and the browser's EventSource reconnects) instead of letting its backlog
+grow without bound. Heartbeats come from the same reader task, so an idle
+client costs no Redis connection and no timer of its own.
+
+The reader task starts with the first client and stops with the last one.
+"""
+
+import asyncio
+import logging
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from fnmatch import fnmatchcase
+from typing import Any, NamedTuple
+
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.metrics import record_sse_client_dropped, set_sse_clients
+from app.core.redis import get_async_redis_client
+from app.events.channels import Channels
+
+logger = logging.getLogger(__name__)
+
+# Seconds between SSE heartbeats; keeps proxies from dropping an idle connection.
+HEARTBEAT_SECONDS = 15.0
+# Pause before resubscribing after the hub loses its Redis connection.
+_RETRY_SECONDS = 1.0
+
+# Everything any subscriber needs (the SSE streams and the cache invalidation
+# watcher); each client filters its own subset.
+HUB_PATTERNS: tuple[str, ...] = (
+    Channels.LEADERBOARD_REFRESHED,
+    Channels.ALL_ACTIVITY_RESULT_EVENTS,
+    Channels.ALL_TEAM_EVENTS,
+    Channels.EVENT_CURRENT_CHANGED,
+    Channels.SETTINGS_CHANGED,
+    Channels.PRINCIPALS_CHANGED,
+    Channels.ROUTE_CHANGED,
+    Channels.PROGRESS_CHANGED,
+)
+
+
+class HubMessage(NamedTuple):
+    """A Pub/Sub message as delivered to SSE clients."""
+
+    channel: str
+    data: str
+
+
+def decode_value(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class Subscription:
+    """One SSE client's view of the hub.
+
+    Iterating yields each matching ``HubMessage`` and ``None`` for every
+    heartbeat, and stops once the hub drops the client for falling behind.
+    """
+
+    def __init__(self, patterns: tuple[str, ...], maxsize: int) -> None:
+        self.patterns = patterns
+        self.queue: asyncio.Queue[HubMessage | None] = asyncio.Queue(maxsize)
+        self.dropped = False
+
+    def matches(self, channel: str) -> bool:
+        return any(fnmatchcase(channel, pattern) for pattern in self.patterns)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> HubMessage | None:
+        item = await self.queue.get()
+        if self.dropped:
+            raise StopAsyncIteration
+        return item
+
+
+class EventHub:
+    """Owns the process's SSE subscription for one event loop."""
+
+    def __init__(self, patterns: tuple[str, ...] = HUB_PATTERNS) -> None:
+        self._patterns = patterns
+        self._subscribers: set[Subscription] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def client_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self, *patterns: str) -> AsyncIterator[Subscription]:
+        """Attach a client for the channels matching ``patterns``."""
+        subscription = Subscription(patterns, settings.SSE_CLIENT_QUEUE_SIZE)
+        self._subscribers.add(subscription)
+        set_sse_clients(len(self._subscribers))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="rally-sse-hub")
+        try:
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+            set_sse_clients(len(self._subscribers))
+            if not self._subscribers:
+                await self._stop()
+
+    async def close(self) -> None:
+        """Drop every client and stop the reader task."""
+        for subscription in list(self._subscribers):
+            self._drop(subscription, slow=False)
+        await self._stop()
+
+    async def _stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        # wait() rather than awaiting the task: it neither re-raises the
+        # task's CancelledError nor swallows a cancellation of our own.
+        await asyncio.wait([task])
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            client = get_async_redis_client()
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(*self._patterns)
+                next_beat = loop.time() + HEARTBEAT_SECONDS
+                while True:
+                    message = await self._next_message(pubsub, max(next_beat - loop.time(), 0.01))
+                    if message and message.get("type") in ("message", "pmessage"):
+                        self._broadcast(
+                            HubMessage(
+                                decode_value(message["channel"]), decode_value(message["data"])
+                            )
+                        )
+                    if loop.time() >= next_beat:
+                        self._broadcast(None)
+                        next_beat = loop.time() + HEARTBEAT_SECONDS
+            except RedisError:
+                logger.warning("SSE hub lost its Redis subscription; retrying", exc_info=True)
+            finally:
+                # redis does not type the async pubsub aclose under strict mypy.
+                await pubsub.aclose()  # type: ignore[no-untyped-call]
+                await client.aclose()
+            await asyncio.sleep(_RETRY_SECONDS)
+
+    @staticmethod
+    async def _next_message(pubsub: PubSub, timeout: float) -> dict[str, Any] | None:
+        """Await the next message, or None once ``timeout`` passes.
+
+        The ``timeout`` is what makes this a blocking wait: without it
+        ``get_message`` polls the socket and returns None immediately, turning
+        the reader into a hot loop.
+        """
+        try:
+            message: dict[str, Any] | None = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=timeout
+            )
+        except TimeoutError:
+            return None
+        return message
+
+    def _broadcast(self, message: HubMessage | None) -> None:
+        """Queue ``message`` (None: a heartbeat, sent to everyone) per client."""
+        for subscription in list(self._subscribers):
+            if message is not None and not subscription.matches(message.channel):
+                continue
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._drop(subscription, slow=True)
+
+    def _drop(self, subscription: Subscription, *, slow: bool) -> None:
+        """Detach a client and wake its stream so it ends."""
+        self._subscribers.discard(subscription)
+        set_sse_clients(len(self._subscribers))
+        subscription.dropped = True
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+        if slow:
+            record_sse_client_dropped()
+            logger.info(
+                "Dropped an SSE client that fell %d messages behind",
+                settings.SSE_CLIENT_QUEUE_SIZE,
+            )
+
+
+# One hub per event loop, like the publisher's clients: its subscription and
+# task belong to the loop that started them.
+_hubs: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, EventHub]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_hub() -> EventHub:
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = _hubs[loop] = EventHub()
+    return hub
+
+
+async def close_hub() -> None:
+    """Close the current loop's hub, if one was started."""
+    hub = _hubs.pop(asyncio.get_running_loop(), None)
+    if hub is not None:
+        await hub.close()
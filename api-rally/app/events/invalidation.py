@@ -0,0 +1,113 @@
+"""Drop process-local caches when another process announces a change.
+
+Some hot lookups are cached in process memory: the current event id (see
+app.crud._event_scope), the settings snapshot (see
+app.services.settings_snapshot), resolved principals (see
+app.api.principal_cache), the route graph (see app.services.route_graph) and
+each team's proximity targets (see app.services.proximity_targets). The
+process that changes the underlying row drops its own copy directly and
+publishes an event; the watcher started here drops every other API process's
+copy when that event arrives. Per-team caches drop only the team the event's
+payload names. It listens through the event hub, so it shares
+the process's single Pub/Sub connection with the SSE streams.
+
+Messages missed while Redis is unreachable are not replayed: each cache keeps
+a short TTL that bounds how stale it can get. A standalone worker process
+(``python -m app.workers``) runs no watcher and relies on the TTL alone.
+"""
+
+import asyncio
+import json
+import logging
+import weakref
+from collections.abc import Callable, Iterable
+
+from app.api.principal_cache import forget_principals
+from app.crud._event_scope import invalidate_current_event
+from app.events.channels import Channels
+from app.events.hub import get_hub
+from app.services.proximity_targets import forget_proximity_targets
+from app.services.route_graph import forget_route
+from app.services.settings_snapshot import forget_settings
+
+logger = logging.getLogger(__name__)
+
+# Pause before resubscribing after the hub dropped the watcher.
+_RETRY_SECONDS = 1.0
+
+# Channel -> the caches its events make stale.
+INVALIDATIONS: dict[str, tuple[Callable[[], None], ...]] = {
+    Channels.EVENT_CURRENT_CHANGED: (invalidate_current_event,),
+    Channels.SETTINGS_CHANGED: (forget_settings,),
+    Channels.PRINCIPALS_CHANGED: (forget_principals,),
+    Channels.ROUTE_CHANGED: (forget_route,),
+}
+
+# Channel -> the per-team caches its events make stale, called with the team
+# id from the event's payload (None, meaning every team, when it has none).
+TEAM_INVALIDATIONS: dict[str, tuple[Callable[[int | None], None], ...]] = {
+    Channels.PROGRESS_CHANGED: (forget_proximity_targets,),
+    Channels.ACTIVITY_RESULT_CREATED: (forget_proximity_targets,),
+    Channels.ACTIVITY_RESULT_UPDATED: (forget_proximity_targets,),
+    Channels.ACTIVITY_RESULT_DELETED: (forget_proximity_targets,),
+}
+
+_watchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task[None]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _invalidate(channels: Iterable[str]) -> None:
+    for channel in channels:
+        for invalidate in INVALIDATIONS.get(channel, ()):
+            invalidate()
+        for invalidate_team in TEAM_INVALIDATIONS.get(channel, ()):
+            invalidate_team(None)
+
+
+def _payload_team_id(data: str) -> int | None:
+    try:
+        team_id = json.loads(data)["payload"]["team_id"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    return team_id if isinstance(team_id, int) else None
+
+
+def _invalidate_message(channel: str, data: str) -> None:
+    for invalidate in INVALIDATIONS.get(channel, ()):
+        invalidate()
+    invalidators = TEAM_INVALIDATIONS.get(channel, ())
+    if invalidators:
+        team_id = _payload_team_id(data)
+        for invalidate_team in invalidators:
+            invalidate_team(team_id)
+
+
+async def _watch() -> None:
+    channels = tuple({**INVALIDATIONS, **TEAM_INVALIDATIONS})
+    while True:
+        async with get_hub().subscribe(*channels) as subscription:
+            # Anything cached before this point may have missed a broadcast.
+            _invalidate(channels)
+            async for message in subscription:
+                if message is not None:
+                    _invalidate_message(message.channel, message.data)
+        logger.warning("Cache invalidation watcher fell behind the event hub; resubscribing")
+        await asyncio.sleep(_RETRY_SECONDS)
+
+
+def start_invalidation_watcher() -> None:
+    """Start the running loop's watcher (idempotent)."""
+    loop = asyncio.get_running_loop()
+    task = _watchers.get(loop)
+    if task is None or task.done():
+        _watchers[loop] = loop.create_task(_watch(), name="rally-cache-invalidation")
+
+
+async def stop_invalidation_watcher() -> None:
+    """Stop the running loop's watcher, if it has one."""
+    task = _watchers.pop(asyncio.get_running_loop(), None)
+    if task is None:
+        return
+    task.cancel()
+    await asyncio.wait([task])
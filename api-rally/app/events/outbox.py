@@ -0,0 +1,77 @@
+"""Transactional outbox: stage events in the writer's transaction.
+
+``stage_events`` adds the events a write produced to the session as
+``OutboxEvent`` rows, so they commit (or roll back) with the change itself; the
+outbox relay worker publishes them afterwards. ``relay_outbox`` is that relay's
+unit of work: it takes the oldest pending rows, publishes them in one pipeline
+and deletes them in the same transaction that locked them.
+
+Delivery is at-least-once: a crash between Redis accepting a batch and the
+delete committing publishes the batch again, so consumers must tolerate
+repeats (every worker handler already recomputes from the database). Rows
+are relayed in id order. Writes to one team serialize on its row lock before
+they stage anything, so the events of one aggregate keep their commit order.
+"""
+
+import logging
+from collections.abc import Iterable
+
+import redis.asyncio as aredis
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import record_event_published, record_outbox_relayed
+from app.events.publisher import WireEvent, send_wire_events, serialize_event
+from app.events.schemas import BaseEvent
+from app.models.event_outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+
+def outbox_enabled() -> bool:
+    return settings.EVENTS_ENABLED and settings.EVENTS_OUTBOX
+
+
+def stage_events(db: AsyncSession, events: Iterable[BaseEvent]) -> bool:
+    """Add ``events`` to the session's transaction when the outbox is on.
+
+    Returns False (staging nothing) when it is off: the caller then publishes
+    the events itself after committing, as before.
+    """
+    if not outbox_enabled():
+        return False
+    for event in events:
+        entry = serialize_event(event)
+        db.add(OutboxEvent(event_type=entry.event_type, channel=entry.channel, data=entry.data))
+    return True
+
+
+async def relay_outbox(db: AsyncSession, client: aredis.Redis, *, limit: int) -> int:
+    """Publish and delete up to ``limit`` of the oldest pending events.
+
+    Returns how many were relayed. On a Redis error the rows stay (the
+    transaction is rolled back) and the error propagates.
+    """
+    rows = list(
+        (
+            await db.scalars(
+                select(OutboxEvent).order_by(OutboxEvent.id).limit(limit).with_for_update()
+            )
+        ).all()
+    )
+    if not rows:
+        await db.rollback()
+        return 0
+    entries = [WireEvent(row.event_type, row.channel, row.data) for row in rows]
+    try:
+        await send_wire_events(client, entries)
+    except Exception:
+        await db.rollback()
+        raise
+    await db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_([row.id for row in rows])))
+    await db.commit()
+    for entry in entries:
+        record_event_published(event_type=entry.event_type, outcome="success")
+    record_outbox_relayed(len(entries))
+    return len(entries)
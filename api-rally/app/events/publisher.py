@@ -1,13 +1,31 @@
-"""Async event publisher over Redis Pub/Sub.
+"""Async event publisher over Redis Pub/Sub (and optionally Redis Streams).
+
+With ``EVENTS_TRANSPORT=streams`` each event is also appended to the event
+stream the workers consume (see ``app.events.streams``); the Pub/Sub publish
+is kept for the SSE streams either way.
 
 Events must be published *after* the database commit that produced them, so
 subscribers never observe state that a later rollback would erase.
 
 The publisher is a no-op when ``settings.EVENTS_ENABLED`` is False: callers can
 publish unconditionally without guarding every call site.
+
+Publishing reuses one pooled client per event loop instead of connecting for
+every event. Inside ``batched_events()`` (every mutating API request runs in
+one, see ``app.main``) events are buffered and flushed together in a single
+pipelined round trip when the block exits, after the request's commits.
 """
 
+import asyncio
 import logging
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import redis.asyncio as aredis
 
 from app.core.config import settings
 from app.core.metrics import record_event_published
@@ -15,6 +33,7 @@ from app.core.redis import get_async_redis_client
 from app.events.channels import Channels
 from app.events.exceptions import EventPublishError
 from app.events.schemas import BaseEvent, EventType
+from app.events.streams import append_event, streams_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +43,63 @@ EVENT_TYPE_TO_CHANNEL: dict[EventType, str] = {
     EventType.ACTIVITY_RESULT_UPDATED: Channels.ACTIVITY_RESULT_UPDATED,
     EventType.ACTIVITY_RESULT_DELETED: Channels.ACTIVITY_RESULT_DELETED,
     EventType.TEAM_SCORE_UPDATED: Channels.TEAM_SCORE_UPDATED,
+    EventType.TEAM_SCORES_UPDATED: Channels.TEAM_SCORES_UPDATED,
     EventType.TEAM_CHECKPOINT_ADVANCED: Channels.TEAM_CHECKPOINT_ADVANCED,
+    EventType.TEAM_CREATED: Channels.TEAM_CREATED,
+    EventType.TEAM_UPDATED: Channels.TEAM_UPDATED,
+    EventType.TEAM_DELETED: Channels.TEAM_DELETED,
     EventType.RALLY_STARTED: Channels.RALLY_STARTED,
     EventType.RALLY_ENDED: Channels.RALLY_ENDED,
     EventType.BADGE_AWARDED: Channels.BADGE_AWARDED,
+    EventType.EVENT_CURRENT_CHANGED: Channels.EVENT_CURRENT_CHANGED,
+    EventType.SETTINGS_CHANGED: Channels.SETTINGS_CHANGED,
+    EventType.PRINCIPALS_CHANGED: Channels.PRINCIPALS_CHANGED,
+    EventType.ROUTE_CHANGED: Channels.ROUTE_CHANGED,
+    EventType.PROGRESS_CHANGED: Channels.PROGRESS_CHANGED,
 }
 
 
+# One client (and so one connection pool) per event loop: a pool's connections
+# bind to the loop that opened them, and the app loop and each worker loop
+# differ. Keyed weakly so a loop that dies without a clean shutdown does not
+# pin its client.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aredis.Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class WireEvent(NamedTuple):
+    """An event serialized for Redis, with the channel it goes to."""
+
+    event_type: str
+    channel: str
+    data: str
+
+
+@dataclass
+class _EventBatch:
+    entries: list[WireEvent] = field(default_factory=list)
+    closed: bool = False
+
+
+_batch: ContextVar[_EventBatch | None] = ContextVar("rally_event_batch", default=None)
+
+
+def _client() -> aredis.Redis:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = get_async_redis_client()
+    return client
+
+
+async def close_publisher() -> None:
+    """Close the current loop's publisher client, if it opened one."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 def _channel_for(event: BaseEvent) -> str:
     # use_enum_values=True stores event_type as the raw string value.
     event_type = EventType(event.event_type)
@@ -40,30 +109,76 @@ def _channel_for(event: BaseEvent) -> str:
     return channel
 
 
+def serialize_event(event: BaseEvent) -> WireEvent:
+    return WireEvent(
+        EventType(event.event_type).value, _channel_for(event), event.model_dump_json()
+    )
+
+
+async def send_wire_events(client: aredis.Redis, entries: list[WireEvent]) -> None:
+    """Send serialized events in one pipeline; Redis errors propagate."""
+    async with client.pipeline(transaction=False) as pipe:
+        for entry in entries:
+            if streams_enabled():
+                append_event(pipe, entry.channel, entry.data)
+            pipe.publish(entry.channel, entry.data)
+        await pipe.execute()
+
+
 async def publish_event(event: BaseEvent) -> None:
     """Publish a single event to its channel.
 
-    No-op when the realtime subsystem is disabled. On a Redis/connection error
-    the behaviour follows ``settings.EVENTS_FAIL_SILENTLY``: when True (default)
-    the error is logged and swallowed so a publish failure never breaks the
-    request that already committed its data; when False it raises
-    ``EventPublishError``.
+    No-op when the realtime subsystem is disabled. Inside ``batched_events()``
+    the event is only buffered; it goes out when the batch flushes. On a
+    Redis/connection error the behaviour follows
+    ``settings.EVENTS_FAIL_SILENTLY``: when True (default) the error is logged
+    and swallowed so a publish failure never breaks the request that already
+    committed its data; when False it raises ``EventPublishError``.
     """
     if not settings.EVENTS_ENABLED:
         return
 
-    channel = _channel_for(event)
-    client = get_async_redis_client()
+    entry = serialize_event(event)
+    batch = _batch.get()
+    if batch is not None and not batch.closed:
+        batch.entries.append(entry)
+        return
+    await _flush([entry])
+
+
+@asynccontextmanager
+async def batched_events() -> AsyncIterator[None]:
+    """Buffer the events published inside the block and flush them on exit.
+
+    The flush is one pipelined round trip however many events the block
+    produced. Events are only ever published after their commit, so the
+    buffer is flushed even when the block raises. Anything published after
+    the block (e.g. by a streaming response body) goes out directly.
+    """
+    batch = _EventBatch()
+    token = _batch.set(batch)
+    try:
+        yield
+    finally:
+        _batch.reset(token)
+        batch.closed = True
+        if batch.entries:
+            await _flush(batch.entries)
+
+
+async def _flush(entries: list[WireEvent]) -> None:
     try:
-        await client.publish(channel, event.model_dump_json())
-        logger.debug("Published %s to %s", event.event_type, channel)
-        record_event_published(event_type=str(event.event_type), outcome="success")
+        await send_wire_events(_client(), entries)
     except Exception as exc:  # noqa: BLE001 — publish must not break the caller
-        record_event_published(event_type=str(event.event_type), outcome="failure")
-        msg = f"Failed to publish {event.event_type} to {channel}: {exc}"
+        for entry in entries:
+            record_event_published(event_type=entry.event_type, outcome="failure")
+        names = ", ".join(f"{entry.event_type} to {entry.channel}" for entry in entries)
+        msg = f"Failed to publish {names}: {exc}"
         if settings.EVENTS_FAIL_SILENTLY:
             logger.error(msg)
         else:
             raise EventPublishError(msg) from exc
-    finally:
-        await client.aclose()
+        return
+    for entry in entries:
+        logger.debug("Published %s to %s", entry.event_type, entry.channel)
+        record_event_published(event_type=entry.event_type, outcome="success")
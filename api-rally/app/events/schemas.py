@@ -19,10 +19,19 @@ class EventType(str, Enum):
     ACTIVITY_RESULT_UPDATED = "activity_result.updated"
     ACTIVITY_RESULT_DELETED = "activity_result.deleted"
     TEAM_SCORE_UPDATED = "team.score_updated"
+    TEAM_SCORES_UPDATED = "team.scores_updated"
     TEAM_CHECKPOINT_ADVANCED = "team.checkpoint_advanced"
+    TEAM_CREATED = "team.created"
+    TEAM_UPDATED = "team.updated"
+    TEAM_DELETED = "team.deleted"
     RALLY_STARTED = "rally.started"
     RALLY_ENDED = "rally.ended"
     BADGE_AWARDED = "badge.awarded"
+    EVENT_CURRENT_CHANGED = "event.current_changed"
+    SETTINGS_CHANGED = "settings.changed"
+    PRINCIPALS_CHANGED = "principals.changed"
+    ROUTE_CHANGED = "route.changed"
+    PROGRESS_CHANGED = "progress.changed"
 
 
 class BaseEvent(BaseModel):
@@ -55,6 +64,12 @@ class TeamScoreUpdatedPayload(BaseModel):
     total_score: float
 
 
+class TeamScoresUpdatedPayload(BaseModel):
+    """Payload for team.scores_updated events (one activity-wide rescore)."""
+
+    teams: list[TeamScoreUpdatedPayload]
+
+
 class TeamCheckpointAdvancedPayload(BaseModel):
     """Payload for team.checkpoint_advanced events."""
 
@@ -62,6 +77,12 @@ class TeamCheckpointAdvancedPayload(BaseModel):
     checkpoint_number: int
 
 
+class TeamChangedPayload(BaseModel):
+    """Payload for team.created / team.updated / team.deleted events."""
+
+    team_id: int
+
+
 class RallyLifecyclePayload(BaseModel):
     """Payload for rally.started / rally.ended events."""
 
@@ -77,6 +98,37 @@ class BadgeAwardedPayload(BaseModel):
     checkpoint_id: int | None = None
 
 
+class CurrentEventChangedPayload(BaseModel):
+    """Payload for event.current_changed events (None: no event is current)."""
+
+    event_id: int | None
+
+
+class SettingsChangedPayload(BaseModel):
+    """Payload for settings.changed events."""
+
+    event_id: int
+    version: int | None = None
+
+
+class PrincipalsChangedPayload(BaseModel):
+    """Payload for principals.changed events (user_id None: any user)."""
+
+    user_id: int | None = None
+
+
+class RouteChangedPayload(BaseModel):
+    """Payload for route.changed events."""
+
+    event_id: int | None = None
+
+
+class ProgressChangedPayload(BaseModel):
+    """Payload for progress.changed events."""
+
+    team_id: int
+
+
 # --- Events ---------------------------------------------------------------
 
 
@@ -100,11 +152,31 @@ class TeamScoreUpdatedEvent(BaseEvent):
     payload: TeamScoreUpdatedPayload
 
 
+class TeamScoresUpdatedEvent(BaseEvent):
+    event_type: EventType = EventType.TEAM_SCORES_UPDATED
+    payload: TeamScoresUpdatedPayload
+
+
 class TeamCheckpointAdvancedEvent(BaseEvent):
     event_type: EventType = EventType.TEAM_CHECKPOINT_ADVANCED
     payload: TeamCheckpointAdvancedPayload
 
 
+class TeamCreatedEvent(BaseEvent):
+    event_type: EventType = EventType.TEAM_CREATED
+    payload: TeamChangedPayload
+
+
+class TeamUpdatedEvent(BaseEvent):
+    event_type: EventType = EventType.TEAM_UPDATED
+    payload: TeamChangedPayload
+
+
+class TeamDeletedEvent(BaseEvent):
+    event_type: EventType = EventType.TEAM_DELETED
+    payload: TeamChangedPayload
+
+
 class RallyStartedEvent(BaseEvent):
     event_type: EventType = EventType.RALLY_STARTED
     payload: RallyLifecyclePayload
@@ -118,3 +190,28 @@ class RallyEndedEvent(BaseEvent):
 class BadgeAwardedEvent(BaseEvent):
     event_type: EventType = EventType.BADGE_AWARDED
     payload: BadgeAwardedPayload
+
+
+class CurrentEventChangedEvent(BaseEvent):
+    event_type: EventType = EventType.EVENT_CURRENT_CHANGED
+    payload: CurrentEventChangedPayload
+
+
+class SettingsChangedEvent(BaseEvent):
+    event_type: EventType = EventType.SETTINGS_CHANGED
+    payload: SettingsChangedPayload
+
+
+class PrincipalsChangedEvent(BaseEvent):
+    event_type: EventType = EventType.PRINCIPALS_CHANGED
+    payload: PrincipalsChangedPayload
+
+
+class RouteChangedEvent(BaseEvent):
+    event_type: EventType = EventType.ROUTE_CHANGED
+    payload: RouteChangedPayload
+
+
+class ProgressChangedEvent(BaseEvent):
+    event_type: EventType = EventType.PROGRESS_CHANGED
+    payload: ProgressChangedPayload
@@ -0,0 +1,140 @@
+"""Redis Streams transport for rally events.
+
+With ``EVENTS_TRANSPORT=streams`` the publisher appends every event to one
+stream (``Channels.EVENT_STREAM``, capped at about ``EVENTS_STREAM_MAXLEN``
+entries) as well as publishing it, and workers read the stream instead of
+subscribing. Each worker class reads through its own consumer group, so every
+worker *type* sees every event while the processes running that type share
+them: an event is handled once, however many processes run the worker.
+
+An entry stays pending in its group until the worker acknowledges it after
+handling. Entries a crashed consumer left pending are reclaimed by the next
+consumer of the group once they have been idle for
+``EVENTS_STREAM_CLAIM_IDLE_SECONDS``, so delivery is at-least-once.
+
+SSE clients keep using Pub/Sub: every connection needs every event, which is
+what fan-out is for.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, cast
+
+import redis
+
+from app.core.config import settings
+from app.core.redis import node_id
+from app.events.channels import Channels
+
+logger = logging.getLogger(__name__)
+
+# Entries fetched per XREADGROUP/XAUTOCLAIM call.
+READ_BATCH_SIZE = 100
+
+
+def streams_enabled() -> bool:
+    return settings.EVENTS_TRANSPORT == "streams"
+
+
+def append_event(pipe: Any, channel: str, data: str) -> None:
+    """Queue the XADD for one serialized event on a (sync or async) pipeline.
+
+    Trimming is approximate (``MAXLEN ~``), which lets Redis drop whole
+    macro-nodes instead of paying for an exact cap on every append.
+    """
+    pipe.xadd(
+        Channels.EVENT_STREAM,
+        {"channel": channel, "data": data},
+        maxlen=settings.EVENTS_STREAM_MAXLEN,
+        approximate=True,
+    )
+
+
+@dataclass(frozen=True)
+class StreamEntry:
+    entry_id: str
+    channel: str
+    data: str
+
+
+def _entries(raw: list[Any]) -> tuple[list[StreamEntry], list[str]]:
+    """Split raw ``(id, fields)`` pairs into events and unusable entry ids.
+
+    An entry trimmed away while pending comes back without fields; it can only
+    be acknowledged.
+    """
+    entries: list[StreamEntry] = []
+    unusable: list[str] = []
+    for entry_id, fields in raw:
+        if fields and "channel" in fields and "data" in fields:
+            entries.append(StreamEntry(entry_id, fields["channel"], fields["data"]))
+        else:
+            unusable.append(entry_id)
+    return entries, unusable
+
+
+class StreamConsumer:
+    """Blocking reader of the event stream for one consumer group (worker thread side)."""
+
+    def __init__(self, client: redis.Redis, group: str, consumer: str | None = None):
+        self._client = client
+        self.group = group
+        self.consumer = consumer or node_id()
+
+    def ensure_group(self) -> None:
+        """Create the group (and the stream) if missing.
+
+        A new group starts at the stream's end: it handles events published
+        from now on, not the backlog other groups already handled.
+        """
+        try:
+            self._client.xgroup_create(Channels.EVENT_STREAM, self.group, id="$", mkstream=True)
+            logger.info("Created consumer group %s on %s", self.group, Channels.EVENT_STREAM)
+        except redis.ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    def read(self, timeout: float) -> list[StreamEntry]:
+        """New entries for this consumer, waiting up to ``timeout`` seconds."""
+        # BLOCK 0 would wait forever; no BLOCK at all returns at once.
+        block = max(1, int(timeout * 1000)) if timeout > 0 else None
+        response = cast(
+            "list[Any] | None",
+            self._client.xreadgroup(
+                self.group,
+                self.consumer,
+                {Channels.EVENT_STREAM: ">"},
+                count=READ_BATCH_SIZE,
+                block=block,
+            ),
+        )
+        entries: list[StreamEntry] = []
+        for _stream, raw in response or []:
+            batch, unusable = _entries(raw)
+            entries.extend(batch)
+            self.ack(unusable)
+        return entries
+
+    def reclaim(self, min_idle_seconds: float) -> list[StreamEntry]:
+        """Take over entries any consumer of the group left pending that long."""
+        entries: list[StreamEntry] = []
+        start = "0-0"
+        while True:
+            # [next start, entries] (+ [deleted ids] on Redis >= 7).
+            start, raw, *_deleted = self._client.xautoclaim(
+                Channels.EVENT_STREAM,
+                self.group,
+                self.consumer,
+                min_idle_time=int(min_idle_seconds * 1000),
+                start_id=start,
+                count=READ_BATCH_SIZE,
+            )
+            batch, unusable = _entries(raw)
+            entries.extend(batch)
+            self.ack(unusable)
+            if start == "0-0":
+                return entries
+
+    def ack(self, entry_ids: list[str]) -> None:
+        if entry_ids:
+            self._client.xack(Channels.EVENT_STREAM, self.group, *entry_ids)
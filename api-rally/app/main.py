@@ -13,22 +13,17 @@ from loguru import logger
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.api.api import api_v1_router
+from app.api.oidc import jwt_validator
 from app.core.config import settings
 from app.core.exceptions import RallyError
 from app.core.logging import bind_request_context, init_logging
 from app.core.metrics import record_request, registry
 from app.core.observability import init_sentry
-from app.core.redis import close_pools
+from app.core.redis import close_async_pool, close_pools
 from app.db.init_db import init_db
-from app.workers import (
-    BadgesWorker,
-    BaseWorker,
-    LeaderboardWorker,
-    ScoringWorker,
-    clear_workers,
-    get_workers,
-    register_worker,
-)
+from app.events import batched_events, close_hub, close_publisher
+from app.events.invalidation import start_invalidation_watcher, stop_invalidation_watcher
+from app.workers import get_workers, start_workers, stop_workers
 
 
 @asynccontextmanager
@@ -36,33 +31,31 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     """Application startup/shutdown.
 
     Startup: logging, schema bootstrap and (when the realtime subsystem is
-    enabled) the background workers. Shutdown: stop workers and close Redis.
+    enabled and they are not run by ``python -m app.workers``) the background
+    workers. Shutdown: stop workers and close Redis and the OIDC HTTP client.
     """
     init_logging()
     init_sentry()  # no-op unless SENTRY_DSN is configured
     await init_db()
 
-    if settings.EVENTS_ENABLED:
-        worker_classes: list[type[BaseWorker]] = [LeaderboardWorker, BadgesWorker]
-        # The scoring worker only earns its keep when recompute is deferred off
-        # the request path; otherwise routes already recompute inline and it
-        # would just duplicate the work.
-        if settings.RECOMPUTE_OFF_PATH:
-            worker_classes.append(ScoringWorker)
-        for worker_cls in worker_classes:
-            worker = worker_cls()
-            worker.start(background=True)
-            register_worker(worker)
+    if settings.EVENTS_ENABLED and settings.WORKERS_EMBEDDED:
+        start_workers()
         logger.info("Realtime subsystem enabled: started {} worker(s)", len(get_workers()))
 
+    if settings.EVENTS_ENABLED:
+        start_invalidation_watcher()
+
     try:
         yield
     finally:
-        for worker in get_workers():
-            worker.stop()
-        clear_workers()
+        stop_workers()
         if settings.EVENTS_ENABLED:
+            await stop_invalidation_watcher()
+            await close_hub()
+            await close_publisher()
             close_pools()
+        await close_async_pool()
+        await jwt_validator.aclose()
 
 
 def _generate_unique_id(route: APIRoute) -> str:
@@ -162,6 +155,24 @@ async def request_id_and_timing(request: Request, call_next):  # type: ignore[no
     return response
 
 
+# Methods that can write, and so publish events worth batching.
+_MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@app.middleware("http")
+async def batch_published_events(request: Request, call_next):  # type: ignore[no-untyped-def]
+    """Flush the events a write request published in one Redis round trip.
+
+    A scoring write can publish several events (results, team scores, ...);
+    batching them costs one pipelined send after the handler instead of one
+    per event.
+    """
+    if request.method not in _MUTATING_METHODS:
+        return await call_next(request)
+    async with batched_events():
+        return await call_next(request)
+
+
 @app.middleware("http")
 async def security_headers(request: Request, call_next):  # type: ignore[no-untyped-def]
     """Attach baseline security response headers.
@@ -10,6 +10,7 @@ from app.models.checkpoint_media import CheckpointMedia, MediaKind
 from app.models.checkpoint_skip import CheckpointSkip
 from app.models.dynamic_scoring import DynamicAward, DynamicRule
 from app.models.evaluation_history import EvaluationAction, EvaluationHistory
+from app.models.event_outbox import OutboxEvent
 from app.models.idempotency_key import IdempotencyKey
 from app.models.participation import EventParticipation
 from app.models.push_subscription import PushSubscription
@@ -17,6 +18,7 @@ from app.models.rally_guide_assignment import RallyGuideAssignment
 from app.models.rally_settings import RallySettings
 from app.models.rally_staff_assignment import RallyStaffAssignment
 from app.models.route_stage import RouteStage
+from app.models.score_ledger import LedgerSource, ScoreLedgerEntry
 from app.models.team import Team
 from app.models.user import User
 
@@ -49,4 +51,7 @@ __all__ = [
     "EvaluationAction",
     "IdempotencyKey",
     "AuditLog",
+    "LedgerSource",
+    "ScoreLedgerEntry",
+    "OutboxEvent",
 ]
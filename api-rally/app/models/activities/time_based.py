@@ -2,6 +2,8 @@
 Time-based activities for Rally extension
 """
 
+from bisect import bisect_left
+from collections.abc import Callable
 from typing import Any
 
 from app.models.activities.base import BaseActivity
@@ -31,44 +33,53 @@ class TimeBasedActivity(BaseActivity):
 
     def calculate_relative_ranking_score(self, team_times: list[float], team_time: float) -> float:
         """Calculate score based on relative ranking among all teams"""
-        if not team_times or team_time not in team_times:
-            return 0
+        return self.relative_ranking_scorer(team_times)(team_time)
+
+    def relative_ranking_scorer(self, team_times: list[float]) -> Callable[[float], float]:
+        """Return a scorer that ranks any time against ``team_times``.
 
+        The times are sorted once and every call is a bisect, so rescoring a
+        whole activity is O(n log n) instead of re-sorting per result.
+        """
         # Sort times (fastest first) and handle ties properly
         sorted_times = sorted(team_times)
-
-        # Count how many times are better (faster) than the current team's time
-        # This handles ties correctly by treating equal times as the same rank
-        better_times_count = sum(1 for time in sorted_times if time < team_time)
-
-        # Rank is 1-based: how many teams are better + 1
-        rank = better_times_count + 1
-
-        total_teams = len(team_times)
+        total_teams = len(sorted_times)
 
         # Get config values
         max_points = self.config.get("max_points", 100)
         min_points = self.config.get("min_points", 10)
 
-        if total_teams == 1:
-            return float(max_points)
-
-        # Calculate score based on ranking
-        # 1st place gets max_points, last place gets min_points
-        # Others are distributed proportionally
-        # Teams with identical times get the same rank and score.
-        # Detect last place by the slowest time, not rank == total_teams:
-        # when several teams tie for last, none of them reaches that rank, so
-        # the rank check would wrongly deny them min_points.
-        slowest_time = sorted_times[-1]
-        if rank == 1:
-            return float(max_points)
-        if team_time == slowest_time:
-            return float(min_points)
-        # Linear interpolation between max and min
-        score_range = float(max_points) - float(min_points)
-        position_ratio = (rank - 1) / (total_teams - 1)
-        return float(max_points) - (score_range * position_ratio)
+        def score(team_time: float) -> float:
+            # Count how many times are better (faster) than the current team's
+            # time. bisect_left stops before equal times, so ties share a rank.
+            better_times_count = bisect_left(sorted_times, team_time)
+            if better_times_count == total_teams or sorted_times[better_times_count] != team_time:
+                return 0
+
+            if total_teams == 1:
+                return float(max_points)
+
+            # Rank is 1-based: how many teams are better + 1
+            rank = better_times_count + 1
+
+            # Calculate score based on ranking
+            # 1st place gets max_points, last place gets min_points
+            # Others are distributed proportionally
+            # Teams with identical times get the same rank and score.
+            # Detect last place by the slowest time, not rank == total_teams:
+            # when several teams tie for last, none of them reaches that rank, so
+            # the rank check would wrongly deny them min_points.
+            slowest_time = sorted_times[-1]
+            if rank == 1:
+                return float(max_points)
+            if team_time == slowest_time:
+                return float(min_points)
+            # Linear interpolation between max and min
+            score_range = float(max_points) - float(min_points)
+            position_ratio = (rank - 1) / (total_teams - 1)
+            return float(max_points) - (score_range * position_ratio)
+
+        return score
 
     async def validate_result(
         self, result_data: dict[str, Any], team_id: int | None = None, db_session: Any = None
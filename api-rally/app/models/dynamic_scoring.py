@@ -3,7 +3,7 @@
 DynamicRule  — configurable per-event scoring rules (not yet auto-evaluated;
                stored for future evaluator automation and visible in admin UI).
 DynamicAward — one-off manual bonus/penalty applied by admin to a team.
-               Picked up by ScoringService.update_team_scores().
+               Folded into the score ledger by ScoringService.record_award().
 """
 
 from typing import Any
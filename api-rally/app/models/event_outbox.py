@@ -0,0 +1,35 @@
+"""Transactional outbox for domain events.
+
+With ``EVENTS_OUTBOX`` on, a write stages the events it produces as rows of
+this table in its own transaction, instead of publishing them to Redis after
+the commit: the events become durable exactly when the change does, and a
+Redis outage or a crash right after the commit can no longer drop them. The
+outbox relay worker (``app.workers.worker_outbox``) publishes pending rows in
+id order and deletes them once Redis has accepted them.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.config import settings
+from app.models.base import Base
+
+
+class OutboxEvent(Base):
+    """One serialized event waiting to be published."""
+
+    __tablename__ = "event_outbox"
+    __table_args__: Any = {"schema": settings.SCHEMA_NAME}
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    channel: Mapped[str] = mapped_column(String(128), nullable=False)
+    # The event envelope exactly as it goes on the wire (``model_dump_json``).
+    data: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,65 @@
+"""Append-only score ledger.
+
+Every scoring fact — an activity result's final score, a dynamic award (manual
+bonus, hint charge, skip forfeit, leg-time adjustment) — is recorded as the
+signed change it made to its team's score. The rows for one fact sum to its
+current contribution; the rows for one team sum to its unrounded total, which
+the team carries as a running ``Team.ledger_total`` so a score write applies a
+delta instead of re-summing every result.
+
+Each row also carries a ``count_delta`` (+1 when the fact starts counting on
+its checkpoint, -1 when it stops), so the ledger knows which checkpoints a
+team has scored on even when the points there add up to 0.
+
+Rows are never mutated or deleted: a changed or revoked fact appends a
+correcting delta. That also makes the ledger a ready-made score-over-time
+series for a team.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.config import settings
+from app.models.base import Base
+
+
+class LedgerSource(str, Enum):
+    """Which kind of fact a ledger row belongs to. String-valued for DB storage."""
+
+    ACTIVITY_RESULT = "activity_result"
+    AWARD = "award"
+
+
+class ScoreLedgerEntry(Base):
+    """One signed score delta for a team."""
+
+    __tablename__ = "score_ledger"
+    __table_args__: Any = (
+        Index("ix_score_ledger_fact", "source", "source_id"),
+        {"schema": settings.SCHEMA_NAME},
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    team_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(f"{settings.SCHEMA_NAME}.teams.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    source: Mapped[str] = mapped_column(String(32), nullable=False)
+    # Id of the result/award row. Not a foreign key: the fact may be deleted
+    # later, and its history (plus the delta that zeroed it) must survive.
+    source_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Checkpoint the points count towards (``score_per_checkpoint``); NULL for
+    # awards, which only move the total. Not a foreign key for the same reason.
+    checkpoint_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    delta: Mapped[float] = mapped_column(Float, nullable=False)
+    count_delta: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
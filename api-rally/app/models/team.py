@@ -1,9 +1,18 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.config import settings
@@ -63,6 +72,18 @@ class Team(Base):
     skips: Mapped[list[int]] = mapped_column(MutableList.as_mutable(ARRAY(Integer)), default=list)
 
     total: Mapped[int] = mapped_column(default=0)
+    # Running sums of the score ledger (see app.models.score_ledger): the
+    # unrounded total and, keyed by checkpoint id, the points and the number of
+    # counted facts on each checkpoint ({"points": float, "facts": int}). A
+    # checkpoint holds a ``score_per_checkpoint`` slot while it has facts, even
+    # at 0 points. ``total`` and ``score_per_checkpoint`` are derived from these
+    # whenever a delta is applied.
+    ledger_total: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default="0"
+    )
+    checkpoint_totals: Mapped[dict[str, dict[str, float]]] = mapped_column(
+        MutableDict.as_mutable(JSON), nullable=False, default=dict, server_default="{}"
+    )
     classification: Mapped[int] = mapped_column(default=-1)
 
     members: Mapped[list[User]] = relationship()
@@ -4,11 +4,18 @@ from pydantic import BaseModel
 
 
 class WorkerHealth(BaseModel):
-    """Liveness of one background worker."""
+    """Liveness of one background worker.
+
+    ``active`` is False for an instance standing by while another node holds
+    the worker's leader lease; ``leader`` names that node and is absent when
+    the worker runs without an election.
+    """
 
     name: str
     alive: bool
     last_beat: float
+    active: bool = True
+    leader: str | None = None
 
 
 class Readiness(BaseModel):
@@ -16,12 +23,14 @@ class Readiness(BaseModel):
 
     ``redis`` is absent when the realtime subsystem is disabled, in which case
     no Redis connection is expected and its state says nothing about
-    readiness.
+    readiness. ``node`` identifies this process, to compare against the
+    workers' ``leader``.
     """
 
     status: str
     db: str
     redis: str | None = None
+    node: str
     workers: list[WorkerHealth]
 
 
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, field_validator
@@ -333,3 +333,29 @@ class RallySettingsResponse(RallySettingsBase):
     logo_url: str = ""
     favicon_url: str = ""
     rules_pdf_url: str = ""
+
+
+class RallySettingsSnapshot(RallySettingsResponse):
+    """Read-only view of one event's settings, as served by the snapshot cache.
+
+    Built without writing anything (see app.services.settings_snapshot): the
+    home/ticker normalization runs in the validators above and the timing and
+    event type are copied from the event. ``id`` is None when the event has no
+    settings row yet and the snapshot carries the bootstrap defaults.
+    ``version`` is bumped by every settings write.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int | None = None
+    event_id: int
+    version: int = 0
+
+    @field_validator("rally_start_time", "rally_end_time")
+    @classmethod
+    def _assume_utc(cls, value: datetime | None) -> datetime | None:
+        # Copied off the event as loaded, not read back from the timestamptz
+        # column, so a naive value assigned in this session shows up as is; UTC.
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
@@ -14,6 +14,7 @@ from app.crud.crud_activity import CRUDActivity
 from app.models.activity import Activity
 from app.models.activity_factory import ActivityFactory
 from app.schemas.activity import ActivityCreate, ActivityRanking, TeamRanking
+from app.services.route_graph import route_changed
 
 
 class ActivityService:
@@ -39,7 +40,9 @@ class ActivityService:
             raise RallyValidationError("Invalid activity type") from e
 
         activity_in.config = {**default_config, **activity_in.config}
-        return await self._activity_crud.create(db=self._db, obj_in=activity_in)
+        created = await self._activity_crud.create(db=self._db, obj_in=activity_in)
+        await route_changed()
+        return created
 
     @staticmethod
     def build_activity_ranking(
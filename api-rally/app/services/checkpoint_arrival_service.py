@@ -15,15 +15,16 @@ from app.api.api_v1.staff_evaluation_utils import checkin_team_to_checkpoint
 from app.core.exceptions import RallyNotFoundError, RallyValidationError
 from app.crud import crud_activity
 from app.crud.crud_checkpoint import CRUDCheckPoint
-from app.crud.crud_rally_settings import rally_settings
 from app.crud.crud_team import CRUDTeam
 from app.models.checkpoint_arrival import CheckpointArrival
 from app.models.dynamic_scoring import DynamicAward
-from app.models.rally_settings import RallySettings
+from app.schemas.rally_settings import RallySettingsSnapshot
 from app.services.checkin_service import require_same_event
 from app.services.leg_time_service import leg_time_points
+from app.services.proximity_targets import team_progress_changed
 from app.services.route_progress import can_reach_checkpoint, closed_message, hours_block_reason
 from app.services.scoring_service import ScoringService
+from app.services.settings_snapshot import current_settings
 from app.services.team_service import validate_rally_timing
 from app.utils.geo import distance_m
 
@@ -75,7 +76,7 @@ class CheckpointArrivalService:
         team_obj = await self._team_crud.get(db=self._db, id=team_id)
         require_same_event(team_obj.event_id, checkpoint.event_id)
 
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         validate_rally_timing(
             settings,
             datetime.now(UTC),
@@ -127,6 +128,7 @@ class CheckpointArrivalService:
             # Lost a race against a concurrent arrival for the same pair.
             await self._db.rollback()
             return None
+        await team_progress_changed(team_id)
         # arrived_at is a server_default, only populated on the DB side.
         await self._db.refresh(arrival)
         return arrival
@@ -138,7 +140,7 @@ class CheckpointArrivalService:
         checkpoint_id: int,
         arrived_at: datetime,
         event_id: int | None,
-        settings: RallySettings,
+        settings: RallySettingsSnapshot,
     ) -> None:
         """Score the leg between a team's previous arrival and this one, if
         leg-time scoring is on. Best-effort: a failure here must never fail
@@ -169,17 +171,15 @@ class CheckpointArrivalService:
             )
             if points == 0:
                 return
-            self._db.add(
-                DynamicAward(
-                    team_id=team_id,
-                    event_id=event_id,
-                    points=points,
-                    reason=f"Tempo de percurso até ao posto #{checkpoint_id}",
-                    is_active=True,
-                )
+            award = DynamicAward(
+                team_id=team_id,
+                event_id=event_id,
+                points=points,
+                reason=f"Tempo de percurso até ao posto #{checkpoint_id}",
+                is_active=True,
             )
-            await self._db.commit()
-            await ScoringService(self._db).update_team_scores(team_id)
+            self._db.add(award)
+            await ScoringService(self._db).record_award(award)
         except Exception as exc:
             logger.warning(
                 f"Leg-time scoring failed for team {team_id} at checkpoint {checkpoint_id}: {exc}"
@@ -211,7 +211,7 @@ class CheckpointArrivalService:
         # does to a staff evaluation. Checking before the insert (rather than
         # relying on the auto-advance path further down) keeps a pre-event or
         # post-event scan out of the arrivals table and the audit log entirely.
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         validate_rally_timing(
             settings,
             datetime.now(UTC),
@@ -295,7 +295,7 @@ class CheckpointArrivalService:
         # add_checkpoint's own validation (same predicate) so the guard tracks the
         # `checkpoint_order_matters` setting instead of assuming strict order —
         # under free-order routes every no-activity post would otherwise stay stuck.
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         if not await can_reach_checkpoint(
             self._db, team=team_obj, checkpoint=checkpoint_obj, settings=settings
         ):
@@ -15,7 +15,6 @@ from app.api.deps import is_admin_or_staff
 from app.core.exceptions import RallyForbiddenError, RallyNotFoundError
 from app.crud.crud_checkpoint import CRUDCheckPoint
 from app.crud.crud_checkpoint_media import CRUDCheckpointMedia
-from app.crud.crud_rally_settings import rally_settings
 from app.models.checkpoint_media import CheckpointMedia, MediaKind
 from app.schemas.checkpoint_media import (
     CheckpointMediaCreate,
@@ -26,6 +25,7 @@ from app.schemas.team_auth import TeamTokenData
 from app.schemas.user import DetailedUser
 from app.services.checkpoint_service import CheckpointService
 from app.services.image_upload import ALLOWED_PHOTO_CONTENT_TYPES, validate_and_store
+from app.services.settings_snapshot import current_settings
 
 MEDIA_NOT_FOUND = "Media not found"
 
@@ -87,7 +87,7 @@ class CheckpointMediaService:
         public follow the same rules as the checkpoint map.
         """
         await self._checkpoint_or_404(checkpoint_id)
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
 
         if curr_user and is_admin_or_staff(getattr(curr_user, "scopes", [])):
             allowed = True
@@ -12,6 +12,7 @@ from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.api.principal_cache import principals_changed
 from app.core.exceptions import RallyValidationError
 from app.crud.crud_checkpoint import CRUDCheckPoint
 from app.crud.crud_team import CRUDTeam
@@ -27,6 +28,7 @@ from app.schemas.checkpoint import (
 )
 from app.schemas.team import ListingTeam
 from app.services.checkpoint_planning import missing_fields
+from app.services.route_graph import route_changed
 from app.services.route_progress import load_stages, resolved_checkpoint_orders
 from app.services.route_stages import is_reachable_in_stages
 from app.services.team_service import TeamService
@@ -463,6 +465,7 @@ class CheckpointService:
         checkpoint.is_draft = is_draft
         await self._db.flush()
         await self._checkpoint_crud.resequence(self._db, commit=True)
+        await route_changed()
         await self._db.refresh(checkpoint)
         return AdminCheckPoint.model_validate(checkpoint)
 
@@ -481,3 +484,6 @@ class CheckpointService:
         )
         await self._checkpoint_crud.remove(db=self._db, id=checkpoint_id, commit=False)
         await self._db.commit()
+        await route_changed()
+        # Staff assigned here may still have this checkpoint cached.
+        await principals_changed()
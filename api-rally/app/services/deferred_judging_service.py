@@ -9,12 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import RallyForbiddenError, RallyNotFoundError, RallyValidationError
 from app.crud.crud_activity import activity_result as crud_result
-from app.crud.crud_rally_settings import rally_settings
 from app.crud.crud_team import CRUDTeam
 from app.models.activity import Activity, ActivityResult
 from app.models.team import Team
 from app.services.ranking import linear_rank_points
 from app.services.scoring_service import ScoringService
+from app.services.settings_snapshot import current_settings
 
 
 class DeferredJudgingService:
@@ -137,7 +137,7 @@ class DeferredJudgingService:
         the result's own media_urls (already stored in R2) to prevent staff
         from pointing a team's photo at an arbitrary URL.
         """
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         if not settings.allow_photo_as_team_photo:
             raise RallyForbiddenError("Setting a team photo from an activity photo is disabled")
 
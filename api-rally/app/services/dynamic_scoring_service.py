@@ -70,18 +70,16 @@ class DynamicScoringService:
             is_active=True,
         )
         self._db.add(award)
-        await self._db.commit()
+        # The award and the team's new score commit together, so the
+        # leaderboard reflects it immediately.
+        await ScoringService(self._db).record_award(award)
         await self._db.refresh(award)
-        # Trigger score recalculation so leaderboard reflects immediately.
-        await ScoringService(self._db).update_team_scores(team_id)
         return award
 
     async def delete_award(self, award_id: int) -> None:
         award = await self._db.get(DynamicAward, award_id)
         if not award:
             raise RallyNotFoundError(AWARD_NOT_FOUND)
-        team_id = award.team_id
         award.is_active = False
-        await self._db.commit()
-        # Recompute score now that the award is gone.
-        await ScoringService(self._db).update_team_scores(team_id)
+        # Revoking appends the award's negated points to the score ledger.
+        await ScoringService(self._db).record_award(award)
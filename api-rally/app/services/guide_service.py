@@ -10,15 +10,15 @@ from sqlalchemy.orm import selectinload
 
 from app.core.exceptions import RallyForbiddenError
 from app.crud.crud_activity import rally_event
-from app.crud.crud_checkpoint import checkpoint as checkpoint_crud
-from app.crud.crud_rally_settings import rally_settings
 from app.models.activity import EventType
 from app.models.checkpoint import CheckPoint
 from app.models.checkpoint_arrival import CheckpointArrival
 from app.models.checkpoint_hint_reveal import CheckpointHintReveal
 from app.models.rally_guide_assignment import RallyGuideAssignment
 from app.models.team import Team
-from app.services.route_progress import resolved_checkpoint_orders
+from app.services.route_graph import RoutePost, route_graph
+from app.services.route_progress import resolved_checkpoint_orders, teams_progress
+from app.services.settings_snapshot import current_settings
 
 
 class GuideService:
@@ -46,7 +46,7 @@ class GuideService:
         """
         event = await rally_event.get_current(self._db)
 
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         guide_mode_on = settings.guide_mode_enabled and settings.guide_mode_active
         is_peddy_paper = event is not None and event.event_type == EventType.PEDDY_PAPER.value
         if not guide_mode_on and not is_peddy_paper:
@@ -99,8 +99,10 @@ class GuideService:
                 return cp.id
         return None
 
-    async def _team_progress(self, user_id: int) -> tuple[list[CheckPoint] | None, frozenset[int]]:
-        """This guide's team's ordered checkpoints and resolved orders, or
+    async def _team_progress(
+        self, user_id: int
+    ) -> tuple[tuple[RoutePost, ...] | None, frozenset[int]]:
+        """This guide's team's ordered posts and resolved orders, or
         ``(None, frozenset())`` when the guide has no team assigned."""
         team_id = await self.assigned_team_id(user_id)
         if team_id is None:
@@ -109,10 +111,10 @@ class GuideService:
         if team is None:
             return None, frozenset()
 
-        checkpoints = list(await checkpoint_crud.get_all_ordered(self._db))
-        if not checkpoints:
+        graph = await route_graph(self._db)
+        if not graph.posts:
             return None, frozenset()
-        return checkpoints, await resolved_checkpoint_orders(self._db, team)
+        return graph.posts, await resolved_checkpoint_orders(self._db, team)
 
     async def accessible_checkpoint_ids(self, user_id: int) -> set[int]:
         """Checkpoints this guide may act on right now: their team's current
@@ -155,7 +157,10 @@ class GuideService:
         The hint state is the point: a team can unlock the guide indications in
         the app, paying points for each. Without this the guide reads out a
         hint the team already paid for — the same words, for free, seconds
-        later. Sorted by arrival so the guide sees who turned up first.
+        later. Each team also carries where it stands on the route and which
+        of its current post's activities are still open, computed for every
+        team in one batch. Sorted by arrival so the guide sees who turned up
+        first.
         """
         stmt = (
             select(CheckpointArrival, Team)
@@ -174,6 +179,7 @@ class GuideService:
         revealed_by_team: dict[int, set[int]] = {}
         for reveal in (await self._db.scalars(reveals_stmt)).all():
             revealed_by_team.setdefault(reveal.team_id, set()).add(reveal.indication_id)
+        progress = await teams_progress(self._db, [team for _, team in rows])
 
         return [
             {
@@ -184,6 +190,8 @@ class GuideService:
                 # rather than a GPS fix.
                 "arrived_by_guide": arrival.latitude is None and arrival.longitude is None,
                 "revealed_indication_ids": sorted(revealed_by_team.get(team.id, set())),
+                "current_checkpoint_number": progress[team.id].current_order,
+                "pending_activity_ids": list(progress[team.id].pending_activity_ids),
             }
             for arrival, team in rows
         ]
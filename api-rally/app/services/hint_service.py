@@ -14,7 +14,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import RallyNotFoundError, RallyValidationError
 from app.crud import crud_activity
 from app.crud.crud_checkpoint import CRUDCheckPoint
-from app.crud.crud_rally_settings import rally_settings
 from app.crud.crud_team import CRUDTeam
 from app.models.checkpoint_guide_indication import CheckpointGuideIndication
 from app.models.checkpoint_hint_reveal import CheckpointHintReveal
@@ -23,6 +22,7 @@ from app.schemas.hint import HintReveal, RevealedHint, TeamHints, TeamHintSummar
 from app.services.checkin_service import require_same_event
 from app.services.route_progress import can_reach_checkpoint
 from app.services.scoring_service import ScoringService
+from app.services.settings_snapshot import current_settings
 
 HINTS_DISABLED = "Hints are not enabled for this event"
 NO_HINTS_LEFT = "No hints left for this checkpoint"
@@ -98,7 +98,7 @@ class HintService:
         # Cross-edition guard, same rule the check-in paths apply.
         require_same_event(team.event_id, checkpoint.event_id)
 
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         # Under a free-choice stage several posts are reachable at once, and
         # hints for any of them are fair: the team really is choosing between
         # them. Opening hours do not apply — the riddle is theirs to solve
@@ -128,7 +128,7 @@ class HintService:
             for reveal in reveals
             if reveal.indication_id in by_id
         ]
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         # With the mechanic off, hints already bought stay readable — the team
         # paid for them — but nothing is left to buy.
         enabled = bool(getattr(settings, "hints_enabled", True))
@@ -141,7 +141,7 @@ class HintService:
 
     async def reveal_next(self, *, team_id: int, checkpoint_id: int) -> HintReveal:
         """Unlock the next hint in the ladder and charge the team for it."""
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         if not getattr(settings, "hints_enabled", True):
             raise RallyValidationError(HINTS_DISABLED)
         await self._require_current_checkpoint(team_id, checkpoint_id)
@@ -156,7 +156,7 @@ class HintService:
             raise RallyValidationError(NO_HINTS_LEFT)
 
         indication = remaining[0]
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         cost = int(settings.hint_penalty or 0)
 
         reveal = CheckpointHintReveal(
@@ -177,13 +177,11 @@ class HintService:
             return await self._hint_already_owned(team_id, checkpoint_id, indication)
 
         if cost != 0:
-            await self._charge(team_id=team_id, cost=cost, indication=indication)
-
-        await self._db.commit()
-        if cost != 0:
-            # Fold the award into team.total (which ScoringService recomputes
-            # from scratch — hence the award row rather than a direct += ).
-            await ScoringService(self._db).update_team_scores(team_id)
+            award = await self._charge(team_id=team_id, cost=cost, indication=indication)
+            # One commit lands the reveal, its charge and the team's new total.
+            await ScoringService(self._db).record_award(award)
+        else:
+            await self._db.commit()
 
         return HintReveal(
             checkpoint_id=checkpoint_id,
@@ -208,20 +206,21 @@ class HintService:
 
     async def _charge(
         self, *, team_id: int, cost: int, indication: CheckpointGuideIndication
-    ) -> None:
+    ) -> DynamicAward:
         """Bill the hint as a DynamicAward.
 
-        team.total is recomputed from activity results plus active awards, so a
-        direct decrement would be erased by the next recompute. An award row is
-        also visible to admins and revocable if a hint turns out to be broken.
+        team.total is the sum of activity results plus active awards (the score
+        ledger's facts), so a direct decrement would be erased by the next
+        reconciliation. An award row is also visible to admins and revocable if
+        a hint turns out to be broken.
         """
         event = await crud_activity.rally_event.get_current(self._db)
-        self._db.add(
-            DynamicAward(
-                team_id=team_id,
-                event_id=event.id if event else None,
-                points=float(cost),
-                reason=f"Pista revelada (indicação #{indication.order + 1})"[:256],
-                is_active=True,
-            )
+        award = DynamicAward(
+            team_id=team_id,
+            event_id=event.id if event else None,
+            points=float(cost),
+            reason=f"Pista revelada (indicação #{indication.order + 1})"[:256],
+            is_active=True,
         )
+        self._db.add(award)
+        return award
@@ -1,9 +1,21 @@
 """Redis-backed cache for the global team leaderboard.
 
-The worker recomputes the ranking from Postgres and stores the rendered list
-here; the scoreboard endpoint and the SSE stream read it back. Storing the full
-rendered ranking (not just scores) keeps reads a single GET and matches the
-shape the API already returns.
+The standings live in a sorted set (team id -> total score) next to a hash of
+the per-team display fields (name, completed-activity count). The worker seeds
+both from Postgres once and then keeps them current one team at a time, so a
+score change costs a ``ZADD`` instead of a full re-rank. Reads render the same
+row shape the API already returns, with "1224" competition ranks derived from
+the sorted set (``ZREVRANGE`` for the slice, ``ZCOUNT`` for the first row's
+rank), which also makes top-N and "window around team X" reads cheap. Ties
+come back in the SQL ranking's order (team id ascending), so a warm read and
+a cold recompute list the same teams in the same order.
+
+Every change the worker applies is also recorded as a versioned delta (the
+teams whose row changed, with their new total and rank, plus the teams that
+left the board). The version is a counter bumped per delta; the last few
+deltas are kept in a capped list so an SSE client that reconnects can replay
+what it missed instead of refetching the board. A separate rankings version
+counts every applied scoring change and backs the ranking ETags.
 
 All functions take an async Redis client so they stay trivially testable and
 free of global state.
@@ -11,32 +23,311 @@ free of global state.
 
 import json
 import logging
-from typing import Any
+from typing import Any, cast
 
 import redis.asyncio as aredis
+from redis.exceptions import WatchError
 
 logger = logging.getLogger(__name__)
 
-GLOBAL_LEADERBOARD_KEY = "rally:leaderboard:global"
+# Sorted set: member = team id, score = total score.
+GLOBAL_SCORES_KEY = "rally:leaderboard:global:scores"
+# Hash: field = team id, value = JSON {"team_name", "activities_completed"}.
+GLOBAL_TEAMS_KEY = "rally:leaderboard:global:teams"
+# Counter: version of the standings, bumped with every recorded delta.
+GLOBAL_VERSION_KEY = "rally:leaderboard:global:version"
+# List: JSON deltas, newest first, capped at the configured history length.
+GLOBAL_DELTAS_KEY = "rally:leaderboard:global:deltas"
+# Counter: bumped after every scoring change, whether or not it moved the
+# global board (an activity ranking can change on its own). ETag source.
+RANKINGS_VERSION_KEY = "rally:leaderboard:rankings:version"
+# String: token of the process recomputing a cold board from Postgres.
+RECOMPUTE_LOCK_KEY = "rally:leaderboard:global:recompute"
+# Lock lifetime; only matters if its holder dies before releasing it.
+RECOMPUTE_LOCK_SECONDS = 30
+
+
+def _meta_json(entry: dict[str, Any]) -> str:
+    return json.dumps(
+        {
+            "team_name": entry.get("team_name"),
+            "activities_completed": entry.get("activities_completed", 0),
+        }
+    )
+
+
+def _entry_score(entry: dict[str, Any]) -> float:
+    score = entry.get("total_score")
+    return float(score) if score is not None else 0.0
 
 
 async def write_global_leaderboard(client: aredis.Redis, ranking: list[dict[str, Any]]) -> None:
-    """Store the rendered global ranking as a JSON blob."""
-    await client.set(GLOBAL_LEADERBOARD_KEY, json.dumps(ranking))
+    """Replace the cached standings with a freshly computed global ranking.
+
+    Runs as one MULTI/EXEC so readers never observe a half-written board.
+    """
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.delete(GLOBAL_SCORES_KEY, GLOBAL_TEAMS_KEY)
+        if ranking:
+            pipe.zadd(GLOBAL_SCORES_KEY, {str(e["team_id"]): _entry_score(e) for e in ranking})
+            pipe.hset(GLOBAL_TEAMS_KEY, mapping={str(e["team_id"]): _meta_json(e) for e in ranking})
+        await pipe.execute()
+
+
+async def seed_global_leaderboard(client: aredis.Redis, ranking: list[dict[str, Any]]) -> bool:
+    """Write a freshly computed ranking only if the standings are still unseeded.
+
+    For request-path cold misses: the ranking was read from Postgres before
+    this call, so if the worker seeded or upserted a team in the meantime its
+    newer data wins and this write is dropped. Returns whether it was written.
+    """
+    if not ranking:
+        return False
+    async with client.pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(GLOBAL_SCORES_KEY)
+            if await pipe.exists(GLOBAL_SCORES_KEY):
+                return False
+            pipe.multi()  # type: ignore[no-untyped-call]
+            pipe.delete(GLOBAL_TEAMS_KEY)
+            pipe.zadd(GLOBAL_SCORES_KEY, {str(e["team_id"]): _entry_score(e) for e in ranking})
+            pipe.hset(GLOBAL_TEAMS_KEY, mapping={str(e["team_id"]): _meta_json(e) for e in ranking})
+            await pipe.execute()
+        except WatchError:
+            return False
+    return True
+
+
+async def acquire_recompute_lock(client: aredis.Redis, token: str) -> bool:
+    """Claim the cold-board recompute for the caller identified by ``token``."""
+    return bool(await client.set(RECOMPUTE_LOCK_KEY, token, nx=True, ex=RECOMPUTE_LOCK_SECONDS))
+
+
+async def release_recompute_lock(client: aredis.Redis, token: str) -> None:
+    """Release the recompute lock if ``token`` still holds it (it may have expired)."""
+    async with client.pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(RECOMPUTE_LOCK_KEY)
+            if await pipe.get(RECOMPUTE_LOCK_KEY) != token:
+                return
+            pipe.multi()  # type: ignore[no-untyped-call]
+            pipe.delete(RECOMPUTE_LOCK_KEY)
+            await pipe.execute()
+        except WatchError:
+            pass
+
+
+async def upsert_team(client: aredis.Redis, entry: dict[str, Any]) -> None:
+    """Insert or refresh one team's standing (rank is derived on read)."""
+    member = str(entry["team_id"])
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.zadd(GLOBAL_SCORES_KEY, {member: _entry_score(entry)})
+        pipe.hset(GLOBAL_TEAMS_KEY, member, _meta_json(entry))
+        await pipe.execute()
+
+
+async def remove_team(client: aredis.Redis, team_id: int) -> None:
+    """Drop a team (e.g. deleted) from the cached standings."""
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.zrem(GLOBAL_SCORES_KEY, str(team_id))
+        pipe.hdel(GLOBAL_TEAMS_KEY, str(team_id))
+        await pipe.execute()
+
+
+async def is_warm(client: aredis.Redis) -> bool:
+    """True when the standings have been seeded (incremental updates are safe)."""
+    return bool(await client.exists(GLOBAL_SCORES_KEY))
+
+
+def _tie_key(entry: tuple[str, float]) -> tuple[float, int]:
+    member, score = entry
+    return -score, int(member)
+
+
+async def _in_sql_order(
+    client: aredis.Redis, entries: list[tuple[str, float]], start: int
+) -> list[tuple[str, float]]:
+    """Reorder a ``ZREVRANGE`` slice starting at ``start`` into SQL tie order.
+
+    Redis orders equal scores by member descending, the SQL ranking by team id
+    ascending. The tie runs the slice's edges cut through are read whole, so
+    the slice holds the same teams a cold recompute would put there.
+    """
+    top, bottom = entries[0][1], entries[-1][1]
+    band = cast(
+        "list[tuple[str, float]]",
+        await client.zrevrangebyscore(GLOBAL_SCORES_KEY, top, bottom, withscores=True),
+    )
+    ahead = 0
+    if start > 0:
+        ahead = int(await client.zcount(GLOBAL_SCORES_KEY, f"({top!r}", "+inf"))
+    band.sort(key=_tie_key)
+    return band[start - ahead : start - ahead + len(entries)]
+
+
+async def _render(
+    client: aredis.Redis, entries: list[tuple[str, float]], start: int
+) -> list[dict[str, Any]] | None:
+    """Turn a ``ZREVRANGE ... WITHSCORES`` slice starting at ``start`` into rows.
+
+    Returns None when a team's display fields are missing or corrupt, so the
+    caller treats the cache as cold and recomputes instead of serving holes.
+    """
+    metas = await client.hmget(GLOBAL_TEAMS_KEY, [member for member, _score in entries])
+    # Competition rank of the first row = 1 + teams strictly ahead of it (only
+    # asked of Redis mid-board); the rest follow in one pass, a new score
+    # taking its 1-based position.
+    rank = 1
+    if start > 0:
+        rank += int(await client.zcount(GLOBAL_SCORES_KEY, f"({entries[0][1]!r}", "+inf"))
+    rows: list[dict[str, Any]] = []
+    prev_score: float | None = None
+    for offset, ((member, score), raw_meta) in enumerate(zip(entries, metas, strict=True)):
+        if raw_meta is None:
+            return None
+        try:
+            meta = json.loads(raw_meta)
+        except json.JSONDecodeError as exc:
+            logger.warning("Discarding corrupt cached leaderboard entry %s: %s", member, exc)
+            return None
+        if not isinstance(meta, dict):
+            return None
+        if prev_score is not None and score != prev_score:
+            rank = start + offset + 1
+        prev_score = score
+        rows.append(
+            {
+                "team_id": int(member),
+                "team_name": meta.get("team_name"),
+                "total_score": float(score),
+                "activities_completed": meta.get("activities_completed", 0),
+                "rank": rank,
+            }
+        )
+    return rows
 
 
 async def read_global_leaderboard(
-    client: aredis.Redis,
+    client: aredis.Redis, *, limit: int | None = None
 ) -> list[dict[str, Any]] | None:
-    """Return the cached global ranking, or None when nothing is cached."""
-    raw = await client.get(GLOBAL_LEADERBOARD_KEY)
-    if raw is None:
+    """Return the cached ranking (top ``limit`` rows when given), or None when cold."""
+    stop = -1 if limit is None else limit - 1
+    entries = cast(
+        "list[tuple[str, float]]",
+        await client.zrevrange(GLOBAL_SCORES_KEY, 0, stop, withscores=True),
+    )
+    if not entries:
+        # Redis drops empty sorted sets, so an empty head means "never seeded".
         return None
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        logger.warning("Discarding corrupt cached leaderboard: %s", exc)
+    if limit is None:
+        entries.sort(key=_tie_key)
+    else:
+        entries = await _in_sql_order(client, entries, 0)
+    return await _render(client, entries, 0)
+
+
+async def read_team_window(
+    client: aredis.Redis, team_id: int, *, radius: int
+) -> list[dict[str, Any]] | None:
+    """Return the rows within ``radius`` places of a team, or None when cold.
+
+    An empty list means the cache is warm but the team is not ranked.
+    """
+    score = await client.zscore(GLOBAL_SCORES_KEY, str(team_id))
+    if score is None:
+        return [] if await is_warm(client) else None
+    # The team's place in SQL order: everyone strictly ahead, plus the teams
+    # it ties with that have a lower id (Redis' own rank breaks ties the other way).
+    tied = cast("list[str]", await client.zrangebyscore(GLOBAL_SCORES_KEY, score, score))
+    position = int(await client.zcount(GLOBAL_SCORES_KEY, f"({score!r}", "+inf"))
+    position += sum(1 for member in tied if int(member) < team_id)
+    start = max(0, position - radius)
+    entries = cast(
+        "list[tuple[str, float]]",
+        await client.zrevrange(GLOBAL_SCORES_KEY, start, position + radius, withscores=True),
+    )
+    return await _render(client, await _in_sql_order(client, entries, start), start)
+
+
+def diff_rankings(
+    before: list[dict[str, Any]], after: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[int]]:
+    """Rows of ``after`` that are new or differ from ``before``, and the ids that left."""
+    previous = {row["team_id"]: row for row in before}
+    changed = [row for row in after if previous.get(row["team_id"]) != row]
+    current = {row["team_id"] for row in after}
+    removed = [team_id for team_id in previous if team_id not in current]
+    return changed, removed
+
+
+async def record_delta(
+    client: aredis.Redis,
+    changed: list[dict[str, Any]],
+    removed: list[int],
+    *,
+    history: int,
+) -> str:
+    """Stamp a delta with the next version and keep it in the history.
+
+    Returns the delta as JSON (what the worker publishes and what a resuming
+    client replays, so both see the same bytes).
+    """
+    version = int(await client.incr(GLOBAL_VERSION_KEY))
+    delta = json.dumps({"version": version, "changed": changed, "removed": removed})
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.lpush(GLOBAL_DELTAS_KEY, delta)
+        pipe.ltrim(GLOBAL_DELTAS_KEY, 0, max(history, 1) - 1)
+        await pipe.execute()
+    return delta
+
+
+async def read_version(client: aredis.Redis) -> int:
+    """Current standings version (0 before the first delta)."""
+    return int(await client.get(GLOBAL_VERSION_KEY) or 0)
+
+
+async def read_deltas_since(client: aredis.Redis, version: int) -> list[str] | None:
+    """The deltas after ``version``, oldest first, or None when they cannot be replayed.
+
+    None means the history no longer reaches back to ``version`` (or the
+    version is from before a reset), so the caller should send a snapshot.
+    Deltas whose version is recorded but not yet listed are left out; they
+    arrive on the live channel.
+    """
+    current = await read_version(client)
+    if version > current:
         return None
-    if not isinstance(data, list):
+    if version == current:
+        return []
+    raw = cast("list[str]", await client.lrange(GLOBAL_DELTAS_KEY, 0, current - version - 1))
+    deltas = [(int(json.loads(entry)["version"]), entry) for entry in raw]
+    deltas.sort()
+    if not deltas or deltas[0][0] > version + 1:
         return None
-    return data
+    return [entry for delta_version, entry in deltas if delta_version > version]
+
+
+async def bump_rankings_version(client: aredis.Redis) -> None:
+    """Mark every ranking read as changed (call once the change is visible)."""
+    await client.incr(RANKINGS_VERSION_KEY)
+
+
+async def read_rankings_version(client: aredis.Redis) -> int | None:
+    """The rankings version, or None before the first scoring change was applied."""
+    raw = await client.get(RANKINGS_VERSION_KEY)
+    return None if raw is None else int(raw)
+
+
+def slice_top(ranking: list[dict[str, Any]], limit: int | None) -> list[dict[str, Any]]:
+    """Top-``limit`` rows of an already-ranked list (all rows when None)."""
+    return ranking if limit is None else ranking[:limit]
+
+
+def slice_team_window(
+    ranking: list[dict[str, Any]], team_id: int, *, radius: int
+) -> list[dict[str, Any]]:
+    """Rows within ``radius`` places of ``team_id`` in an already-ranked list."""
+    for position, row in enumerate(ranking):
+        if row.get("team_id") == team_id:
+            return ranking[max(0, position - radius) : position + radius + 1]
+    return []
@@ -0,0 +1,97 @@
+"""Single-flight recomputation of a cold global leaderboard.
+
+When the cached board is missing (a Redis flush or restart) every scoreboard
+request would otherwise run the full ranking aggregation itself, right when
+the system is recovering. Instead, per process, the first request recomputes
+and the concurrent ones await its result; across processes, a short Redis
+lock lets one of them query Postgres while the others poll the cache for its
+write. A request that is still waiting after ``wait_seconds`` is served the
+last ranking this process saw, flagged as stale, and only recomputes itself
+when it has nothing to serve at all.
+"""
+
+import asyncio
+import uuid
+import weakref
+from typing import Any
+
+import redis.asyncio as aredis
+
+from app.core.metrics import record_leaderboard_recompute
+from app.services import leaderboard_cache
+from app.services.scoring_service import ScoringService
+
+# How often a waiting request re-reads the cache for the lock holder's write.
+_POLL_SECONDS = 0.05
+
+Ranking = list[dict[str, Any]]
+Recompute = asyncio.Future[tuple[Ranking, bool]]
+
+# The recompute in flight on each loop, awaited by concurrent requests. A
+# cancelled future means its owner went away and a waiter should take over.
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Recompute]" = (
+    weakref.WeakKeyDictionary()
+)
+# The last full ranking this process computed or read, served when stale.
+_last_known: Ranking | None = None
+
+
+def _remember(ranking: Ranking) -> Ranking:
+    global _last_known
+    _last_known = ranking
+    return ranking
+
+
+async def recompute_global_ranking(
+    client: aredis.Redis, service: ScoringService, *, wait_seconds: float
+) -> tuple[Ranking, bool]:
+    """Return the full ranking for a cold cache and whether it is stale."""
+    loop = asyncio.get_running_loop()
+    while (pending := _inflight.get(loop)) is not None:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # this request was cancelled, not the one it waited on
+    future: Recompute = loop.create_future()
+    _inflight[loop] = future
+    try:
+        result = await _recompute_or_wait(client, service, wait_seconds)
+    except BaseException:
+        future.cancel()
+        raise
+    finally:
+        if _inflight.get(loop) is future:
+            del _inflight[loop]
+    future.set_result(result)
+    return result
+
+
+async def _recompute_or_wait(
+    client: aredis.Redis, service: ScoringService, wait_seconds: float
+) -> tuple[Ranking, bool]:
+    token = uuid.uuid4().hex
+    if await leaderboard_cache.acquire_recompute_lock(client, token):
+        try:
+            ranking = await service.get_team_ranking()
+            await leaderboard_cache.seed_global_leaderboard(client, ranking)
+        finally:
+            await leaderboard_cache.release_recompute_lock(client, token)
+        record_leaderboard_recompute(outcome="computed")
+        return _remember(ranking), False
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_seconds
+    while loop.time() < deadline:
+        await asyncio.sleep(_POLL_SECONDS)
+        cached = await leaderboard_cache.read_global_leaderboard(client)
+        if cached is not None:
+            record_leaderboard_recompute(outcome="waited")
+            return _remember(cached), False
+
+    if _last_known is not None:
+        record_leaderboard_recompute(outcome="stale")
+        return _last_known, True
+    # Nothing to fall back on: better a duplicate query than no scoreboard.
+    record_leaderboard_recompute(outcome="computed")
+    return _remember(await service.get_team_ranking()), False
@@ -23,12 +23,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import RallyNotFoundError, RallyValidationError
 from app.crud.crud_checkpoint import CRUDCheckPoint
-from app.crud.crud_rally_settings import rally_settings
 from app.crud.crud_team import CRUDTeam
 from app.schemas.proximity import ProximityReading
 from app.services.checkin_service import require_same_event
 from app.services.checkpoint_arrival_service import _DISTANCE_BUCKETS, _distance_bucket
+from app.services.proximity_targets import (
+    ProximityTarget,
+    cached_target,
+    remember_target,
+    target_generation,
+)
+from app.services.route_graph import RouteGraph, route_graph
 from app.services.route_progress import can_reach_checkpoint
+from app.services.settings_snapshot import current_settings
 from app.utils.geo import distance_m
 
 PROXIMITY_DISABLED = "The proximity check is not enabled for this event"
@@ -67,10 +74,42 @@ class ProximityService:
     async def read(
         self, *, team_id: int, checkpoint_id: int, latitude: float, longitude: float
     ) -> ProximityReading:
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         if not getattr(settings, "proximity_enabled", False):
             raise RallyValidationError(PROXIMITY_DISABLED)
 
+        route = await route_graph(self._db)
+        target = cached_target(team_id, checkpoint_id, route=route, snapshot=settings)
+        if target is None:
+            generation = target_generation()
+            target = await self._target(
+                team_id=team_id, checkpoint_id=checkpoint_id, route=route, settings=settings
+            )
+            remember_target(team_id, checkpoint_id, target, generation)
+
+        dist = distance_m(latitude, longitude, target.latitude, target.longitude)
+        is_closest_band = dist < _COMPASS_BAND_M
+
+        direction: str | None = None
+        if is_closest_band and getattr(settings, "compass_enabled", False):
+            direction = bearing_sector(
+                from_lat=latitude,
+                from_lon=longitude,
+                to_lat=target.latitude,
+                to_lon=target.longitude,
+            )
+
+        return ProximityReading(
+            checkpoint_id=checkpoint_id,
+            band=_distance_bucket(dist),
+            is_within_radius=dist <= target.arrival_radius_m,
+            direction=direction,
+        )
+
+    async def _target(
+        self, *, team_id: int, checkpoint_id: int, route: RouteGraph, settings: Any
+    ) -> ProximityTarget:
+        """Check that the team may sample this post; raises when it may not."""
         checkpoint = await self._checkpoint_crud.get(db=self._db, id=checkpoint_id)
         if checkpoint is None:
             raise RallyNotFoundError("Checkpoint not found")
@@ -90,23 +129,12 @@ class ProximityService:
         if checkpoint.latitude is None or checkpoint.longitude is None:
             raise RallyValidationError(NO_COORDINATES)
 
-        dist = distance_m(latitude, longitude, checkpoint.latitude, checkpoint.longitude)
-        is_closest_band = dist < _COMPASS_BAND_M
-
-        direction: str | None = None
-        if is_closest_band and getattr(settings, "compass_enabled", False):
-            direction = bearing_sector(
-                from_lat=latitude,
-                from_lon=longitude,
-                to_lat=checkpoint.latitude,
-                to_lon=checkpoint.longitude,
-            )
-
-        return ProximityReading(
-            checkpoint_id=checkpoint_id,
-            band=_distance_bucket(dist),
-            is_within_radius=dist <= checkpoint.arrival_radius_m,
-            direction=direction,
+        return ProximityTarget(
+            latitude=checkpoint.latitude,
+            longitude=checkpoint.longitude,
+            arrival_radius_m=checkpoint.arrival_radius_m,
+            route=route,
+            snapshot=settings,
         )
 
 
@@ -0,0 +1,93 @@
+"""Per-process cache of the posts each team may sample with the proximity aid.
+
+Every team phone pings its distance every few seconds, which made the
+proximity read the most frequent request in the system. Deciding whether the
+team may sample a post at all (team and checkpoint lookups, the cross-edition
+guard and ``can_reach_checkpoint`` with its route-progress query) only changes
+when the team makes progress, so its outcome is cached here per team and post:
+the post's coordinates and arrival radius. A hit leaves the ping with the
+settings snapshot, the route graph (both cached) and the haversine.
+
+An entry remembers the route graph and settings snapshot it was checked
+against and only counts while both are still the current ones, so a route
+edit or a settings change (order rules, stages) takes effect without a
+broadcast of its own. A team's progress — an arrival, a skip, a check-in or an
+evaluation — drops that team's entries through ``team_progress_changed`` and
+the activity-result events (see app.events.invalidation). Entries expire after
+``settings.PROXIMITY_TARGET_CACHE_SECONDS`` regardless.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.events.publisher import publish_event
+from app.events.schemas import ProgressChangedEvent, ProgressChangedPayload
+
+
+@dataclass(frozen=True)
+class ProximityTarget:
+    """A post a team may sample, as far as a proximity reading is concerned."""
+
+    latitude: float
+    longitude: float
+    arrival_radius_m: int
+    # What the verdict was checked against; compared by identity.
+    route: object
+    snapshot: object
+
+
+_lock = threading.Lock()
+# team id -> checkpoint id -> (target, monotonic expiry)
+_targets: dict[int, dict[int, tuple[ProximityTarget, float]]] = {}
+# Bumped by every invalidation, so a ping that started before the team made
+# progress cannot cache what it read before it.
+_generation = 0
+
+
+def target_generation() -> int:
+    return _generation
+
+
+def cached_target(
+    team_id: int, checkpoint_id: int, *, route: object, snapshot: object
+) -> ProximityTarget | None:
+    """The cached target, if still fresh and checked against this route and
+    this settings snapshot."""
+    entry = _targets.get(team_id, {}).get(checkpoint_id)
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    target = entry[0]
+    if target.route is not route or target.snapshot is not snapshot:
+        return None
+    return target
+
+
+def remember_target(
+    team_id: int, checkpoint_id: int, target: ProximityTarget, generation: int
+) -> None:
+    """Cache ``target``, unless the cache was invalidated since ``generation``."""
+    with _lock:
+        if generation != _generation:
+            return
+        expiry = time.monotonic() + settings.PROXIMITY_TARGET_CACHE_SECONDS
+        _targets.setdefault(team_id, {})[checkpoint_id] = (target, expiry)
+
+
+def forget_proximity_targets(team_id: int | None = None) -> None:
+    """Drop one team's cached targets, or every team's when ``team_id`` is None."""
+    global _generation
+    with _lock:
+        if team_id is None:
+            _targets.clear()
+        else:
+            _targets.pop(team_id, None)
+        _generation += 1
+
+
+async def team_progress_changed(team_id: int) -> None:
+    """Drop a team's cached targets everywhere; call after an arrival, skip
+    or check-in commits."""
+    forget_proximity_targets(team_id)
+    await publish_event(ProgressChangedEvent(payload=ProgressChangedPayload(team_id=team_id)))
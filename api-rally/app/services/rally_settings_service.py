@@ -13,6 +13,7 @@ from app.models.rally_settings import RallySettings
 from app.schemas.rally_settings import RallySettingsResponse
 from app.schemas.user import DetailedUser
 from app.services.image_upload import MAX_IMAGE_SIZE_BYTES, validate_and_store
+from app.services.settings_snapshot import settings_changed
 from app.services.storage import storage_client
 
 
@@ -63,4 +64,5 @@ class RallySettingsService:
         )
 
         updated = await rally_settings.set_image_url(self._db, field=field, url=url)
+        await settings_changed(updated.event_id)  # type: ignore[arg-type]
         return await self.build_response(updated)
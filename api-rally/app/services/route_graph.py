@@ -0,0 +1,149 @@
+"""Per-process cache of the current event's route.
+
+Every progress check (GPS arrivals and proximity pings, the guide screen, the
+team dashboard, staff evaluation) walks the same route: the published posts in
+order, the stages they belong to and which activities each post asks for. That
+used to cost a checkpoint query, a stage query and one activity query per post
+on every check. ``route_graph`` reads it once into an immutable ``RouteGraph``
+and keeps it per event for ``settings.ROUTE_GRAPH_CACHE_SECONDS``.
+
+Every write to a checkpoint, stage or activity calls ``route_changed`` after
+its commit, which drops this process's copy and broadcasts ``route.changed``
+so every other API process drops its copy too (see app.events.invalidation).
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud._event_scope import current_event_id
+from app.crud.crud_checkpoint import checkpoint as checkpoint_crud
+from app.crud.crud_route_stage import route_stage as route_stage_crud
+from app.events.publisher import publish_event
+from app.events.schemas import RouteChangedEvent, RouteChangedPayload
+from app.models.activity import Activity
+from app.services.route_stages import Stage, build_stages
+
+
+@dataclass(frozen=True)
+class RoutePost:
+    """A published post, as far as progress is concerned."""
+
+    id: int
+    order: int
+    name: str
+    stage_id: int | None
+    available_from: datetime | None
+    available_until: datetime | None
+    # The post's active activities; empty for a post with nothing to judge.
+    activity_ids: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class RouteGraph:
+    """The current event's published route, posts in order."""
+
+    event_id: int
+    posts: tuple[RoutePost, ...]
+    # Empty when the event has no stages.
+    stages: tuple[Stage, ...]
+
+    @property
+    def max_order(self) -> int:
+        return self.posts[-1].order if self.posts else 0
+
+
+_lock = threading.Lock()
+# event id -> (graph, monotonic expiry)
+_graphs: dict[int, tuple[RouteGraph, float]] = {}
+# Bumped by every invalidation, so a read that started before a write cannot
+# cache what it read before the write.
+_generation = 0
+
+
+def forget_route() -> None:
+    """Drop every locally cached route."""
+    global _generation
+    with _lock:
+        _graphs.clear()
+        _generation += 1
+
+
+def _cached(event_id: int) -> RouteGraph | None:
+    entry = _graphs.get(event_id)
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    return entry[0]
+
+
+def _remember(graph: RouteGraph, generation: int) -> None:
+    with _lock:
+        if generation != _generation:
+            return
+        _graphs[graph.event_id] = (graph, time.monotonic() + settings.ROUTE_GRAPH_CACHE_SECONDS)
+
+
+async def _load(db: AsyncSession, event_id: int) -> RouteGraph:
+    checkpoints = await checkpoint_crud.get_all_ordered(db)
+    activity_ids: dict[int | None, list[int]] = {}
+    if checkpoints:
+        rows = await db.execute(
+            select(Activity.checkpoint_id, Activity.id)
+            .where(
+                Activity.checkpoint_id.in_([cp.id for cp in checkpoints]),
+                Activity.is_active.is_(True),
+            )
+            .order_by(Activity.id)
+        )
+        for checkpoint_id, activity_id in rows:
+            activity_ids.setdefault(checkpoint_id, []).append(activity_id)
+
+    posts = tuple(
+        RoutePost(
+            id=cp.id,
+            order=cp.order,
+            name=cp.name,
+            stage_id=cp.stage_id,
+            available_from=cp.available_from,
+            available_until=cp.available_until,
+            activity_ids=tuple(activity_ids.get(cp.id, ())),
+        )
+        for cp in checkpoints
+    )
+
+    # Draft posts are left out of the stages too: a stage's required count
+    # must be reachable, and a post nobody can visit would leave it short.
+    stage_rows = await route_stage_crud.get_all_ordered(db)
+    orders_by_stage: dict[int, list[int]] = {}
+    for post in posts:
+        if post.stage_id is not None:
+            orders_by_stage.setdefault(post.stage_id, []).append(post.order)
+    stages = build_stages(
+        ((s.id, s.order, bool(s.order_matters), s.required_count) for s in stage_rows),
+        orders_by_stage,
+    )
+    return RouteGraph(event_id=event_id, posts=posts, stages=tuple(stages))
+
+
+async def route_graph(db: AsyncSession) -> RouteGraph:
+    """Return the current event's route graph. Never writes."""
+    event_id = await current_event_id(db)
+    graph = _cached(event_id)
+    if graph is not None:
+        return graph
+    generation = _generation
+    graph = await _load(db, event_id)
+    _remember(graph, generation)
+    return graph
+
+
+async def route_changed(event_id: int | None = None) -> None:
+    """Drop cached routes everywhere; call after a checkpoint, stage or
+    activity write commits."""
+    forget_route()
+    await publish_event(RouteChangedEvent(payload=RouteChangedPayload(event_id=event_id)))
@@ -8,25 +8,29 @@ the plain sequential rule from disagreeing with each other.
 
 The count-based predicate still lives here and still runs every event that has
 no stages — that is the behaviour the whole app had before stages existed.
+
+The route itself comes from the cached ``RouteGraph`` (app.services.route_graph)
+and a team's side of it — completed activities, skips and arrivals — from one
+query (``load_team_state``, or ``load_team_states`` for a whole listing);
+everything in between is pure.
 """
 
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.crud_activity import activity as activity_crud
-from app.crud.crud_activity import activity_result as activity_result_crud
-from app.crud.crud_checkpoint import checkpoint as checkpoint_crud
+from app.models.activity import ActivityResult
 from app.models.checkpoint import CheckPoint
 from app.models.checkpoint_arrival import CheckpointArrival
 from app.models.checkpoint_skip import CheckpointSkip
-from app.models.route_stage import RouteStage
 from app.models.team import Team
+from app.services.route_graph import RouteGraph, route_graph
 from app.services.route_stages import (
     Stage,
-    build_stages,
     is_open_at,
     is_reachable_in_stages,
     opening_state,
@@ -48,8 +52,74 @@ def is_checkpoint_reachable(
     return checkpoint_order > times_reached
 
 
-async def resolved_checkpoint_orders(
-    db: AsyncSession, team: Team, *, ignore_arrival_for: int | None = None
+@dataclass(frozen=True)
+class TeamRouteState:
+    """What a team has done on the route, as ids."""
+
+    completed_activity_ids: frozenset[int] = frozenset()
+    skipped_checkpoint_ids: frozenset[int] = frozenset()
+    arrived_checkpoint_ids: frozenset[int] = frozenset()
+
+
+@dataclass(frozen=True)
+class CheckpointProgress:
+    """How far along the route a team has got, post by post."""
+
+    last_completed_order: int
+    current_order: int
+    last_completed_name: str | None
+    completed_orders: tuple[int, ...]
+    # The current post's activities the team has not completed yet; empty once
+    # the route is done or when the current post has nothing to judge.
+    pending_activity_ids: tuple[int, ...] = ()
+
+
+async def load_team_states(
+    db: AsyncSession, team_ids: Collection[int]
+) -> dict[int, TeamRouteState]:
+    """Read the completed activities, skips and arrivals of every team in
+    ``team_ids`` in one query, however many teams there are.
+
+    Every requested id gets an entry, empty for a team that has done nothing.
+    """
+    ids = set(team_ids)
+    if not ids:
+        return {}
+    rows = await db.execute(
+        union_all(
+            select(literal("result"), ActivityResult.team_id, ActivityResult.activity_id).where(
+                ActivityResult.team_id.in_(ids), ActivityResult.is_completed.is_(True)
+            ),
+            select(literal("skip"), CheckpointSkip.team_id, CheckpointSkip.checkpoint_id).where(
+                CheckpointSkip.team_id.in_(ids)
+            ),
+            select(
+                literal("arrival"), CheckpointArrival.team_id, CheckpointArrival.checkpoint_id
+            ).where(CheckpointArrival.team_id.in_(ids)),
+        )
+    )
+    by_team: dict[int, dict[str, set[int]]] = {
+        team_id: {"result": set(), "skip": set(), "arrival": set()} for team_id in ids
+    }
+    for kind, team_id, row_id in rows:
+        by_team[team_id][kind].add(row_id)
+    return {
+        team_id: TeamRouteState(
+            completed_activity_ids=frozenset(found["result"]),
+            skipped_checkpoint_ids=frozenset(found["skip"]),
+            arrived_checkpoint_ids=frozenset(found["arrival"]),
+        )
+        for team_id, found in by_team.items()
+    }
+
+
+async def load_team_state(db: AsyncSession, team_id: int) -> TeamRouteState:
+    """Read a team's completed activities, skips and arrivals in one query."""
+    return (await load_team_states(db, [team_id]))[team_id]
+
+
+def resolved_orders(
+    graph: RouteGraph, state: TeamRouteState, *, ignore_arrival_for: int | None = None
 ) -> frozenset[int]:
     """The orders of the posts this team is done with.
 
@@ -68,60 +138,95 @@ async def resolved_checkpoint_orders(
     top of this set would then refuse the very checkpoint being evaluated.
     Every caller checking a specific target passes that target's id here.
     """
-    checkpoints = await checkpoint_crud.get_all_ordered(db)
-    skipped_ids = set(
-        (
-            await db.scalars(
-                select(CheckpointSkip.checkpoint_id).where(CheckpointSkip.team_id == team.id)
+    resolved: set[int] = set()
+    for post in graph.posts:
+        if post.id in state.skipped_checkpoint_ids:
+            resolved.add(post.order)
+        elif post.activity_ids:
+            if all(aid in state.completed_activity_ids for aid in post.activity_ids):
+                resolved.add(post.order)
+        elif post.id in state.arrived_checkpoint_ids and post.id != ignore_arrival_for:
+            resolved.add(post.order)
+    return frozenset(resolved)
+
+
+def checkpoint_progress(
+    graph: RouteGraph, state: TeamRouteState, *, checked_in_count: int
+) -> CheckpointProgress:
+    """Walk the route in order up to the first post the team is not done with.
+
+    A post is completed when all its activities have a completed result for
+    the team. A post the team gave up on is resolved, not completed: they
+    score nothing for it, but it must stop blocking the route — otherwise the
+    escape hatch would not actually let anyone out. A post with nothing to
+    judge counts as done once the team has checked in (``checked_in_count``,
+    which grows by one per post reached, in order).
+    """
+    last_completed_order = 0
+    last_completed_name: str | None = None
+    completed_orders: list[int] = []
+    pending_activity_ids: tuple[int, ...] = ()
+    for post in graph.posts:
+        if post.id in state.skipped_checkpoint_ids:
+            done = True
+        elif post.activity_ids:
+            done = all(aid in state.completed_activity_ids for aid in post.activity_ids)
+        else:
+            done = checked_in_count >= post.order
+        if not done:
+            pending_activity_ids = tuple(
+                aid for aid in post.activity_ids if aid not in state.completed_activity_ids
             )
-        ).all()
+            break
+        last_completed_order = post.order
+        last_completed_name = post.name
+        completed_orders.append(post.order)
+
+    current_order = (
+        last_completed_order + 1 if last_completed_order < graph.max_order else last_completed_order
     )
-    arrived_ids = set(
-        (
-            await db.scalars(
-                select(CheckpointArrival.checkpoint_id).where(CheckpointArrival.team_id == team.id)
-            )
-        ).all()
+    return CheckpointProgress(
+        last_completed_order=last_completed_order,
+        current_order=current_order,
+        last_completed_name=last_completed_name,
+        completed_orders=tuple(completed_orders),
+        pending_activity_ids=pending_activity_ids,
     )
-    results = await activity_result_crud.get_by_team(db, team_id=team.id)
-    completed_activity_ids = {r.activity_id for r in results if getattr(r, "is_completed", False)}
-
-    resolved: set[int] = set()
-    for cp in checkpoints:
-        if cp.id in skipped_ids:
-            resolved.add(cp.order)
-            continue
-        activities = await activity_crud.get_by_checkpoint(db, checkpoint_id=cp.id)
-        active_ids = [a.id for a in activities if a.is_active]
-        if active_ids:
-            if all(aid in completed_activity_ids for aid in active_ids):
-                resolved.add(cp.order)
-        elif cp.id in arrived_ids and cp.id != ignore_arrival_for:
-            resolved.add(cp.order)
-    return frozenset(resolved)
 
 
-async def load_stages(db: AsyncSession) -> list[Stage]:
-    """The current event's stages, each carrying the orders of its posts.
+async def teams_progress(db: AsyncSession, teams: Sequence[Team]) -> dict[int, CheckpointProgress]:
+    """``checkpoint_progress`` for many teams at once, keyed by team id.
 
-    Draft posts are left out: a stage's required count must be reachable, and
-    a post nobody can visit would make it permanently short.
+    Costs the (usually cached) route graph and one ``load_team_states`` query
+    in total, instead of a state query per team — what team listings need.
     """
-    stage_rows = (await db.scalars(select(RouteStage).order_by(RouteStage.order))).all()
-    if not stage_rows:
-        return []
-
-    orders_by_stage: dict[int, list[int]] = {}
-    for cp in await checkpoint_crud.get_all_ordered(db):
-        if cp.stage_id is not None:
-            orders_by_stage.setdefault(cp.stage_id, []).append(cp.order)
-
-    return build_stages(
-        ((s.id, s.order, bool(s.order_matters), s.required_count) for s in stage_rows),
-        orders_by_stage,
+    if not teams:
+        return {}
+    graph = await route_graph(db)
+    states = await load_team_states(db, [team.id for team in teams])
+    return {
+        team.id: checkpoint_progress(graph, states[team.id], checked_in_count=len(team.times))
+        for team in teams
+    }
+
+
+async def resolved_checkpoint_orders(
+    db: AsyncSession, team: Team, *, ignore_arrival_for: int | None = None
+) -> frozenset[int]:
+    """The orders of the posts this team is done with; see ``resolved_orders``."""
+    return resolved_orders(
+        await route_graph(db),
+        await load_team_state(db, team.id),
+        ignore_arrival_for=ignore_arrival_for,
     )
 
 
+async def load_stages(db: AsyncSession) -> list[Stage]:
+    """The current event's stages, each carrying the orders of its published
+    posts (from the cached route graph)."""
+    return list((await route_graph(db)).stages)
+
+
 def hours_block_reason(
     checkpoint: CheckPoint, settings: Any, now: datetime | None = None
 ) -> str | None:
@@ -176,13 +281,15 @@ async def can_reach_checkpoint(
         return False
 
     if getattr(settings, "route_stages_enabled", False):
-        stages = await load_stages(db)
-        if stages:
+        graph = await route_graph(db)
+        if graph.stages:
             return is_reachable_in_stages(
                 checkpoint_order=checkpoint.order,
-                stages=stages,
-                resolved_orders=await resolved_checkpoint_orders(
-                    db, team, ignore_arrival_for=checkpoint.id
+                stages=graph.stages,
+                resolved_orders=resolved_orders(
+                    graph,
+                    await load_team_state(db, team.id),
+                    ignore_arrival_for=checkpoint.id,
                 ),
             )
 
@@ -0,0 +1,317 @@
+"""Append-only score ledger: O(1) score writes and their reconciliation.
+
+A score write describes the facts it touched (a result's final score, an
+award's points) as ``ScoreFact`` values. ``record`` appends the signed
+difference between each fact's new value (and counted state) and what the
+ledger already holds for it, and moves the team's running totals
+(``ledger_total``, ``checkpoint_totals``, hence ``total`` and
+``score_per_checkpoint``) by the same deltas — the cost depends on the facts
+written, not on how many results the team has.
+
+``reconcile`` is the safety net: given the facts recomputed from the source
+tables, it appends whatever corrections bring the ledger back in line and resets
+the running totals, reporting the teams that had drifted.
+"""
+
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import ColumnElement, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.checkpoint import CheckPoint
+from app.models.score_ledger import LedgerSource, ScoreLedgerEntry
+from app.models.team import Team
+
+# Below this a delta or a difference between sums is float noise, not points.
+_EPSILON = 1e-6
+
+# (source, source_id) — one result or award.
+_FactKey = tuple[str, int]
+# What the ledger holds for one fact on one checkpoint: (points, counted facts).
+_Held = tuple[float, int]
+
+
+@dataclass(frozen=True)
+class ScoreFact:
+    """The current contribution of one result or award to its team's score.
+
+    ``counted`` is False for a fact that no longer scores (an incomplete or
+    deleted result, a revoked award), whose ``value`` is then 0. A counted fact
+    keeps its checkpoint's slot in ``score_per_checkpoint`` even at 0 points.
+    """
+
+    source: LedgerSource
+    source_id: int
+    team_id: int
+    checkpoint_id: int | None
+    value: float
+    counted: bool = True
+
+    @classmethod
+    def revoked(cls, source: LedgerSource, source_id: int, team_id: int) -> "ScoreFact":
+        return cls(source, source_id, team_id, checkpoint_id=None, value=0.0, counted=False)
+
+    @property
+    def key(self) -> _FactKey:
+        return (self.source.value, self.source_id)
+
+
+@dataclass(frozen=True)
+class ReconcileReport:
+    """Outcome of ``ScoreLedgerService.reconcile``."""
+
+    # Unrounded total (awards included) of every reconciled team.
+    totals: dict[int, float]
+    # Teams whose ledger or running totals disagreed with the recompute.
+    drifted: list[int]
+    # Ledger rows appended to correct them.
+    corrections: int
+
+
+def checkpoint_layout(
+    checkpoint_scores: dict[int, float], checkpoint_order_by_id: dict[int, int], num_visits: int
+) -> list[int]:
+    """Positional ``score_per_checkpoint`` for a team.
+
+    The list is parallel to ``team.times`` (visit order == checkpoint order):
+    scores are laid out by the checkpoints' *current* order and sized to the
+    number of visits, so the last slot stays the last-visited checkpoint's score
+    for ``[-1]`` consumers. Scores are keyed by the stable checkpoint id, so two
+    checkpoints that transiently share an ``order`` mid-reorder never collapse
+    into one slot.
+    """
+    scores_by_order = sorted(
+        (checkpoint_order_by_id[cid], score)
+        for cid, score in checkpoint_scores.items()
+        if cid in checkpoint_order_by_id
+    )
+    ordered_scores = [int(score) for _order, score in scores_by_order]
+    return (ordered_scores[:num_visits] + [0] * (num_visits - len(ordered_scores)))[:num_visits]
+
+
+def _settle(value: float) -> float:
+    """Round off the float noise a long chain of deltas accumulates."""
+    return round(value, 9)
+
+
+def _corrections(fact: ScoreFact, held: dict[int | None, _Held]) -> list[ScoreLedgerEntry]:
+    """Rows moving what the ledger holds for ``fact`` to its current value.
+
+    ``held`` is the ledger's (points, count) per checkpoint for the fact; a
+    result whose activity moved to another checkpoint is zeroed on the old one.
+    """
+    targets: dict[int | None, _Held] = dict.fromkeys(held, (0.0, 0))
+    targets[fact.checkpoint_id] = (fact.value, 1 if fact.counted else 0)
+    entries = []
+    for checkpoint_id, (points, count) in targets.items():
+        held_points, held_count = held.get(checkpoint_id, (0.0, 0))
+        delta = points - held_points
+        count_delta = count - held_count
+        if abs(delta) > _EPSILON or count_delta:
+            entries.append(
+                ScoreLedgerEntry(
+                    team_id=fact.team_id,
+                    source=fact.source.value,
+                    source_id=fact.source_id,
+                    checkpoint_id=checkpoint_id,
+                    delta=delta,
+                    count_delta=count_delta,
+                )
+            )
+    return entries
+
+
+def _stored_slots(team: Team) -> dict[int, _Held]:
+    return {
+        int(cid): (float(slot["points"]), int(slot["facts"]))
+        for cid, slot in team.checkpoint_totals.items()
+    }
+
+
+class ScoreLedgerService:
+    """Writes the ledger and keeps the teams' running totals in step with it.
+
+    Neither method commits: the ledger rows and the team columns land in the
+    caller's transaction, together with the write that changed the facts.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def record(self, facts: Sequence[ScoreFact]) -> dict[int, float]:
+        """Append the deltas for ``facts`` and apply them to their teams.
+
+        Returns the new unrounded total of every team the facts belong to.
+        """
+        if not facts:
+            return {}
+        teams = await self._lock_teams({fact.team_id for fact in facts})
+        held = await self._held(
+            tuple_(ScoreLedgerEntry.source, ScoreLedgerEntry.source_id).in_(
+                {fact.key for fact in facts}
+            )
+        )
+
+        entries: list[ScoreLedgerEntry] = []
+        for fact in facts:
+            if fact.team_id in teams:
+                entries.extend(_corrections(fact, held.get(fact.key, (fact.team_id, {}))[1]))
+        self._db.add_all(entries)
+
+        slots = {team_id: _stored_slots(team) for team_id, team in teams.items()}
+        for entry in entries:
+            team = teams[entry.team_id]
+            team.ledger_total = _settle(team.ledger_total + entry.delta)
+            if entry.checkpoint_id is None:
+                continue
+            team_slots = slots[entry.team_id]
+            points, count = team_slots.get(entry.checkpoint_id, (0.0, 0))
+            points = _settle(points + entry.delta)
+            count += entry.count_delta
+            # A checkpoint keeps its slot while a fact counts there, whatever
+            # the points; leftover points without facts are drift, kept for
+            # reconcile to see.
+            if count > 0 or abs(points) > _EPSILON:
+                team_slots[entry.checkpoint_id] = (points, count)
+            else:
+                team_slots.pop(entry.checkpoint_id, None)
+
+        await self._apply(teams, slots)
+        return {team_id: team.ledger_total for team_id, team in teams.items()}
+
+    async def reconcile(
+        self, team_ids: Collection[int], facts: Sequence[ScoreFact]
+    ) -> ReconcileReport:
+        """Bring the ledger and running totals of ``team_ids`` in line with ``facts``.
+
+        ``facts`` is every counted fact of those teams, recomputed from the
+        source tables; anything the ledger holds beyond them is zeroed.
+        """
+        if not team_ids:
+            return ReconcileReport(totals={}, drifted=[], corrections=0)
+        teams = await self._lock_teams(team_ids)
+        held = await self._held(ScoreLedgerEntry.team_id.in_(teams))
+
+        expected = {fact.key: fact for fact in facts if fact.team_id in teams}
+        entries: list[ScoreLedgerEntry] = []
+        for key, fact in expected.items():
+            entries.extend(_corrections(fact, held.get(key, (fact.team_id, {}))[1]))
+        for (source, source_id), (team_id, by_checkpoint) in held.items():
+            if (source, source_id) not in expected:
+                fact = ScoreFact.revoked(LedgerSource(source), source_id, team_id)
+                entries.extend(_corrections(fact, by_checkpoint))
+        self._db.add_all(entries)
+
+        totals = dict.fromkeys(teams, 0.0)
+        slots: dict[int, dict[int, _Held]] = {team_id: {} for team_id in teams}
+        for fact in expected.values():
+            totals[fact.team_id] += fact.value
+            if fact.checkpoint_id is not None:
+                points, count = slots[fact.team_id].get(fact.checkpoint_id, (0.0, 0))
+                slots[fact.team_id][fact.checkpoint_id] = (points + fact.value, count + 1)
+
+        corrected = {entry.team_id for entry in entries}
+        drifted = []
+        for team_id, team in teams.items():
+            stored = _stored_slots(team)
+            expected_slots = slots[team_id]
+            if (
+                team_id in corrected
+                or abs(team.ledger_total - totals[team_id]) > _EPSILON
+                or stored.keys() != expected_slots.keys()
+                or any(
+                    abs(stored[cid][0] - points) > _EPSILON or stored[cid][1] != count
+                    for cid, (points, count) in expected_slots.items()
+                )
+            ):
+                drifted.append(team_id)
+            team.ledger_total = _settle(totals[team_id])
+
+        await self._apply(
+            teams,
+            {
+                team_id: {cid: (_settle(p), n) for cid, (p, n) in team_slots.items()}
+                for team_id, team_slots in slots.items()
+            },
+        )
+        return ReconcileReport(totals=totals, drifted=drifted, corrections=len(entries))
+
+    async def _lock_teams(self, team_ids: Collection[int]) -> dict[int, Team]:
+        """Row-lock the teams (in id order, so concurrent writers can't
+        deadlock) and reload their running totals.
+
+        The lock serialises writers of one team, so the ledger sums read next
+        can't move before this transaction appends to them. Pending changes are
+        flushed first: ``populate_existing`` would otherwise overwrite them.
+        """
+        await self._db.flush()
+        stmt = (
+            select(Team)
+            .where(Team.id.in_(team_ids))
+            .order_by(Team.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return {team.id: team for team in (await self._db.scalars(stmt)).all()}
+
+    async def _held(
+        self, where: ColumnElement[bool]
+    ) -> dict[_FactKey, tuple[int, dict[int | None, _Held]]]:
+        """Ledger sums (points, count) per fact and checkpoint, with each fact's team."""
+        stmt = (
+            select(
+                ScoreLedgerEntry.source,
+                ScoreLedgerEntry.source_id,
+                ScoreLedgerEntry.team_id,
+                ScoreLedgerEntry.checkpoint_id,
+                func.sum(ScoreLedgerEntry.delta),
+                func.sum(ScoreLedgerEntry.count_delta),
+            )
+            .where(where)
+            .group_by(
+                ScoreLedgerEntry.source,
+                ScoreLedgerEntry.source_id,
+                ScoreLedgerEntry.team_id,
+                ScoreLedgerEntry.checkpoint_id,
+            )
+        )
+        held: dict[_FactKey, tuple[int, dict[int | None, _Held]]] = {}
+        for source, source_id, team_id, checkpoint_id, points, count in await self._db.execute(
+            stmt
+        ):
+            held.setdefault((source, source_id), (team_id, {}))[1][checkpoint_id] = (
+                float(points),
+                int(count),
+            )
+        return held
+
+    async def _apply(self, teams: dict[int, Team], slots: dict[int, dict[int, _Held]]) -> None:
+        """Store the running totals and derive ``total``/``score_per_checkpoint``.
+
+        Columns are only assigned when their value changes, so an untouched
+        team is not rewritten.
+        """
+        checkpoint_ids = {cid for team_slots in slots.values() for cid in team_slots}
+        order_by_id: dict[int, int] = {}
+        if checkpoint_ids:
+            stmt = select(CheckPoint.id, CheckPoint.order).where(CheckPoint.id.in_(checkpoint_ids))
+            order_by_id = dict((await self._db.execute(stmt)).tuples().all())
+
+        for team_id, team in teams.items():
+            team_slots = slots[team_id]
+            stored = {
+                str(cid): {"points": points, "facts": count}
+                for cid, (points, count) in team_slots.items()
+            }
+            if team.checkpoint_totals != stored:
+                team.checkpoint_totals = stored
+            # Round, don't truncate: float sums like 99.999… must not silently
+            # drop a point.
+            total = round(team.ledger_total)
+            if team.total != total:
+                team.total = total
+            scores = {cid: points for cid, (points, _count) in team_slots.items()}
+            layout = checkpoint_layout(scores, order_by_id, len(team.times))
+            if list(team.score_per_checkpoint or []) != layout:
+                team.score_per_checkpoint = layout
@@ -4,37 +4,47 @@ Scoring system service for Rally activities
 
 import logging
 import time
+from collections.abc import Callable, Collection, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import selectinload
 
 from app.core.config import get_settings
 from app.core.exceptions import RallyError, RallyValidationError
 from app.core.metrics import observe_scoring_recompute
 from app.core.observability import traced
+from app.crud import current_event_id
 from app.crud.crud_activity import activity_result as activity_result_crud
 from app.events import (
     ActivityResultChangedPayload,
     ActivityResultCreatedEvent,
     ActivityResultDeletedEvent,
     ActivityResultUpdatedEvent,
+    BaseEvent,
+    TeamScoresUpdatedEvent,
+    TeamScoresUpdatedPayload,
     TeamScoreUpdatedEvent,
     TeamScoreUpdatedPayload,
     publish_event,
 )
+from app.events.outbox import stage_events
 from app.models.activity import Activity, ActivityResult
 from app.models.activity_factory import ActivityFactory
 from app.models.dynamic_scoring import DynamicAward
 from app.models.evaluation_history import EvaluationAction, EvaluationHistory
-from app.models.rally_settings import RallySettings
+from app.models.score_ledger import LedgerSource
 from app.models.team import Team
 from app.schemas.activity import ActivityResultCreate, ActivityResultUpdate
 from app.schemas.activity_types import ActivityType
+from app.schemas.rally_settings import RallySettingsSnapshot
 from app.services._diff import diff_snapshots, snapshot_fields
+from app.services.proximity_targets import forget_proximity_targets
+from app.services.score_ledger_service import ReconcileReport, ScoreFact, ScoreLedgerService
+from app.services.settings_snapshot import current_settings
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +91,7 @@ class ScoringService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self._settings: RallySettings | None = None
+        self._settings: RallySettingsSnapshot | None = None
 
     @property
     def _defer_recompute(self) -> bool:
@@ -143,20 +153,50 @@ class ScoringService:
         """
 
         instance = ActivityFactory.create_activity(activity_type, config)
+        time_scorer = (
+            instance.relative_ranking_scorer(all_times)
+            if activity_type == ActivityType.TIME_BASED.value
+            and all_times
+            and len(all_times) > 1
+            and hasattr(instance, "relative_ranking_scorer")
+            else None
+        )
+        bonus_per_shot = await self._bonus_per_extra_shot() if extra_shots else None
+        return self._score_with(
+            instance,
+            activity_type=activity_type,
+            result_data=result_data,
+            team_size=team_size,
+            extra_shots=extra_shots,
+            penalties=penalties,
+            bonus_per_shot=bonus_per_shot,
+            time_scorer=time_scorer,
+        )
+
+    @staticmethod
+    def _score_with(
+        instance: Any,
+        *,
+        activity_type: str,
+        result_data: dict[str, Any],
+        team_size: int,
+        extra_shots: int,
+        penalties: dict[str, Any] | None,
+        bonus_per_shot: float | None,
+        time_scorer: Callable[[float], float] | None,
+    ) -> float:
+        """Score one result with everything already resolved (no I/O).
 
+        Shared by ``compute_final_score`` and the activity-wide batch rescore,
+        which builds the activity instance and the time scorer only once.
+        """
         is_time_based = activity_type == ActivityType.TIME_BASED.value
         this_time = result_data.get("completion_time_seconds")
 
         if is_time_based and this_time is not None:
-            if (
-                all_times
-                and len(all_times) > 1
-                and hasattr(instance, "calculate_relative_ranking_score")
-            ):
+            if time_scorer is not None:
                 # Rank this time against every other team's time
-                base_score = float(
-                    instance.calculate_relative_ranking_score(all_times, float(this_time))
-                )
+                base_score = float(time_scorer(float(this_time)))
             else:
                 # Lone (or only completed) time-based result gets max points
                 base_score = float(instance.config.get("max_points", 100))
@@ -165,26 +205,19 @@ class ScoringService:
 
         modifiers: dict[str, Any] = {"extra_shots": extra_shots, "penalties": penalties or {}}
         if extra_shots:
-            modifiers["bonus_per_shot"] = (await self._get_settings()).bonus_per_extra_shot
+            modifiers["bonus_per_shot"] = bonus_per_shot
         return float(instance.apply_modifiers(base_score, modifiers))
 
-    async def _get_settings(self) -> RallySettings:
-        """Get rally settings from database (cached)"""
-        if self._settings is None:
-            stmt = select(RallySettings)
-            self._settings = (await self.db.scalars(stmt)).first()
-            if not self._settings:
-                # Create default settings if none exist. Flush (not commit) so
-                # callers batching writes into one atomic transaction
-                # (commit=False paths) don't get a mid-transaction commit that
-                # would persist their partial state.
-                self._settings = RallySettings()
-                self.db.add(self._settings)
-                await self.db.flush()
+    async def _get_settings(self) -> RallySettingsSnapshot:
+        """The current event's rally settings (a cached snapshot; never writes)"""
         if self._settings is None:
-            raise RallyError("Failed to get or create rally settings")
+            self._settings = await current_settings(self.db)
         return self._settings
 
+    async def _bonus_per_extra_shot(self) -> int:
+        """Per-shot bonus from the rally settings"""
+        return (await self._get_settings()).bonus_per_extra_shot
+
     async def calculate_team_total_score(self, team_id: int) -> float:
         """Calculate total score for a team including all modifiers"""
         stmt = select(ActivityResult).where(ActivityResult.team_id == team_id)
@@ -197,177 +230,210 @@ class ScoringService:
 
         return total_score
 
-    async def _checkpoint_scores_for_team(
-        self, team_id: int
-    ) -> tuple[dict[int, float], dict[int, int], float]:
-        """Sum completed results per checkpoint, plus the raw total.
-
-        Scores are keyed by the stable ``checkpoint.id`` (not the mutable
-        ``checkpoint.order``): two checkpoints that transiently share an
-        ``order`` mid-reorder must not collapse their scores into one slot.
-        The returned ``id -> order`` map lets the caller lay the scores out in
-        the checkpoints' current visit order.
-        """
-        stmt = (
-            select(ActivityResult)
-            .options(joinedload(ActivityResult.activity).joinedload(Activity.checkpoint))
-            .where(ActivityResult.team_id == team_id)
+    async def _expected_facts(self, team_ids: Collection[int]) -> list[ScoreFact]:
+        """Every counted score fact of these teams, recomputed from the source
+        tables: completed, scored results on a checkpoint plus active awards."""
+        results_stmt = (
+            select(
+                ActivityResult.id,
+                ActivityResult.team_id,
+                Activity.checkpoint_id,
+                ActivityResult.final_score,
+            )
+            .join(Activity, Activity.id == ActivityResult.activity_id)
+            .where(
+                ActivityResult.team_id.in_(team_ids),
+                ActivityResult.is_completed.is_(True),
+                ActivityResult.final_score.is_not(None),
+                Activity.checkpoint_id.is_not(None),
+            )
         )
-        results = (await self.db.scalars(stmt)).all()
-
-        checkpoint_scores: dict[int, float] = {}
-        checkpoint_order_by_id: dict[int, int] = {}
-        total_score = 0.0
-        for result in results:
-            if not (result.is_completed and result.final_score is not None):
-                continue
-            if not (result.activity and result.activity.checkpoint):
-                continue
-            checkpoint = result.activity.checkpoint
-            checkpoint_scores[checkpoint.id] = (
-                checkpoint_scores.get(checkpoint.id, 0.0) + result.final_score
+        awards_stmt = select(DynamicAward.id, DynamicAward.team_id, DynamicAward.points).where(
+            DynamicAward.team_id.in_(team_ids), DynamicAward.is_active.is_(True)
+        )
+        facts = [
+            ScoreFact(
+                LedgerSource.ACTIVITY_RESULT,
+                result_id,
+                team_id,
+                checkpoint_id,
+                # NOT NULL per the filter above.
+                cast("float", score),
             )
-            checkpoint_order_by_id[checkpoint.id] = checkpoint.order
-            total_score += result.final_score
+            for result_id, team_id, checkpoint_id, score in await self.db.execute(results_stmt)
+        ]
+        facts.extend(
+            ScoreFact(LedgerSource.AWARD, award_id, team_id, None, float(points))
+            for award_id, team_id, points in await self.db.execute(awards_stmt)
+        )
+        return facts
+
+    async def _result_facts(self, results: Sequence[ActivityResult]) -> list[ScoreFact]:
+        """Ledger facts for results just written (one query for their checkpoints)."""
+        activity_ids = {result.activity_id for result in results}
+        stmt = select(Activity.id, Activity.checkpoint_id).where(Activity.id.in_(activity_ids))
+        checkpoint_by_activity = dict((await self.db.execute(stmt)).tuples().all())
+        facts = []
+        for result in results:
+            checkpoint_id = checkpoint_by_activity.get(result.activity_id)
+            if result.is_completed and result.final_score is not None and checkpoint_id:
+                facts.append(
+                    ScoreFact(
+                        LedgerSource.ACTIVITY_RESULT,
+                        result.id,
+                        result.team_id,
+                        checkpoint_id,
+                        float(result.final_score),
+                    )
+                )
+            else:
+                facts.append(
+                    ScoreFact.revoked(LedgerSource.ACTIVITY_RESULT, result.id, result.team_id)
+                )
+        return facts
+
+    async def _record_score_facts(
+        self, facts: Sequence[ScoreFact], should_commit: bool = True
+    ) -> dict[int, float]:
+        """Apply score facts to the ledger in O(facts), then commit and publish."""
+        totals = await ScoreLedgerService(self.db).record(facts)
+        if should_commit:
+            await self._commit_and_publish_totals(totals)
+        return totals
 
-        return checkpoint_scores, checkpoint_order_by_id, total_score
+    async def record_award(self, award: DynamicAward, should_commit: bool = True) -> float:
+        """Fold a new, changed or revoked award into its team's score.
 
-    async def _active_award_points(self, team_id: int) -> float:
-        """Sum points from active dynamic awards for this team (D4)."""
-        award_stmt = select(DynamicAward).where(
-            DynamicAward.team_id == team_id,
-            DynamicAward.is_active.is_(True),
+        Flushes first so a fresh award has an id to key its ledger rows by.
+        Returns the team's new unrounded total.
+        """
+        await self.db.flush()
+        fact = (
+            ScoreFact(LedgerSource.AWARD, award.id, award.team_id, None, float(award.points))
+            if award.is_active
+            else ScoreFact.revoked(LedgerSource.AWARD, award.id, award.team_id)
         )
-        awards = (await self.db.scalars(award_stmt)).all()
-        return sum(float(award.points) for award in awards)
+        totals = await self._record_score_facts([fact], should_commit=should_commit)
+        return totals.get(award.team_id, 0.0)
 
-    async def _commit_and_publish_team_score(self, team_id: int, total_score: float) -> None:
+    async def _commit_and_publish(self, events: Sequence[BaseEvent]) -> None:
+        """Commit, then publish ``events``: the single funnel for every
+        leaderboard-affecting change.
+
+        Publishing after the commit means subscribers never see scores a
+        rollback would erase. With the transactional outbox on, the events are
+        staged in the committed transaction instead, for the outbox relay to
+        publish. No-op publish unless the realtime subsystem is on.
+        """
+        staged = stage_events(self.db, events)
         try:
             await self.db.commit()
         except Exception as e:
             logger.exception("Failed to update team scores")
             raise RallyError(f"Failed to update team scores: {str(e)}") from e
-        # Publish after the commit so subscribers never see scores a
-        # rollback would erase. No-op unless the realtime subsystem is on.
-        # This is the single funnel for every leaderboard-affecting change.
-        await publish_event(
-            TeamScoreUpdatedEvent(
-                payload=TeamScoreUpdatedPayload(team_id=team_id, total_score=total_score)
+        # An evaluation moves the team along its route, so its cached proximity
+        # targets go. Other processes drop theirs when the activity_result
+        # event reaches them.
+        payloads = [getattr(event, "payload", None) for event in events]
+        for team_id in {p.team_id for p in payloads if isinstance(p, ActivityResultChangedPayload)}:
+            forget_proximity_targets(team_id)
+        if not staged:
+            for event in events:
+                await publish_event(event)
+
+    async def _commit_and_publish_totals(
+        self, totals: dict[int, float], *events: BaseEvent
+    ) -> None:
+        """Commit, then publish one team's score event or one batched event
+        (none when no total moved), followed by ``events``."""
+        score_events: list[BaseEvent] = []
+        if len(totals) == 1:
+            [(team_id, total)] = totals.items()
+            score_events.append(
+                TeamScoreUpdatedEvent(
+                    payload=TeamScoreUpdatedPayload(team_id=team_id, total_score=total)
+                )
             )
-        )
-
-    async def update_team_scores(self, team_id: int, should_commit: bool = True) -> bool:
-        """Update team's total and score_per_checkpoint based on activity results"""
-        team = await self.db.get(Team, team_id)
-        if not team:
-            return False
+        elif totals:
+            score_events.append(self._team_scores_event(totals))
+        await self._commit_and_publish([*score_events, *events])
 
-        (
-            checkpoint_scores,
-            checkpoint_order_by_id,
-            total_score,
-        ) = await self._checkpoint_scores_for_team(team_id)
-        total_score += await self._active_award_points(team_id)
-
-        # Update team scores (round, don't truncate: float sums like 99.999…
-        # must not silently drop a point)
-        team.total = round(total_score)
-
-        # score_per_checkpoint is positional and parallel to team.times (visit
-        # order == checkpoint order). Lay the per-checkpoint scores out by the
-        # checkpoints' *current* order, sized to the number of visits, so the
-        # last slot stays the last-visited checkpoint's score for `[-1]`
-        # consumers. Keying the aggregation by id (above) keeps this correct
-        # even if orders shift during a reorder.
-        self._apply_checkpoint_layout(team, checkpoint_scores, checkpoint_order_by_id)
+    async def _commit_and_publish_team_score(self, team_id: int, total_score: float) -> None:
+        await self._commit_and_publish_totals({team_id: total_score})
 
-        if should_commit:
-            await self._commit_and_publish_team_score(team_id, total_score)
+    async def _commit_and_publish_team_scores(self, totals: dict[int, float]) -> None:
+        """Batched ``_commit_and_publish_team_score``: one commit, one event."""
+        await self._commit_and_publish([self._team_scores_event(totals)])
 
-        return True
+    @staticmethod
+    def _team_scores_event(totals: dict[int, float]) -> TeamScoresUpdatedEvent:
+        return TeamScoresUpdatedEvent(
+            payload=TeamScoresUpdatedPayload(
+                teams=[
+                    TeamScoreUpdatedPayload(team_id=team_id, total_score=total)
+                    for team_id, total in totals.items()
+                ]
+            )
+        )
 
-    def _apply_checkpoint_layout(
-        self,
-        team: Team,
-        checkpoint_scores: dict[int, float],
-        checkpoint_order_by_id: dict[int, int],
-    ) -> None:
-        """Lay per-checkpoint scores onto ``team.score_per_checkpoint``.
+    async def reconcile_score_ledger(
+        self, team_ids: Collection[int] | None = None
+    ) -> ReconcileReport:
+        """Check the score ledger against a full recompute and repair drift.
 
-        Extracted from ``update_team_scores`` so the batch path shares the exact
-        same positional layout (visit order == checkpoint order, sized to
-        ``team.times``).
+        Defaults to every team of the current event. Does not commit.
         """
-        scores_by_order = sorted(
-            (checkpoint_order_by_id[cid], score) for cid, score in checkpoint_scores.items()
+        if team_ids is None:
+            stmt = select(Team.id).where(await self._event_team_scope())
+            team_ids = list((await self.db.scalars(stmt)).all())
+        if not team_ids:
+            return ReconcileReport(totals={}, drifted=[], corrections=0)
+        return await ScoreLedgerService(self.db).reconcile(
+            team_ids, await self._expected_facts(team_ids)
         )
-        ordered_scores = [int(score) for _order, score in scores_by_order]
-        num_visits = len(team.times)
-        team.score_per_checkpoint = (
-            ordered_scores[:num_visits] + [0] * (num_visits - len(ordered_scores))
-        )[:num_visits]
 
-    async def update_all_team_scores(self, teams: list[Team]) -> None:
-        """Recompute total + per-checkpoint scores for many teams in bulk.
+    async def update_team_scores(self, team_id: int, should_commit: bool = True) -> bool:
+        """Recompute a team's total and score_per_checkpoint from scratch.
 
-        Avoids the N+1 the per-team ``update_team_scores`` incurs when called in
-        a loop: instead of 2 queries per team (results + awards) it issues 2
-        queries total, filtering by ``team_id IN (...)`` and grouping in Python.
-        Mutates each team in place (same session identity); the caller commits.
+        Writes that know which result or award they changed go through the
+        ledger directly (``_record_score_facts``/``record_award``); this full
+        recompute is for callers that don't, and repairs any ledger drift.
         """
-        if not teams:
-            return
-
-        team_ids = [team.id for team in teams]
+        report = await self.reconcile_score_ledger([team_id])
+        if team_id not in report.totals:
+            return False
 
-        results_stmt = (
-            select(ActivityResult)
-            .options(joinedload(ActivityResult.activity).joinedload(Activity.checkpoint))
-            .where(ActivityResult.team_id.in_(team_ids))
-        )
-        results = (await self.db.scalars(results_stmt)).all()
+        if should_commit:
+            await self._commit_and_publish_team_score(team_id, report.totals[team_id])
 
-        awards_stmt = select(DynamicAward).where(
-            DynamicAward.team_id.in_(team_ids),
-            DynamicAward.is_active.is_(True),
-        )
-        awards = (await self.db.scalars(awards_stmt)).all()
+        return True
 
-        # team_id -> (checkpoint_scores, checkpoint_order_by_id, raw_total)
-        per_team: dict[int, tuple[dict[int, float], dict[int, int], float]] = {
-            tid: ({}, {}, 0.0) for tid in team_ids
-        }
-        for result in results:
-            if not (result.is_completed and result.final_score is not None):
-                continue
-            if not (result.activity and result.activity.checkpoint):
-                continue
-            bucket = per_team.get(result.team_id)
-            if bucket is None:
-                continue
-            checkpoint_scores, checkpoint_order_by_id, _ = bucket
-            checkpoint = result.activity.checkpoint
-            checkpoint_scores[checkpoint.id] = (
-                checkpoint_scores.get(checkpoint.id, 0.0) + result.final_score
-            )
-            checkpoint_order_by_id[checkpoint.id] = checkpoint.order
-            per_team[result.team_id] = (
-                checkpoint_scores,
-                checkpoint_order_by_id,
-                bucket[2] + result.final_score,
-            )
+    async def update_all_team_scores(self, teams: list[Team]) -> dict[int, float]:
+        """Recompute total + per-checkpoint scores for many teams in bulk.
 
-        award_points_by_team: dict[int, float] = {}
-        for award in awards:
-            award_points_by_team[award.team_id] = award_points_by_team.get(
-                award.team_id, 0.0
-            ) + float(award.points)
+        Same full recompute as ``update_team_scores``, with a fixed number of
+        queries however many teams are passed. Mutates each team in place (same
+        session identity); the caller commits. Returns each team's unrounded
+        total (awards included), as published in score events.
+        """
+        report = await self.reconcile_score_ledger([team.id for team in teams])
+        return report.totals
 
-        for team in teams:
-            checkpoint_scores, checkpoint_order_by_id, raw_total = per_team[team.id]
-            total_score = raw_total + award_points_by_team.get(team.id, 0.0)
-            team.total = round(total_score)
-            self._apply_checkpoint_layout(team, checkpoint_scores, checkpoint_order_by_id)
+    @staticmethod
+    def _result_event(
+        event_cls: type[
+            ActivityResultCreatedEvent | ActivityResultUpdatedEvent | ActivityResultDeletedEvent
+        ],
+        *,
+        result_id: int,
+        team_id: int,
+        activity_id: int,
+    ) -> BaseEvent:
+        return event_cls(
+            payload=ActivityResultChangedPayload(
+                result_id=result_id, team_id=team_id, activity_id=activity_id
+            )
+        )
 
     async def _publish_result_change(
         self,
@@ -383,13 +449,12 @@ class ScoringService:
 
         Only call once the change is durable: subscribers (leaderboard now,
         badges later) must never react to a result a rollback would erase.
-        No-op unless the realtime subsystem is enabled.
+        Writes that own their commit go through ``_commit_and_publish``
+        instead. No-op unless the realtime subsystem is enabled.
         """
         await publish_event(
-            event_cls(
-                payload=ActivityResultChangedPayload(
-                    result_id=result_id, team_id=team_id, activity_id=activity_id
-                )
+            self._result_event(
+                event_cls, result_id=result_id, team_id=team_id, activity_id=activity_id
             )
         )
 
@@ -426,10 +491,11 @@ class ScoringService:
         # Recalculate final score
         await self._recalculate_result_score(result)
 
-        await self.db.commit()
-        # final_score changed, so the team total must follow.
-        if not self._defer_recompute:
-            await self.update_team_scores(team_id)
+        # final_score changed, so the team total must follow, in the same commit.
+        if self._defer_recompute:
+            await self.db.commit()
+        else:
+            await self._record_score_facts(await self._result_facts([result]))
         return True
 
     async def apply_penalty(
@@ -451,10 +517,11 @@ class ScoringService:
         # Recalculate final score
         await self._recalculate_result_score(result)
 
-        await self.db.commit()
-        # final_score changed, so the team total must follow.
-        if not self._defer_recompute:
-            await self.update_team_scores(team_id)
+        # final_score changed, so the team total must follow, in the same commit.
+        if self._defer_recompute:
+            await self.db.commit()
+        else:
+            await self._record_score_facts(await self._result_facts([result]))
         return True
 
     async def apply_vomit_penalty(self, team_id: int, activity_id: int) -> bool:
@@ -555,27 +622,37 @@ class ScoringService:
 
         db_obj = activity_result_crud.build(obj_in, final_score)
         self._set_activity_specific_scores(db_obj, activity, obj_in.result_data)
-        await activity_result_crud.persist(self.db, db_obj, commit=commit)
+        # Only flushed: the row, the rescore and the ledger delta it implies
+        # commit together below, so a result is never durable without them.
+        await activity_result_crud.persist(self.db, db_obj, commit=False)
 
         # Adding a time-based result shifts the ranking, so rescore the rest.
         # When recompute is deferred, the scoring worker does this off-path;
         # the row keeps its own freshly-computed final_score in the meantime.
+        totals: dict[int, float] = {}
         if recalc and is_time_based and not self._defer_recompute:
-            await self._recalculate_all_results_for_activity(
-                activity.id, exclude_result_id=db_obj.id
+            totals = await self._recalculate_all_results_for_activity(
+                activity.id, exclude_result_id=db_obj.id, commit=False
             )
 
         if update_team_scores and not self._defer_recompute:
-            await self.update_team_scores(obj_in.team_id)
+            totals.update(
+                await self._record_score_facts(
+                    await self._result_facts([db_obj]), should_commit=False
+                )
+            )
 
-        # Granular event only when this call owns the commit. Batched callers
-        # (commit=False, e.g. team-vs) publish once after their own commit.
+        # Commit and publish only when this call owns the commit. Batched
+        # callers (commit=False, e.g. team-vs) publish after their own commit.
         if commit:
-            await self._publish_result_change(
-                ActivityResultCreatedEvent,
-                result_id=db_obj.id,
-                team_id=db_obj.team_id,
-                activity_id=db_obj.activity_id,
+            await self._commit_and_publish_totals(
+                totals,
+                self._result_event(
+                    ActivityResultCreatedEvent,
+                    result_id=db_obj.id,
+                    team_id=db_obj.team_id,
+                    activity_id=db_obj.activity_id,
+                ),
             )
 
         return db_obj
@@ -591,9 +668,11 @@ class ScoringService:
 
         When ``editor`` is given, an ``EvaluationHistory`` row is appended with
         the field-level diff — the audit trail for who changed a score. No row
-        is written when nothing actually changed.
+        is written when nothing actually changed. The row, the audit entry and
+        the ledger delta commit together.
         """
         before = _snapshot_result(db_obj) if editor is not None else None
+        totals: dict[int, float] = {}
 
         update_data = activity_result_crud.apply_update(db_obj, obj_in)
 
@@ -613,30 +692,37 @@ class ScoringService:
                 and activity.activity_type == ActivityType.TIME_BASED.value
                 and not self._defer_recompute
             ):
-                await self._recalculate_all_results_for_activity(activity.id)
+                totals = await self._recalculate_all_results_for_activity(activity.id, commit=False)
 
-        await activity_result_crud.persist(self.db, db_obj)
+        await activity_result_crud.persist(self.db, db_obj, commit=False)
 
         if before is not None and editor is not None:
-            await self._record_history(db_obj, before, editor)
+            self._record_history(db_obj, before, editor)
 
         if not self._defer_recompute:
-            await self.update_team_scores(db_obj.team_id)
-        await self._publish_result_change(
-            ActivityResultUpdatedEvent,
-            result_id=db_obj.id,
-            team_id=db_obj.team_id,
-            activity_id=db_obj.activity_id,
+            totals.update(
+                await self._record_score_facts(
+                    await self._result_facts([db_obj]), should_commit=False
+                )
+            )
+        await self._commit_and_publish_totals(
+            totals,
+            self._result_event(
+                ActivityResultUpdatedEvent,
+                result_id=db_obj.id,
+                team_id=db_obj.team_id,
+                activity_id=db_obj.activity_id,
+            ),
         )
         return db_obj
 
-    async def _record_history(
+    def _record_history(
         self,
         db_obj: ActivityResult,
         before: dict[str, Any],
         editor: EvaluationEditor,
     ) -> None:
-        """Append an UPDATED audit row when audited fields actually changed."""
+        """Stage an UPDATED audit row when audited fields actually changed (no commit)."""
         changes = _diff_snapshots(before, _snapshot_result(db_obj))
         if not changes:
             return
@@ -649,7 +735,6 @@ class ScoringService:
                 changes=changes,
             )
         )
-        await self.db.commit()
 
     async def remove_result(self, result_id: int) -> ActivityResult | None:
         """Delete a result and refresh the owning team's scores."""
@@ -660,33 +745,43 @@ class ScoringService:
         # Capture identifiers before the row is gone.
         team_id = db_obj.team_id
         activity_id = db_obj.activity_id
-        await activity_result_crud.delete(self.db, db_obj=db_obj)
+        # The delete and the ledger's revocation commit together.
+        await activity_result_crud.delete(self.db, db_obj=db_obj, commit=False)
+        totals: dict[int, float] = {}
         if not self._defer_recompute:
-            await self.update_team_scores(team_id)
-        await self._publish_result_change(
-            ActivityResultDeletedEvent,
-            result_id=result_id,
-            team_id=team_id,
-            activity_id=activity_id,
+            totals = await self._record_score_facts(
+                [ScoreFact.revoked(LedgerSource.ACTIVITY_RESULT, result_id, team_id)],
+                should_commit=False,
+            )
+        await self._commit_and_publish_totals(
+            totals,
+            self._result_event(
+                ActivityResultDeletedEvent,
+                result_id=result_id,
+                team_id=team_id,
+                activity_id=activity_id,
+            ),
         )
         return db_obj
 
     async def _recalculate_all_results_for_activity(
         self, activity_id: int, exclude_result_id: int | None = None, *, commit: bool = True
-    ) -> None:
+    ) -> dict[int, float]:
         """Rescore every completed result of a time-based activity.
 
         Called when the set of times changed (a result was added/edited), since
         relative ranking depends on the full distribution of completion times.
 
-        Pass commit=False to defer persistence to the caller, so this rescore
-        can be batched into a single atomic transaction.
+        Pass commit=False to defer persistence (and the batched
+        ``team.scores_updated`` event) to the caller, so this rescore can be
+        batched into a single atomic transaction. Returns the rescored teams'
+        new totals (empty when nothing was rescored).
         """
         start = time.perf_counter()
         with traced("scoring.recalculate_all_results_for_activity"):
             activity = await self.db.get(Activity, activity_id)
             if not activity or activity.activity_type != ActivityType.TIME_BASED.value:
-                return
+                return {}
 
             stmt = select(ActivityResult).where(
                 ActivityResult.activity_id == activity_id, ActivityResult.is_completed.is_(True)
@@ -696,7 +791,7 @@ class ScoringService:
 
             all_results = list((await self.db.scalars(stmt)).all())
             if not all_results:
-                return
+                return {}
 
             all_times = [float(r.time_score) for r in all_results if r.time_score is not None]
             if exclude_result_id is not None:
@@ -705,109 +800,161 @@ class ScoringService:
                 if excluded and excluded.time_score is not None:
                     all_times.append(float(excluded.time_score))
 
-            team_size_cache: dict[int, int] = {}
-            for result in all_results:
-                if result.team_id not in team_size_cache:
-                    team_size_cache[result.team_id] = await self._team_size(result.team_id)
-                result.final_score = await self.compute_final_score(
-                    activity_type=activity.activity_type,
-                    config=activity.config,
-                    result_data=result.result_data,
-                    team_size=team_size_cache[result.team_id],
-                    extra_shots=result.extra_shots,
-                    penalties=result.penalties,
-                    all_times=all_times,
-                )
-
+            instance = ActivityFactory.create_activity(activity.activity_type, activity.config)
+            time_scorer = (
+                instance.relative_ranking_scorer(all_times) if len(all_times) > 1 else None
+            )
+            bonus_per_shot = (
+                await self._bonus_per_extra_shot()
+                if any(r.extra_shots for r in all_results)
+                else None
+            )
+            scores = [
+                {
+                    "id": result.id,
+                    "final_score": self._score_with(
+                        instance,
+                        activity_type=activity.activity_type,
+                        result_data=result.result_data,
+                        # Time-based scoring never looks at team size.
+                        team_size=1,
+                        extra_shots=result.extra_shots,
+                        penalties=result.penalties,
+                        bonus_per_shot=bonus_per_shot,
+                        time_scorer=time_scorer,
+                    ),
+                }
+                for result in all_results
+            ]
+            # One executemany UPDATE by primary key. The default "evaluate"
+            # sync copies the new scores onto the loaded results, which the
+            # team-score refresh below reads back from the identity map.
+            await self.db.execute(update(ActivityResult), scores)
+
+            # Every ranked team's total moved: append one ledger delta per
+            # rescored result and land results + totals in one commit with a
+            # single batched event, not a commit and a leaderboard rebuild per
+            # team.
+            totals = await self._record_score_facts(
+                await self._result_facts(all_results), should_commit=False
+            )
             if commit:
-                await self.db.commit()
-            for team_id in {r.team_id for r in all_results}:
-                await self.update_team_scores(team_id, should_commit=commit)
+                await self._commit_and_publish_team_scores(totals)
         observe_scoring_recompute(time.perf_counter() - start)
+        return totals
+
+    async def _event_team_scope(self) -> ColumnElement[bool]:
+        """Teams of the current event (legacy NULL rows count as current, as in crud.team)."""
+        event_id = await current_event_id(self.db)
+        return (Team.event_id == event_id) | (Team.event_id.is_(None))
 
-    async def _completed_counts_by_team(self) -> dict[int, int]:
-        """Completed-activity count per team, in one grouped query (avoids N+1)."""
-        count_stmt = (
-            select(ActivityResult.team_id, func.count())
+    async def _get_activity_ranking(self, activity_id: int) -> list[dict[str, Any]]:
+        """Rank teams by final_score for one activity ("1224" competition ranking).
+
+        One statement: ``RANK() OVER`` does the ranking and a grouped subquery
+        supplies each team's completed-activity count, so only the rendered
+        rows leave Postgres.
+        """
+        completed_counts = (
+            select(
+                ActivityResult.team_id.label("team_id"),
+                func.count().label("activities_completed"),
+            )
             .where(ActivityResult.is_completed.is_(True))
             .group_by(ActivityResult.team_id)
+            .subquery()
         )
-        rows = (await self.db.execute(count_stmt)).all()
-        return {row[0]: row[1] for row in rows}
-
-    async def _get_activity_ranking(self, activity_id: int) -> list[dict[str, Any]]:
-        """Rank teams by final_score for one activity ("1224" competition ranking)."""
+        score = func.coalesce(ActivityResult.final_score, 0.0)
         stmt = (
-            select(ActivityResult)
-            .options(joinedload(ActivityResult.team))
-            .where(ActivityResult.activity_id == activity_id)
-        )
-        results = (await self.db.scalars(stmt)).all()
-        results = sorted(
-            results, key=lambda r: (r.final_score is not None, r.final_score or 0), reverse=True
-        )
-
-        completed_counts = await self._completed_counts_by_team()
-
-        ranking = []
-        prev_score: float | None = None
-        rank = 0
-        for i, result in enumerate(results, 1):
-            if not result.team:
-                continue
-            score = float(result.final_score or 0)
-            if prev_score is None or score != prev_score:
-                rank = i
-            prev_score = score
-            ranking.append(
-                {
-                    "rank": rank,
-                    "team_id": result.team.id,
-                    "team_name": result.team.name,
-                    "score": result.final_score or 0,
-                    "activities_completed": completed_counts.get(result.team.id, 0),
-                    "completed_at": result.completed_at,
-                }
+            select(
+                func.rank().over(order_by=score.desc()).label("rank"),
+                Team.id,
+                Team.name,
+                score.label("score"),
+                func.coalesce(completed_counts.c.activities_completed, 0),
+                ActivityResult.completed_at,
             )
-        return ranking
-
-    @staticmethod
-    def _ranking_score(item: dict[str, Any]) -> float:
-        score = item.get("total_score", 0)
-        return float(score) if score is not None else 0.0
+            .join(Team, Team.id == ActivityResult.team_id)
+            .outerjoin(completed_counts, completed_counts.c.team_id == Team.id)
+            .where(ActivityResult.activity_id == activity_id, await self._event_team_scope())
+            # Unscored results sort after real zeroes (they share the rank).
+            .order_by(score.desc(), ActivityResult.final_score.desc().nulls_last(), Team.id)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        return [
+            {
+                "rank": int(row[0]),
+                "team_id": row[1],
+                "team_name": row[2],
+                "score": float(row[3]),
+                "activities_completed": int(row[4]),
+                "completed_at": row[5],
+            }
+            for row in rows
+        ]
 
     async def _get_global_ranking(self) -> list[dict[str, Any]]:
-        """Rank teams by total score across all activities ("1224" ranking)."""
-        team_stmt = select(Team).options(selectinload(Team.activity_results))
-        teams: list[Team] = list((await self.db.scalars(team_stmt)).all())
-
-        ranking = []
-        for team in teams:
-            # activity_results are eager-loaded via selectinload above; compute
-            # the total from them instead of a per-team query (avoids N+1).
-            completed = [r for r in team.activity_results if r.is_completed]
-            total_score = sum(float(r.final_score) for r in completed if r.final_score is not None)
-            ranking.append(
-                {
-                    "team_id": team.id,
-                    "team_name": team.name,
-                    "total_score": total_score,
-                    "activities_completed": len(completed),
-                }
-            )
+        """Rank teams by total score across all activities ("1224" ranking).
 
-        ranking.sort(key=self._ranking_score, reverse=True)
+        Totals, completion counts and ``RANK() OVER`` are all computed in one
+        grouped statement over the current event's teams.
+        """
+        completed = ActivityResult.is_completed.is_(True)
+        total = func.coalesce(func.sum(ActivityResult.final_score).filter(completed), 0.0)
+        stmt = (
+            select(
+                Team.id,
+                Team.name,
+                total.label("total_score"),
+                func.count(ActivityResult.id).filter(completed),
+                func.rank().over(order_by=total.desc()).label("rank"),
+            )
+            .outerjoin(ActivityResult, ActivityResult.team_id == Team.id)
+            .where(await self._event_team_scope())
+            .group_by(Team.id, Team.name)
+            .order_by(total.desc(), Team.id)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        return [
+            {
+                "team_id": row[0],
+                "team_name": row[1],
+                "total_score": float(row[2] or 0.0),
+                "activities_completed": int(row[3]),
+                "rank": int(row[4]),
+            }
+            for row in rows
+        ]
 
-        prev_total: float | None = None
-        rank = 0
-        for i, team_rank in enumerate(ranking, 1):
-            total = self._ranking_score(team_rank)
-            if prev_total is None or total != prev_total:
-                rank = i
-            prev_total = total
-            team_rank["rank"] = rank
+    async def get_team_ranking_entry(self, team_id: int) -> dict[str, Any] | None:
+        """One team's global-ranking row (without ``rank``).
 
-        return ranking
+        The ``_get_global_ranking`` row for a single team, so the leaderboard
+        worker can refresh one standing without re-ranking every team. None if
+        the team is gone or not on the current event's board, so the worker
+        drops it rather than ranking it.
+        """
+        completed = ActivityResult.is_completed.is_(True)
+        stmt = (
+            select(
+                Team.id,
+                Team.name,
+                func.coalesce(func.sum(ActivityResult.final_score).filter(completed), 0.0),
+                func.count(ActivityResult.id).filter(completed),
+            )
+            .outerjoin(ActivityResult, ActivityResult.team_id == Team.id)
+            .where(Team.id == team_id, await self._event_team_scope())
+            .group_by(Team.id, Team.name)
+        )
+        row = (await self.db.execute(stmt)).first()
+        if row is None:
+            return None
+        return {
+            "team_id": row[0],
+            "team_name": row[1],
+            "total_score": float(row[2] or 0.0),
+            "activities_completed": int(row[3]),
+        }
 
     async def get_team_ranking(self, activity_id: int | None = None) -> list[dict[str, Any]]:
         """Get team ranking for specific activity or global ranking"""
@@ -930,21 +1077,24 @@ class ScoringService:
             # Recalculate the activity and both teams' scores, still deferring the
             # commit so everything persists atomically below.
             await self._recalculate_all_results_for_activity(activity_id, commit=False)
-            await self.update_team_scores(team1_id, should_commit=False)
-            await self.update_team_scores(team2_id, should_commit=False)
+            await self._record_score_facts(
+                await self._result_facts([result1_db_obj, result2_db_obj]), should_commit=False
+            )
             # Single commit: either the full match persists or nothing does.
-            await self.db.commit()
-
             # Both results were persisted with commit=False, so neither emitted
-            # its own event. Publish now (post-commit) so the leaderboard and
-            # future badge consumers see the completed head-to-head.
-            for db_obj in (result1_db_obj, result2_db_obj):
-                await self._publish_result_change(
-                    ActivityResultCreatedEvent,
-                    result_id=db_obj.id,
-                    team_id=db_obj.team_id,
-                    activity_id=db_obj.activity_id,
-                )
+            # its own event; they go out with this commit so the leaderboard
+            # and badge consumers see the completed head-to-head.
+            await self._commit_and_publish(
+                [
+                    self._result_event(
+                        ActivityResultCreatedEvent,
+                        result_id=db_obj.id,
+                        team_id=db_obj.team_id,
+                        activity_id=db_obj.activity_id,
+                    )
+                    for db_obj in (result1_db_obj, result2_db_obj)
+                ]
+            )
 
             return result1_db_obj, result2_db_obj
 
@@ -0,0 +1,159 @@
+"""Versioned, cached snapshot of the current event's rally settings.
+
+Nearly every request reads a few settings (visibility toggles, penalties,
+route rules). ``current_settings`` serves them from an immutable
+``RallySettingsSnapshot`` instead of the settings row, looked up in three
+places in turn:
+
+1. this process's copy, for ``settings.SETTINGS_CACHE_SECONDS``;
+2. the shared copy in Redis (same TTL), filled by whichever process read the
+   database last;
+3. the database, read through ``crud.rally_settings.load_snapshot``, which
+   never writes (unlike ``get_or_create``, which adopts legacy rows, creates
+   missing ones and re-syncs the timing from the event, committing each time).
+
+Every settings write calls ``settings_changed`` after its commit. It bumps
+the event's version counter in Redis, drops the shared and local copies, and
+broadcasts ``settings.changed`` so every other API process drops its copy too
+(see app.events.invalidation). A reader only stores a snapshot in Redis if the
+version it read before querying the database is still current, so a read that
+raced a write cannot put the old values back.
+
+Redis errors fail open: reads fall back to the database and the local copy,
+whose TTL then bounds how stale another process can be.
+"""
+
+import logging
+import threading
+import time
+
+import redis.asyncio as aredis
+from redis.exceptions import RedisError, WatchError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_async_redis_client
+from app.crud._event_scope import current_event_id
+from app.crud.crud_rally_settings import rally_settings
+from app.events.publisher import publish_event
+from app.events.schemas import SettingsChangedEvent, SettingsChangedPayload
+from app.schemas.rally_settings import RallySettingsSnapshot
+
+logger = logging.getLogger(__name__)
+
+# String: the snapshot as JSON, expiring after SETTINGS_CACHE_SECONDS.
+SNAPSHOT_KEY = "rally:settings:{event_id}:snapshot"
+# Counter: bumped by every settings write to the event.
+VERSION_KEY = "rally:settings:{event_id}:version"
+
+_lock = threading.Lock()
+# event id -> (snapshot, monotonic expiry)
+_snapshots: dict[int, tuple[RallySettingsSnapshot, float]] = {}
+# Bumped by every invalidation, so a read that started before a write cannot
+# cache what it read after the write dropped the cache.
+_generation = 0
+
+
+def forget_settings() -> None:
+    """Drop every locally cached snapshot."""
+    global _generation
+    with _lock:
+        _snapshots.clear()
+        _generation += 1
+
+
+def _cached(event_id: int) -> RallySettingsSnapshot | None:
+    entry = _snapshots.get(event_id)
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    return entry[0]
+
+
+def _remember(snapshot: RallySettingsSnapshot, generation: int) -> None:
+    with _lock:
+        if generation != _generation:
+            return
+        _snapshots[snapshot.event_id] = (
+            snapshot,
+            time.monotonic() + settings.SETTINGS_CACHE_SECONDS,
+        )
+
+
+async def _share(
+    client: aredis.Redis,
+    event_id: int,
+    snapshot: RallySettingsSnapshot,
+    version: bytes | str | None,
+) -> None:
+    """Store ``snapshot`` in Redis unless a write bumped the version since ``version``."""
+    version_key = VERSION_KEY.format(event_id=event_id)
+    async with client.pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(version_key)
+            if await pipe.get(version_key) != version:
+                return
+            pipe.multi()  # type: ignore[no-untyped-call]
+            pipe.set(
+                SNAPSHOT_KEY.format(event_id=event_id),
+                snapshot.model_dump_json(),
+                ex=max(1, round(settings.SETTINGS_CACHE_SECONDS)),
+            )
+            await pipe.execute()
+        except WatchError:
+            # A write landed while the database was read; the next read rebuilds.
+            pass
+
+
+async def _load(db: AsyncSession, event_id: int) -> RallySettingsSnapshot:
+    """Read the shared snapshot, or build it from the database and share it."""
+    client = get_async_redis_client()
+    try:
+        try:
+            cached, version = await client.mget(
+                SNAPSHOT_KEY.format(event_id=event_id), VERSION_KEY.format(event_id=event_id)
+            )
+        except RedisError as exc:
+            logger.warning("Settings snapshot cache unavailable, reading the database: %s", exc)
+            return await rally_settings.load_snapshot(db, version=0)
+        if cached is not None:
+            return RallySettingsSnapshot.model_validate_json(cached)
+
+        snapshot = await rally_settings.load_snapshot(db, version=int(version or 0))
+        try:
+            await _share(client, event_id, snapshot, version)
+        except RedisError as exc:
+            logger.warning("Could not share the settings snapshot: %s", exc)
+        return snapshot
+    finally:
+        await client.aclose()
+
+
+async def current_settings(db: AsyncSession) -> RallySettingsSnapshot:
+    """Return the current event's settings snapshot. Never writes settings."""
+    event_id = await current_event_id(db)
+    snapshot = _cached(event_id)
+    if snapshot is not None:
+        return snapshot
+    generation = _generation
+    snapshot = await _load(db, event_id)
+    _remember(snapshot, generation)
+    return snapshot
+
+
+async def settings_changed(event_id: int) -> None:
+    """Invalidate ``event_id``'s snapshot everywhere; call after the commit."""
+    forget_settings()
+    version: int | None = None
+    client = get_async_redis_client()
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.incr(VERSION_KEY.format(event_id=event_id))
+            pipe.delete(SNAPSHOT_KEY.format(event_id=event_id))
+            version, _ = await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Could not bump the settings version of event %s: %s", event_id, exc)
+    finally:
+        await client.aclose()
+    await publish_event(
+        SettingsChangedEvent(payload=SettingsChangedPayload(event_id=event_id, version=version))
+    )
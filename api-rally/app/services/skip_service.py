@@ -14,14 +14,15 @@ from app.api.api_v1.staff_evaluation_utils import checkin_team_to_checkpoint
 from app.core.exceptions import RallyNotFoundError, RallyValidationError
 from app.crud import crud_activity
 from app.crud.crud_checkpoint import CRUDCheckPoint
-from app.crud.crud_rally_settings import rally_settings
 from app.crud.crud_team import CRUDTeam
 from app.models.checkpoint_skip import CheckpointSkip
 from app.models.dynamic_scoring import DynamicAward
 from app.schemas.skip import CheckpointSkipped
 from app.services.checkin_service import require_same_event
+from app.services.proximity_targets import team_progress_changed
 from app.services.route_progress import can_reach_checkpoint
 from app.services.scoring_service import ScoringService
+from app.services.settings_snapshot import current_settings
 
 ALREADY_SKIPPED = "This checkpoint was already given up on"
 SKIP_DISABLED = "Giving up on a checkpoint is not enabled for this event"
@@ -52,7 +53,7 @@ class SkipService:
         # Cross-edition guard, same rule every progress path applies.
         require_same_event(team.event_id, checkpoint.event_id)
 
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         if not getattr(settings, "skip_enabled", True):
             raise RallyValidationError(SKIP_DISABLED)
         # Hours are not enforced here: giving up on a bar that has not opened
@@ -73,9 +74,13 @@ class SkipService:
         except IntegrityError:
             raise RallyValidationError(ALREADY_SKIPPED) from None
 
-        if cost != 0:
+        award = (
             await self._charge(team_id=team_id, cost=cost, checkpoint_order=checkpoint.order)
+            if cost != 0
+            else None
+        )
         await self._db.commit()
+        await team_progress_changed(team_id)
 
         # Advancing is the whole point: append to team.times so the team's
         # current pointer moves to the next post. compute_checkpoint_progress
@@ -83,8 +88,10 @@ class SkipService:
         # activity no longer blocks the route.
         await checkin_team_to_checkpoint(self._db, team_id, checkpoint_id)
 
-        if cost != 0:
-            await ScoringService(self._db).update_team_scores(team_id)
+        if award is not None:
+            # After the check-in, so score_per_checkpoint is laid out over the
+            # team's new visit count.
+            await ScoringService(self._db).record_award(award)
 
         next_checkpoint = await self._checkpoint_crud.get_next(db=self._db, team_id=team_id)
         return CheckpointSkipped(
@@ -93,17 +100,17 @@ class SkipService:
             next_checkpoint_order=next_checkpoint.order if next_checkpoint else None,
         )
 
-    async def _charge(self, *, team_id: int, cost: int, checkpoint_order: int) -> None:
+    async def _charge(self, *, team_id: int, cost: int, checkpoint_order: int) -> DynamicAward:
         """Bill the forfeit as a DynamicAward, for the same reason hints are:
-        team.total is recomputed from activity results plus active awards, so a
-        direct decrement would be erased by the next recompute."""
+        team.total is the sum of activity results plus active awards, so a
+        direct decrement would be erased by the next reconciliation."""
         event = await crud_activity.rally_event.get_current(self._db)
-        self._db.add(
-            DynamicAward(
-                team_id=team_id,
-                event_id=event.id if event else None,
-                points=float(cost),
-                reason=f"Desistiu do posto {checkpoint_order}"[:256],
-                is_active=True,
-            )
+        award = DynamicAward(
+            team_id=team_id,
+            event_id=event.id if event else None,
+            points=float(cost),
+            reason=f"Desistiu do posto {checkpoint_order}"[:256],
+            is_active=True,
         )
+        self._db.add(award)
+        return award
@@ -11,11 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.exceptions import RallyForbiddenError, RallyNotFoundError, RallyValidationError
-from app.crud.crud_rally_settings import rally_settings
 from app.models.team import Team
 from app.models.user import User
 from app.schemas.team_members import TeamMemberAdd, TeamMemberUpdate
 from app.schemas.user import UserCreate
+from app.services.settings_snapshot import current_settings
 
 TEAM_NOT_FOUND_MESSAGE = "Team not found"
 USER_NOT_FOUND_MESSAGE = "User not found"
@@ -64,7 +64,7 @@ class TeamMemberService:
         """Add a new member to a team, enforcing the member cap, walk-up
         registration gating, and single-captain rule."""
         await self.get_team_or_raise(team_id)
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
 
         # Staff can only add members when walk-up registration is enabled.
         # Admins and managers are never gated.
@@ -14,26 +14,32 @@ from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import RallyNotFoundError, RallyValidationError
-from app.crud.crud_activity import activity
-from app.crud.crud_activity import activity_result as activity_result_crud
-from app.crud.crud_checkpoint import checkpoint as checkpoint_crud
-from app.crud.crud_rally_settings import rally_settings
+from app.crud._event_scope import current_event_id
 from app.crud.crud_team import CRUDTeam
 from app.models.checkpoint import CheckPoint
-from app.models.checkpoint_skip import CheckpointSkip
 from app.models.team import Team
 from app.schemas.team import (
     ListingTeam,
     PrivilegedDetailedTeam,
     TeamScoresUpdate,
 )
-from app.services.route_progress import can_reach_checkpoint, closed_message, hours_block_reason
+from app.services.proximity_targets import team_progress_changed
+from app.services.route_graph import route_graph
+from app.services.route_progress import (
+    CheckpointProgress,
+    can_reach_checkpoint,
+    checkpoint_progress,
+    closed_message,
+    hours_block_reason,
+    load_team_state,
+    teams_progress,
+)
 from app.services.route_progress import is_checkpoint_reachable as _is_checkpoint_reachable
-from app.services.scoring_service import ScoringService
+from app.services.settings_snapshot import current_settings
 
 
 def validate_rally_timing(
@@ -122,22 +128,31 @@ class TeamService:
         )
 
     async def update_classification_unlocked(self) -> None:
-        """Update team classifications based on activity results."""
-        teams = list(await self._team_crud.get_multi(db=self._db, for_update=True))
-        scoring_service = ScoringService(self._db)
-
-        # Recompute every team's scores in bulk (2 queries total) rather than
-        # per-team in a loop (which was 3 queries + a refresh each). Teams are
-        # already row-locked via for_update above; the batch mutates them in
-        # the same session, so no nested transaction or refresh is needed.
-        await scoring_service.update_all_team_scores(teams)
-
-        # Sort teams by total score (descending), then by name (ascending)
-        teams.sort(key=lambda t: (-t.total, t.name))
-
-        for i, team in enumerate(teams):
-            team.classification = i + 1
-            self._db.add(team)
+        """Rewrite ``classification`` from the current event's team totals.
+
+        One statement ranks the teams by total (descending), then name, and
+        writes only the rows whose place changed. Totals are kept current by
+        the score ledger as scores are written (and reconciled off-path by the
+        score ledger worker), so nothing is recomputed here and no team is
+        locked up front: a check-in that moved no total updates no row, and
+        concurrent check-ins at different posts no longer queue behind a lock
+        on every team of the event.
+        """
+        event_id = await current_event_id(self._db)
+        ranked = (
+            select(
+                Team.id.label("id"),
+                func.row_number().over(order_by=(Team.total.desc(), Team.name)).label("place"),
+            )
+            .where((Team.event_id == event_id) | (Team.event_id.is_(None)))
+            .subquery()
+        )
+        await self._db.execute(
+            update(Team)
+            .where(Team.id == ranked.c.id, Team.classification.is_distinct_from(ranked.c.place))
+            .values(classification=ranked.c.place)
+            .execution_options(synchronize_session="fetch")
+        )
 
     async def update_classification(self) -> None:
         await self.update_classification_unlocked()
@@ -184,12 +199,12 @@ class TeamService:
         """Record a team's arrival/score at a checkpoint and recompute classification.
 
         The transaction boundary: settings are resolved before the savepoint
-        (``get_or_create`` may itself commit — event bootstrap, legacy
-        adoption, timing sync — and a commit inside ``begin_nested()`` would
-        close the outer transaction), scores are appended inside the
-        savepoint, then the whole thing commits and classification recomputes.
+        (resolving the current event may bootstrap one and commit, and a
+        commit inside ``begin_nested()`` would close the outer transaction),
+        scores are appended inside the savepoint, then the whole thing commits
+        and classification recomputes.
         """
-        settings = await rally_settings.get_or_create(self._db)
+        settings = await current_settings(self._db)
         async with self._db.begin_nested():
             team = await self._team_crud.get(db=self._db, id=id, for_update=True)
             current_time = datetime.now(UTC)
@@ -210,6 +225,7 @@ class TeamService:
             )
 
         await self._db.commit()
+        await team_progress_changed(id)
         await self.update_classification()
         await self._db.refresh(team)
         return team
@@ -218,63 +234,23 @@ class TeamService:
         """Compute last fully completed checkpoint and current checkpoint.
 
         A checkpoint is considered completed only when all its activities have
-        a completed result for this team.
+        a completed result for this team (see ``checkpoint_progress``).
         Returns: (last_completed_order, current_order, last_checkpoint_name)
         """
-        checkpoints = await checkpoint_crud.get_all_ordered(self._db)
-        team_results = await activity_result_crud.get_by_team(self._db, team_id=team_obj.id)
-        completed_activity_ids = {
-            r.activity_id for r in team_results if getattr(r, "is_completed", False)
-        }
-        # A post the team gave up on is resolved, not completed: they score
-        # nothing for it, but it must stop blocking the route — otherwise the
-        # escape hatch would not actually let anyone out.
-        skipped_ids = set(
-            (
-                await self._db.scalars(
-                    select(CheckpointSkip.checkpoint_id).where(
-                        CheckpointSkip.team_id == team_obj.id
-                    )
-                )
-            ).all()
-        )
-        # Number of checkpoints the team has physically checked into (times grows
-        # by one per checkpoint reached, in order).
-        checked_in_count = len(team_obj.times)
-
-        last_completed_order = 0
-        last_completed_name: str | None = None
-        for cp in checkpoints:
-            if cp.id in skipped_ids:
-                last_completed_order = cp.order
-                last_completed_name = cp.name
-                continue
-            cp_activities = await activity.get_by_checkpoint(self._db, checkpoint_id=cp.id)
-            active_ids = [a.id for a in cp_activities if a.is_active]
-            if not active_ids:
-                # No activity to judge here: the post counts as done once the
-                # team has checked in (via GPS arrival auto-complete).
-                # Otherwise it is still their current, not-yet-reached post —
-                # stop here.
-                if checked_in_count >= cp.order:
-                    last_completed_order = cp.order
-                    last_completed_name = cp.name
-                    continue
-                break
-            if all(aid in completed_activity_ids for aid in active_ids):
-                last_completed_order = cp.order
-                last_completed_name = cp.name
-            else:
-                break
-
-        max_order = checkpoints[-1].order if checkpoints else 0
-        current_order = (
-            last_completed_order + 1 if last_completed_order < max_order else last_completed_order
+        progress = checkpoint_progress(
+            await route_graph(self._db),
+            await load_team_state(self._db, team_obj.id),
+            checked_in_count=len(team_obj.times),
         )
-        return last_completed_order, current_order, last_completed_name
+        return progress.last_completed_order, progress.current_order, progress.last_completed_name
 
     async def build_listing_team(
-        self, team: Team, *, reveal_next_checkpoint: bool = True, is_privileged: bool = False
+        self,
+        team: Team,
+        *,
+        reveal_next_checkpoint: bool = True,
+        is_privileged: bool = False,
+        progress: CheckpointProgress | None = None,
     ) -> ListingTeam:
         """Build team data for listing using strict completion rules.
 
@@ -283,12 +259,19 @@ class TeamService:
         in a peddy paper that name is the answer to a puzzle the viewer
         hasn't solved yet. Withheld from non-privileged viewers whenever
         ``reveal_next_checkpoint`` is off; staff/admin always see it.
+
+        ``progress`` is the team's precomputed progress (see
+        ``build_listing_teams``); computed here when not given.
         """
-        (
-            last_checkpoint_number,
-            current_checkpoint_number,
-            last_checkpoint_name,
-        ) = await self.compute_checkpoint_progress(team)
+        if progress is None:
+            progress = checkpoint_progress(
+                await route_graph(self._db),
+                await load_team_state(self._db, team.id),
+                checked_in_count=len(team.times),
+            )
+        last_checkpoint_number = progress.last_completed_order
+        current_checkpoint_number = progress.current_order
+        last_checkpoint_name = progress.last_completed_name
 
         if not reveal_next_checkpoint and not is_privileged:
             last_checkpoint_name = None
@@ -309,6 +292,26 @@ class TeamService:
             num_members=team.num_members,
         )
 
+    async def build_listing_teams(
+        self,
+        teams: Sequence[Team],
+        *,
+        reveal_next_checkpoint: bool = True,
+        is_privileged: bool = False,
+    ) -> list[ListingTeam]:
+        """``build_listing_team`` for a whole listing, computing every team's
+        progress in one batch (see ``teams_progress``) rather than per team."""
+        progress = await teams_progress(self._db, teams)
+        return [
+            await self.build_listing_team(
+                team,
+                reveal_next_checkpoint=reveal_next_checkpoint,
+                is_privileged=is_privileged,
+                progress=progress[team.id],
+            )
+            for team in teams
+        ]
+
     async def build_detailed_team(
         self, team_obj: Team, *, with_progress: bool = False, with_access_code: bool = False
     ) -> PrivilegedDetailedTeam:
@@ -327,5 +330,5 @@ class TeamService:
             last_cp, current_cp, _ = await self.compute_checkpoint_progress(team_obj)
             result.last_checkpoint_number = last_cp
             result.current_checkpoint_number = current_cp
-            result.total_checkpoints = len(await checkpoint_crud.get_all_ordered(self._db))
+            result.total_checkpoints = len((await route_graph(self._db)).posts)
         return result
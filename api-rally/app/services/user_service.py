@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.api import authentik_client
+from app.api.principal_cache import principals_changed
 from app.core.exceptions import RallyValidationError
 from app.models.user import User
 
@@ -129,6 +130,7 @@ class UserService:
             updated_assignment = await assignment_crud.create_or_update(
                 db=self._db, user_id=user_id, checkpoint_id=checkpoint_id
             )
+            await principals_changed(user_id)
 
             if updated_assignment:
                 return schema(
@@ -211,6 +213,7 @@ class UserService:
             updated_assignment = await assignment_crud.create_or_update(
                 db=self._db, user_id=user_id, team_id=team_id
             )
+            await principals_changed(user_id)
 
             if updated_assignment:
                 return schema(
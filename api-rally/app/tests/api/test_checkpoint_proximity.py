@@ -5,9 +5,14 @@ the post? So the assertions are as much about what is *absent* from the
 response — metres, coordinates, a bearing taken too early — as what is in it.
 """
 
+from unittest.mock import patch
+
 from app.crud.crud_checkpoint import checkpoint as crud_checkpoint
+from app.crud.crud_team import team as crud_team
 from app.models.activity import EventType
 from app.schemas.checkpoint import CheckPointCreate
+from app.schemas.team import TeamScoresUpdate
+from app.services import proximity_service
 from app.tests.conftest import as_team, make_event, make_team, set_rally_settings
 
 URL = "/api/rally/v1/checkpoint/{id}/proximity"
@@ -178,3 +183,50 @@ async def test_requires_a_team_token(pg_session, pg_client):
     resp = _read(pg_client, checkpoint, POST_LAT, POST_LON)
 
     assert resp.status_code in (401, 403), resp.text
+
+
+async def test_repeat_pings_skip_the_route_check(pg_session, pg_client):
+    event = await _make_event(pg_session)
+    checkpoint = await _make_checkpoint(pg_session, event_id=event.id)
+    team = await make_team(pg_session, event_id=event.id)
+    await set_rally_settings(pg_session, proximity_enabled=True)
+
+    with (
+        as_team(team.id, "TeamA"),
+        patch.object(
+            proximity_service, "can_reach_checkpoint", wraps=proximity_service.can_reach_checkpoint
+        ) as reach,
+    ):
+        first = _read(pg_client, checkpoint, 41.01, POST_LON)
+        second = _read(pg_client, checkpoint, POST_LAT, POST_LON)
+
+    assert first.status_code == second.status_code == 200
+    assert reach.await_count == 1
+    # Only the verdict is cached; every ping measures its own position.
+    assert first.json()["is_within_radius"] is False
+    assert second.json()["is_within_radius"] is True
+
+
+async def test_progress_makes_the_team_check_again(pg_session, pg_client):
+    event = await _make_event(pg_session)
+    first = await _make_checkpoint(pg_session, order=1, event_id=event.id)
+    await _make_checkpoint(pg_session, order=2, event_id=event.id, lat=41.5, lon=-8.5)
+    team = await make_team(pg_session, event_id=event.id)
+    await set_rally_settings(pg_session, proximity_enabled=True)
+
+    with as_team(team.id, "TeamA"):
+        assert _read(pg_client, first, POST_LAT, POST_LON).status_code == 200
+        # A staff check-in commits and drops the team's cached targets.
+        await crud_team.add_checkpoint(
+            db=pg_session,
+            id=team.id,
+            checkpoint_id=first.id,
+            obj_in=TeamScoresUpdate(
+                checkpoint_id=first.id, question_score=0, time_score=0, pukes=0, skips=0
+            ),
+        )
+
+        resp = _read(pg_client, first, POST_LAT, POST_LON)
+
+    # The team has moved past the post it had been sampling.
+    assert resp.status_code == 400, resp.text
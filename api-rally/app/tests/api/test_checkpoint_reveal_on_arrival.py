@@ -13,6 +13,7 @@ from app.crud.crud_team import team as crud_team
 from app.models.activity import Activity, EventType
 from app.schemas.checkpoint import CheckPointCreate
 from app.schemas.team import TeamCreate
+from app.services.settings_snapshot import forget_settings
 from app.tests.conftest import as_team, make_event
 
 CHECKPOINTS_URL = "/api/rally/v1/checkpoint/"
@@ -164,6 +165,8 @@ async def test_the_switch_keeps_an_arrived_post_hidden(pg_session, pg_client):
     await rally_settings.update(
         pg_session, id=settings.id, obj_in=RallySettingsUpdate(**data), commit=True
     )
+    # Written directly, not through the settings routes: drop the cached snapshot.
+    forget_settings()
 
     with as_team(team.id, "TeamA"):
         _arrive(pg_client, checkpoint)
@@ -1,6 +1,10 @@
 """API tests for the event (edition) endpoints, against real Postgres."""
 
+import pytest
+
+from app.api.api_v1 import events as events_module
 from app.crud.crud_activity import rally_event
+from app.events import BaseEvent
 from app.models.activity import EventType
 from app.schemas.activity import RallyEventCreate
 
@@ -74,6 +78,25 @@ async def test_set_current_event(pg_session, pg_client, as_admin):
     assert resp.json()["is_current"] is True
 
 
+async def test_set_current_event_broadcasts_the_switch(
+    pg_session, pg_client, as_admin, monkeypatch: pytest.MonkeyPatch
+):
+    created = await rally_event.create(pg_session, obj_in=RallyEventCreate(name="Next"))
+    published: list[BaseEvent] = []
+
+    async def _record(event: BaseEvent) -> None:
+        published.append(event)
+
+    monkeypatch.setattr(events_module, "publish_event", _record)
+
+    resp = pg_client.post(f"/api/rally/v1/events/{created.id}/set-current")
+
+    assert resp.status_code == 200, resp.text
+    assert [(e.event_type, e.payload.event_id) for e in published] == [
+        ("event.current_changed", created.id)
+    ]
+
+
 def test_set_current_event_not_found(pg_client, as_admin):
     resp = pg_client.post("/api/rally/v1/events/999999/set-current")
 
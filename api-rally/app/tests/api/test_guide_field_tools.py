@@ -21,6 +21,7 @@ from app.models.rally_guide_assignment import RallyGuideAssignment
 from app.schemas.checkpoint import CheckPointCreate
 from app.schemas.rally_settings import RallySettingsResponse, RallySettingsUpdate
 from app.schemas.team import TeamCreate
+from app.services.settings_snapshot import forget_settings
 from app.tests.conftest import make_event
 
 CHECKPOINTS_URL = "/api/rally/v1/guide/checkpoints"
@@ -280,6 +281,8 @@ class TestManualArrival:
         await rally_settings.update(
             pg_session, id=settings.id, obj_in=RallySettingsUpdate(**data), commit=True
         )
+        # Written directly, not through the settings routes: drop the cached snapshot.
+        forget_settings()
 
         resp = pg_client.post(ARRIVALS_URL.format(id=checkpoint.id), json={"team_id": team.id})
 
@@ -323,6 +326,28 @@ class TestTeamsAtCheckpoint:
         assert row["revealed_indication_ids"] == [indication.id]
         assert row["arrived_by_guide"] is True
 
+    async def test_shows_each_teams_open_activities_at_its_current_post(
+        self, pg_session, pg_client, as_guide
+    ):
+        event = await _make_event(pg_session)
+        await _enable_guide_mode(pg_session)
+        checkpoint = await _make_checkpoint(pg_session, order=1, event_id=event.id)
+        activity = Activity(
+            checkpoint_id=checkpoint.id, is_active=True, name="Prova", activity_type="generic"
+        )
+        pg_session.add(activity)
+        await pg_session.commit()
+        team = await _make_team(pg_session, event_id=event.id)
+        await _assign_guide(pg_session, team.id)
+
+        pg_client.post(ARRIVALS_URL.format(id=checkpoint.id), json={"team_id": team.id})
+        resp = pg_client.get(TEAMS_URL.format(id=checkpoint.id))
+
+        assert resp.status_code == 200, resp.text
+        [row] = resp.json()
+        assert row["current_checkpoint_number"] == 1
+        assert row["pending_activity_ids"] == [activity.id]
+
     async def test_is_empty_before_anyone_arrives(self, pg_session, pg_client, as_guide):
         event = await _make_event(pg_session)
         await _enable_guide_mode(pg_session)
@@ -70,6 +70,19 @@ class TestUpdateRallySettings:
         assert resp.status_code == 200, resp.text
         assert resp.json()["bonus_per_extra_shot"] == 7
 
+    async def test_update_replaces_the_cached_snapshot(self, pg_session, pg_client, as_admin):
+        await _make_event(pg_session)
+        before = pg_client.get("/api/rally/v1/rally/settings/public").json()
+
+        pg_client.put(
+            "/api/rally/v1/rally/settings",
+            json=_valid_settings_payload(bonus_per_extra_shot=before["bonus_per_extra_shot"] + 1),
+        )
+        after = pg_client.get("/api/rally/v1/rally/settings/public").json()
+
+        assert after["bonus_per_extra_shot"] == before["bonus_per_extra_shot"] + 1
+        assert "version" not in after
+
     async def test_non_admin_cannot_update_settings(self, pg_session, pg_client, as_user):
         await _make_event(pg_session)
 
@@ -1,6 +1,7 @@
 """API tests for the live scoreboard endpoints."""
 
 import asyncio
+import json
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
@@ -9,11 +10,14 @@ import fakeredis.aioredis
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api import conditional
 from app.api.api_v1 import scoreboard as scoreboard_module
-from app.api.api_v1.scoreboard import decode_value
 from app.core.config import get_settings
+from app.events import hub as hub_module
+from app.events.channels import Channels
+from app.events.hub import decode_value
 from app.main import app
-from app.services import leaderboard_cache
+from app.services import leaderboard_cache, leaderboard_recompute
 
 BASE = "/api/rally/v1"
 
@@ -83,6 +87,25 @@ class _FakeRequest:
         return self._calls > self._disconnect_after
 
 
+async def _event_one(_db: Any) -> int:
+    await asyncio.sleep(0)
+    return 1
+
+
+def _patch_redis(monkeypatch: pytest.MonkeyPatch, fake: fakeredis.aioredis.FakeRedis) -> None:
+    """Serve the cached board and the ranking ETag's version from `fake`, with
+    event 1 as the current event."""
+    monkeypatch.setattr(scoreboard_module, "get_async_redis_client", lambda: fake)
+    monkeypatch.setattr(conditional, "get_async_redis_client", lambda: fake)
+    monkeypatch.setattr(conditional, "current_event_id", _event_one)
+
+
+def _patch_hub(monkeypatch: pytest.MonkeyPatch, fake: "_FakeClient") -> None:
+    """Serve the SSE hub's subscription from `fake`, with a fast heartbeat."""
+    monkeypatch.setattr(hub_module, "get_async_redis_client", lambda: fake)
+    monkeypatch.setattr(hub_module, "HEARTBEAT_SECONDS", 0.01)
+
+
 @contextmanager
 def _override_settings(**overrides: Any) -> Iterator[None]:
     base = get_settings()
@@ -129,7 +152,7 @@ def test_stream_returns_503_when_disabled(client: TestClient) -> None:
 
 def test_live_serves_cached_ranking(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
-    monkeypatch.setattr("app.api.api_v1.scoreboard.get_async_redis_client", lambda: fake)
+    _patch_redis(monkeypatch, fake)
 
     ranking = [
         {
@@ -153,7 +176,7 @@ def test_live_computes_and_warms_cache_on_miss(
 ) -> None:
     """Cold cache: compute the ranking once, warm the cache, then serve it."""
     fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
-    monkeypatch.setattr("app.api.api_v1.scoreboard.get_async_redis_client", lambda: fake)
+    _patch_redis(monkeypatch, fake)
 
     ranking = [
         {
@@ -179,6 +202,138 @@ def test_live_computes_and_warms_cache_on_miss(
     assert cached == ranking
 
 
+def test_live_answers_matching_etag_with_304(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A poll carrying the current ETag is answered before any ranking read."""
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    _patch_redis(monkeypatch, fake)
+    asyncio.run(leaderboard_cache.write_global_leaderboard(fake, _board(2)))
+    asyncio.run(leaderboard_cache.bump_rankings_version(fake))
+
+    reads = 0
+    real_read = leaderboard_cache.read_global_leaderboard
+
+    async def _counting_read(*args: Any, **kwargs: Any) -> list[dict[str, Any]] | None:
+        nonlocal reads
+        reads += 1
+        return await real_read(*args, **kwargs)
+
+    monkeypatch.setattr(leaderboard_cache, "read_global_leaderboard", _counting_read)
+
+    first = client.get(f"{BASE}/scoreboard/live")
+    assert first.headers["ETag"] == '"rankings-1-1"'
+
+    cached = client.get(f"{BASE}/scoreboard/live", headers={"If-None-Match": first.headers["ETag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert reads == 1
+
+    asyncio.run(leaderboard_cache.bump_rankings_version(fake))
+    changed = client.get(f"{BASE}/scoreboard/live", headers={"If-None-Match": '"rankings-1-1"'})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] == '"rankings-1-2"'
+    assert reads == 2
+
+
+def test_live_flags_a_stale_fallback_and_drops_its_etag(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cold cache while another process holds the recompute: the last known
+    board is served marked stale, without an ETag a later 304 could pin."""
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    _patch_redis(monkeypatch, fake)
+    monkeypatch.setattr(leaderboard_recompute, "_last_known", _board(2))
+    asyncio.run(leaderboard_cache.bump_rankings_version(fake))
+    asyncio.run(leaderboard_cache.acquire_recompute_lock(fake, "other-process"))
+
+    with _override_settings(LEADERBOARD_RECOMPUTE_WAIT_SECONDS=0.0):
+        resp = client.get(f"{BASE}/scoreboard/live")
+
+    assert resp.status_code == 200
+    assert resp.json() == _board(2)
+    assert resp.headers[scoreboard_module.STALE_HEADER] == "true"
+    assert "ETag" not in resp.headers
+
+
+def _board(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "team_id": i,
+            "team_name": f"T{i}",
+            "total_score": float(100 - i),
+            "activities_completed": 1,
+            "rank": i,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def test_live_top_n_served_from_cache(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    _patch_redis(monkeypatch, fake)
+    asyncio.run(leaderboard_cache.write_global_leaderboard(fake, _board(6)))
+
+    resp = client.get(f"{BASE}/scoreboard/live", params={"limit": 3})
+    assert resp.status_code == 200
+    assert resp.json() == _board(6)[:3]
+
+
+def test_live_top_n_sliced_when_disabled(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _fake_ranking(self: Any) -> list[dict[str, Any]]:
+        await asyncio.sleep(0)
+        return _board(5)
+
+    monkeypatch.setattr("app.api.api_v1.scoreboard.ScoringService.get_team_ranking", _fake_ranking)
+
+    with _override_settings(EVENTS_ENABLED=False):
+        resp = client.get(f"{BASE}/scoreboard/live", params={"limit": 2})
+    assert resp.json() == _board(5)[:2]
+
+
+def test_window_around_team_served_from_cache(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    _patch_redis(monkeypatch, fake)
+    asyncio.run(leaderboard_cache.write_global_leaderboard(fake, _board(8)))
+
+    resp = client.get(f"{BASE}/scoreboard/live/teams/5", params={"radius": 1})
+    assert resp.status_code == 200
+    assert resp.json() == _board(8)[3:6]
+
+
+def test_window_around_team_computes_on_cold_cache(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    _patch_redis(monkeypatch, fake)
+
+    async def _fake_ranking(self: Any) -> list[dict[str, Any]]:
+        await asyncio.sleep(0)
+        return _board(4)
+
+    monkeypatch.setattr("app.api.api_v1.scoreboard.ScoringService.get_team_ranking", _fake_ranking)
+
+    resp = client.get(f"{BASE}/scoreboard/live/teams/1", params={"radius": 1})
+    assert resp.json() == _board(4)[:2]
+    # The cold read warmed the sorted set for the next caller.
+    assert asyncio.run(leaderboard_cache.is_warm(fake))
+
+
+def test_window_around_unknown_team_is_404(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    _patch_redis(monkeypatch, fake)
+    asyncio.run(leaderboard_cache.write_global_leaderboard(fake, _board(3)))
+
+    resp = client.get(f"{BASE}/scoreboard/live/teams/42")
+    assert resp.status_code == 404
+
+
 def test_events_stream_returns_503_when_disabled(client: TestClient) -> None:
     with _override_settings(EVENTS_ENABLED=False):
         resp = client.get(f"{BASE}/events/stream")
@@ -213,11 +368,8 @@ def test_stream_scoreboard_emits_refresh_on_publish(
 ) -> None:
     """Directly drive the `event_stream` generator returned by
     `stream_scoreboard`, avoiding real ASGI/network timing."""
-    monkeypatch.setattr(
-        scoreboard_module,
-        "get_async_redis_client",
-        lambda: _FakeClient(messages=[{"type": "message"}]),
-    )
+    refreshed = {"type": "pmessage", "channel": Channels.LEADERBOARD_REFRESHED, "data": "1"}
+    _patch_hub(monkeypatch, _FakeClient(messages=[refreshed]))
 
     async def _run() -> list[str]:
         settings = get_settings().model_copy(update={"EVENTS_ENABLED": True})
@@ -243,7 +395,7 @@ def test_stream_scoreboard_emits_ping_and_stops_on_disconnect(
     client disconnects the generator exits (covers the ping and break
     branches that `test_stream_scoreboard_emits_refresh_on_publish` and the
     fake-message path never reach)."""
-    monkeypatch.setattr(scoreboard_module, "get_async_redis_client", lambda: _FakeClient())
+    _patch_hub(monkeypatch, _FakeClient())
 
     async def _run() -> list[str]:
         settings = get_settings().model_copy(update={"EVENTS_ENABLED": True})
@@ -262,11 +414,74 @@ def test_stream_scoreboard_emits_ping_and_stops_on_disconnect(
     assert ": ping\n\n" in events
 
 
+def _delta_message(delta: str) -> dict[str, Any]:
+    return {"type": "pmessage", "channel": Channels.LEADERBOARD_REFRESHED, "data": delta}
+
+
+def _stream_frames(request: _FakeRequest, last_event_id: str, count: int) -> list[str]:
+    async def _run() -> list[str]:
+        settings = get_settings().model_copy(update={"EVENTS_ENABLED": True})
+        response = scoreboard_module.ScoreboardController().stream_scoreboard(
+            request, settings, last_event_id
+        )
+        frames = []
+        async for frame in response.body_iterator:
+            if frame != ": ping\n\n":
+                frames.append(frame)
+            if len(frames) >= count:
+                break
+        return frames
+
+    return asyncio.run(_run())
+
+
+def test_stream_scoreboard_resumes_from_last_event_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Missed deltas are replayed in order; a live delta the replay already
+    covered is not sent twice."""
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(scoreboard_module, "get_async_redis_client", lambda: fake)
+    row = _board(1)[0]
+    deltas = [
+        asyncio.run(leaderboard_cache.record_delta(fake, [row], [], history=10)) for _ in range(3)
+    ]
+    live = asyncio.run(leaderboard_cache.record_delta(fake, [row], [], history=10))
+    _patch_hub(monkeypatch, _FakeClient(messages=[_delta_message(deltas[2]), _delta_message(live)]))
+
+    frames = _stream_frames(_FakeRequest(disconnect_after=10), "1", 4)
+
+    assert frames == [
+        ": connected\n\n",
+        f"id: 2\nevent: refresh\ndata: {deltas[1]}\n\n",
+        f"id: 3\nevent: refresh\ndata: {deltas[2]}\n\n",
+        f"id: 4\nevent: refresh\ndata: {live}\n\n",
+    ]
+
+
+def test_stream_scoreboard_sends_snapshot_when_too_far_behind(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(scoreboard_module, "get_async_redis_client", lambda: fake)
+    board = _board(2)
+    asyncio.run(leaderboard_cache.write_global_leaderboard(fake, board))
+    for _ in range(3):
+        asyncio.run(leaderboard_cache.record_delta(fake, board, [], history=1))
+    _patch_hub(monkeypatch, _FakeClient())
+
+    frames = _stream_frames(_FakeRequest(disconnect_after=10), "0", 2)
+
+    assert frames[1].startswith("id: 3\nevent: snapshot\ndata: ")
+    snapshot = json.loads(frames[1].split("data: ", 1)[1])
+    assert snapshot == {"version": 3, "ranking": board}
+
+
 def test_pmessage_event_stream_emits_ping_and_stops_on_disconnect(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Same as above for `_pmessage_event_stream`'s ping/break branches."""
-    monkeypatch.setattr(scoreboard_module, "get_async_redis_client", lambda: _FakeClient())
+    _patch_hub(monkeypatch, _FakeClient())
 
     async def _run() -> list[str]:
         events = []
@@ -287,14 +502,10 @@ def test_pmessage_event_stream_forwards_activity_events(
     branches are covered without depending on ASGI transport timing."""
     pmessage = {
         "type": "pmessage",
-        "channel": b"activity_result:1",
+        "channel": Channels.ACTIVITY_RESULT_CREATED.encode(),
         "data": b'{"foo": "bar"}',
     }
-    monkeypatch.setattr(
-        scoreboard_module,
-        "get_async_redis_client",
-        lambda: _FakeClient(messages=[pmessage]),
-    )
+    _patch_hub(monkeypatch, _FakeClient(messages=[pmessage]))
 
     async def _run() -> list[str]:
         events = []
@@ -307,7 +518,8 @@ def test_pmessage_event_stream_forwards_activity_events(
 
     events = asyncio.run(_run())
     assert events[0] == ": connected\n\n"
-    assert any('event: activity_result:1\ndata: {"foo": "bar"}' in e for e in events)
+    expected = f'event: {Channels.ACTIVITY_RESULT_CREATED}\ndata: {{"foo": "bar"}}'
+    assert any(expected in e for e in events)
 
 
 def test_decode_handles_str_and_bytes() -> None:
@@ -35,6 +35,7 @@ from app.schemas.activity import ActivityCreate, ActivityResultEvaluation, Activ
 from app.schemas.checkpoint import CheckPointCreate
 from app.schemas.team import TeamCreate
 from app.services.scoring_service import ScoringService
+from app.services.settings_snapshot import forget_settings
 from app.tests.conftest import make_event as _make_event
 
 
@@ -667,6 +668,7 @@ class TestCheckinAndAdvanceExceptionPaths:
         event.end_time = datetime.now(UTC) + timedelta(hours=2)
         pg_session.add(event)
         await pg_session.commit()
+        forget_settings()
 
         with pytest.raises(RallyValidationError):
             await advance_team_to_next_checkpoint(pg_session, team.id)
@@ -421,6 +421,34 @@ class TestUpdateTeam:
         assert resp.status_code == 200, resp.text
         assert resp.json()["name"] == "New Name"
 
+    async def test_update_team_drops_its_proximity_targets(self, pg_session, pg_client, as_admin):
+        """Rewriting ``times`` moves the team on the route, so the posts it was
+        cleared to sample must be checked again."""
+        from app.services import proximity_targets
+
+        await _make_event(pg_session)
+        team = await _make_team(pg_session, "Rewound")
+        target = proximity_targets.ProximityTarget(
+            latitude=41.0, longitude=-8.0, arrival_radius_m=50, route=object(), snapshot=object()
+        )
+        proximity_targets.remember_target(team.id, 1, target, proximity_targets.target_generation())
+        assert (
+            proximity_targets.cached_target(
+                team.id, 1, route=target.route, snapshot=target.snapshot
+            )
+            is target
+        )
+
+        resp = pg_client.put(f"/api/rally/v1/team/{team.id}", json={"times": []})
+
+        assert resp.status_code == 200, resp.text
+        assert (
+            proximity_targets.cached_target(
+                team.id, 1, route=target.route, snapshot=target.snapshot
+            )
+            is None
+        )
+
     async def test_update_team_not_found(self, pg_session, pg_client, as_admin):
         await _make_event(pg_session)
 
@@ -459,6 +487,30 @@ class TestDeleteTeam:
         assert resp.status_code == 200, resp.text
         assert resp.json()["message"] == "Team deleted successfully"
 
+    async def test_roster_changes_publish_team_events(
+        self, pg_session, pg_client, as_admin, monkeypatch
+    ):
+        """Create/rename/delete each publish a team.* event so the cached
+        leaderboard can add, rename or drop the team without a full rebuild."""
+        from unittest.mock import AsyncMock
+
+        published = []
+        monkeypatch.setattr(
+            "app.api.api_v1.team.publish_event",
+            AsyncMock(side_effect=lambda event: published.append(event)),
+        )
+        await _make_event(pg_session)
+
+        team_id = pg_client.post("/api/rally/v1/team/", json={"name": "Roster"}).json()["id"]
+        pg_client.put(f"/api/rally/v1/team/{team_id}", json={"name": "Renamed"})
+        pg_client.delete(f"/api/rally/v1/team/{team_id}")
+
+        assert [(e.event_type, e.payload.team_id) for e in published] == [
+            ("team.created", team_id),
+            ("team.updated", team_id),
+            ("team.deleted", team_id),
+        ]
+
     async def test_delete_team_not_found(self, pg_session, pg_client, as_admin):
         await _make_event(pg_session)
 
@@ -16,11 +16,13 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 from app.api.deps import get_db
+from app.api.principal_cache import forget_principals
 
 # Rally is an OIDC resource server: it validates authentik-issued tokens via
 # JWKS discovery and no longer reads a local signing key, so there is nothing to
 # mock at import time.
 from app.core.config import settings as app_settings
+from app.crud._event_scope import invalidate_current_event
 from app.main import app
 
 # Import every model so Base.metadata is complete before create_all in pg_session.
@@ -41,6 +43,9 @@ from app.models import (  # noqa: F401
     User,
 )
 from app.models.base import Base
+from app.services.proximity_targets import forget_proximity_targets
+from app.services.route_graph import forget_route
+from app.services.settings_snapshot import forget_settings
 
 # Test database setup — async SQLite (aiosqlite). A single shared file lets the
 # get_db override and the db fixtures see each other's committed data.
@@ -70,6 +75,27 @@ app.dependency_overrides[get_db] = sqlite_override_get_db
 # real AsyncSession object for the get_db override; no tables are created.
 
 
+@pytest.fixture(autouse=True)
+def _fresh_process_caches():
+    """Start every test without any process-cached lookup (event id, settings
+    snapshot, principals, route graph, proximity targets).
+
+    Tests reset and reseed the schema between each other without broadcasting
+    it, so a value cached by one test would leak into the next.
+    """
+    invalidate_current_event()
+    forget_settings()
+    forget_principals()
+    forget_route()
+    forget_proximity_targets()
+    yield
+    invalidate_current_event()
+    forget_settings()
+    forget_principals()
+    forget_route()
+    forget_proximity_targets()
+
+
 @pytest_asyncio.fixture
 async def db():
     """An AsyncSession bound to the test database (no schema; for mock-based tests)."""
@@ -284,9 +310,12 @@ async def set_rally_settings(pg_session, **overrides):
     current = await rally_settings.get_or_create(pg_session)
     data = RallySettingsResponse.model_validate(current).model_dump(exclude={"id"})
     data.update(overrides)
-    return await rally_settings.update(
+    updated = await rally_settings.update(
         pg_session, id=current.id, obj_in=RallySettingsUpdate(**data), commit=True
     )
+    # Written behind the settings routes' back, so drop the snapshot they would.
+    forget_settings()
+    return updated
 
 
 def _fake_detailed_user(**overrides):
@@ -0,0 +1,76 @@
+"""Real-Redis check of the rate-limit Lua scripts.
+
+fakeredis cannot run Lua, so the unit tests only cover the Python side of the
+limiter. This runs both policies' scripts against a real Redis. Skipped
+automatically when no Redis is reachable on the smoke port; see
+``test_worker_redis_roundtrip`` for how to start one.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+import redis as sync_redis
+import redis.asyncio as aredis
+from fastapi import HTTPException
+
+from app.api import rate_limit as rl
+
+SMOKE_REDIS_HOST = os.getenv("SMOKE_REDIS_HOST", "localhost")
+SMOKE_REDIS_PORT = int(os.getenv("SMOKE_REDIS_PORT", "6399"))
+
+
+def _redis_available() -> bool:
+    try:
+        client = sync_redis.Redis(
+            host=SMOKE_REDIS_HOST, port=SMOKE_REDIS_PORT, socket_connect_timeout=1
+        )
+        return bool(client.ping())
+    except Exception:
+        return False
+
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        not _redis_available(),
+        reason=f"no Redis on {SMOKE_REDIS_HOST}:{SMOKE_REDIS_PORT}",
+    ),
+]
+
+
+@pytest.fixture
+async def key(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[str]:
+    def _client() -> aredis.Redis:
+        return aredis.Redis(host=SMOKE_REDIS_HOST, port=SMOKE_REDIS_PORT, decode_responses=True)
+
+    monkeypatch.setattr(rl, "get_async_redis_client", _client)
+    name = f"rally:test:ratelimit:{uuid.uuid4().hex}"
+    yield name
+    cleanup = _client()
+    await cleanup.delete(f"{name}:sw", f"{name}:tb")
+    await cleanup.aclose()
+
+
+@pytest.mark.parametrize("policy", ["sliding_window", "token_bucket"])
+async def test_policy_allows_the_limit_then_denies(key: str, policy: rl.RateLimitPolicy) -> None:
+    for _ in range(3):
+        await rl._enforce(key, limit=3, window_seconds=60, policy=policy)
+
+    with pytest.raises(HTTPException) as exc:
+        await rl._enforce(key, limit=3, window_seconds=60, policy=policy)
+
+    assert exc.value.status_code == 429
+    assert 1 <= int(exc.value.headers["Retry-After"]) <= 60
+
+
+async def test_script_is_reloaded_after_a_script_flush(key: str) -> None:
+    client = rl.get_async_redis_client()
+    try:
+        await client.script_flush()
+        script = rl._SCRIPTS["sliding_window"]
+        assert await script(client, f"{key}:sw", 3, 60_000, "member") == [1, 0]
+        assert await client.script_exists(script.sha) == [True]
+    finally:
+        await client.aclose()
@@ -8,6 +8,7 @@ only assert around it; here it runs against real Postgres.
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from sqlalchemy import event
 
 from app.core.exceptions import RallyValidationError
 from app.crud.crud_team import team as crud_team
@@ -16,6 +17,7 @@ from app.models.checkpoint import CheckPoint
 from app.models.rally_settings import RallySettings
 from app.models.team import Team
 from app.schemas.team import TeamScoresUpdate
+from app.services.settings_snapshot import forget_settings
 
 pytestmark = pytest.mark.asyncio
 
@@ -107,10 +109,11 @@ async def test_add_checkpoint_twice_rejected(pg_session) -> None:
 
 async def test_add_checkpoint_outside_rally_window_rejected(pg_session) -> None:
     event, _, cp1, _, team = await _setup_rally(pg_session)
-    # The event is the source of truth for timing; get_or_create syncs the
-    # settings row from it on every read.
+    # The event is the source of truth for timing; the settings snapshot
+    # mirrors it, so drop the cached one as the events route would.
     event.end_time = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1)
     await pg_session.commit()
+    forget_settings()
 
     call = crud_team.add_checkpoint(
         db=pg_session,
@@ -124,3 +127,53 @@ async def test_add_checkpoint_outside_rally_window_rejected(pg_session) -> None:
         await call
     assert exc.value.status_code == 400
     assert "ended" in str(exc.value).lower()
+
+
+async def _statements_during(pg_session, call) -> list[str]:
+    statements: list[str] = []
+    engine = pg_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        await call
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+
+async def test_classification_ranks_by_total_then_name(pg_session) -> None:
+    rally, _, _, _, team = await _setup_rally(pg_session)
+    leader = Team(name="Team A", access_code="PRG-0002", event_id=rally.id, total=30)
+    tied = Team(name="Team B", access_code="PRG-0003", event_id=rally.id, total=30)
+    team.total = 10
+    pg_session.add_all([leader, tied])
+    await pg_session.commit()
+
+    await crud_team.update_classification(pg_session)
+
+    for obj in (leader, tied, team):
+        await pg_session.refresh(obj)
+    assert [leader.classification, tied.classification, team.classification] == [1, 2, 3]
+
+
+async def test_check_in_locks_no_team_for_classification(pg_session) -> None:
+    _, _, cp1, _, team = await _setup_rally(pg_session)
+    await crud_team.update_classification(pg_session)
+
+    statements = await _statements_during(
+        pg_session,
+        crud_team.add_checkpoint(
+            db=pg_session,
+            id=team.id,
+            checkpoint_id=cp1.id,
+            obj_in=TeamScoresUpdate(
+                checkpoint_id=cp1.id, question_score=1, time_score=10, pukes=0, skips=0
+            ),
+        ),
+    )
+
+    # The only row lock is the checked-in team's own, taken by id.
+    locks = [sql for sql in statements if "FOR UPDATE" in sql]
+    assert len(locks) == 1
+    assert locks[0].rstrip().endswith("teams.id = $1::INTEGER FOR UPDATE")
+    assert (await pg_session.get(Team, team.id)).classification == 1
@@ -1,8 +1,8 @@
 """Real-Redis smoke for the event publisher → worker thread plumbing.
 
 The fragile part of the realtime foundation is the seam between the async
-publisher and the *synchronous* worker thread, which re-enters asyncio with
-``asyncio.run`` for every message. Unit tests mock Redis, so they never cover
+publisher and the *synchronous* worker thread, which runs every message on the
+thread's own long-lived event loop. Unit tests mock Redis, so they never cover
 that seam. This test runs the real ``BaseWorker`` against a real Redis and
 asserts a published event is actually delivered to ``handle_event``.
 
@@ -13,6 +13,7 @@ with: ``docker run -d -p 6399:6379 redis:7-alpine`` and set SMOKE_REDIS_PORT.
 
 import asyncio
 import os
+import weakref
 from typing import Any
 
 import pytest
@@ -72,9 +73,10 @@ async def test_published_event_reaches_worker_over_real_redis(
     monkeypatch.setattr(settings, "REDIS_PORT", SMOKE_REDIS_PORT)
     monkeypatch.setattr(settings, "EVENTS_ENABLED", True)
     monkeypatch.setattr(settings, "EVENTS_FAIL_SILENTLY", False)
-    # The sync pool is a cached global; drop it so it rebuilds against the
-    # smoke port. The async client is pool-less (reads settings per call).
+    # The sync pool and the per-loop async pools are cached; drop them so they
+    # rebuild against the smoke port.
     monkeypatch.setattr(redis_mod, "_sync_pool", None)
+    monkeypatch.setattr(redis_mod, "_async_pools", weakref.WeakKeyDictionary())
 
     worker = _RecordingWorker()
     worker.start()
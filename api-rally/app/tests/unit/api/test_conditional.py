@@ -0,0 +1,114 @@
+"""Unit tests for the ranking ETag dependency."""
+
+from unittest.mock import Mock
+
+import fakeredis.aioredis
+import pytest
+from fastapi import HTTPException, Response
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api import conditional
+from app.core.config import settings
+from app.services import leaderboard_cache
+
+
+def _request(if_none_match: str | None = None) -> Mock:
+    req = Mock()
+    req.headers = {} if if_none_match is None else {"if-none-match": if_none_match}
+    return req
+
+
+def _current_event(monkeypatch: pytest.MonkeyPatch, event_id: int) -> None:
+    async def _current_event_id(_db: object) -> int:
+        return event_id
+
+    monkeypatch.setattr(conditional, "current_event_id", _current_event_id)
+
+
+@pytest.fixture(autouse=True)
+def _event_five(monkeypatch: pytest.MonkeyPatch) -> None:
+    _current_event(monkeypatch, 5)
+
+
+@pytest.fixture
+def fake(monkeypatch: pytest.MonkeyPatch) -> fakeredis.aioredis.FakeRedis:
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(conditional, "get_async_redis_client", lambda: client)
+    monkeypatch.setattr(settings, "EVENTS_ENABLED", True)
+    return client
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard() -> None:
+    assert conditional.etag_matches('"rankings-3"', '"rankings-3"')
+    assert conditional.etag_matches('"rankings-1", W/"rankings-3"', '"rankings-3"')
+    assert conditional.etag_matches("*", '"rankings-3"')
+    assert not conditional.etag_matches('"rankings-2"', '"rankings-3"')
+    assert not conditional.etag_matches(None, '"rankings-3"')
+
+
+async def test_sets_etag_from_the_rankings_version(fake: fakeredis.aioredis.FakeRedis) -> None:
+    await leaderboard_cache.bump_rankings_version(fake)
+    response = Response()
+
+    await conditional.ranking_etag(_request(), response, settings, Mock())
+
+    assert response.headers["ETag"] == '"rankings-5-1"'
+
+
+async def test_matching_if_none_match_is_not_modified(
+    fake: fakeredis.aioredis.FakeRedis,
+) -> None:
+    await leaderboard_cache.bump_rankings_version(fake)
+
+    with pytest.raises(HTTPException) as exc:
+        await conditional.ranking_etag(_request('"rankings-5-1"'), Response(), settings, Mock())
+
+    assert exc.value.status_code == 304
+    assert exc.value.headers == {"ETag": '"rankings-5-1"'}
+
+
+async def test_stale_tag_gets_the_new_version(fake: fakeredis.aioredis.FakeRedis) -> None:
+    await leaderboard_cache.bump_rankings_version(fake)
+    await leaderboard_cache.bump_rankings_version(fake)
+    response = Response()
+
+    await conditional.ranking_etag(_request('"rankings-5-1"'), response, settings, Mock())
+
+    assert response.headers["ETag"] == '"rankings-5-2"'
+
+
+async def test_event_switch_changes_the_etag(
+    fake: fakeredis.aioredis.FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Before the worker has bumped the version, a tag from the previous event
+    # must not match.
+    await leaderboard_cache.bump_rankings_version(fake)
+    _current_event(monkeypatch, 6)
+    response = Response()
+
+    await conditional.ranking_etag(_request('"rankings-5-1"'), response, settings, Mock())
+
+    assert response.headers["ETag"] == '"rankings-6-1"'
+
+
+async def test_no_etag_before_a_first_version(fake: fakeredis.aioredis.FakeRedis) -> None:
+    response = Response()
+    await conditional.ranking_etag(_request("*"), response, settings, Mock())
+    assert "ETag" not in response.headers
+
+
+async def test_fails_open_when_redis_is_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = Mock()
+    client.get = Mock(side_effect=RedisConnectionError("down"))
+
+    async def _aclose() -> None:
+        return None
+
+    client.aclose = _aclose
+    monkeypatch.setattr(conditional, "get_async_redis_client", lambda: client)
+    monkeypatch.setattr(settings, "EVENTS_ENABLED", True)
+    response = Response()
+
+    await conditional.ranking_etag(_request("*"), response, settings, Mock())
+
+    assert "ETag" not in response.headers
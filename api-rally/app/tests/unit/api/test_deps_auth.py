@@ -1,7 +1,8 @@
 """Unit tests for the auth dependencies in app.api.deps.
 
 Covers the OIDC user-mirroring paths (create, placeholder backfill, scope
-sync, concurrent-creation race) and the team-token dependencies.
+sync, concurrent-creation race), the resolved-principal cache and the
+team-token dependencies.
 """
 
 from datetime import UTC, datetime, timedelta
@@ -13,7 +14,7 @@ from fastapi.security import HTTPAuthorizationCredentials
 from jose import jwt
 from sqlalchemy.exc import IntegrityError
 
-from app.api import deps
+from app.api import deps, principal_cache
 from app.core.config import settings
 from app.schemas.user import DetailedUser
 
@@ -198,6 +199,95 @@ async def test_get_current_user_syncs_scopes_from_provider():
     assert user.scopes == ["rally-staff"]
 
 
+async def test_get_current_user_syncs_scopes_only_when_they_differ():
+    db = AsyncMock()
+    user = _user(scopes=["rally-staff", "manager-rally"])
+    with (
+        patch("app.crud.user.get_by_authentik_sub", new=AsyncMock(return_value=user)),
+        patch.object(DetailedUser, "model_validate", return_value=_detailed(user)),
+    ):
+        await deps.get_current_user(_auth(scopes=["manager-rally", "rally-staff"]), db)
+    db.commit.assert_not_awaited()
+
+
+# ---------- principal cache ----------
+
+
+async def test_cached_principal_skips_the_subject_and_assignment_lookups():
+    db = AsyncMock()
+    user = _user(scopes=["rally-guide"])
+    db.get.return_value = user
+    by_sub = AsyncMock(return_value=user)
+    by_user = AsyncMock(return_value=Mock(team_id=42))
+    with (
+        patch("app.crud.user.get_by_authentik_sub", new=by_sub),
+        patch.object(DetailedUser, "model_validate", side_effect=lambda u: _detailed(u)),
+        patch(
+            "app.crud.crud_rally_guide_assignment.rally_guide_assignment.get_by_user_id",
+            new=by_user,
+        ),
+    ):
+        first = await deps.get_current_user(_auth(scopes=["rally-guide"]), db)
+        second = await deps.get_current_user(_auth(scopes=["rally-guide"]), db)
+    assert first.guide_team_id == second.guide_team_id == 42
+    assert by_sub.await_count == 1
+    assert by_user.await_count == 1
+    db.get.assert_awaited_once()
+
+
+async def test_cached_principal_is_keyed_by_scopes():
+    db = AsyncMock()
+    user = _user(scopes=["rally-guide"])
+    by_sub = AsyncMock(return_value=user)
+    with (
+        patch("app.crud.user.get_by_authentik_sub", new=by_sub),
+        patch.object(DetailedUser, "model_validate", side_effect=lambda u: _detailed(u)),
+        patch(
+            "app.crud.crud_rally_guide_assignment.rally_guide_assignment.get_by_user_id",
+            new=AsyncMock(return_value=Mock(team_id=42)),
+        ),
+    ):
+        await deps.get_current_user(_auth(scopes=["rally-guide"]), db)
+        result = await deps.get_current_user(_auth(scopes=[]), db)
+    assert by_sub.await_count == 2
+    assert result.guide_team_id is None
+
+
+async def test_cached_principal_for_a_vanished_user_is_resolved_again():
+    db = AsyncMock()
+    user = _user()
+    db.get.return_value = None
+    by_sub = AsyncMock(return_value=user)
+    with (
+        patch("app.crud.user.get_by_authentik_sub", new=by_sub),
+        patch.object(DetailedUser, "model_validate", side_effect=lambda u: _detailed(u)),
+    ):
+        await deps.get_current_user(_auth(), db)
+        await deps.get_current_user(_auth(), db)
+    assert by_sub.await_count == 2
+
+
+async def test_an_assignment_change_drops_cached_principals():
+    db = AsyncMock()
+    user = _user(scopes=["rally-guide"])
+    db.get.return_value = user
+    by_user = AsyncMock(side_effect=[Mock(team_id=42), Mock(team_id=7)])
+    with (
+        patch("app.crud.user.get_by_authentik_sub", new=AsyncMock(return_value=user)),
+        patch.object(DetailedUser, "model_validate", side_effect=lambda u: _detailed(u)),
+        patch(
+            "app.crud.crud_rally_guide_assignment.rally_guide_assignment.get_by_user_id",
+            new=by_user,
+        ),
+        patch("app.api.principal_cache.publish_event", new=AsyncMock()) as publish,
+    ):
+        await deps.get_current_user(_auth(scopes=["rally-guide"]), db)
+        await principal_cache.principals_changed(user.id)
+        result = await deps.get_current_user(_auth(scopes=["rally-guide"]), db)
+    assert result.guide_team_id == 7
+    publish.assert_awaited_once()
+
+
 # ---------- get_current_user_optional ----------
 
 
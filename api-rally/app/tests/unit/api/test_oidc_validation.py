@@ -1,9 +1,13 @@
 """Unit tests for OIDC token validation hardening (app.api.oidc).
 
-Covers algorithm pinning (alg-confusion defence) and JWKS caching. Uses a
-locally generated RSA keypair so no real provider is contacted.
+Covers algorithm pinning (alg-confusion defence), JWKS caching and refresh
+coalescing, and the verified-token cache. Uses a locally generated RSA keypair
+so no real provider is contacted.
 """
 
+import asyncio
+import hashlib
+import time
 from contextlib import contextmanager
 from unittest.mock import AsyncMock, patch
 
@@ -30,6 +34,10 @@ def _sign(alg: str, **claims) -> str:
     return token.decode() if isinstance(token, bytes) else token
 
 
+def _hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 @contextmanager
 def _wired_validator(jwks_calls: list[int] | None = None):
     """A validator with config/discovery stubbed and JWKS fetch instrumented."""
@@ -95,6 +103,69 @@ async def test_jwks_cached_across_validations():
     assert len(calls) == 1
 
 
+@pytest.mark.asyncio
+async def test_verified_token_is_served_from_the_cache():
+    token = _sign("RS256", sub="u1")
+    with _wired_validator() as v:
+        first = await v.validate_token(token, settings)
+        with patch("app.api.oidc._jwt.decode", side_effect=AssertionError("re-verified")):
+            second = await v.validate_token(token, settings)
+    assert second == first
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_cached_token_never_outlives_its_exp():
+    token = _sign("RS256", sub="u1", exp=int(time.time()) + 1)
+    with _wired_validator() as v:
+        await v.validate_token(token, settings)
+        (_, until) = next(iter(v._verified.values()))
+    assert until <= time.monotonic() + 1
+
+
+@pytest.mark.asyncio
+async def test_token_cache_evicts_the_least_recently_used():
+    tokens = [_sign("RS256", sub=f"u{i}") for i in range(3)]
+    with patch.object(settings, "OIDC_TOKEN_CACHE_SIZE", 2), _wired_validator() as v:
+        await v.validate_token(tokens[0], settings)
+        await v.validate_token(tokens[1], settings)
+        await v.validate_token(tokens[0], settings)
+        await v.validate_token(tokens[2], settings)
+    assert len(v._verified) == 2
+    assert v._cached_claims(_hash(tokens[1])) is None
+    assert v._cached_claims(_hash(tokens[0]))["sub"] == "u0"
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_is_not_cached():
+    token = _sign("RS256", sub="u1", aud="someone-else")
+    with _wired_validator() as v, pytest.raises(HTTPException):
+        await v.validate_token(token, settings)
+    assert not v._verified
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jwks_refreshes_fetch_once():
+    calls: list[int] = []
+    with _wired_validator(jwks_calls=calls) as v:
+        await v._get_jwks("https://issuer.example/jwks", settings)
+        await asyncio.gather(
+            *(
+                v._get_jwks("https://issuer.example/jwks", settings, force_refresh=True, tried=1)
+                for _ in range(5)
+            )
+        )
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared_per_loop():
+    with _wired_validator() as v:
+        assert v._client() is v._client()
+        await v.aclose()
+    assert not v._clients
+
+
 @pytest.mark.asyncio
 async def test_wrong_issuer_rejected():
     token = _sign("RS256", sub="u1")
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import HTTPException
+from redis.exceptions import NoScriptError
 
 from app.api import rate_limit as rl
 from app.core.config import settings
@@ -34,36 +35,52 @@ def test_resolve_client_ip_trusts_xff_from_trusted_proxy():
         assert rl.resolve_client_ip(req, settings) == "203.0.113.1"
 
 
-# --- fixed-window enforcement ----------------------------------------------
+# --- scripted enforcement --------------------------------------------------
 
 
-def _fake_redis(count: int, ttl: int = 30) -> Mock:
+def _fake_redis(allowed: int, retry_after_ms: int = 0) -> Mock:
     client = Mock()
-    client.incr = AsyncMock(return_value=count)
-    client.expire = AsyncMock()
-    client.ttl = AsyncMock(return_value=ttl)
+    client.evalsha = AsyncMock(return_value=[allowed, retry_after_ms])
+    client.script_load = AsyncMock()
     client.aclose = AsyncMock()
     return client
 
 
 @pytest.mark.asyncio
 async def test_enforce_allows_under_limit():
-    with patch.object(rl, "get_async_redis_client", return_value=_fake_redis(3)):
+    client = _fake_redis(1)
+    with patch.object(rl, "get_async_redis_client", return_value=client):
         await rl._enforce("k", limit=5, window_seconds=60)  # no raise
+    client.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_enforce_sets_expiry_on_first_attempt():
-    """The very first increment in a window (attempts == 1) arms the TTL."""
+async def test_enforce_is_one_evalsha_per_policy():
     client = _fake_redis(1)
     with patch.object(rl, "get_async_redis_client", return_value=client):
         await rl._enforce("k", limit=5, window_seconds=60)
-    client.expire.assert_awaited_once_with("k", 60)
+        await rl._enforce("k", limit=5, window_seconds=60, policy="token_bucket")
+
+    sliding, bucket = client.evalsha.await_args_list
+    assert sliding.args[:5] == (rl._SCRIPTS["sliding_window"].sha, 1, "k:sw", 5, 60_000)
+    assert len(sliding.args) == 6  # + the unique log member
+    assert bucket.args == (rl._SCRIPTS["token_bucket"].sha, 1, "k:tb", 5, 60_000)
+    client.script_load.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_enforce_blocks_over_limit():
-    with patch.object(rl, "get_async_redis_client", return_value=_fake_redis(6)):
+async def test_enforce_loads_the_script_on_a_cache_miss():
+    client = _fake_redis(1)
+    client.evalsha.side_effect = [NoScriptError("NOSCRIPT"), [1, 0]]
+    with patch.object(rl, "get_async_redis_client", return_value=client):
+        await rl._enforce("k", limit=5, window_seconds=60, policy="token_bucket")
+    client.script_load.assert_awaited_once_with(rl._TOKEN_BUCKET_LUA)
+    assert client.evalsha.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_enforce_blocks_with_the_scripts_retry_after():
+    with patch.object(rl, "get_async_redis_client", return_value=_fake_redis(0, 29_001)):
         with pytest.raises(HTTPException) as exc:
             await rl._enforce("k", limit=5, window_seconds=60)
         assert exc.value.status_code == 429
@@ -71,23 +88,17 @@ async def test_enforce_blocks_over_limit():
 
 
 @pytest.mark.asyncio
-async def test_enforce_rearms_orphaned_key_on_block():
-    """A key without TTL (crash between INCR and EXPIRE) must be re-armed
-    so the block cannot last forever."""
-    client = _fake_redis(6, ttl=-1)
-    with (
-        patch.object(rl, "get_async_redis_client", return_value=client),
-        pytest.raises(HTTPException) as exc,
-    ):
-        await rl._enforce("k", limit=5, window_seconds=60)
-    assert exc.value.headers["Retry-After"] == "60"
-    client.expire.assert_awaited_with("k", 60)
+async def test_enforce_retry_after_is_at_least_one_second():
+    with patch.object(rl, "get_async_redis_client", return_value=_fake_redis(0, 0)):
+        with pytest.raises(HTTPException) as exc:
+            await rl._enforce("k", limit=5, window_seconds=60)
+        assert exc.value.headers["Retry-After"] == "1"
 
 
 @pytest.mark.asyncio
 async def test_enforce_fails_open_on_redis_error():
     client = Mock()
-    client.incr = AsyncMock(side_effect=RuntimeError("redis down"))
+    client.evalsha = AsyncMock(side_effect=RuntimeError("redis down"))
     client.aclose = AsyncMock()
     with patch.object(rl, "get_async_redis_client", return_value=client):
         await rl._enforce("k", limit=1, window_seconds=60)  # swallowed, no raise
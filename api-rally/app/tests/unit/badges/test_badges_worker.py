@@ -20,8 +20,8 @@ def _patch_session(monkeypatch: pytest.MonkeyPatch, *, badges_enabled: bool = Tr
 
     monkeypatch.setattr(worker_badges, "worker_session", fake_session)
     monkeypatch.setattr(
-        worker_badges.rally_settings,
-        "get_or_create",
+        worker_badges,
+        "current_settings",
         AsyncMock(return_value=SimpleNamespace(badges_enabled=badges_enabled)),
     )
 
@@ -37,3 +37,10 @@ def test_validate_team_jwt_secret_key_rejects_empty(monkeypatch: pytest.MonkeyPa
     monkeypatch.setenv("TEAM_JWT_SECRET_KEY", "placeholder")
     with pytest.raises(ValidationError, match="TEAM_JWT_SECRET_KEY"):
         Settings(TEAM_JWT_SECRET_KEY="")
+
+
+def test_validate_events_transport_rejects_unknown(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TEAM_JWT_SECRET_KEY", "placeholder")
+    assert Settings(EVENTS_TRANSPORT="streams").EVENTS_TRANSPORT == "streams"
+    with pytest.raises(ValidationError, match="EVENTS_TRANSPORT"):
+        Settings(EVENTS_TRANSPORT="kafka")
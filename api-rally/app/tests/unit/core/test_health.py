@@ -24,8 +24,9 @@ def client() -> TestClient:
     return TestClient(app)
 
 
-def _fake_worker(name: str, alive: bool) -> SimpleNamespace:
-    return SimpleNamespace(name=name, is_alive=alive, last_beat=123.0)
+def _fake_worker(name: str, alive: bool, **election: object) -> SimpleNamespace:
+    election = {"active": True, "leader": None, **election}
+    return SimpleNamespace(name=name, is_alive=alive, last_beat=123.0, **election)
 
 
 def test_health_is_liveness_always_200(monkeypatch: pytest.MonkeyPatch, client: TestClient) -> None:
@@ -73,6 +74,25 @@ def test_ready_503_when_worker_dead(monkeypatch: pytest.MonkeyPatch, client: Tes
     assert resp.json()["workers"][0]["alive"] is False
 
 
+def test_ready_reports_standby_workers_and_their_leader(
+    monkeypatch: pytest.MonkeyPatch, client: TestClient
+) -> None:
+    monkeypatch.setattr(health, "check_db_health", lambda: _async(True))
+    monkeypatch.setattr(health, "check_redis_health", lambda: _async(True))
+    monkeypatch.setattr(settings, "EVENTS_ENABLED", True)
+    standby = _fake_worker("LeaderboardWorker", True, active=False, leader="api-2:7")
+    monkeypatch.setattr(health, "get_workers", lambda: (standby,))
+
+    resp = client.get(READY_URL)
+
+    # Standing by is healthy: the leader does the work.
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["node"]
+    assert body["workers"][0]["active"] is False
+    assert body["workers"][0]["leader"] == "api-2:7"
+
+
 def test_ready_skips_redis_and_workers_when_events_disabled(
     monkeypatch: pytest.MonkeyPatch, client: TestClient
 ) -> None:
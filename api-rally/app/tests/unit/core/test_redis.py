@@ -5,10 +5,13 @@ Redis, so they need no running Redis server.
 """
 
 import asyncio
+import weakref
 
+import fakeredis
 import fakeredis.aioredis
 import pytest
 
+from app.core import metrics
 from app.core import redis as redis_module
 from app.core.config import settings
 
@@ -60,3 +63,88 @@ async def test_get_async_redis_dependency_yields_client(
         assert await client.get("k") == "v"
     finally:
         await gen.aclose()
+
+
+@pytest.fixture
+def fake_pool_backend(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeServer:
+    """Build the per-loop pools on fakeredis connections."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis_module,
+        "_connection_kwargs",
+        lambda: {
+            "connection_class": fakeredis.aioredis.FakeAsyncRedisConnection,
+            "server": server,
+            "decode_responses": True,
+        },
+    )
+    monkeypatch.setattr(redis_module, "_async_pools", weakref.WeakKeyDictionary())
+    return server
+
+
+async def test_async_clients_share_the_loop_pool(
+    fake_pool_backend: fakeredis.FakeServer,
+) -> None:
+    first = redis_module.get_async_redis_client()
+    second = redis_module.get_async_redis_client()
+    try:
+        assert first.connection_pool is second.connection_pool
+        await first.set("k", "v")
+        await first.aclose()
+        # Closing a client only returns its connection to the shared pool.
+        assert await second.get("k") == "v"
+        assert len(second.connection_pool._available_connections) == 1
+    finally:
+        await second.aclose()
+        await redis_module.close_async_pool()
+
+
+def test_each_loop_gets_its_own_pool(fake_pool_backend: fakeredis.FakeServer) -> None:
+    async def _pool() -> object:
+        return redis_module.get_async_redis_client().connection_pool
+
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(_pool())
+        assert first_loop.run_until_complete(_pool()) is first
+        assert second_loop.run_until_complete(_pool()) is not first
+    finally:
+        for loop in (first_loop, second_loop):
+            loop.run_until_complete(redis_module.close_async_pool())
+            loop.close()
+    assert len(redis_module._async_pools) == 0
+
+
+async def test_close_async_pool_disconnects_and_forgets_the_pool(
+    fake_pool_backend: fakeredis.FakeServer,
+) -> None:
+    client = redis_module.get_async_redis_client()
+    await client.ping()
+    pool = client.connection_pool
+    await client.aclose()
+
+    await redis_module.close_async_pool()
+
+    assert all(not conn.is_connected for conn in pool._available_connections)
+    assert redis_module.get_async_redis_client().connection_pool is not pool
+    await redis_module.close_async_pool()
+
+
+async def test_pool_checkouts_are_measured(
+    fake_pool_backend: fakeredis.FakeServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    waits = metrics.redis_pool_wait_seconds.collect()[0]
+    before = next(s.value for s in waits.samples if s.name.endswith("_count"))
+
+    client = redis_module.get_async_redis_client()
+    try:
+        await client.ping()
+        idle = metrics.redis_pool_connections.labels(state="idle")._value.get()
+        assert idle == 1
+    finally:
+        await client.aclose()
+        await redis_module.close_async_pool()
+
+    waits = metrics.redis_pool_wait_seconds.collect()[0]
+    assert next(s.value for s in waits.samples if s.name.endswith("_count")) == before + 1
@@ -7,6 +7,8 @@ an AsyncMock session.
 
 import pytest
 
+from app.core.config import settings
+from app.crud import _event_scope, current_event_id
 from app.crud.crud_activity import _slugify, rally_event
 from app.models.activity import EventType
 from app.schemas.activity import RallyEventCreate, RallyEventUpdate
@@ -80,6 +82,66 @@ async def test_ensure_current_creates_default_when_empty(pg_session) -> None:
     assert result.slug == "rally-tascas"
 
 
+async def test_current_event_id_is_cached_per_process_and_session(
+    pg_session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    event = await rally_event.create(
+        pg_session, obj_in=RallyEventCreate(name="Cached", is_current=True)
+    )
+    assert await current_event_id(pg_session) == event.id
+    assert pg_session.info[_event_scope._MEMO_KEY] == event.id
+
+    async def _no_lookup(_db: object) -> None:
+        raise AssertionError("the cached id should have been used")
+
+    monkeypatch.setattr(rally_event, "ensure_current", _no_lookup)
+    pg_session.info.clear()  # as a new request's session would start
+    assert await current_event_id(pg_session) == event.id
+
+
+async def test_switching_the_current_event_drops_the_cache(pg_session) -> None:
+    first = await rally_event.create(
+        pg_session, obj_in=RallyEventCreate(name="First", is_current=True)
+    )
+    second = await rally_event.create(
+        pg_session, obj_in=RallyEventCreate(name="Second", is_current=False)
+    )
+    assert await current_event_id(pg_session) == first.id
+
+    await rally_event.set_current(pg_session, event_id=second.id)
+
+    assert _event_scope.cached_current_event_id() is None
+    assert await current_event_id(pg_session) == second.id
+    assert (await rally_event.ensure_current(pg_session)).id == second.id
+
+
+async def test_stale_cached_id_falls_back_to_the_query(pg_session) -> None:
+    event = await rally_event.create(
+        pg_session, obj_in=RallyEventCreate(name="Live", is_current=True)
+    )
+    # As if another process switched events and the broadcast was missed.
+    _event_scope.remember_current_event(event.id + 1000, _event_scope.current_event_generation())
+
+    assert (await rally_event.ensure_current(pg_session)).id == event.id
+    assert _event_scope.cached_current_event_id() == event.id
+
+
+def test_cache_is_not_filled_by_a_lookup_older_than_an_invalidation() -> None:
+    generation = _event_scope.current_event_generation()
+    _event_scope.invalidate_current_event()
+
+    _event_scope.remember_current_event(7, generation)
+
+    assert _event_scope.cached_current_event_id() is None
+
+
+def test_cached_id_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "CURRENT_EVENT_CACHE_SECONDS", 0)
+    _event_scope.remember_current_event(7, _event_scope.current_event_generation())
+
+    assert _event_scope.cached_current_event_id() is None
+
+
 async def test_create_duplicate_slug_gets_suffixed(pg_session) -> None:
     first = await rally_event.create(pg_session, obj_in=RallyEventCreate(name="Rally Tascas"))
     second = await rally_event.create(pg_session, obj_in=RallyEventCreate(name="Rally Tascas"))
@@ -1,6 +1,7 @@
 """Unit tests for the event subsystem (channels, schemas, publisher)."""
 
 import json
+from collections.abc import AsyncIterator
 
 import fakeredis.aioredis
 import pytest
@@ -12,11 +13,20 @@ from app.events import (
     EventType,
     TeamScoreUpdatedEvent,
     TeamScoreUpdatedPayload,
+    batched_events,
+    close_publisher,
     publish_event,
 )
 from app.events.publisher import _channel_for
 
 
+@pytest.fixture(autouse=True)
+async def _close_publisher() -> AsyncIterator[None]:
+    """Drop the loop's cached publisher client so no test inherits a fake."""
+    yield
+    await close_publisher()
+
+
 def test_every_event_type_has_a_channel() -> None:
     """A missing mapping would silently drop events at runtime."""
     for event_type in EventType:
@@ -91,10 +101,50 @@ async def test_publish_sends_to_channel_when_enabled(monkeypatch: pytest.MonkeyP
     await pubsub.aclose()
 
 
-class _Broken:
-    async def publish(self, *_: object) -> None:
+async def test_publish_also_appends_to_stream_in_streams_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("app.events.publisher.settings.EVENTS_ENABLED", True)
+    monkeypatch.setattr("app.events.publisher.settings.EVENTS_TRANSPORT", "streams")
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr("app.events.publisher.get_async_redis_client", lambda: fake)
+
+    pubsub = fake.pubsub()
+    await pubsub.subscribe(Channels.TEAM_SCORE_UPDATED)
+    await pubsub.get_message(timeout=1)
+
+    await publish_event(
+        TeamScoreUpdatedEvent(payload=TeamScoreUpdatedPayload(team_id=7, total_score=42))
+    )
+
+    [(_entry_id, fields)] = await fake.xrange(Channels.EVENT_STREAM)
+    assert fields["channel"] == Channels.TEAM_SCORE_UPDATED
+    assert json.loads(fields["data"])["payload"]["team_id"] == 7
+    # SSE clients still get the event over Pub/Sub.
+    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+    assert message is not None
+    assert message["data"] == fields["data"]
+    await pubsub.aclose()
+
+
+class _BrokenPipeline:
+    async def __aenter__(self) -> "_BrokenPipeline":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Nothing to release."""
+
+    def publish(self, *_: object) -> None:
+        """Queued commands only fail on execute."""
+
+    async def execute(self) -> None:
         raise ConnectionError("down")
 
+
+class _Broken:
+    def pipeline(self, **_: object) -> _BrokenPipeline:
+        return _BrokenPipeline()
+
     async def aclose(self) -> None:
         """No-op close for the broken redis stub."""
 
@@ -123,3 +173,68 @@ async def test_publish_raises_when_not_fail_silently(
     )
     with pytest.raises(EventPublishError):
         await call
+
+
+async def test_publisher_reuses_one_client_per_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.events.publisher.settings.EVENTS_ENABLED", True)
+    created: list[fakeredis.aioredis.FakeRedis] = []
+
+    def _factory() -> fakeredis.aioredis.FakeRedis:
+        created.append(fakeredis.aioredis.FakeRedis(decode_responses=True))
+        return created[-1]
+
+    monkeypatch.setattr("app.events.publisher.get_async_redis_client", _factory)
+    for total in (1, 2, 3):
+        await publish_event(
+            TeamScoreUpdatedEvent(payload=TeamScoreUpdatedPayload(team_id=1, total_score=total))
+        )
+    assert len(created) == 1
+
+    await close_publisher()
+    await publish_event(
+        TeamScoreUpdatedEvent(payload=TeamScoreUpdatedPayload(team_id=1, total_score=4))
+    )
+    assert len(created) == 2
+
+
+async def test_batched_events_flush_once_on_exit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.events.publisher.settings.EVENTS_ENABLED", True)
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr("app.events.publisher.get_async_redis_client", lambda: fake)
+    pubsub = fake.pubsub()
+    await pubsub.subscribe(Channels.TEAM_SCORE_UPDATED)
+    await pubsub.get_message(timeout=1)
+
+    async with batched_events():
+        for team_id in (1, 2):
+            await publish_event(
+                TeamScoreUpdatedEvent(
+                    payload=TeamScoreUpdatedPayload(team_id=team_id, total_score=5)
+                )
+            )
+        # Buffered until the block exits.
+        assert await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.05) is None
+
+    received = []
+    for _ in range(2):
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+        assert message is not None
+        received.append(json.loads(message["data"])["payload"]["team_id"])
+    assert received == [1, 2]
+    await pubsub.aclose()
+
+
+async def test_batched_flush_failure_follows_fail_silently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("app.events.publisher.settings.EVENTS_ENABLED", True)
+    monkeypatch.setattr("app.events.publisher.settings.EVENTS_FAIL_SILENTLY", False)
+    monkeypatch.setattr("app.events.publisher.get_async_redis_client", lambda: _Broken())
+
+    from app.events.exceptions import EventPublishError
+
+    with pytest.raises(EventPublishError):
+        async with batched_events():
+            await publish_event(
+                TeamScoreUpdatedEvent(payload=TeamScoreUpdatedPayload(team_id=1, total_score=1))
+            )
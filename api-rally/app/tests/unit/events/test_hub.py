@@ -0,0 +1,113 @@
+"""Unit tests for the SSE fan-out hub."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import fakeredis.aioredis
+import pytest
+
+from app.core.config import settings
+from app.events import hub as hub_module
+from app.events.channels import Channels
+from app.events.hub import EventHub, HubMessage, Subscription
+
+
+class _Backend:
+    """A fakeredis server that counts the clients the hub opens on it."""
+
+    def __init__(self) -> None:
+        self.server = fakeredis.FakeServer()
+        self.opened = 0
+
+    def client(self) -> fakeredis.aioredis.FakeRedis:
+        self.opened += 1
+        return fakeredis.aioredis.FakeRedis(server=self.server, decode_responses=True)
+
+    async def publish(self, channel: str, data: str = "{}") -> None:
+        """Publish once the hub's subscription is live (it starts in a task)."""
+        publisher = fakeredis.aioredis.FakeRedis(server=self.server, decode_responses=True)
+        for _ in range(200):
+            if await publisher.publish(channel, data):
+                break
+            await asyncio.sleep(0.01)
+        await publisher.aclose()
+
+
+@pytest.fixture
+def backend(monkeypatch: pytest.MonkeyPatch) -> _Backend:
+    fake = _Backend()
+    monkeypatch.setattr(hub_module, "get_async_redis_client", fake.client)
+    return fake
+
+
+@pytest.fixture
+async def hub() -> AsyncIterator[EventHub]:
+    event_hub = EventHub()
+    yield event_hub
+    await event_hub.close()
+
+
+async def _next(subscription: Subscription) -> HubMessage | None:
+    return await asyncio.wait_for(anext(subscription), timeout=2)
+
+
+async def test_clients_share_one_subscription_and_get_their_channels(
+    backend: _Backend, hub: EventHub
+) -> None:
+    async with (
+        hub.subscribe(Channels.LEADERBOARD_REFRESHED) as board,
+        hub.subscribe(Channels.ALL_TEAM_EVENTS) as teams,
+    ):
+        await backend.publish(Channels.TEAM_SCORE_UPDATED, '{"t": 1}')
+        await backend.publish(Channels.LEADERBOARD_REFRESHED, "1")
+
+        assert await _next(teams) == HubMessage(Channels.TEAM_SCORE_UPDATED, '{"t": 1}')
+        assert await _next(board) == HubMessage(Channels.LEADERBOARD_REFRESHED, "1")
+        assert teams.queue.empty()
+        assert backend.opened == 1
+
+
+async def test_heartbeat_reaches_every_client(
+    backend: _Backend, hub: EventHub, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(hub_module, "HEARTBEAT_SECONDS", 0.01)
+    async with (
+        hub.subscribe(Channels.LEADERBOARD_REFRESHED) as board,
+        hub.subscribe(Channels.ALL_TEAM_EVENTS) as teams,
+    ):
+        assert await _next(board) is None
+        assert await _next(teams) is None
+
+
+async def test_slow_client_is_dropped_without_affecting_others(
+    backend: _Backend, hub: EventHub, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "SSE_CLIENT_QUEUE_SIZE", 1)
+    async with (
+        hub.subscribe(Channels.ALL_TEAM_EVENTS) as slow,
+        hub.subscribe(Channels.ALL_TEAM_EVENTS) as fast,
+    ):
+        await backend.publish(Channels.TEAM_CREATED, "a")
+        assert await _next(fast) == HubMessage(Channels.TEAM_CREATED, "a")
+        await backend.publish(Channels.TEAM_UPDATED, "b")
+        assert await _next(fast) == HubMessage(Channels.TEAM_UPDATED, "b")
+
+        # `slow` never read its first message, so the second overflowed it.
+        assert slow.dropped
+        assert [message async for message in slow] == []
+        assert not fast.dropped
+        assert hub.client_count == 1
+
+
+async def test_reader_stops_with_the_last_client(backend: _Backend, hub: EventHub) -> None:
+    async with hub.subscribe(Channels.ALL_TEAM_EVENTS):
+        task = hub._task
+        assert task is not None and not task.done()
+    assert task.done()
+    assert hub._task is None
+
+
+async def test_close_ends_attached_streams(backend: _Backend, hub: EventHub) -> None:
+    async with hub.subscribe(Channels.ALL_TEAM_EVENTS) as sub:
+        await hub.close()
+        assert [message async for message in sub] == []
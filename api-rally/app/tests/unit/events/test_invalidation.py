@@ -0,0 +1,176 @@
+"""Unit tests for the cross-process cache invalidation watcher."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import fakeredis.aioredis
+import pytest
+
+from app.api import principal_cache
+from app.crud import _event_scope
+from app.events import hub as hub_module
+from app.events import invalidation
+from app.events.channels import Channels
+from app.services import proximity_targets, route_graph, settings_snapshot
+
+
+@pytest.fixture
+async def server(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[fakeredis.FakeServer]:
+    fake = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        hub_module,
+        "get_async_redis_client",
+        lambda: fakeredis.aioredis.FakeRedis(server=fake, decode_responses=True),
+    )
+    yield fake
+    await invalidation.stop_invalidation_watcher()
+    await hub_module.close_hub()
+
+
+def _remember(event_id: int) -> None:
+    _event_scope.remember_current_event(event_id, _event_scope.current_event_generation())
+
+
+async def test_broadcast_drops_the_cached_current_event(server: fakeredis.FakeServer) -> None:
+    invalidation.start_invalidation_watcher()
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    # The watcher's subscription starts in a task; wait until it is live.
+    for _ in range(200):
+        if await publisher.pubsub_numpat():
+            break
+        await asyncio.sleep(0.01)
+    _remember(7)
+
+    await publisher.publish(Channels.EVENT_CURRENT_CHANGED, '{"payload": {"event_id": 8}}')
+    for _ in range(200):
+        if _event_scope.cached_current_event_id() is None:
+            break
+        await asyncio.sleep(0.01)
+
+    assert _event_scope.cached_current_event_id() is None
+    await publisher.aclose()
+
+
+async def test_settings_broadcast_drops_the_cached_snapshots(
+    server: fakeredis.FakeServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    invalidation.start_invalidation_watcher()
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    for _ in range(200):
+        if await publisher.pubsub_numpat():
+            break
+        await asyncio.sleep(0.01)
+    monkeypatch.setitem(settings_snapshot._snapshots, 7, (object(), float("inf")))
+
+    await publisher.publish(Channels.SETTINGS_CHANGED, '{"payload": {"event_id": 7}}')
+    for _ in range(200):
+        if not settings_snapshot._snapshots:
+            break
+        await asyncio.sleep(0.01)
+
+    assert not settings_snapshot._snapshots
+    await publisher.aclose()
+
+
+async def test_assignment_broadcast_drops_the_cached_principals(
+    server: fakeredis.FakeServer,
+) -> None:
+    invalidation.start_invalidation_watcher()
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    for _ in range(200):
+        if await publisher.pubsub_numpat():
+            break
+        await asyncio.sleep(0.01)
+    principal_cache.remember_principal(
+        "sub-1",
+        ["rally-staff"],
+        principal_cache.Principal(user_id=1),
+        principal_cache.principal_generation(),
+    )
+
+    await publisher.publish(Channels.PRINCIPALS_CHANGED, '{"payload": {"user_id": 1}}')
+    for _ in range(200):
+        if principal_cache.cached_principal("sub-1", ["rally-staff"]) is None:
+            break
+        await asyncio.sleep(0.01)
+
+    assert principal_cache.cached_principal("sub-1", ["rally-staff"]) is None
+    await publisher.aclose()
+
+
+async def test_route_broadcast_drops_the_cached_graphs(
+    server: fakeredis.FakeServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    invalidation.start_invalidation_watcher()
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    for _ in range(200):
+        if await publisher.pubsub_numpat():
+            break
+        await asyncio.sleep(0.01)
+    monkeypatch.setitem(route_graph._graphs, 7, (object(), float("inf")))
+
+    await publisher.publish(Channels.ROUTE_CHANGED, '{"payload": {"event_id": 7}}')
+    for _ in range(200):
+        if not route_graph._graphs:
+            break
+        await asyncio.sleep(0.01)
+
+    assert not route_graph._graphs
+    await publisher.aclose()
+
+
+@pytest.mark.parametrize("channel", [Channels.PROGRESS_CHANGED, Channels.ACTIVITY_RESULT_CREATED])
+async def test_progress_broadcast_drops_only_that_teams_targets(
+    server: fakeredis.FakeServer, channel: str
+) -> None:
+    invalidation.start_invalidation_watcher()
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    for _ in range(200):
+        if await publisher.pubsub_numpat():
+            break
+        await asyncio.sleep(0.01)
+    route, snapshot = object(), object()
+    target = proximity_targets.ProximityTarget(
+        latitude=41.0, longitude=-8.0, arrival_radius_m=50, route=route, snapshot=snapshot
+    )
+    for team_id in (1, 2):
+        proximity_targets.remember_target(
+            team_id, 10, target, proximity_targets.target_generation()
+        )
+
+    await publisher.publish(channel, '{"payload": {"team_id": 1, "activity_id": 3}}')
+    for _ in range(200):
+        if 1 not in proximity_targets._targets:
+            break
+        await asyncio.sleep(0.01)
+
+    assert proximity_targets.cached_target(1, 10, route=route, snapshot=snapshot) is None
+    assert proximity_targets.cached_target(2, 10, route=route, snapshot=snapshot) is target
+    await publisher.aclose()
+
+
+async def test_unrelated_channels_keep_the_cache(server: fakeredis.FakeServer) -> None:
+    invalidation.start_invalidation_watcher()
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    for _ in range(200):
+        if await publisher.pubsub_numpat():
+            break
+        await asyncio.sleep(0.01)
+    _remember(7)
+
+    await publisher.publish(Channels.TEAM_UPDATED, "{}")
+    await asyncio.sleep(0.05)
+
+    assert _event_scope.cached_current_event_id() == 7
+    await publisher.aclose()
+
+
+async def test_watcher_is_started_once_per_loop(server: fakeredis.FakeServer) -> None:
+    invalidation.start_invalidation_watcher()
+    task = invalidation._watchers[asyncio.get_running_loop()]
+
+    invalidation.start_invalidation_watcher()
+
+    assert invalidation._watchers[asyncio.get_running_loop()] is task
+    await invalidation.stop_invalidation_watcher()
+    assert task.done()
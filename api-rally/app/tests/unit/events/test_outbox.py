@@ -0,0 +1,114 @@
+"""DB-backed tests for the transactional outbox and its relay.
+
+Runs on the real-Postgres `pg_session` fixture (auto-skips when Postgres is
+unreachable); Redis is fakeredis.
+"""
+
+import json
+from unittest.mock import AsyncMock
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.crud.crud_team import team as crud_team
+from app.events import Channels, EventType, TeamScoreUpdatedEvent, TeamScoreUpdatedPayload
+from app.events.outbox import relay_outbox, stage_events
+from app.models.activity import Activity
+from app.models.checkpoint import CheckPoint
+from app.models.event_outbox import OutboxEvent
+from app.schemas.activity import ActivityResultCreate
+from app.schemas.activity_types import ActivityType
+from app.schemas.team import TeamCreate
+from app.services.scoring_service import ScoringService
+
+
+@pytest.fixture
+def outbox_on(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "EVENTS_ENABLED", True)
+    monkeypatch.setattr(settings, "EVENTS_OUTBOX", True)
+
+
+def _event(team_id: int) -> TeamScoreUpdatedEvent:
+    return TeamScoreUpdatedEvent(payload=TeamScoreUpdatedPayload(team_id=team_id, total_score=1))
+
+
+async def _pending(db) -> list[OutboxEvent]:
+    return list((await db.scalars(select(OutboxEvent).order_by(OutboxEvent.id))).all())
+
+
+async def test_stage_is_a_noop_when_the_outbox_is_off(
+    pg_session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "EVENTS_OUTBOX", False)
+    assert stage_events(pg_session, [_event(1)]) is False
+    await pg_session.commit()
+    assert await _pending(pg_session) == []
+
+
+async def test_scoring_write_stages_its_events_in_its_transaction(
+    pg_session, outbox_on: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    publish = AsyncMock()
+    monkeypatch.setattr("app.services.scoring_service.publish_event", publish)
+    team = await crud_team.create(pg_session, obj_in=TeamCreate(name="Outbox"))
+    checkpoint = CheckPoint(name="CP1", order=1)
+    pg_session.add(checkpoint)
+    await pg_session.flush()
+    activity = Activity(
+        name="Act",
+        activity_type=ActivityType.GENERAL.value,
+        config={"min_points": 0, "max_points": 100},
+        checkpoint_id=checkpoint.id,
+    )
+    pg_session.add(activity)
+    await pg_session.commit()
+
+    await ScoringService(pg_session).create_result(
+        ActivityResultCreate(
+            activity_id=activity.id, team_id=team.id, result_data={"assigned_points": 20}
+        )
+    )
+
+    # Nothing went to Redis on the request path; both events committed with the result.
+    publish.assert_not_awaited()
+    assert [row.event_type for row in await _pending(pg_session)] == [
+        EventType.TEAM_SCORE_UPDATED.value,
+        EventType.ACTIVITY_RESULT_CREATED.value,
+    ]
+
+
+async def test_relay_publishes_in_order_and_deletes(pg_session, outbox_on: None) -> None:
+    stage_events(pg_session, [_event(team_id) for team_id in (1, 2, 3)])
+    await pg_session.commit()
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    pubsub = fake.pubsub()
+    await pubsub.subscribe(Channels.TEAM_SCORE_UPDATED)
+    await pubsub.get_message(timeout=1)
+
+    assert await relay_outbox(pg_session, fake, limit=2) == 2
+    assert len(await _pending(pg_session)) == 1
+    assert await relay_outbox(pg_session, fake, limit=2) == 1
+    assert await relay_outbox(pg_session, fake, limit=2) == 0
+
+    received = []
+    for _ in range(3):
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+        assert message is not None
+        received.append(json.loads(message["data"])["payload"]["team_id"])
+    assert received == [1, 2, 3]
+    await pubsub.aclose()
+
+
+async def test_relay_keeps_rows_when_redis_fails(pg_session, outbox_on: None) -> None:
+    stage_events(pg_session, [_event(1)])
+    await pg_session.commit()
+    broken = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    broken.pipeline = lambda **_: (_ for _ in ()).throw(ConnectionError("down"))
+
+    with pytest.raises(ConnectionError):
+        await relay_outbox(pg_session, broken, limit=10)
+
+    # Still pending: the next run delivers it.
+    assert len(await _pending(pg_session)) == 1
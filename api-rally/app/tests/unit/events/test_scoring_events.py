@@ -1,21 +1,23 @@
 """Unit test: update_team_scores publishes a TeamScoreUpdated event."""
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
 from app.events import EventType
+from app.services.score_ledger_service import ReconcileReport
 from app.services.scoring_service import ScoringService
 
 
-def _mock_db_with_team() -> AsyncMock:
+def _mock_db_with_team(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
     db = AsyncMock()
-    # A team with no checkpoints/results: total resolves to 0, no array work.
-    db.get.return_value = SimpleNamespace(id=5, total=0, score_per_checkpoint=[], times=[])
-    scalars_result = MagicMock()
-    scalars_result.all.return_value = []
-    db.scalars.return_value = scalars_result
+    # A team with no results or awards: the recompute resolves to 0.
+    monkeypatch.setattr(
+        ScoringService,
+        "reconcile_score_ledger",
+        AsyncMock(return_value=ReconcileReport(totals={5: 0.0}, drifted=[], corrections=0)),
+    )
     db.commit = AsyncMock()
     return db
 
@@ -27,7 +29,7 @@ async def test_update_team_scores_publishes_event(monkeypatch: pytest.MonkeyPatc
         AsyncMock(side_effect=lambda event: published.append(event)),
     )
 
-    service = ScoringService(_mock_db_with_team())
+    service = ScoringService(_mock_db_with_team(monkeypatch))
     ok = await service.update_team_scores(team_id=5, should_commit=True)
 
     assert ok is True
@@ -45,7 +47,7 @@ async def test_update_team_scores_no_publish_without_commit(
         AsyncMock(side_effect=lambda event: published.append(event)),
     )
 
-    service = ScoringService(_mock_db_with_team())
+    service = ScoringService(_mock_db_with_team(monkeypatch))
     # Batched callers defer the commit; the event must fire only on real persistence.
     await service.update_team_scores(team_id=5, should_commit=False)
 
@@ -97,13 +99,17 @@ async def test_remove_result_publishes_deleted_after_commit(
     monkeypatch.setattr(crud_activity.activity_result, "delete", AsyncMock())
 
     service = ScoringService(AsyncMock())
-    monkeypatch.setattr(service, "update_team_scores", AsyncMock(return_value=True))
+    monkeypatch.setattr(service, "_record_score_facts", AsyncMock(return_value={3: 0.0}))
 
     removed = await service.remove_result(11)
 
     assert removed is db_obj
-    assert len(published) == 1
-    assert published[0].event_type == EventType.ACTIVITY_RESULT_DELETED.value
-    assert published[0].payload.result_id == 11
-    assert published[0].payload.team_id == 3
-    assert published[0].payload.activity_id == 9
+    # The team's new total first, then the deletion, both after the one commit.
+    assert [event.event_type for event in published] == [
+        EventType.TEAM_SCORE_UPDATED.value,
+        EventType.ACTIVITY_RESULT_DELETED.value,
+    ]
+    deleted = published[-1]
+    assert deleted.payload.result_id == 11
+    assert deleted.payload.team_id == 3
+    assert deleted.payload.activity_id == 9
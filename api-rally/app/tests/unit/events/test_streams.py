@@ -0,0 +1,74 @@
+"""Unit tests for the Redis Streams event transport (consumer groups, reclaim)."""
+
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from app.events.channels import Channels
+from app.events.streams import StreamConsumer, append_event
+
+
+@pytest.fixture
+def fake() -> fakeredis.FakeRedis:
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def _append(client: fakeredis.FakeRedis, *team_ids: int) -> None:
+    pipe = client.pipeline(transaction=False)
+    for team_id in team_ids:
+        append_event(pipe, Channels.TEAM_SCORE_UPDATED, f'{{"team_id": {team_id}}}')
+    pipe.execute()
+
+
+def test_new_group_starts_at_the_end_of_the_stream(fake: fakeredis.FakeRedis) -> None:
+    _append(fake, 1)
+    consumer = StreamConsumer(fake, group="Worker", consumer="a")
+    consumer.ensure_group()
+    consumer.ensure_group()  # idempotent
+    _append(fake, 2)
+
+    assert [entry.data for entry in consumer.read(0.0)] == ['{"team_id": 2}']
+
+
+def test_each_group_gets_every_entry_once(fake: fakeredis.FakeRedis) -> None:
+    first = StreamConsumer(fake, group="Leaderboard", consumer="a")
+    second = StreamConsumer(fake, group="Leaderboard", consumer="b")
+    other = StreamConsumer(fake, group="Badges", consumer="a")
+    for consumer in (first, second, other):
+        consumer.ensure_group()
+    _append(fake, 1, 2)
+
+    assert len(first.read(0.0)) == 2
+    assert second.read(0.0) == []
+    assert len(other.read(0.0)) == 2
+
+
+def test_reclaim_takes_over_entries_a_crashed_consumer_left_pending(
+    fake: fakeredis.FakeRedis,
+) -> None:
+    crashed = StreamConsumer(fake, group="Worker", consumer="crashed")
+    survivor = StreamConsumer(fake, group="Worker", consumer="survivor")
+    crashed.ensure_group()
+    _append(fake, 1, 2)
+    crashed.read(0.0)  # never acknowledged
+
+    reclaimed = survivor.reclaim(0.0)
+    assert [entry.channel for entry in reclaimed] == [Channels.TEAM_SCORE_UPDATED] * 2
+
+    survivor.ack([entry.entry_id for entry in reclaimed])
+    assert fake.xpending(Channels.EVENT_STREAM, "Worker")["pending"] == 0
+
+
+def test_appends_are_trimmed_to_maxlen(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.events.streams.settings.EVENTS_STREAM_MAXLEN", 5)
+    pipe = MagicMock()
+
+    append_event(pipe, Channels.TEAM_SCORE_UPDATED, "{}")
+
+    pipe.xadd.assert_called_once_with(
+        Channels.EVENT_STREAM,
+        {"channel": Channels.TEAM_SCORE_UPDATED, "data": "{}"},
+        maxlen=5,
+        approximate=True,
+    )
@@ -1,7 +1,7 @@
 """Property-based tests for relative scoring invariants (Hypothesis).
 
 Covers pure, DB-free scoring math:
-- TimeBasedActivity.calculate_relative_ranking_score
+- TimeBasedActivity.calculate_relative_ranking_score / relative_ranking_scorer
 - BaseActivity.apply_modifiers
 
 These functions have clean algebraic invariants, so property tests catch
@@ -94,6 +94,32 @@ def test_lone_competitor_gets_max_points(time: float) -> None:
     assert activity.calculate_relative_ranking_score([time], time) == pytest.approx(100.0)
 
 
+def _linear_reference_score(times: list[float], time: float) -> float:
+    """The original per-call algorithm: count faster times linearly."""
+    if time not in times:
+        return 0
+    if len(times) == 1:
+        return 100.0
+    rank = sum(1 for t in times if t < time) + 1
+    if rank == 1:
+        return 100.0
+    if time == max(times):
+        return 10.0
+    return 100.0 - 90.0 * (rank - 1) / (len(times) - 1)
+
+
+@given(
+    times=st.lists(st.sampled_from([5.0, 10.0, 12.5, 20.0, 30.0]), min_size=1, max_size=30),
+    probe=st.sampled_from([5.0, 10.0, 12.5, 20.0, 30.0, 99.0]),
+)
+@settings(max_examples=300)
+def test_batch_scorer_matches_linear_reference(times: list[float], probe: float) -> None:
+    """The sort-once bisect scorer keeps the exact tie and last-place rules."""
+    activity = _make_time_activity()
+    scorer = activity.relative_ranking_scorer(times)
+    assert scorer(probe) == pytest.approx(_linear_reference_score(times, probe))
+
+
 # ---------------------------------------------------------------------------
 # apply_modifiers: penalties/bonuses invariants
 # ---------------------------------------------------------------------------
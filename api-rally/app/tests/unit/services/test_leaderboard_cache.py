@@ -1,5 +1,7 @@
 """Unit tests for the Redis leaderboard cache."""
 
+import json
+
 import fakeredis.aioredis
 import pytest
 
@@ -11,8 +13,19 @@ def client() -> fakeredis.aioredis.FakeRedis:
     return fakeredis.aioredis.FakeRedis(decode_responses=True)
 
 
+def _row(team_id: int, total: float, rank: int, completed: int = 1) -> dict:
+    return {
+        "team_id": team_id,
+        "team_name": f"T{team_id}",
+        "total_score": total,
+        "activities_completed": completed,
+        "rank": rank,
+    }
+
+
 async def test_read_returns_none_when_empty(client: fakeredis.aioredis.FakeRedis) -> None:
     assert await cache.read_global_leaderboard(client) is None
+    assert not await cache.is_warm(client)
 
 
 async def test_write_then_read_roundtrip(client: fakeredis.aioredis.FakeRedis) -> None:
@@ -22,13 +35,150 @@ async def test_write_then_read_roundtrip(client: fakeredis.aioredis.FakeRedis) -
     ]
     await cache.write_global_leaderboard(client, ranking)
     assert await cache.read_global_leaderboard(client) == ranking
+    assert await cache.is_warm(client)
+
+
+async def test_write_replaces_previous_board(client: fakeredis.aioredis.FakeRedis) -> None:
+    await cache.write_global_leaderboard(client, [_row(1, 10.0, 1), _row(2, 5.0, 2)])
+    await cache.write_global_leaderboard(client, [_row(3, 7.0, 1)])
+    assert await cache.read_global_leaderboard(client) == [_row(3, 7.0, 1)]
 
 
-async def test_read_discards_corrupt_payload(client: fakeredis.aioredis.FakeRedis) -> None:
-    await client.set(cache.GLOBAL_LEADERBOARD_KEY, "not-json{")
+async def test_read_discards_corrupt_entry(client: fakeredis.aioredis.FakeRedis) -> None:
+    await cache.write_global_leaderboard(client, [_row(1, 10.0, 1)])
+    await client.hset(cache.GLOBAL_TEAMS_KEY, "1", "not-json{")
     assert await cache.read_global_leaderboard(client) is None
 
 
-async def test_read_rejects_non_list(client: fakeredis.aioredis.FakeRedis) -> None:
-    await client.set(cache.GLOBAL_LEADERBOARD_KEY, '{"team_id": 1}')
+async def test_read_rejects_non_dict_entry(client: fakeredis.aioredis.FakeRedis) -> None:
+    await cache.write_global_leaderboard(client, [_row(1, 10.0, 1)])
+    await client.hset(cache.GLOBAL_TEAMS_KEY, "1", "[1, 2]")
     assert await cache.read_global_leaderboard(client) is None
+
+
+async def test_read_treats_missing_entry_as_cold(client: fakeredis.aioredis.FakeRedis) -> None:
+    """A score without display fields must trigger a recompute, not a hole."""
+    await client.zadd(cache.GLOBAL_SCORES_KEY, {"4": 3.0})
+    assert await cache.read_global_leaderboard(client) is None
+
+
+async def test_ties_share_competition_rank(client: fakeredis.aioredis.FakeRedis) -> None:
+    await cache.write_global_leaderboard(
+        client, [_row(1, 50.0, 1), _row(2, 30.0, 2), _row(3, 30.0, 2), _row(4, 10.0, 4)]
+    )
+    ranks = {row["team_id"]: row["rank"] for row in await cache.read_global_leaderboard(client)}
+    assert ranks == {1: 1, 2: 2, 3: 2, 4: 4}
+
+
+async def test_upsert_moves_team_and_rerank_is_derived(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    await cache.write_global_leaderboard(client, [_row(1, 50.0, 1), _row(2, 30.0, 2)])
+    await cache.upsert_team(
+        client,
+        {"team_id": 2, "team_name": "Renamed", "total_score": 80.0, "activities_completed": 4},
+    )
+    ranking = await cache.read_global_leaderboard(client)
+    assert [(r["team_id"], r["rank"]) for r in ranking] == [(2, 1), (1, 2)]
+    assert ranking[0]["team_name"] == "Renamed"
+    assert ranking[0]["activities_completed"] == 4
+
+
+async def test_remove_team_drops_it(client: fakeredis.aioredis.FakeRedis) -> None:
+    await cache.write_global_leaderboard(client, [_row(1, 50.0, 1), _row(2, 30.0, 2)])
+    await cache.remove_team(client, 1)
+    assert await cache.read_global_leaderboard(client) == [_row(2, 30.0, 1)]
+
+
+async def test_read_top_n(client: fakeredis.aioredis.FakeRedis) -> None:
+    await cache.write_global_leaderboard(client, [_row(i, float(100 - i), i) for i in range(1, 11)])
+    top = await cache.read_global_leaderboard(client, limit=3)
+    assert [r["team_id"] for r in top] == [1, 2, 3]
+
+
+async def test_team_window_ranks_mid_board(client: fakeredis.aioredis.FakeRedis) -> None:
+    """The first row of a mid-board window gets its true rank, ties included."""
+    await cache.write_global_leaderboard(
+        client,
+        [_row(1, 90.0, 1), _row(2, 70.0, 2), _row(3, 70.0, 2), _row(4, 50.0, 4), _row(5, 40.0, 5)],
+    )
+    window = await cache.read_team_window(client, 4, radius=1)
+    # Ties follow the SQL order (lower id first), so team 3 sits directly above.
+    assert [(r["team_id"], r["rank"]) for r in window] == [(3, 2), (4, 4), (5, 5)]
+
+
+async def test_ties_read_in_sql_order(client: fakeredis.aioredis.FakeRedis) -> None:
+    """Equal scores list by team id ascending, as the SQL ranking does."""
+    await cache.write_global_leaderboard(
+        client, [_row(9, 50.0, 1), _row(2, 30.0, 2), _row(10, 30.0, 2), _row(11, 30.0, 2)]
+    )
+    full = await cache.read_global_leaderboard(client)
+    assert [r["team_id"] for r in full] == [9, 2, 10, 11]
+    # A slice edge inside a tie run still holds the teams SQL would put there.
+    top = await cache.read_global_leaderboard(client, limit=2)
+    assert [(r["team_id"], r["rank"]) for r in top] == [(9, 1), (2, 2)]
+    window = await cache.read_team_window(client, 10, radius=1)
+    assert [(r["team_id"], r["rank"]) for r in window] == [(2, 2), (10, 2), (11, 2)]
+
+
+async def test_seed_only_writes_an_unseeded_board(client: fakeredis.aioredis.FakeRedis) -> None:
+    """A cold-miss seed must never clobber standings the worker already wrote."""
+    assert await cache.seed_global_leaderboard(client, [_row(1, 10.0, 1)])
+    await cache.upsert_team(client, _row(1, 25.0, 1))
+
+    assert not await cache.seed_global_leaderboard(client, [_row(1, 10.0, 1), _row(2, 5.0, 2)])
+    assert await cache.read_global_leaderboard(client) == [_row(1, 25.0, 1)]
+
+
+async def test_team_window_clamps_at_top(client: fakeredis.aioredis.FakeRedis) -> None:
+    await cache.write_global_leaderboard(client, [_row(1, 90.0, 1), _row(2, 70.0, 2)])
+    window = await cache.read_team_window(client, 1, radius=3)
+    assert [r["team_id"] for r in window] == [1, 2]
+
+
+async def test_team_window_cold_vs_unknown_team(client: fakeredis.aioredis.FakeRedis) -> None:
+    assert await cache.read_team_window(client, 1, radius=1) is None
+    await cache.write_global_leaderboard(client, [_row(1, 90.0, 1)])
+    assert await cache.read_team_window(client, 99, radius=1) == []
+
+
+def test_slices_over_a_computed_ranking() -> None:
+    ranking = [_row(i, float(10 - i), i) for i in range(1, 6)]
+    assert cache.slice_top(ranking, None) == ranking
+    assert cache.slice_top(ranking, 2) == ranking[:2]
+    assert cache.slice_team_window(ranking, 1, radius=1) == ranking[:2]
+    assert cache.slice_team_window(ranking, 3, radius=1) == ranking[1:4]
+    assert cache.slice_team_window(ranking, 42, radius=1) == []
+
+
+def test_diff_lists_changed_rows_and_departed_teams() -> None:
+    before = [_row(1, 90.0, 1), _row(2, 70.0, 2), _row(3, 50.0, 3)]
+    after = [_row(2, 95.0, 1), _row(1, 90.0, 2), _row(4, 10.0, 3)]
+    changed, removed = cache.diff_rankings(before, after)
+    assert changed == after
+    assert removed == [3]
+    assert cache.diff_rankings(after, after) == ([], [])
+
+
+async def test_deltas_replay_from_a_version(client: fakeredis.aioredis.FakeRedis) -> None:
+    assert await cache.read_version(client) == 0
+    for score in (10.0, 20.0, 30.0):
+        await cache.record_delta(client, [_row(1, score, 1)], [], history=10)
+
+    assert await cache.read_version(client) == 3
+    replay = await cache.read_deltas_since(client, 1)
+    assert [json.loads(delta)["version"] for delta in replay] == [2, 3]
+    assert json.loads(replay[-1])["changed"] == [_row(1, 30.0, 1)]
+    assert await cache.read_deltas_since(client, 3) == []
+
+
+async def test_deltas_beyond_the_history_need_a_snapshot(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    for score in (10.0, 20.0, 30.0):
+        await cache.record_delta(client, [_row(1, score, 1)], [], history=2)
+
+    assert await cache.read_deltas_since(client, 0) is None
+    assert len(await cache.read_deltas_since(client, 1)) == 2
+    # An id from before a Redis reset is ahead of the counter.
+    assert await cache.read_deltas_since(client, 7) is None
@@ -0,0 +1,103 @@
+"""Unit tests for the single-flight cold-leaderboard recompute."""
+
+import asyncio
+from typing import Any
+
+import fakeredis.aioredis
+import pytest
+
+from app.services import leaderboard_cache, leaderboard_recompute
+
+RANKING = [
+    {"team_id": 1, "team_name": "A", "total_score": 9.0, "activities_completed": 2, "rank": 1},
+    {"team_id": 2, "team_name": "B", "total_score": 4.0, "activities_completed": 1, "rank": 2},
+]
+
+
+class _FakeService:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self._delay = delay
+
+    async def get_team_ranking(self) -> list[dict[str, Any]]:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        return [dict(row) for row in RANKING]
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> fakeredis.aioredis.FakeRedis:
+    monkeypatch.setattr(leaderboard_recompute, "_last_known", None)
+    monkeypatch.setattr(leaderboard_recompute, "_POLL_SECONDS", 0.01)
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+async def _recompute(
+    client: fakeredis.aioredis.FakeRedis, service: _FakeService, wait: float = 0.1
+) -> tuple[list[dict[str, Any]], bool]:
+    return await leaderboard_recompute.recompute_global_ranking(
+        client,
+        service,  # type: ignore[arg-type]
+        wait_seconds=wait,
+    )
+
+
+async def test_concurrent_misses_share_one_recompute(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    service = _FakeService(delay=0.05)
+
+    results = await asyncio.gather(*(_recompute(client, service) for _ in range(5)))
+
+    assert service.calls == 1
+    assert all(result == (RANKING, False) for result in results)
+    assert await leaderboard_cache.read_global_leaderboard(client) == RANKING
+    assert not await client.exists(leaderboard_cache.RECOMPUTE_LOCK_KEY)
+
+
+async def test_waits_for_another_process_to_seed(client: fakeredis.aioredis.FakeRedis) -> None:
+    assert await leaderboard_cache.acquire_recompute_lock(client, "other-process")
+    service = _FakeService()
+
+    async def _other_process_seeds() -> None:
+        await asyncio.sleep(0.03)
+        await leaderboard_cache.seed_global_leaderboard(client, RANKING)
+
+    seeding = asyncio.create_task(_other_process_seeds())
+    assert await _recompute(client, service, wait=1.0) == (RANKING, False)
+    await seeding
+    assert service.calls == 0
+
+
+async def test_serves_last_known_board_as_stale(
+    client: fakeredis.aioredis.FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    old = [dict(RANKING[0], total_score=1.0)]
+    monkeypatch.setattr(leaderboard_recompute, "_last_known", old)
+    assert await leaderboard_cache.acquire_recompute_lock(client, "other-process")
+    service = _FakeService()
+
+    assert await _recompute(client, service, wait=0.05) == (old, True)
+    assert service.calls == 0
+
+
+async def test_recomputes_when_nothing_to_fall_back_on(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    assert await leaderboard_cache.acquire_recompute_lock(client, "other-process")
+    service = _FakeService()
+
+    assert await _recompute(client, service, wait=0.05) == (RANKING, False)
+    assert service.calls == 1
+
+
+async def test_lock_is_only_released_by_its_holder(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    assert await leaderboard_cache.acquire_recompute_lock(client, "mine")
+    assert not await leaderboard_cache.acquire_recompute_lock(client, "theirs")
+
+    await leaderboard_cache.release_recompute_lock(client, "theirs")
+    assert await client.get(leaderboard_cache.RECOMPUTE_LOCK_KEY) == "mine"
+    await leaderboard_cache.release_recompute_lock(client, "mine")
+    assert await leaderboard_cache.acquire_recompute_lock(client, "theirs")
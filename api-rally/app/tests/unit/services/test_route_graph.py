@@ -0,0 +1,230 @@
+"""Unit tests for the cached route graph and the single-query team state."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import event
+
+from app.crud.crud_activity import activity as crud_activity
+from app.crud.crud_checkpoint import checkpoint as crud_checkpoint
+from app.models.activity import ActivityResult
+from app.models.checkpoint_arrival import CheckpointArrival
+from app.models.checkpoint_skip import CheckpointSkip
+from app.schemas.activity import ActivityCreate, ActivityType
+from app.schemas.checkpoint import CheckPointCreate
+from app.services import route_graph as route_graph_module
+from app.services.route_graph import RouteGraph, RoutePost, route_changed, route_graph
+from app.services.route_progress import (
+    TeamRouteState,
+    checkpoint_progress,
+    load_team_state,
+    load_team_states,
+    resolved_orders,
+    teams_progress,
+)
+from app.tests.conftest import make_event, make_team
+
+
+async def _checkpoint(pg_session, order, **fields):
+    return await crud_checkpoint.create(
+        pg_session, obj_in=CheckPointCreate(name=f"Checkpoint {order}", order=order, **fields)
+    )
+
+
+async def _activity(pg_session, checkpoint_id, *, is_active=True):
+    return await crud_activity.create(
+        pg_session,
+        obj_in=ActivityCreate(
+            name="Activity",
+            activity_type=ActivityType.GENERAL,
+            checkpoint_id=checkpoint_id,
+            config={},
+            is_active=is_active,
+        ),
+    )
+
+
+def _post(id, order, *activity_ids):
+    return RoutePost(
+        id=id,
+        order=order,
+        name=f"Checkpoint {order}",
+        stage_id=None,
+        available_from=None,
+        available_until=None,
+        activity_ids=activity_ids,
+    )
+
+
+_GRAPH = RouteGraph(
+    event_id=1,
+    posts=(_post(10, 1, 100), _post(20, 2), _post(30, 3, 300, 301)),
+    stages=(),
+)
+
+
+async def test_graph_lists_published_posts_with_their_active_activities(pg_session) -> None:
+    await make_event(pg_session)
+    first = await _checkpoint(pg_session, 1)
+    second = await _checkpoint(pg_session, 2)
+    await _checkpoint(pg_session, 3, is_draft=True)
+    active = await _activity(pg_session, first.id)
+    await _activity(pg_session, first.id, is_active=False)
+
+    graph = await route_graph(pg_session)
+
+    assert [(p.id, p.order) for p in graph.posts] == [(first.id, 1), (second.id, 2)]
+    assert graph.posts[0].activity_ids == (active.id,)
+    assert graph.posts[1].activity_ids == ()
+    assert graph.max_order == 2
+    assert graph.stages == ()
+
+
+async def test_graph_is_cached_until_the_route_changes(pg_session) -> None:
+    await make_event(pg_session)
+    await _checkpoint(pg_session, 1)
+    first = await route_graph(pg_session)
+
+    await _checkpoint(pg_session, 2)
+    assert await route_graph(pg_session) is first
+
+    with patch.object(route_graph_module, "publish_event", new=AsyncMock()) as publish:
+        await route_changed()
+    publish.assert_awaited_once()
+    assert len((await route_graph(pg_session)).posts) == 2
+
+
+async def test_team_state_is_read_in_one_query(pg_session) -> None:
+    await make_event(pg_session)
+    first = await _checkpoint(pg_session, 1)
+    second = await _checkpoint(pg_session, 2)
+    done = await _activity(pg_session, first.id)
+    pending = await _activity(pg_session, second.id)
+    team = await make_team(pg_session)
+    pg_session.add_all(
+        [
+            ActivityResult(team_id=team.id, activity_id=done.id, result_data={}, is_completed=True),
+            ActivityResult(
+                team_id=team.id, activity_id=pending.id, result_data={}, is_completed=False
+            ),
+            CheckpointSkip(team_id=team.id, checkpoint_id=second.id),
+            CheckpointArrival(team_id=team.id, checkpoint_id=first.id),
+        ]
+    )
+    await pg_session.commit()
+
+    statements: list[str] = []
+    engine = pg_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        state = await load_team_state(pg_session, team.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert state == TeamRouteState(
+        completed_activity_ids=frozenset({done.id}),
+        skipped_checkpoint_ids=frozenset({second.id}),
+        arrived_checkpoint_ids=frozenset({first.id}),
+    )
+
+
+async def test_team_states_for_a_whole_listing_are_read_in_one_query(pg_session) -> None:
+    await make_event(pg_session)
+    first = await _checkpoint(pg_session, 1)
+    second = await _checkpoint(pg_session, 2)
+    done = await _activity(pg_session, first.id)
+    pending = await _activity(pg_session, second.id)
+    teams = [await make_team(pg_session, name=f"Team {i}") for i in range(3)]
+    pg_session.add_all(
+        [
+            ActivityResult(
+                team_id=teams[0].id, activity_id=done.id, result_data={}, is_completed=True
+            ),
+            CheckpointSkip(team_id=teams[1].id, checkpoint_id=first.id),
+            CheckpointArrival(team_id=teams[1].id, checkpoint_id=second.id),
+        ]
+    )
+    await pg_session.commit()
+
+    statements: list[str] = []
+    engine = pg_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        states = await load_team_states(pg_session, [team.id for team in teams])
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    for team in teams:
+        assert states[team.id] == await load_team_state(pg_session, team.id)
+    assert states[teams[2].id] == TeamRouteState()
+
+    progress = await teams_progress(pg_session, teams)
+    assert [progress[team.id].current_order for team in teams] == [2, 2, 1]
+    assert progress[teams[0].id].pending_activity_ids == (pending.id,)
+    assert progress[teams[2].id].pending_activity_ids == (done.id,)
+
+
+async def test_team_states_of_no_teams_cost_no_query(pg_session) -> None:
+    assert await load_team_states(pg_session, []) == {}
+
+
+@pytest.mark.parametrize(
+    ("state", "checked_in", "expected"),
+    [
+        (TeamRouteState(), 0, (0, 1, ())),
+        (TeamRouteState(completed_activity_ids=frozenset({100})), 2, (2, 3, (1, 2))),
+        (TeamRouteState(completed_activity_ids=frozenset({100})), 0, (1, 2, (1,))),
+        (TeamRouteState(skipped_checkpoint_ids=frozenset({10})), 0, (1, 2, (1,))),
+        (
+            TeamRouteState(completed_activity_ids=frozenset({100, 300, 301})),
+            3,
+            (3, 3, (1, 2, 3)),
+        ),
+    ],
+)
+def test_checkpoint_progress_walks_to_the_first_unfinished_post(
+    state, checked_in, expected
+) -> None:
+    progress = checkpoint_progress(_GRAPH, state, checked_in_count=checked_in)
+
+    assert (
+        progress.last_completed_order,
+        progress.current_order,
+        progress.completed_orders,
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    ("state", "expected"),
+    [
+        (TeamRouteState(), (100,)),
+        (TeamRouteState(completed_activity_ids=frozenset({100, 301})), ()),
+        (
+            TeamRouteState(
+                completed_activity_ids=frozenset({100, 301}),
+                skipped_checkpoint_ids=frozenset({20}),
+            ),
+            (300,),
+        ),
+        (TeamRouteState(skipped_checkpoint_ids=frozenset({10, 20})), (300, 301)),
+        (TeamRouteState(completed_activity_ids=frozenset({100, 300, 301})), ()),
+    ],
+)
+def test_pending_activities_are_the_current_posts_unfinished_ones(state, expected) -> None:
+    progress = checkpoint_progress(_GRAPH, state, checked_in_count=0)
+
+    assert progress.pending_activity_ids == expected
+
+
+def test_resolved_orders_counts_arrivals_only_at_posts_without_activities() -> None:
+    state = TeamRouteState(
+        completed_activity_ids=frozenset({300}),
+        arrived_checkpoint_ids=frozenset({10, 20, 30}),
+    )
+
+    assert resolved_orders(_GRAPH, state) == frozenset({2})
+    assert resolved_orders(_GRAPH, state, ignore_arrival_for=20) == frozenset()
@@ -0,0 +1,179 @@
+"""DB-backed tests for the append-only score ledger.
+
+Score writes append signed deltas and move the team's running totals; the
+reconciliation pass compares the ledger against a full recompute and appends
+corrections. Runs on the real-Postgres `pg_session` fixture (auto-skips when
+Postgres is unreachable).
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.crud.crud_team import team as crud_team
+from app.models.activity import Activity, ActivityResult
+from app.models.checkpoint import CheckPoint
+from app.models.dynamic_scoring import DynamicAward
+from app.models.score_ledger import LedgerSource, ScoreLedgerEntry
+from app.models.team import Team
+from app.schemas.activity import ActivityResultCreate, ActivityResultUpdate
+from app.schemas.activity_types import ActivityType
+from app.schemas.team import TeamCreate
+from app.services.scoring_service import ScoringService
+
+
+async def _make_team(db, name: str = "Team A") -> Team:
+    return await crud_team.create(db, obj_in=TeamCreate(name=name))
+
+
+async def _make_activity(db, order: int) -> Activity:
+    checkpoint = CheckPoint(name=f"CP{order}", order=order)
+    db.add(checkpoint)
+    await db.flush()
+    activity = Activity(
+        name=f"Act{order}",
+        activity_type=ActivityType.GENERAL.value,
+        config={"min_points": 0, "max_points": 100},
+        checkpoint_id=checkpoint.id,
+    )
+    db.add(activity)
+    await db.commit()
+    await db.refresh(activity)
+    return activity
+
+
+async def _deltas(db, source: LedgerSource, source_id: int) -> list[float]:
+    stmt = (
+        select(ScoreLedgerEntry.delta)
+        .where(ScoreLedgerEntry.source == source.value, ScoreLedgerEntry.source_id == source_id)
+        .order_by(ScoreLedgerEntry.id)
+    )
+    return list((await db.scalars(stmt)).all())
+
+
+async def test_result_writes_append_deltas_and_move_running_totals(pg_session):
+    team = await _make_team(pg_session)
+    team.times = [datetime(2026, 5, 1, 10, 0), datetime(2026, 5, 1, 10, 40)]
+    await pg_session.commit()
+    first = await _make_activity(pg_session, order=1)
+    second = await _make_activity(pg_session, order=2)
+    svc = ScoringService(pg_session)
+
+    result = await svc.create_result(
+        ActivityResultCreate(
+            activity_id=first.id, team_id=team.id, result_data={"assigned_points": 40}
+        )
+    )
+    await svc.create_result(
+        ActivityResultCreate(
+            activity_id=second.id, team_id=team.id, result_data={"assigned_points": 15}
+        )
+    )
+    await svc.update_result(result, ActivityResultUpdate(result_data={"assigned_points": 50}))
+
+    assert await _deltas(pg_session, LedgerSource.ACTIVITY_RESULT, result.id) == [40, 10]
+    assert team.ledger_total == pytest.approx(65)
+    assert team.total == 65
+    assert team.checkpoint_totals == {
+        str(first.checkpoint_id): {"points": 50, "facts": 1},
+        str(second.checkpoint_id): {"points": 15, "facts": 1},
+    }
+    assert team.score_per_checkpoint == [50, 15]
+
+    await svc.remove_result(result.id)
+
+    # Rows are never rewritten: removal appends the negated contribution.
+    assert await _deltas(pg_session, LedgerSource.ACTIVITY_RESULT, result.id) == [40, 10, -50]
+    assert team.total == 15
+    assert team.checkpoint_totals == {str(second.checkpoint_id): {"points": 15, "facts": 1}}
+    assert team.score_per_checkpoint == [15, 0]
+
+
+async def test_zero_point_result_keeps_its_checkpoint_slot(pg_session):
+    team = await _make_team(pg_session)
+    team.times = [datetime(2026, 5, 1, 10, 0), datetime(2026, 5, 1, 10, 40)]
+    await pg_session.commit()
+    first = await _make_activity(pg_session, order=1)
+    second = await _make_activity(pg_session, order=2)
+    svc = ScoringService(pg_session)
+
+    await svc.create_result(
+        ActivityResultCreate(
+            activity_id=first.id, team_id=team.id, result_data={"assigned_points": 0}
+        )
+    )
+    await svc.create_result(
+        ActivityResultCreate(
+            activity_id=second.id, team_id=team.id, result_data={"assigned_points": 15}
+        )
+    )
+
+    # A scored 0 is still a fact at its checkpoint, so its slot survives.
+    assert team.checkpoint_totals[str(first.checkpoint_id)] == {"points": 0, "facts": 1}
+    assert team.score_per_checkpoint == [0, 15]
+
+    report = await svc.reconcile_score_ledger([team.id])
+    assert report.drifted == []
+
+
+async def test_award_and_revocation_are_ledger_deltas(pg_session):
+    team = await _make_team(pg_session)
+    award = DynamicAward(team_id=team.id, points=-5, is_active=True)
+    pg_session.add(award)
+    svc = ScoringService(pg_session)
+
+    assert await svc.record_award(award) == pytest.approx(-5)
+    award.is_active = False
+    assert await svc.record_award(award) == pytest.approx(0)
+
+    assert await _deltas(pg_session, LedgerSource.AWARD, award.id) == [-5, 5]
+    assert team.total == 0
+    # Awards move the total only, never a checkpoint slot.
+    assert team.checkpoint_totals == {}
+
+
+async def test_reconcile_repairs_writes_that_bypassed_the_ledger(pg_session):
+    team = await _make_team(pg_session)
+    activity = await _make_activity(pg_session, order=1)
+    result = ActivityResult(
+        activity_id=activity.id,
+        team_id=team.id,
+        result_data={"assigned_points": 30},
+        final_score=30,
+        is_completed=True,
+    )
+    pg_session.add(result)
+    await pg_session.commit()
+    svc = ScoringService(pg_session)
+
+    report = await svc.reconcile_score_ledger()
+
+    assert report.drifted == [team.id]
+    assert report.corrections == 1
+    assert report.totals[team.id] == pytest.approx(30)
+    assert team.total == 30
+    assert await _deltas(pg_session, LedgerSource.ACTIVITY_RESULT, result.id) == [30]
+
+    await pg_session.commit()
+    # Back in line: a second pass finds nothing to correct.
+    again = await svc.reconcile_score_ledger()
+    assert again.drifted == []
+    assert again.corrections == 0
+
+
+async def test_reconcile_zeroes_facts_missing_from_the_source_tables(pg_session):
+    team = await _make_team(pg_session)
+    award = DynamicAward(team_id=team.id, points=8, is_active=True)
+    pg_session.add(award)
+    svc = ScoringService(pg_session)
+    await svc.record_award(award)
+    # Deleted behind the ledger's back.
+    await pg_session.delete(award)
+    await pg_session.commit()
+
+    report = await svc.reconcile_score_ledger([team.id])
+
+    assert report.drifted == [team.id]
+    assert team.total == 0
+    assert await _deltas(pg_session, LedgerSource.AWARD, award.id) == [8, -8]
@@ -16,7 +16,7 @@ import pytest
 
 from app.core.exceptions import RallyError
 from app.crud.crud_team import team as crud_team
-from app.models.activity import Activity, ActivityResult
+from app.models.activity import Activity, ActivityResult, RallyEvent
 from app.models.checkpoint import CheckPoint
 from app.models.dynamic_scoring import DynamicAward
 from app.models.team import Team
@@ -171,9 +171,10 @@ async def test_update_team_scores_missing_team_returns_false(pg_session):
     assert await svc.update_team_scores(999999) is False
 
 
-async def test_get_settings_creates_default_row_when_none_exists(pg_session):
-    """Fresh DB with no RallySettings row: `_get_settings` must create and
-    persist a default one instead of raising."""
+async def test_get_settings_falls_back_to_defaults_without_writing(pg_session):
+    """Fresh DB with no RallySettings row: `_get_settings` must serve the
+    bootstrap defaults instead of raising, without creating the row (reads
+    never write settings)."""
     from sqlalchemy import select as sa_select
 
     from app.models.rally_settings import RallySettings
@@ -184,10 +185,11 @@ async def test_get_settings_creates_default_row_when_none_exists(pg_session):
     svc = ScoringService(pg_session)
     settings = await svc._get_settings()
 
-    assert settings is not None
-    assert settings.id is not None
+    assert settings.id is None
+    assert settings.penalty_per_puke == -10
+    assert (await pg_session.scalars(sa_select(RallySettings))).first() is None
 
-    # Second call reuses the cached instance rather than creating another row.
+    # Second call reuses the cached instance rather than reading again.
     settings_again = await svc._get_settings()
     assert settings_again is settings
 
@@ -198,9 +200,8 @@ async def test_update_all_team_scores_noop_on_empty_list(pg_session):
 
 
 async def test_checkpoint_scores_skips_incomplete_and_global_results(pg_session):
-    """`_checkpoint_scores_for_team` (the single-team path) must skip
-    incomplete results and results for checkpoint-less (global) activities,
-    same as its bulk counterpart."""
+    """The full recompute (`_expected_facts`) must skip incomplete results and
+    results for checkpoint-less (global) activities."""
     team = await _make_team(pg_session)
     cp = CheckPoint(name="CP", order=1)
     pg_session.add(cp)
@@ -246,10 +247,10 @@ async def test_checkpoint_scores_skips_incomplete_and_global_results(pg_session)
     await pg_session.commit()
 
     svc = ScoringService(pg_session)
-    checkpoint_scores, order_by_id, total = await svc._checkpoint_scores_for_team(team.id)
+    facts = await svc._expected_facts([team.id])
 
-    assert total == pytest.approx(25)
-    assert list(checkpoint_scores.values()) == [25]
+    assert sum(fact.value for fact in facts) == pytest.approx(25)
+    assert [(fact.checkpoint_id, fact.value) for fact in facts] == [(cp.id, 25)]
 
 
 async def test_update_team_scores_wraps_commit_failure_in_rally_error(pg_session, monkeypatch):
@@ -840,6 +841,115 @@ async def test_get_global_ranking_orders_and_ranks(pg_session):
     assert bottom["rank"] > top["rank"]
 
 
+async def test_global_ranking_ties_share_rank_and_skips_other_events(pg_session):
+    activity = await _make_activity(pg_session)
+    first = await _make_team(pg_session, "First")
+    tied_a = await _make_team(pg_session, "TiedA")
+    tied_b = await _make_team(pg_session, "TiedB")
+    last = await _make_team(pg_session, "Last")
+    for team, score in ((first, 50), (tied_a, 30), (tied_b, 30)):
+        await _make_result(
+            pg_session,
+            team=team,
+            activity=activity,
+            result_data={"assigned_points": score},
+            final_score=score,
+        )
+    # A team from a past edition must not show up on the current board.
+    past = RallyEvent(name="Past", slug="past-edition", is_current=False)
+    pg_session.add(past)
+    await pg_session.flush()
+    stale = await _make_team(pg_session, "Stale")
+    stale.event_id = past.id
+    await pg_session.commit()
+
+    ranking = await ScoringService(pg_session).get_team_ranking()
+
+    assert [(r["team_id"], r["rank"]) for r in ranking] == [
+        (first.id, 1),
+        (tied_a.id, 2),
+        (tied_b.id, 2),
+        (last.id, 4),
+    ]
+    assert ranking[-1]["total_score"] == pytest.approx(0)
+    assert ranking[-1]["activities_completed"] == 0
+
+
+async def test_activity_ranking_counts_completions_and_ranks_unscored_last(pg_session):
+    activity = await _make_activity(pg_session)
+    other = await _make_activity(pg_session)
+    scored = await _make_team(pg_session, "Scored")
+    zero = await _make_team(pg_session, "Zero")
+    pending = await _make_team(pg_session, "Pending")
+    await _make_result(pg_session, team=scored, activity=activity, result_data={}, final_score=40)
+    await _make_result(pg_session, team=scored, activity=other, result_data={}, final_score=5)
+    await _make_result(pg_session, team=zero, activity=activity, result_data={}, final_score=0)
+    pg_session.add(ActivityResult(activity_id=activity.id, team_id=pending.id, result_data={}))
+    await pg_session.commit()
+
+    ranking = await ScoringService(pg_session).get_team_ranking(activity_id=activity.id)
+
+    assert [(r["team_id"], r["rank"], r["score"]) for r in ranking] == [
+        (scored.id, 1, 40),
+        (zero.id, 2, 0),
+        (pending.id, 2, 0),
+    ]
+    assert [r["activities_completed"] for r in ranking] == [2, 1, 0]
+
+
+async def test_get_team_ranking_entry_matches_global_row(pg_session):
+    activity = await _make_activity(pg_session)
+    other = await _make_activity(pg_session)
+    team = await _make_team(pg_session, "Solo")
+    await _make_result(
+        pg_session,
+        team=team,
+        activity=activity,
+        result_data={"assigned_points": 30},
+        final_score=30,
+    )
+    await _make_result(
+        pg_session,
+        team=team,
+        activity=other,
+        result_data={"assigned_points": 12},
+        final_score=12,
+    )
+
+    svc = ScoringService(pg_session)
+    entry = await svc.get_team_ranking_entry(team.id)
+    row = next(r for r in await svc.get_team_ranking() if r["team_id"] == team.id)
+
+    assert entry == {k: row[k] for k in entry}
+    assert entry["total_score"] == pytest.approx(42)
+    assert entry["activities_completed"] == 2
+
+
+async def test_get_team_ranking_entry_empty_and_missing(pg_session):
+    team = await _make_team(pg_session, "Fresh")
+    svc = ScoringService(pg_session)
+
+    entry = await svc.get_team_ranking_entry(team.id)
+    assert entry["total_score"] == pytest.approx(0)
+    assert entry["activities_completed"] == 0
+    assert await svc.get_team_ranking_entry(999999) is None
+
+
+async def test_get_team_ranking_entry_skips_teams_of_other_events(pg_session):
+    current = await _make_team(pg_session, "Current")
+    past = RallyEvent(name="Past", slug="past-edition", is_current=False)
+    pg_session.add(past)
+    await pg_session.flush()
+    stale = await _make_team(pg_session, "Stale")
+    stale.event_id = past.id
+    await pg_session.commit()
+
+    svc = ScoringService(pg_session)
+    assert await svc.get_team_ranking_entry(current.id) is not None
+    # Not on the current board, so the worker must drop it, not upsert it.
+    assert await svc.get_team_ranking_entry(stale.id) is None
+
+
 async def test_get_activity_statistics_empty(pg_session):
     activity = await _make_activity(pg_session)
     svc = ScoringService(pg_session)
@@ -944,6 +1054,85 @@ async def test_update_time_based_result_reranks_activity(pg_session):
     assert slow_res.final_score is not None
 
 
+async def test_batch_rescore_keeps_ties_bonus_and_session_in_sync(pg_session):
+    """The activity-wide rescore writes every score in one bulk UPDATE; the
+    loaded results must see the new values, tied-last teams all get
+    min_points and extra-shot bonuses still apply."""
+    from sqlalchemy import select
+
+    activity = await _make_activity(
+        pg_session,
+        activity_type=ActivityType.TIME_BASED.value,
+        config={"max_points": 100, "min_points": 10},
+    )
+    teams = [await _make_team(pg_session, f"T{i}") for i in range(4)]
+    results = []
+    for team, seconds in zip(teams, (30, 45, 90, 90), strict=True):
+        results.append(
+            await _make_result(
+                pg_session,
+                team=team,
+                activity=activity,
+                result_data={"completion_time_seconds": seconds},
+                final_score=0,
+                time_score=seconds,
+            )
+        )
+    results[1].extra_shots = 2
+    await pg_session.commit()
+
+    svc = ScoringService(pg_session)
+    bonus = (await svc._get_settings()).bonus_per_extra_shot
+    await svc._recalculate_all_results_for_activity(activity.id)
+
+    expected = [100.0, 100.0 - 90.0 / 3 + 2 * bonus, 10.0, 10.0]
+    assert [r.final_score for r in results] == pytest.approx(expected)
+    fresh = (
+        await pg_session.execute(
+            select(ActivityResult.final_score)
+            .where(ActivityResult.activity_id == activity.id)
+            .order_by(ActivityResult.team_id)
+        )
+    ).scalars()
+    assert list(fresh) == pytest.approx(expected)
+
+
+async def test_activity_rescore_refreshes_teams_with_one_batched_event(pg_session, monkeypatch):
+    import app.services.scoring_service as scoring_module
+    from app.events import EventType
+
+    published = []
+
+    async def _capture(event):
+        published.append(event)
+
+    monkeypatch.setattr(scoring_module, "publish_event", _capture)
+    activity = await _make_activity(
+        pg_session,
+        activity_type=ActivityType.TIME_BASED.value,
+        config={"max_points": 100, "min_points": 10},
+    )
+    teams = [await _make_team(pg_session, f"T{i}") for i in range(3)]
+    for team, seconds in zip(teams, (30, 60, 90), strict=True):
+        await _make_result(
+            pg_session,
+            team=team,
+            activity=activity,
+            result_data={"completion_time_seconds": seconds},
+            final_score=0,
+            time_score=seconds,
+        )
+
+    await ScoringService(pg_session)._recalculate_all_results_for_activity(activity.id)
+
+    assert [e.event_type for e in published] == [EventType.TEAM_SCORES_UPDATED.value]
+    totals = {t.team_id: t.total_score for t in published[0].payload.teams}
+    assert totals == pytest.approx({teams[0].id: 100, teams[1].id: 55, teams[2].id: 10})
+    for team in teams:
+        await pg_session.refresh(team)
+    assert [team.total for team in teams] == [100, 55, 10]
+
+
 # --------------------------------------------------------------------------- #
 # team vs team
 # --------------------------------------------------------------------------- #
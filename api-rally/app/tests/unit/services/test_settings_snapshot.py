@@ -0,0 +1,109 @@
+"""Unit tests for the versioned, cached rally settings snapshot."""
+
+from datetime import UTC, datetime
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import select
+
+from app.models.rally_settings import RallySettings
+from app.services import settings_snapshot
+from app.tests.conftest import make_event, set_rally_settings
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeServer:
+    fake = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        settings_snapshot,
+        "get_async_redis_client",
+        lambda: fakeredis.aioredis.FakeRedis(server=fake, decode_responses=True),
+    )
+    return fake
+
+
+def _client(server: fakeredis.FakeServer) -> fakeredis.aioredis.FakeRedis:
+    return fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+async def test_defaults_are_served_without_writing_a_row(pg_session, server) -> None:
+    event = await make_event(pg_session)
+
+    snapshot = await settings_snapshot.current_settings(pg_session)
+
+    assert snapshot.id is None
+    assert snapshot.event_id == event.id
+    assert snapshot.version == 0
+    assert snapshot.max_teams == 14
+    assert (await pg_session.scalars(select(RallySettings))).first() is None
+
+
+async def test_snapshot_mirrors_the_event_timing_and_type(pg_session, server) -> None:
+    start = datetime(2026, 5, 1, 18, 0, tzinfo=UTC)
+    await make_event(pg_session, event_type="peddy_paper", start_time=start)
+    await set_rally_settings(pg_session, max_teams=3)
+
+    snapshot = await settings_snapshot.current_settings(pg_session)
+
+    assert snapshot.max_teams == 3
+    assert snapshot.event_type == "peddy_paper"
+    assert snapshot.rally_start_time == start
+
+
+async def test_reads_are_cached_until_a_write_is_announced(pg_session, server) -> None:
+    await make_event(pg_session)
+    first = await settings_snapshot.current_settings(pg_session)
+
+    await set_rally_settings(pg_session, max_teams=3)
+    # set_rally_settings drops the local copy; the shared one still answers.
+    second = await settings_snapshot.current_settings(pg_session)
+    third = await settings_snapshot.current_settings(pg_session)
+
+    assert second == first
+    assert third is second
+
+
+async def test_a_write_bumps_the_version_everywhere(pg_session, server) -> None:
+    event = await make_event(pg_session)
+    await settings_snapshot.current_settings(pg_session)
+    await set_rally_settings(pg_session, max_teams=3)
+
+    await settings_snapshot.settings_changed(event.id)
+    snapshot = await settings_snapshot.current_settings(pg_session)
+
+    assert snapshot.max_teams == 3
+    assert snapshot.version == 1
+    shared = await _client(server).get(settings_snapshot.SNAPSHOT_KEY.format(event_id=event.id))
+    assert shared is not None
+    assert settings_snapshot.RallySettingsSnapshot.model_validate_json(shared) == snapshot
+
+
+async def test_a_read_that_raced_a_write_is_not_shared(pg_session, server) -> None:
+    event = await make_event(pg_session)
+    client = _client(server)
+    stale = await settings_snapshot.current_settings(pg_session)
+    await client.flushall()
+    await client.set(settings_snapshot.VERSION_KEY.format(event_id=event.id), 1)
+
+    await settings_snapshot._share(client, event.id, stale, None)
+
+    assert not await client.exists(settings_snapshot.SNAPSHOT_KEY.format(event_id=event.id))
+
+
+async def test_reads_fall_back_to_the_database_without_redis(
+    pg_session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _Down(fakeredis.aioredis.FakeRedis):
+        async def mget(self, *args, **kwargs):
+            raise RedisConnectionError("down")
+
+    monkeypatch.setattr(settings_snapshot, "get_async_redis_client", _Down)
+    await make_event(pg_session)
+    await set_rally_settings(pg_session, max_teams=3)
+
+    snapshot = await settings_snapshot.current_settings(pg_session)
+
+    assert snapshot.max_teams == 3
+    assert await settings_snapshot.current_settings(pg_session) is snapshot
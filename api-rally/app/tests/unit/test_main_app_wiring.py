@@ -8,7 +8,7 @@ from fastapi.testclient import TestClient
 
 from app.core.exceptions import RallyError
 from app.main import app, lifespan, settings
-from app.workers import clear_workers, get_workers
+from app.workers import clear_workers, get_workers, runner
 
 
 def test_rally_error_handler_logs_traceback_for_5xx(monkeypatch):
@@ -53,7 +53,9 @@ async def test_lifespan_starts_scoring_worker_when_recompute_off_path(monkeypatc
     import app.main as main_module
 
     monkeypatch.setattr(main_module.settings, "EVENTS_ENABLED", True)
+    monkeypatch.setattr(main_module.settings, "WORKERS_EMBEDDED", True)
     monkeypatch.setattr(main_module.settings, "RECOMPUTE_OFF_PATH", True)
+    monkeypatch.setattr(main_module.settings, "SCORE_RECONCILE_INTERVAL_SECONDS", 0)
     monkeypatch.setattr(main_module, "init_logging", MagicMock())
     monkeypatch.setattr(main_module, "init_sentry", MagicMock())
     monkeypatch.setattr(main_module, "init_db", AsyncMock())
@@ -61,9 +63,9 @@ async def test_lifespan_starts_scoring_worker_when_recompute_off_path(monkeypatc
 
     fake_worker = MagicMock()
     fake_worker_cls = MagicMock(return_value=fake_worker)
-    monkeypatch.setattr(main_module, "LeaderboardWorker", fake_worker_cls)
-    monkeypatch.setattr(main_module, "BadgesWorker", fake_worker_cls)
-    monkeypatch.setattr(main_module, "ScoringWorker", fake_worker_cls)
+    monkeypatch.setattr(runner, "LeaderboardWorker", fake_worker_cls)
+    monkeypatch.setattr(runner, "BadgesWorker", fake_worker_cls)
+    monkeypatch.setattr(runner, "ScoringWorker", fake_worker_cls)
 
     # Running workers live in app.workers.registry, not app.main.
     clear_workers()
@@ -72,3 +74,53 @@ async def test_lifespan_starts_scoring_worker_when_recompute_off_path(monkeypatc
 
     assert get_workers() == ()
     main_module.close_pools.assert_called_once()
+
+
+async def test_lifespan_starts_score_ledger_worker_when_reconcile_interval_set(monkeypatch):
+    """A positive SCORE_RECONCILE_INTERVAL_SECONDS adds the ScoreLedgerWorker."""
+    import app.main as main_module
+
+    monkeypatch.setattr(main_module.settings, "EVENTS_ENABLED", True)
+    monkeypatch.setattr(main_module.settings, "WORKERS_EMBEDDED", True)
+    monkeypatch.setattr(main_module.settings, "RECOMPUTE_OFF_PATH", False)
+    monkeypatch.setattr(main_module.settings, "SCORE_RECONCILE_INTERVAL_SECONDS", 60)
+    monkeypatch.setattr(main_module, "init_logging", MagicMock())
+    monkeypatch.setattr(main_module, "init_sentry", MagicMock())
+    monkeypatch.setattr(main_module, "init_db", AsyncMock())
+    monkeypatch.setattr(main_module, "close_pools", MagicMock())
+
+    started: list[str] = []
+
+    def _fake_worker_cls(name: str) -> MagicMock:
+        def _build() -> MagicMock:
+            started.append(name)
+            return MagicMock()
+
+        return MagicMock(side_effect=_build)
+
+    for name in ("LeaderboardWorker", "BadgesWorker", "ScoreLedgerWorker"):
+        monkeypatch.setattr(runner, name, _fake_worker_cls(name))
+
+    clear_workers()
+    async with lifespan(app):
+        assert started == ["LeaderboardWorker", "BadgesWorker", "ScoreLedgerWorker"]
+
+
+async def test_lifespan_leaves_workers_to_the_worker_process_when_not_embedded(monkeypatch):
+    """With WORKERS_EMBEDDED off the workers run under `python -m app.workers`."""
+    import app.main as main_module
+
+    monkeypatch.setattr(main_module.settings, "EVENTS_ENABLED", True)
+    monkeypatch.setattr(main_module.settings, "WORKERS_EMBEDDED", False)
+    monkeypatch.setattr(main_module, "init_logging", MagicMock())
+    monkeypatch.setattr(main_module, "init_sentry", MagicMock())
+    monkeypatch.setattr(main_module, "init_db", AsyncMock())
+    monkeypatch.setattr(main_module, "close_pools", MagicMock())
+    fake_worker_cls = MagicMock()
+    for name in ("LeaderboardWorker", "BadgesWorker", "ScoringWorker", "ScoreLedgerWorker"):
+        monkeypatch.setattr(runner, name, fake_worker_cls)
+
+    clear_workers()
+    async with lifespan(app):
+        assert get_workers() == ()
+    fake_worker_cls.assert_not_called()
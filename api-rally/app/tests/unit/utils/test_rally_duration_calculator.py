@@ -2,7 +2,6 @@
 
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -146,20 +145,12 @@ class TestCalculateProgressPercentage:
 
 
 class TestConvenienceFunctions:
-    async def test_get_rally_duration_info_uses_settings_and_calculator(self):
+    def test_get_rally_duration_info_uses_settings_and_calculator(self):
         settings = _settings(start=NOW - timedelta(hours=1))
-        with patch(
-            "app.utils.rally_duration.rally_settings.get_or_create",
-            new=AsyncMock(return_value=settings),
-        ):
-            result = await get_rally_duration_info(db=None)
+        result = get_rally_duration_info(settings)
         assert result["status"] == "active_no_end"
 
-    async def test_get_team_duration_info_uses_settings_and_calculator(self):
+    def test_get_team_duration_info_uses_settings_and_calculator(self):
         settings = _settings(start=NOW - timedelta(hours=1))
-        with patch(
-            "app.utils.rally_duration.rally_settings.get_or_create",
-            new=AsyncMock(return_value=settings),
-        ):
-            result = await get_team_duration_info(db=None, team_start_time=NOW)
+        result = get_team_duration_info(settings, team_start_time=NOW)
         assert "team_duration" in result
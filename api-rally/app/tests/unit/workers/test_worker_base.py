@@ -1,13 +1,17 @@
-"""Unit tests for BaseWorker: dispatch, lifecycle (start/stop), signal handling."""
+"""Unit tests for BaseWorker: dispatch, coalescing, lifecycle (start/stop), signal handling."""
 
+import asyncio
 import json
 import signal
 import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import fakeredis
 import pytest
 
+from app.events.channels import Channels
+from app.events.streams import StreamConsumer
 from app.workers import base
 from app.workers.base import BaseWorker
 
@@ -56,6 +60,36 @@ class TestDispatch:
         worker._dispatch({"type": "message", "channel": "test.chan", "data": {"c": 3}})
         assert worker.events == [("test.chan", {"c": 3})]
 
+    def test_messages_share_one_event_loop_until_closed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        loops: list[object] = []
+
+        class _LoopRecordingWorker(BaseWorker):
+            channels = ["test.chan"]
+
+            async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
+                loops.append(asyncio.get_running_loop())
+
+        released: list[object] = []
+
+        async def _fake_close() -> None:
+            released.append(asyncio.get_running_loop())
+
+        monkeypatch.setattr(base, "close_worker_resources", _fake_close)
+        worker = _LoopRecordingWorker()
+        for n in range(2):
+            worker._dispatch({"type": "message", "channel": "test.chan", "data": {"n": n}})
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
+        worker._close_loop()
+
+        # The loop's pooled resources are released on it before it closes.
+        assert released == [loops[0]]
+        assert loops[0].is_closed()
+
     def test_logs_and_continues_on_bad_json(self) -> None:
         worker = _RecordingWorker()
         worker._dispatch({"type": "message", "channel": "test.chan", "data": "{not json"})
@@ -67,6 +101,92 @@ class TestDispatch:
         worker._dispatch({"type": "message", "channel": "test.chan", "data": "{}"})
 
 
+class _CoalescingWorker(_RecordingWorker):
+    """Coalesces by the payload's ``key``; merging keeps a running count."""
+
+    def coalesce_key(self, channel: str, data: dict[str, Any]) -> Any:
+        return data.get("key")
+
+    def merge_events(self, pending: dict[str, Any], incoming: dict[str, Any]) -> dict[str, Any]:
+        return {**incoming, "merged": pending.get("merged", 1) + 1}
+
+
+class TestCoalesce:
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        now = [100.0]
+        monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(base.settings, "WORKER_COALESCE_WINDOW_SECONDS", 0.5)
+        monkeypatch.setattr(base.settings, "WORKER_COALESCE_MAX_LATENCY_SECONDS", 2.0)
+        return now
+
+    @staticmethod
+    def _send(worker: BaseWorker, **data: Any) -> None:
+        worker._dispatch({"type": "message", "channel": "test.chan", "data": data})
+
+    def test_burst_is_handled_once_after_quiet_window(self, clock: list[float]) -> None:
+        worker = _CoalescingWorker()
+        for n in range(3):
+            self._send(worker, key="a", n=n)
+            clock[0] += 0.2
+        self._send(worker, key="b", n=9)
+
+        worker._flush_pending()
+        assert worker.events == []
+        # "a" was last seen at 100.4, so it is due first.
+        assert worker._poll_timeout() == pytest.approx(0.3)
+
+        clock[0] += 0.5
+        worker._flush_pending()
+        assert worker.events == [
+            ("test.chan", {"key": "a", "n": 2, "merged": 3}),
+            ("test.chan", {"key": "b", "n": 9}),
+        ]
+        assert worker._poll_timeout() == pytest.approx(base.POLL_TIMEOUT_SECONDS)
+
+    def test_busy_key_is_flushed_at_max_latency(self, clock: list[float]) -> None:
+        worker = _CoalescingWorker()
+        for n in range(5):
+            self._send(worker, key="a", n=n)
+            worker._flush_pending()
+            clock[0] += 0.4  # never quiet for the full window
+
+        self._send(worker, key="a", n=5)
+        worker._flush_pending()
+
+        # First event at 100.0, cap reached at 102.0.
+        assert worker.events == [("test.chan", {"key": "a", "n": 5, "merged": 6})]
+
+    def test_uncoalesced_events_and_zero_window_run_immediately(
+        self, clock: list[float], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        worker = _CoalescingWorker()
+        self._send(worker, n=1)  # no key
+        assert worker.events == [("test.chan", {"n": 1})]
+
+        monkeypatch.setattr(base.settings, "WORKER_COALESCE_WINDOW_SECONDS", 0.0)
+        worker = _CoalescingWorker()
+        self._send(worker, key="a", n=2)
+        assert worker.events == [("test.chan", {"key": "a", "n": 2})]
+
+    def test_pending_events_are_flushed_when_the_run_loop_exits(
+        self, clock: list[float], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # No lease configured: the run loop goes straight to consuming.
+        monkeypatch.setattr(base.settings, "WORKER_LEADER_LEASE_SECONDS", 0.0)
+        worker = _CoalescingWorker()
+
+        def _consume_then_stop() -> None:
+            self._send(worker, key="a", n=1)
+            worker._stop_event.set()
+
+        monkeypatch.setattr(worker, "_consume", _consume_then_stop)
+        worker._run_loop()
+
+        assert worker.events == [("test.chan", {"key": "a", "n": 1})]
+        assert worker._loop is None
+
+
 class TestStartStop:
     def test_start_noop_when_events_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setattr(base.settings, "EVENTS_ENABLED", False)
@@ -172,3 +292,60 @@ class TestConsume:
         fake_pubsub.psubscribe.assert_called_once_with("test.*")
         fake_pubsub.close.assert_called_once()
         assert worker.events == [("test.chan", {"n": 1})]
+
+    def test_consume_runs_periodic_job_once_interval_elapses(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class _PeriodicWorker(_RecordingWorker):
+            interval_seconds = 5.0
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.runs = 0
+
+            async def on_interval(self) -> None:
+                self.runs += 1
+
+        worker = _PeriodicWorker()
+        monkeypatch.setattr(worker, "_beat", lambda: None)
+        clock = iter([100.0, 101.0, 106.0])
+        monkeypatch.setattr(base.time, "monotonic", lambda: next(clock, 107.0))
+        polls = [None, None]
+
+        fake_pubsub = MagicMock()
+        fake_pubsub.get_message.side_effect = lambda timeout=1.0: (  # noqa: ARG005
+            polls.pop(0) if polls else worker._stop_event.set()
+        )
+        fake_client = MagicMock()
+        fake_client.pubsub.return_value = fake_pubsub
+        monkeypatch.setattr(base, "get_redis_client", lambda: fake_client)
+
+        worker._consume()
+
+        # Not due 1 s after subscribing, due after 6 s, then rescheduled.
+        assert worker.runs == 1
+
+    def test_consume_reads_the_event_stream_in_streams_mode(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        fake = fakeredis.FakeRedis(decode_responses=True)
+        monkeypatch.setattr(base, "get_redis_client", lambda: fake)
+        monkeypatch.setattr(base.settings, "EVENTS_TRANSPORT", "streams")
+
+        class _OnceWorker(_RecordingWorker):
+            patterns = ["test.*"]
+
+            async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
+                await super().handle_event(channel, data)
+                self._stop_event.set()
+
+        worker = _OnceWorker()
+        StreamConsumer(fake, group=worker.name).ensure_group()
+        for channel, n in [("test.chan", 1), ("other.chan", 2)]:
+            fake.xadd(Channels.EVENT_STREAM, {"channel": channel, "data": json.dumps({"n": n})})
+
+        worker._consume()
+
+        assert worker.events == [("test.chan", {"n": 1})]
+        # Handled and unsubscribed entries alike are acknowledged.
+        assert fake.xpending(Channels.EVENT_STREAM, worker.name)["pending"] == 0
@@ -0,0 +1,132 @@
+"""Unit tests for worker leader election and the standalone worker process."""
+
+import signal
+from typing import Any
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from app.workers import __main__ as worker_process
+from app.workers import base
+from app.workers.base import BaseWorker
+from app.workers.leader import LeaderLease
+
+
+class _Worker(BaseWorker):
+    channels = ["test.chan"]
+
+    async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
+        """Events are irrelevant here."""
+
+
+@pytest.fixture
+def fake(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeRedis:
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(base, "get_redis_client", lambda: client)
+    monkeypatch.setattr(base.settings, "WORKER_LEADER_LEASE_SECONDS", 15.0)
+    monkeypatch.setattr(base.settings, "EVENTS_TRANSPORT", "pubsub")
+    return client
+
+
+def _lease(client: fakeredis.FakeRedis, node: str, name: str = "Worker") -> LeaderLease:
+    lease = LeaderLease(client, name, ttl_seconds=15)
+    lease.node = node
+    return lease
+
+
+def test_lease_is_held_by_one_node_until_released(fake: fakeredis.FakeRedis) -> None:
+    first, second = _lease(fake, "api-1"), _lease(fake, "api-2")
+
+    assert first.acquire() is True
+    assert second.acquire() is False
+    assert second.holder == "api-1"
+    assert first.acquire() is True  # renewal
+
+    second.release()  # not the holder: no effect
+    assert fake.get(first.key) == "api-1"
+
+    first.release()
+    assert second.acquire() is True
+    assert second.holder == "api-2"
+
+
+def test_standby_worker_beats_and_reports_the_leader(
+    fake: fakeredis.FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    worker = _Worker()
+    assert _lease(fake, "api-2", name=worker.name).acquire() is True
+    # Stop instead of waiting out the retry interval.
+    monkeypatch.setattr(worker._stop_event, "wait", lambda **_: worker._stop_event.set())
+
+    assert worker._await_leadership() is False
+    assert worker.active is False
+    assert worker.leader == "api-2"
+    assert worker.is_alive is True
+
+
+def test_leader_that_loses_its_lease_stands_down(fake: fakeredis.FakeRedis) -> None:
+    worker = _Worker()
+    assert worker._await_leadership() is True
+    assert worker.active is True
+    assert worker.leader == worker._lease.node
+
+    fake.set(worker._lease.key, "api-2")  # lapsed and taken over
+    worker._next_renewal = 0.0
+    with pytest.raises(base._LeadershipLostError):
+        worker._keep_leadership()
+    assert worker.active is False
+
+
+def test_stopping_releases_the_lease(
+    fake: fakeredis.FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    worker = _Worker()
+    monkeypatch.setattr(worker, "_consume", worker._stop_event.set)
+
+    worker._run_loop()
+
+    assert fake.get(f"rally:leader:{worker.name}") is None
+    assert worker.active is False
+
+
+def test_stream_consumers_skip_the_election_unless_they_run_a_periodic_job(
+    fake: fakeredis.FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    worker = _Worker()
+    assert worker._elects_leader() is True
+
+    monkeypatch.setattr(base.settings, "EVENTS_TRANSPORT", "streams")
+    assert worker._elects_leader() is False
+    worker.interval_seconds = 60.0
+    assert worker._elects_leader() is True
+
+    monkeypatch.setattr(base.settings, "WORKER_LEADER_LEASE_SECONDS", 0.0)
+    assert worker._elects_leader() is False
+
+
+def test_worker_process_runs_workers_until_signalled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(worker_process.settings, "EVENTS_ENABLED", True)
+    for name in ("init_logging", "init_sentry", "close_pools", "stop_workers"):
+        monkeypatch.setattr(worker_process, name, MagicMock())
+    handlers: dict[int, Any] = {}
+    monkeypatch.setattr(worker_process.signal, "signal", handlers.__setitem__)
+    # The "workers" run until SIGTERM arrives.
+    monkeypatch.setattr(
+        worker_process, "start_workers", lambda: handlers[signal.SIGTERM](signal.SIGTERM, None)
+    )
+
+    assert worker_process.main() == 0
+    worker_process.stop_workers.assert_called_once()
+    worker_process.close_pools.assert_called_once()
+
+
+def test_worker_process_refuses_to_run_with_events_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(worker_process.settings, "EVENTS_ENABLED", False)
+    monkeypatch.setattr(worker_process, "init_logging", MagicMock())
+    monkeypatch.setattr(worker_process, "start_workers", MagicMock())
+
+    assert worker_process.main() == 1
+    worker_process.start_workers.assert_not_called()
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -16,11 +17,20 @@ async def _fake_session():
 
 
 class _FakeScoringService:
+    # team_id -> entry served by get_team_ranking_entry (None = team deleted).
+    entries: dict[int, dict[str, Any] | None] = {}
+    full_rebuilds = 0
+
     def __init__(self, _session: Any) -> None:
         """Session is unused; ranking is stubbed below."""
 
+    async def get_team_ranking_entry(self, team_id: int) -> dict[str, Any] | None:
+        await asyncio.sleep(0)
+        return self.entries.get(team_id)
+
     async def get_team_ranking(self) -> list[dict[str, Any]]:
         await asyncio.sleep(0)
+        type(self).full_rebuilds += 1
         return [
             {
                 "rank": 1,
@@ -36,7 +46,7 @@ async def test_rebuild_writes_cache_and_signals(monkeypatch: pytest.MonkeyPatch)
     fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
     monkeypatch.setattr("app.workers.worker_leaderboard.worker_session", _fake_session)
     monkeypatch.setattr("app.workers.worker_leaderboard.ScoringService", _FakeScoringService)
-    monkeypatch.setattr("app.workers.worker_leaderboard.get_async_redis_client", lambda: fake)
+    monkeypatch.setattr("app.workers.worker_leaderboard.worker_redis", lambda: fake)
 
     pubsub = fake.pubsub()
     await pubsub.subscribe(Channels.LEADERBOARD_REFRESHED)
@@ -51,11 +61,160 @@ async def test_rebuild_writes_cache_and_signals(monkeypatch: pytest.MonkeyPatch)
 
     signal = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
     assert signal is not None
-    assert signal["data"] == "1"
+    delta = json.loads(signal["data"])
+    assert delta["version"] == 1
+    assert [row["team_id"] for row in delta["changed"]] == [9]
+    assert delta["removed"] == []
+    assert await leaderboard_cache.read_deltas_since(fake, 0) == [signal["data"]]
     await pubsub.aclose()
 
 
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> fakeredis.aioredis.FakeRedis:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr("app.workers.worker_leaderboard.worker_session", _fake_session)
+    monkeypatch.setattr("app.workers.worker_leaderboard.ScoringService", _FakeScoringService)
+    monkeypatch.setattr("app.workers.worker_leaderboard.worker_redis", lambda: fake)
+    monkeypatch.setattr(_FakeScoringService, "entries", {})
+    monkeypatch.setattr(_FakeScoringService, "full_rebuilds", 0)
+    return fake
+
+
+async def test_team_event_on_cold_cache_seeds_full_ranking(
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    worker = LeaderboardWorker()
+    await worker.handle_event(
+        Channels.TEAM_SCORE_UPDATED, {"payload": {"team_id": 9, "total_score": 99.0}}
+    )
+    assert _FakeScoringService.full_rebuilds == 1
+    assert await leaderboard_cache.is_warm(fake_redis)
+
+
+async def test_team_event_on_warm_cache_updates_only_that_team(
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    await leaderboard_cache.write_global_leaderboard(
+        fake_redis,
+        [
+            {"team_id": 9, "team_name": "Z", "total_score": 99.0, "activities_completed": 5},
+            {"team_id": 4, "team_name": "D", "total_score": 50.0, "activities_completed": 2},
+        ],
+    )
+    _FakeScoringService.entries = {
+        4: {"team_id": 4, "team_name": "D", "total_score": 120.0, "activities_completed": 3}
+    }
+
+    worker = LeaderboardWorker()
+    await worker.handle_event(
+        Channels.TEAM_SCORE_UPDATED, {"payload": {"team_id": 4, "total_score": 120.0}}
+    )
+
+    assert _FakeScoringService.full_rebuilds == 0
+    cached = await leaderboard_cache.read_global_leaderboard(fake_redis)
+    assert [(row["team_id"], row["rank"]) for row in cached] == [(4, 1), (9, 2)]
+    # Team 9 only lost a place, but its row changed too.
+    (delta,) = await leaderboard_cache.read_deltas_since(fake_redis, 0)
+    assert json.loads(delta)["changed"] == cached
+
+
+async def test_event_that_changes_nothing_publishes_no_delta(
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    row = {"team_id": 4, "team_name": "D", "total_score": 50.0, "activities_completed": 2}
+    await leaderboard_cache.write_global_leaderboard(fake_redis, [row])
+    _FakeScoringService.entries = {4: row}
+
+    worker = LeaderboardWorker()
+    await worker.handle_event(Channels.TEAM_UPDATED, {"payload": {"team_id": 4}})
+
+    assert await leaderboard_cache.read_version(fake_redis) == 0
+    # Ranking ETags still move: an activity ranking can change on its own.
+    assert await leaderboard_cache.read_rankings_version(fake_redis) == 1
+
+
+async def test_deleted_team_is_removed_from_board(
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    await leaderboard_cache.write_global_leaderboard(
+        fake_redis,
+        [
+            {"team_id": 9, "team_name": "Z", "total_score": 99.0, "activities_completed": 5},
+            {"team_id": 4, "team_name": "D", "total_score": 50.0, "activities_completed": 2},
+        ],
+    )
+
+    worker = LeaderboardWorker()
+    await worker.handle_event(Channels.TEAM_DELETED, {"payload": {"team_id": 9}})
+
+    cached = await leaderboard_cache.read_global_leaderboard(fake_redis)
+    assert [row["team_id"] for row in cached] == [4]
+    (delta,) = await leaderboard_cache.read_deltas_since(fake_redis, 0)
+    assert json.loads(delta)["removed"] == [9]
+
+
+async def test_event_switch_on_warm_cache_replaces_the_board(
+    fake_redis: fakeredis.aioredis.FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The warm board still holds the previous event's teams.
+    await leaderboard_cache.write_global_leaderboard(
+        fake_redis,
+        [
+            {"team_id": 4, "team_name": "D", "total_score": 50.0, "activities_completed": 2},
+            {"team_id": 5, "team_name": "E", "total_score": 40.0, "activities_completed": 1},
+        ],
+    )
+    invalidated: list[bool] = []
+    monkeypatch.setattr(
+        "app.workers.worker_leaderboard.invalidate_current_event",
+        lambda: invalidated.append(True),
+    )
+
+    worker = LeaderboardWorker()
+    await worker.handle_event(Channels.EVENT_CURRENT_CHANGED, {"payload": {"event_id": 2}})
+
+    assert invalidated == [True]
+    assert _FakeScoringService.full_rebuilds == 1
+    cached = await leaderboard_cache.read_global_leaderboard(fake_redis)
+    assert [row["team_id"] for row in cached] == [9]
+    (delta,) = await leaderboard_cache.read_deltas_since(fake_redis, 0)
+    assert [row["team_id"] for row in json.loads(delta)["changed"]] == [9]
+    assert sorted(json.loads(delta)["removed"]) == [4, 5]
+
+
+async def test_route_edit_rebuilds_and_bumps_the_rankings_version(
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    worker = LeaderboardWorker()
+    await worker.handle_event(Channels.ROUTE_CHANGED, {"payload": {"event_id": 2}})
+    await worker.handle_event(Channels.ROUTE_CHANGED, {"payload": {"event_id": 2}})
+
+    assert _FakeScoringService.full_rebuilds == 2
+    assert await leaderboard_cache.read_rankings_version(fake_redis) == 2
+    # The second rebuild changed nothing, so only the first recorded a delta.
+    assert await leaderboard_cache.read_version(fake_redis) == 1
+
+
 def test_worker_subscribes_to_relevant_patterns() -> None:
     worker = LeaderboardWorker()
     assert Channels.ALL_ACTIVITY_RESULT_EVENTS in worker.patterns
     assert Channels.ALL_TEAM_EVENTS in worker.patterns
+    assert Channels.EVENT_CURRENT_CHANGED in worker.channels
+    assert Channels.ROUTE_CHANGED in worker.channels
+
+
+def test_events_coalesce_per_team_and_rebuilds_together() -> None:
+    worker = LeaderboardWorker()
+    team_event = {"payload": {"team_id": 3}}
+    assert worker.coalesce_key(Channels.TEAM_SCORE_UPDATED, team_event) == worker.coalesce_key(
+        Channels.ACTIVITY_RESULT_UPDATED, team_event
+    )
+    assert worker.coalesce_key(Channels.TEAM_SCORE_UPDATED, {"payload": {"team_id": 4}}) != (
+        worker.coalesce_key(Channels.TEAM_SCORE_UPDATED, team_event)
+    )
+    assert worker.coalesce_key(Channels.TEAM_SCORES_UPDATED, {"payload": {}}) == (
+        worker.coalesce_key(Channels.TEAM_SCORES_UPDATED, {"payload": {"team_ids": [1, 2]}})
+    )
+    assert worker.coalesce_key(Channels.EVENT_CURRENT_CHANGED, {"payload": {"event_id": 2}}) == (
+        worker.coalesce_key(Channels.TEAM_SCORES_UPDATED, {"payload": {}})
+    )
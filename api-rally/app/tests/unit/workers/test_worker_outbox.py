@@ -0,0 +1,59 @@
+"""Unit tests for the outbox relay worker."""
+
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from app.workers.worker_outbox import OutboxRelayWorker
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield object()  # relay_outbox is stubbed, so the session is never used
+
+
+async def test_drains_full_batches_until_a_short_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    counts = [3, 3, 1]
+    calls: list[int] = []
+
+    async def _relay(_session: Any, _client: Any, *, limit: int) -> int:
+        calls.append(limit)
+        return counts.pop(0)
+
+    monkeypatch.setattr("app.workers.worker_outbox.worker_session", _fake_session)
+    monkeypatch.setattr("app.workers.worker_outbox.worker_redis", lambda: object())
+    monkeypatch.setattr("app.workers.worker_outbox.relay_outbox", _relay)
+
+    worker = OutboxRelayWorker()
+    worker.batch_size = 3
+    await worker.on_interval()
+
+    assert calls == [3, 3, 3]
+    assert counts == []
+
+
+async def test_empty_outbox_is_one_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    async def _relay(_session: Any, _client: Any, *, limit: int) -> int:
+        calls.append(limit)
+        return 0
+
+    monkeypatch.setattr("app.workers.worker_outbox.worker_session", _fake_session)
+    monkeypatch.setattr("app.workers.worker_outbox.worker_redis", lambda: object())
+    monkeypatch.setattr("app.workers.worker_outbox.relay_outbox", _relay)
+
+    await OutboxRelayWorker().on_interval()
+
+    assert len(calls) == 1
+
+
+def test_relay_runs_only_with_the_outbox_on(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.core.config import settings
+    from app.workers.runner import enabled_worker_classes
+
+    monkeypatch.setattr(settings, "EVENTS_OUTBOX", False)
+    assert OutboxRelayWorker not in enabled_worker_classes()
+    monkeypatch.setattr(settings, "EVENTS_OUTBOX", True)
+    assert OutboxRelayWorker in enabled_worker_classes()
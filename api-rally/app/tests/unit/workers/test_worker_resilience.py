@@ -57,6 +57,14 @@ def _install_fake_client(monkeypatch: pytest.MonkeyPatch, pubsub: _FlakyPubSub)
         def pubsub(self) -> _FlakyPubSub:
             return pubsub
 
+        # Leader lease: the only node, so SET NX always wins; releasing
+        # finds nothing to delete.
+        def set(self, *_args: Any, **_kwargs: Any) -> bool:
+            return True
+
+        def transaction(self, *_args: Any, **_kwargs: Any) -> list[Any]:
+            return []
+
     monkeypatch.setattr(base, "get_redis_client", lambda: _FakeClient())
 
 
@@ -0,0 +1,69 @@
+"""Unit tests for the periodic score ledger reconciliation worker."""
+
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.config import settings
+from app.services.score_ledger_service import ReconcileReport
+from app.workers.worker_score_ledger import ScoreLedgerWorker
+
+
+class _SpyScoringService:
+    report = ReconcileReport(totals={}, drifted=[], corrections=0)
+    published: list[dict[int, float]] = []
+
+    def __init__(self, _session: Any) -> None:
+        """Session is unused; the reconcile outcome is set on the class."""
+
+    async def reconcile_score_ledger(self) -> ReconcileReport:
+        return _SpyScoringService.report
+
+    async def _commit_and_publish_team_scores(self, totals: dict[int, float]) -> None:
+        _SpyScoringService.published.append(totals)
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    fake = AsyncMock()
+
+    @asynccontextmanager
+    async def _fake_session():
+        yield fake
+
+    _SpyScoringService.published = []
+    monkeypatch.setattr("app.workers.worker_score_ledger.worker_session", _fake_session)
+    monkeypatch.setattr("app.workers.worker_score_ledger.ScoringService", _SpyScoringService)
+    return fake
+
+
+async def test_drift_is_committed_and_published_for_drifted_teams_only(
+    session: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        _SpyScoringService,
+        "report",
+        ReconcileReport(totals={1: 10.0, 2: 42.0}, drifted=[2], corrections=3),
+    )
+
+    await ScoreLedgerWorker().on_interval()
+
+    assert _SpyScoringService.published == [{2: 42.0}]
+    session.rollback.assert_not_awaited()
+
+
+async def test_clean_ledger_writes_nothing(session: AsyncMock) -> None:
+    await ScoreLedgerWorker().on_interval()
+
+    assert _SpyScoringService.published == []
+    session.rollback.assert_awaited_once()
+
+
+def test_interval_comes_from_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "SCORE_RECONCILE_INTERVAL_SECONDS", 12.0)
+    worker = ScoreLedgerWorker()
+    assert worker.interval_seconds == 12.0
+    assert worker.channels == []
+    assert worker.patterns == []
@@ -2,6 +2,7 @@
 
 import asyncio
 from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -12,9 +13,19 @@ from app.services.scoring_service import ScoringService
 from app.workers.worker_scoring import ScoringWorker
 
 
+class _FakeSession:
+    """Serves the team lookup; ScoringService is stubbed for everything else."""
+
+    teams = [SimpleNamespace(id=3), SimpleNamespace(id=4)]
+
+    async def scalars(self, _stmt: Any) -> Any:
+        await asyncio.sleep(0)
+        return SimpleNamespace(all=lambda: list(self.teams))
+
+
 @asynccontextmanager
 async def _fake_session():
-    yield object()  # ScoringService is stubbed, so the session is never used
+    yield _FakeSession()
 
 
 class _SpyScoringService:
@@ -25,13 +36,21 @@ class _SpyScoringService:
     def __init__(self, _session: Any) -> None:
         """Session is unused; recompute calls are recorded on the class."""
 
-    async def _recalculate_all_results_for_activity(self, activity_id: int) -> None:
+    async def _recalculate_all_results_for_activity(
+        self, activity_id: int, *, commit: bool = True
+    ) -> dict[int, float]:
         await asyncio.sleep(0)
         _SpyScoringService.calls.append(("recalc", activity_id))
+        return {}
+
+    async def update_all_team_scores(self, teams: list[Any]) -> dict[int, float]:
+        await asyncio.sleep(0)
+        _SpyScoringService.calls.append(("teams", [team.id for team in teams]))
+        return {team.id: 1.0 for team in teams}
 
-    async def update_team_scores(self, team_id: int) -> None:
+    async def _commit_and_publish_team_scores(self, totals: dict[int, float]) -> None:
         await asyncio.sleep(0)
-        _SpyScoringService.calls.append(("team", team_id))
+        _SpyScoringService.calls.append(("publish", sorted(totals)))
 
 
 @pytest.fixture(autouse=True)
@@ -54,8 +73,8 @@ async def test_handle_event_recomputes_activity_and_team(
         },
     )
 
-    assert ("recalc", 7) in _SpyScoringService.calls
-    assert ("team", 3) in _SpyScoringService.calls
+    assert _SpyScoringService.calls[0] == ("recalc", 7)
+    assert [name for name, _ in _SpyScoringService.calls[1:]] == ["teams", "publish"]
 
 
 async def test_handle_event_ignores_payload_without_ids(
@@ -73,6 +92,28 @@ async def test_handle_event_ignores_payload_without_ids(
     assert _SpyScoringService.calls == []
 
 
+async def test_coalesced_burst_rescores_once_and_refreshes_every_team(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("app.workers.worker_scoring.worker_session", _fake_session)
+    monkeypatch.setattr("app.workers.worker_scoring.ScoringService", _SpyScoringService)
+
+    worker = ScoringWorker()
+    events = [
+        {"payload": {"result_id": n, "team_id": team_id, "activity_id": 7}}
+        for n, team_id in enumerate([3, 4, 3])
+    ]
+    assert {worker.coalesce_key(Channels.ACTIVITY_RESULT_UPDATED, e) for e in events} == {7}
+    merged = events[0]
+    for event in events[1:]:
+        merged = worker.merge_events(merged, event)
+
+    await worker.handle_event(Channels.ACTIVITY_RESULT_UPDATED, merged)
+
+    # One batched refresh and one commit/event for the whole burst, not one per team.
+    assert _SpyScoringService.calls == [("recalc", 7), ("teams", [3, 4]), ("publish", [3, 4])]
+
+
 def test_worker_subscribes_to_activity_result_pattern() -> None:
     assert Channels.ALL_ACTIVITY_RESULT_EVENTS in ScoringWorker().patterns
 
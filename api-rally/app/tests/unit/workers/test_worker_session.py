@@ -1,36 +1,67 @@
 """Integration test for app.workers.session (real Postgres via test env)."""
 
+import asyncio
+
 import pytest
 from sqlalchemy import text
 
 from app.core.config import settings
-from app.workers.session import worker_session
+from app.workers import session as session_mod
+from app.workers.session import close_worker_resources, worker_redis, worker_session
 
 
 @pytest.fixture(autouse=True)
-def _use_test_postgres_uri(monkeypatch):
+async def _use_test_postgres_uri(monkeypatch):
     """Point worker_session at the test database, not the app's real one.
 
-    worker_session() builds its own engine straight from settings.POSTGRES_URI
-    (by design — see its docstring), so it doesn't pick up the sqlite/test-pg
+    worker_session() builds its engine straight from settings.POSTGRES_URI (by
+    design — see the module docstring), so it doesn't pick up the sqlite/test-pg
     overrides the rest of the suite uses. Redirect it to TEST_POSTGRES_URI for
-    the duration of these tests.
+    the duration of these tests, and dispose the loop's pools afterwards.
     """
     monkeypatch.setattr(settings, "POSTGRES_URI", settings.TEST_POSTGRES_URI)
+    yield
+    await close_worker_resources()
 
 
-async def test_worker_session_yields_working_session_and_disposes():
+async def test_worker_session_yields_working_session():
     async with worker_session() as session:
         result = await session.execute(text("SELECT 1"))
         assert result.scalar() == 1
 
 
+async def test_sessions_on_one_loop_share_a_pooled_engine():
+    async with worker_session() as first:
+        await first.execute(text("SELECT 1"))
+    async with worker_session() as second:
+        await second.execute(text("SELECT 1"))
+
+    assert first.bind is second.bind
+    assert worker_redis() is worker_redis()
+
+
+async def test_close_worker_resources_disposes_the_loop_entry():
+    async with worker_session() as session:
+        await session.execute(text("SELECT 1"))
+    assert asyncio.get_running_loop() in session_mod._resources
+
+    await close_worker_resources()
+
+    assert asyncio.get_running_loop() not in session_mod._resources
+    # Closing twice (or on a loop that never used a session) is a no-op.
+    await close_worker_resources()
+
+
 async def _raise_inside_worker_session() -> None:
     async with worker_session() as session:
         await session.execute(text("SELECT 1"))
         raise RuntimeError("boom")
 
 
-async def test_worker_session_disposes_engine_on_exception():
+async def test_worker_session_survives_a_failed_handler():
     with pytest.raises(RuntimeError):
         await _raise_inside_worker_session()
+
+    # The pooled engine stays usable for the next event.
+    async with worker_session() as session:
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
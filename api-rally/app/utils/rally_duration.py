@@ -3,18 +3,17 @@ from typing import Any, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.crud_rally_settings import rally_settings
-from app.models.rally_settings import RallySettings
-
 
 class RallyDurationCalculator:
     """Utility class for calculating rally duration and timing information.
 
     Settings are fetched asynchronously by the caller and injected, so the
-    pure timing computations below stay synchronous.
+    pure timing computations below stay synchronous. Anything with
+    ``rally_start_time``/``rally_end_time`` will do; callers pass the current
+    event's settings snapshot.
     """
 
-    def __init__(self, db: AsyncSession, settings: RallySettings):
+    def __init__(self, db: AsyncSession | None, settings: Any):
         self.db = db
         self.settings = settings
 
@@ -143,8 +142,8 @@ class RallyDurationCalculator:
 
         # Calculate total rally duration if end time is set
         total_rally_duration: timedelta | None = None
-        end_time: datetime | None = self.settings.rally_end_time  # type: ignore[assignment]
-        start_time: datetime | None = self.settings.rally_start_time  # type: ignore[assignment]
+        end_time: datetime | None = self.settings.rally_end_time
+        start_time: datetime | None = self.settings.rally_start_time
         if end_time and start_time:
             total_rally_duration = end_time - start_time
 
@@ -202,15 +201,13 @@ class RallyDurationCalculator:
         return not (self.settings.rally_end_time and team_start_time > self.settings.rally_end_time)
 
 
-async def get_rally_duration_info(db: AsyncSession) -> dict[str, Any]:
+def get_rally_duration_info(settings: Any) -> dict[str, Any]:
     """Convenience function to get rally duration information."""
-    settings = await rally_settings.get_or_create(db)
-    calculator = RallyDurationCalculator(db, settings)
+    calculator = RallyDurationCalculator(None, settings)
     return calculator.get_rally_status()
 
 
-async def get_team_duration_info(db: AsyncSession, team_start_time: datetime) -> dict[str, Any]:
+def get_team_duration_info(settings: Any, team_start_time: datetime) -> dict[str, Any]:
     """Convenience function to get team duration information."""
-    settings = await rally_settings.get_or_create(db)
-    calculator = RallyDurationCalculator(db, settings)
+    calculator = RallyDurationCalculator(None, settings)
     return calculator.get_team_rally_duration(team_start_time)
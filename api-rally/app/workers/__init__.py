@@ -2,16 +2,24 @@
 
 from app.workers.base import BaseWorker
 from app.workers.registry import clear_workers, get_workers, register_worker
+from app.workers.runner import enabled_worker_classes, start_workers, stop_workers
 from app.workers.worker_badges import BadgesWorker
 from app.workers.worker_leaderboard import LeaderboardWorker
+from app.workers.worker_outbox import OutboxRelayWorker
+from app.workers.worker_score_ledger import ScoreLedgerWorker
 from app.workers.worker_scoring import ScoringWorker
 
 __all__ = [
     "BadgesWorker",
     "BaseWorker",
     "LeaderboardWorker",
+    "OutboxRelayWorker",
+    "ScoreLedgerWorker",
     "ScoringWorker",
     "clear_workers",
+    "enabled_worker_classes",
     "get_workers",
     "register_worker",
+    "start_workers",
+    "stop_workers",
 ]
@@ -0,0 +1,52 @@
+"""Run the background workers in a dedicated process: ``python -m app.workers``.
+
+Pair it with ``WORKERS_EMBEDDED=false`` on the API so the workers run here
+instead of in every API process. Several of these processes can run side by
+side: leader election (or, with ``EVENTS_TRANSPORT=streams``, the consumer
+groups) keeps them from repeating each other's work.
+"""
+
+import logging
+import signal
+import sys
+import threading
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import init_logging
+from app.core.observability import init_sentry
+from app.core.redis import close_pools
+from app.workers.registry import get_workers
+from app.workers.runner import start_workers, stop_workers
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    init_logging()
+    init_sentry()  # no-op unless SENTRY_DSN is configured
+    if not settings.EVENTS_ENABLED:
+        logger.error("EVENTS_ENABLED is off: there are no workers to run")
+        return 1
+
+    stopping = threading.Event()
+
+    def _stop(signum: int, _frame: Any) -> None:
+        logger.info("Signal %s, stopping workers", signum)
+        stopping.set()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    start_workers()
+    logger.info("Started %d worker(s)", len(get_workers()))
+    try:
+        stopping.wait()
+    finally:
+        stop_workers()
+        close_pools()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
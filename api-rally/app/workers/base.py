@@ -1,14 +1,38 @@
 """Abstract base for Redis Pub/Sub worker threads.
 
 A worker subscribes to channels/patterns on a daemon thread and dispatches each
-message to an async ``handle_event``. Because the rally data layer is async but
-the pub/sub loop is a blocking sync call, each message is handled in its own
-short-lived event loop via ``asyncio.run``. Handlers open their own database
-session (see ``app.workers.session``) so they never share an engine across
-event loops.
+message to an async ``handle_event``; a worker with ``interval_seconds`` set
+also gets ``on_interval`` called periodically from the same loop. Because the
+rally data layer is async but the pub/sub loop is a blocking sync call, the
+thread owns one long-lived asyncio event loop and runs each message (and each
+periodic run) to completion on it. Handlers take their database sessions and
+Redis client from ``app.workers.session``, which pools them per loop, so a
+burst of events reuses warm connections instead of opening new ones; they are
+disposed together with the loop when the thread exits.
+
+A worker can also opt into coalescing by returning a key from
+``coalesce_key``: events sharing a key are held until the key has been quiet
+for ``WORKER_COALESCE_WINDOW_SECONDS`` (or has waited
+``WORKER_COALESCE_MAX_LATENCY_SECONDS`` in total), and only the latest one —
+or whatever ``merge_events`` folds them into — is handled. A burst of
+evaluations then costs one recompute instead of one per event.
+
+With ``EVENTS_TRANSPORT=streams`` a worker reads the event stream through a
+consumer group named after its class instead of subscribing (see
+``app.events.streams``): entries are filtered by the same channels/patterns and
+acknowledged once handled, or once the coalesced event they were folded into
+is.
+
+When every API process embeds the workers, the instances of each worker elect
+a leader through a Redis lease (``app.workers.leader``): only the holder
+subscribes and runs, the others stand by — still beating, so they read as
+alive — until the lease lapses. A worker reading the stream through a consumer
+group needs no election unless it also runs a periodic job: the group already
+hands each entry to a single instance.
 """
 
 import asyncio
+import fnmatch
 import json
 import logging
 import random
@@ -16,13 +40,22 @@ import signal
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass, field
 from typing import Any
 
 import redis
 
 from app.core.config import settings
-from app.core.metrics import set_worker_last_beat_age
+from app.core.metrics import (
+    record_worker_event_coalesced,
+    record_worker_stream_reclaimed,
+    set_worker_last_beat_age,
+)
 from app.core.redis import get_redis_client
+from app.events.streams import StreamConsumer, StreamEntry, streams_enabled
+from app.workers.leader import LeaderLease
+from app.workers.session import close_worker_resources
 
 logger = logging.getLogger(__name__)
 
@@ -36,26 +69,77 @@ RETRY_BACKOFF_MAX_SECONDS = 30.0
 # this leaves generous slack before a healthy worker looks stale.
 LIVENESS_WINDOW_SECONDS = 30.0
 
+# Longest the pub/sub poll blocks; also the heartbeat period.
+POLL_TIMEOUT_SECONDS = 1.0
+
+
+@dataclass
+class _PendingEvent:
+    """The coalesced work waiting under one key."""
+
+    channel: str
+    data: dict[str, Any]
+    first_seen: float
+    last_seen: float
+    # Stream entries folded into this event, acknowledged once it is handled.
+    entry_ids: list[str] = field(default_factory=list)
+
+
+class _LeadershipLostError(Exception):
+    """Raised from the consume loop when another node took the lease."""
+
+
+# One poll of the event source: (message, stream entry id or None) pairs.
+_Poll = Callable[[float], list[tuple[dict[str, Any], str | None]]]
+
 
 class BaseWorker(ABC):
     """Base class for Redis Pub/Sub workers."""
 
     channels: list[str] = []
     patterns: list[str] = []
+    # > 0 runs ``on_interval`` that often (checked once per loop iteration, so
+    # with ~1 s granularity). The first run is one interval after subscribing.
+    interval_seconds: float = 0.0
 
     def __init__(self) -> None:
         self._running = False
         self._thread: threading.Thread | None = None
         self._pubsub: redis.client.PubSub | None = None
+        self._stream: StreamConsumer | None = None
         self._stop_event = threading.Event()
         # monotonic timestamp of the last successful pub/sub heartbeat; 0.0
         # means "never beaten". Read by `is_alive` for the readiness probe.
         self._last_beat: float = 0.0
+        # The worker thread's event loop, created on first use and closed when
+        # the thread's run loop exits. Only ever touched from that thread.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Coalesced events by key, flushed from the pub/sub loop. A window of
+        # 0 handles every event as it arrives.
+        self.coalesce_window_seconds = settings.WORKER_COALESCE_WINDOW_SECONDS
+        self.coalesce_max_latency_seconds = settings.WORKER_COALESCE_MAX_LATENCY_SECONDS
+        self._pending: dict[Hashable, _PendingEvent] = {}
+        # Leader election: the lease (created on first use when the election
+        # applies), whether this instance is the one doing the work, and when
+        # the lease is next renewed.
+        self._lease: LeaderLease | None = None
+        self._active = False
+        self._next_renewal = 0.0
 
     @property
     def name(self) -> str:
         return self.__class__.__name__
 
+    @property
+    def active(self) -> bool:
+        """True while this instance does the work (leads, or needs no election)."""
+        return self._active
+
+    @property
+    def leader(self) -> str | None:
+        """Node last seen holding this worker's lease (None without an election)."""
+        return self._lease.holder if self._lease is not None else None
+
     @property
     def last_beat(self) -> float:
         """Monotonic timestamp of the last heartbeat (0.0 if never)."""
@@ -82,21 +166,193 @@ class BaseWorker(ABC):
     async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
         """Process a single received event."""
 
-    def _dispatch(self, message: dict[str, Any]) -> None:
+    async def on_interval(self) -> None:  # noqa: B027 — optional hook, not abstract
+        """Periodic job, run every ``interval_seconds`` when that is set."""
+
+    def coalesce_key(self, channel: str, data: dict[str, Any]) -> Hashable | None:
+        """Key under which this event may be coalesced with others.
+
+        Events with equal keys must be redundant up to ``merge_events``: only
+        the merged result is handled. None (the default) handles the event
+        immediately.
+        """
+        return None
+
+    def merge_events(self, pending: dict[str, Any], incoming: dict[str, Any]) -> dict[str, Any]:
+        """Fold a newer event into the one pending under the same key.
+
+        Latest wins by default; override when the older events carry something
+        the newest one does not (e.g. other teams to refresh).
+        """
+        return incoming
+
+    def _run(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run ``coro`` to completion on this worker's event loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(coro)
+
+    def _close_loop(self) -> None:
+        """Dispose the loop's pooled resources, then close the loop."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.run_until_complete(close_worker_resources())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        except Exception:  # noqa: BLE001 — shutdown must still close the loop
+            logger.exception("[%s] Error releasing worker resources", self.name)
+        finally:
+            loop.close()
+            self._loop = None
+
+    def _run_interval(self) -> None:
+        try:
+            self._run(self.on_interval())
+        except Exception:  # noqa: BLE001 — a failed run must not kill the worker
+            logger.exception("[%s] Error in periodic job", self.name)
+
+    def _dispatch(self, message: dict[str, Any], entry_id: str | None = None) -> None:
+        entry_ids = [] if entry_id is None else [entry_id]
         if message["type"] not in ("message", "pmessage"):
             return
         channel = message.get("channel", message.get("pattern", "unknown"))
         raw = message.get("data")
         try:
             data = json.loads(raw) if isinstance(raw, str) else raw
-            if not isinstance(data, dict):
-                logger.warning("[%s] Non-dict payload on %s, skipping", self.name, channel)
-                return
-            asyncio.run(self.handle_event(channel, data))
         except json.JSONDecodeError:
             logger.exception("[%s] Bad JSON on %s", self.name, channel)
+            self._ack(entry_ids)
+            return
+        if not isinstance(data, dict):
+            logger.warning("[%s] Non-dict payload on %s, skipping", self.name, channel)
+            self._ack(entry_ids)
+            return
+        key = self.coalesce_key(channel, data) if self.coalesce_window_seconds > 0 else None
+        if key is None:
+            self._handle(channel, data, entry_ids)
+        else:
+            self._defer(key, channel, data, entry_ids)
+
+    def _handle(self, channel: str, data: dict[str, Any], entry_ids: list[str]) -> None:
+        try:
+            self._run(self.handle_event(channel, data))
         except Exception:  # noqa: BLE001 — one bad event must not kill the worker
             logger.exception("[%s] Error handling %s", self.name, channel)
+        # Acknowledged even when the handler failed: a redelivered poison
+        # event would fail forever, and Pub/Sub drops it the same way.
+        self._ack(entry_ids)
+
+    def _ack(self, entry_ids: list[str]) -> None:
+        if entry_ids and self._stream is not None:
+            self._stream.ack(entry_ids)
+
+    def _defer(
+        self, key: Hashable, channel: str, data: dict[str, Any], entry_ids: list[str]
+    ) -> None:
+        now = time.monotonic()
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = _PendingEvent(
+                channel, data, first_seen=now, last_seen=now, entry_ids=entry_ids
+            )
+            return
+        pending.channel = channel
+        pending.data = self.merge_events(pending.data, data)
+        pending.last_seen = now
+        pending.entry_ids.extend(entry_ids)
+        record_worker_event_coalesced(worker=self.name)
+
+    def _due_at(self, pending: _PendingEvent) -> float:
+        return min(
+            pending.last_seen + self.coalesce_window_seconds,
+            pending.first_seen + self.coalesce_max_latency_seconds,
+        )
+
+    def _poll_timeout(self) -> float:
+        """How long the next poll may block without delaying a due flush."""
+        if not self._pending:
+            return POLL_TIMEOUT_SECONDS
+        next_due = min(self._due_at(pending) for pending in self._pending.values())
+        return max(0.0, min(POLL_TIMEOUT_SECONDS, next_due - time.monotonic()))
+
+    def _flush_pending(self, *, force: bool = False) -> None:
+        """Handle every coalesced event that is due (all of them if ``force``)."""
+        if not self._pending:
+            return
+        now = time.monotonic()
+        due = [key for key, p in self._pending.items() if force or self._due_at(p) <= now]
+        for key in due:
+            pending = self._pending.pop(key)
+            self._handle(pending.channel, pending.data, pending.entry_ids)
+
+    def _drain(self) -> None:
+        """Handle everything still coalescing, whatever its deadline."""
+        try:
+            self._flush_pending(force=True)
+        except redis.RedisError:
+            # Unacknowledged stream entries are reclaimed by the group.
+            logger.exception("[%s] Redis error flushing pending events", self.name)
+
+    def _elects_leader(self) -> bool:
+        if settings.WORKER_LEADER_LEASE_SECONDS <= 0:
+            return False
+        # Consumer groups already hand each stream entry to one instance; only
+        # a periodic job would still run on every node.
+        reads_stream = streams_enabled() and bool(self.channels or self.patterns)
+        return not reads_stream or self.interval_seconds > 0
+
+    def _renewal_interval(self) -> float:
+        return settings.WORKER_LEADER_LEASE_SECONDS / 3
+
+    def _await_leadership(self) -> bool:
+        """Block until this instance may run (True) or the worker stops (False)."""
+        if not self._elects_leader():
+            self._active = True
+            return True
+        if self._lease is None:
+            self._lease = LeaderLease(
+                get_redis_client(), self.name, settings.WORKER_LEADER_LEASE_SECONDS
+            )
+        standing_by = False
+        while not self._stop_event.is_set():
+            if self._lease.acquire():
+                logger.info("[%s] Leading as %s", self.name, self._lease.node)
+                self._active = True
+                self._next_renewal = time.monotonic() + self._renewal_interval()
+                return True
+            if not standing_by:
+                logger.info("[%s] Standing by, %s leads", self.name, self._lease.holder)
+                standing_by = True
+            self._beat()  # a standby instance is healthy, just idle
+            self._stop_event.wait(timeout=self._renewal_interval())
+        return False
+
+    def _keep_leadership(self) -> None:
+        """Renew the lease when due; raise ``_LeadershipLostError`` if it was taken."""
+        if self._lease is None or not self._active:
+            return
+        if time.monotonic() < self._next_renewal:
+            return
+        if not self._lease.acquire():
+            self._active = False
+            raise _LeadershipLostError
+        self._next_renewal = time.monotonic() + self._renewal_interval()
+
+    def _resign(self) -> None:
+        if self._lease is None or not self._active:
+            return
+        self._active = False
+        try:
+            self._lease.release()
+        except redis.RedisError:
+            # The lease lapses on its own; a standby just waits longer.
+            logger.exception("[%s] Redis error releasing leadership", self.name)
+
+    def _subscribed(self, channel: str) -> bool:
+        return channel in self.channels or any(
+            fnmatch.fnmatchcase(channel, pattern) for pattern in self.patterns
+        )
 
     def _run_loop(self) -> None:
         """Supervise the pub/sub session, reconnecting on Redis errors.
@@ -107,31 +363,51 @@ class BaseWorker(ABC):
         """
         logger.info("[%s] Worker loop starting", self.name)
         attempt = 0
-        while not self._stop_event.is_set():
-            try:
-                self._consume()
-                # Clean exit from _consume means the stop event was set.
-                break
-            except redis.RedisError:
-                attempt += 1
-                delay = min(
-                    RETRY_BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)),
-                    RETRY_BACKOFF_MAX_SECONDS,
-                )
-                delay += random.uniform(0, delay * 0.1)  # jitter
-                logger.exception(
-                    "[%s] Redis error (attempt %d), reconnecting in %.1fs",
-                    self.name,
-                    attempt,
-                    delay,
-                )
-                # Interruptible sleep: a stop during backoff exits immediately.
-                if self._stop_event.wait(timeout=delay):
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    if not self._await_leadership():
+                        break
+                    self._consume()
+                    # Clean exit from _consume means the stop event was set.
                     break
+                except _LeadershipLostError:
+                    logger.warning("[%s] Lost leadership to %s", self.name, self.leader)
+                    # Already received here, so nobody else will handle them.
+                    self._drain()
+                except redis.RedisError:
+                    attempt += 1
+                    delay = min(
+                        RETRY_BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)),
+                        RETRY_BACKOFF_MAX_SECONDS,
+                    )
+                    delay += random.uniform(0, delay * 0.1)  # jitter
+                    logger.exception(
+                        "[%s] Redis error (attempt %d), reconnecting in %.1fs",
+                        self.name,
+                        attempt,
+                        delay,
+                    )
+                    # Interruptible sleep: a stop during backoff exits immediately.
+                    if self._stop_event.wait(timeout=delay):
+                        break
+        finally:
+            # Coalesced work is not dropped on shutdown. The event loop (and
+            # the pools bound to it) outlive reconnects but not the thread.
+            self._drain()
+            self._resign()
+            self._close_loop()
         logger.info("[%s] Worker loop ended", self.name)
 
     def _consume(self) -> None:
         """Subscribe and consume until stopped. Raises RedisError on failure."""
+        # A worker with nothing to read (interval-only) keeps the plain loop.
+        if streams_enabled() and (self.channels or self.patterns):
+            self._consume_stream()
+        else:
+            self._consume_pubsub()
+
+    def _consume_pubsub(self) -> None:
         # redis does not type pubsub() under strict mypy.
         pubsub = get_redis_client().pubsub()  # type: ignore[no-untyped-call]
         self._pubsub = pubsub
@@ -146,15 +422,67 @@ class BaseWorker(ABC):
                 self.channels,
                 self.patterns,
             )
-            self._beat()  # subscribed successfully — mark alive
-            while not self._stop_event.is_set():
-                message = pubsub.get_message(timeout=1.0)
-                self._beat()
-                if message:
-                    self._dispatch(message)
+
+            def poll(timeout: float) -> list[tuple[dict[str, Any], str | None]]:
+                message = pubsub.get_message(timeout=timeout)
+                return [(message, None)] if message else []
+
+            self._serve(poll)
         finally:
             pubsub.close()
 
+    def _consume_stream(self) -> None:
+        consumer = StreamConsumer(get_redis_client(), group=self.name)
+        consumer.ensure_group()
+        self._stream = consumer
+        logger.info(
+            "[%s] Reading the event stream as %s (channels=%s patterns=%s)",
+            self.name,
+            consumer.consumer,
+            self.channels,
+            self.patterns,
+        )
+        # Reclaim straight away: a restarted worker picks up what its crashed
+        # predecessor left pending.
+        next_reclaim = time.monotonic()
+
+        def poll(timeout: float) -> list[tuple[dict[str, Any], str | None]]:
+            nonlocal next_reclaim
+            entries: list[StreamEntry] = []
+            if time.monotonic() >= next_reclaim:
+                idle = settings.EVENTS_STREAM_CLAIM_IDLE_SECONDS
+                entries = consumer.reclaim(idle)
+                record_worker_stream_reclaimed(worker=self.name, count=len(entries))
+                next_reclaim = time.monotonic() + idle
+            entries += consumer.read(0.0 if entries else timeout)
+            batch: list[tuple[dict[str, Any], str | None]] = []
+            for entry in entries:
+                if self._subscribed(entry.channel):
+                    message = {"type": "message", "channel": entry.channel, "data": entry.data}
+                    batch.append((message, entry.entry_id))
+                else:
+                    consumer.ack([entry.entry_id])
+            return batch
+
+        # ``_stream`` outlives this session: events still coalescing across a
+        # reconnect (or the final flush) are acknowledged through it.
+        self._serve(poll)
+
+    def _serve(self, poll: _Poll) -> None:
+        """Dispatch what ``poll`` returns and run the timers until stopped."""
+        self._beat()  # subscribed successfully — mark alive
+        next_interval = time.monotonic() + self.interval_seconds
+        while not self._stop_event.is_set():
+            self._keep_leadership()
+            batch = poll(self._poll_timeout())
+            self._beat()
+            for message, entry_id in batch:
+                self._dispatch(message, entry_id)
+            self._flush_pending()
+            if self.interval_seconds > 0 and time.monotonic() >= next_interval:
+                self._run_interval()
+                next_interval = time.monotonic() + self.interval_seconds
+
     def start(self, background: bool = True) -> None:
         if self._running:
             logger.warning("[%s] Already running", self.name)
@@ -0,0 +1,67 @@
+"""Redis lease used to elect one active instance of each worker.
+
+Every API process embeds the workers, so without coordination each process
+would rebuild the leaderboard and evaluate badges for every event. An instance
+runs only while it holds its worker's lease: a key set with ``NX`` and a TTL,
+renewed by the holder well before it expires. Any other instance stands by and
+retries; when the holder dies its lease lapses and the next instance to retry
+takes over.
+
+Renewal and release check the stored holder first, inside a ``WATCH``/``MULTI``
+transaction so the check and the write are atomic: a node whose lease already
+lapsed must never extend or delete its successor's.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import redis
+from redis.client import Pipeline
+
+from app.core.redis import node_id
+
+KEY_PREFIX = "rally:leader:"
+
+
+class LeaderLease:
+    """One node's claim on the leadership of one worker."""
+
+    def __init__(self, client: redis.Redis, name: str, ttl_seconds: float):
+        self._client = client
+        self.key = f"{KEY_PREFIX}{name}"
+        self.node = node_id()
+        self._ttl_ms = max(1, int(ttl_seconds * 1000))
+        # Node seen holding the lease at the last attempt (None: unknown/free).
+        self.holder: str | None = None
+
+    def acquire(self) -> bool:
+        """Take the lease if it is free, or renew it if this node holds it."""
+        if self._client.set(self.key, self.node, nx=True, px=self._ttl_ms):
+            self.holder = self.node
+            return True
+        if self._if_held(lambda pipe: pipe.pexpire(self.key, self._ttl_ms)):
+            self.holder = self.node
+            return True
+        holder = self._client.get(self.key)
+        self.holder = holder if isinstance(holder, str) else None
+        return False
+
+    def release(self) -> None:
+        """Give the lease up so a standby node takes over without waiting."""
+        self._if_held(lambda pipe: pipe.delete(self.key))
+        self.holder = None
+
+    def _if_held(self, write: Callable[[Pipeline], Any]) -> bool:
+        """Run ``write`` on a transaction only if this node holds the lease."""
+
+        held = False
+
+        def _transaction(pipe: Pipeline) -> None:
+            nonlocal held
+            held = pipe.get(self.key) == self.node
+            if held:
+                pipe.multi()
+                write(pipe)
+
+        self._client.transaction(_transaction, self.key)
+        return held
@@ -0,0 +1,44 @@
+"""Start and stop the background workers this deployment runs.
+
+Shared by the API lifespan (workers embedded in every API process) and by
+``python -m app.workers`` (a dedicated worker process), so both run the same
+set.
+"""
+
+from app.core.config import settings
+from app.workers.base import BaseWorker
+from app.workers.registry import clear_workers, get_workers, register_worker
+from app.workers.worker_badges import BadgesWorker
+from app.workers.worker_leaderboard import LeaderboardWorker
+from app.workers.worker_outbox import OutboxRelayWorker
+from app.workers.worker_score_ledger import ScoreLedgerWorker
+from app.workers.worker_scoring import ScoringWorker
+
+
+def enabled_worker_classes() -> list[type[BaseWorker]]:
+    worker_classes: list[type[BaseWorker]] = [LeaderboardWorker, BadgesWorker]
+    # The scoring worker only earns its keep when recompute is deferred off
+    # the request path; otherwise routes already recompute inline and it
+    # would just duplicate the work.
+    if settings.RECOMPUTE_OFF_PATH:
+        worker_classes.append(ScoringWorker)
+    if settings.SCORE_RECONCILE_INTERVAL_SECONDS > 0:
+        worker_classes.append(ScoreLedgerWorker)
+    if settings.EVENTS_OUTBOX:
+        worker_classes.append(OutboxRelayWorker)
+    return worker_classes
+
+
+def start_workers() -> None:
+    """Start every enabled worker on its background thread and register it."""
+    for worker_cls in enabled_worker_classes():
+        worker = worker_cls()
+        worker.start(background=True)
+        register_worker(worker)
+
+
+def stop_workers() -> None:
+    """Stop and unregister every running worker."""
+    for worker in get_workers():
+        worker.stop()
+    clear_workers()
@@ -1,28 +1,96 @@
-"""Database session factory for worker event handlers.
+"""Database and Redis resources for worker event handlers.
 
-Worker handlers run inside a fresh event loop per event (``asyncio.run``), so
-they cannot reuse the request-scoped engine, whose asyncpg pool is bound to the
-main loop. Each handler builds a short-lived engine, does its work and disposes
-it. Events are infrequent (one per scoring change), so the per-event cost is
-negligible and correctness beats pooling here.
+Each worker thread runs one long-lived event loop (see ``BaseWorker``) and
+handles every message on it. Resources bound to a loop — the asyncpg pool behind
+an engine, the loop's asyncio Redis pool — are created lazily the first time a
+handler needs them on that loop and reused for every later event, so an event
+costs a pool checkout instead of a fresh connection. They
+cannot be shared with the request-scoped engine, whose pool belongs to the main
+loop. ``close_worker_resources`` disposes them when the worker loop shuts down.
 """
 
+import asyncio
+import weakref
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import redis.asyncio as aredis
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import settings
-from app.db.session import _async_url
+from app.core.redis import close_async_pool, get_async_redis_client
+from app.db.session import _async_url, _engine_kwargs
+from app.events.publisher import close_publisher
+
+
+@dataclass
+class _LoopResources:
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[AsyncSession]
+    redis: aredis.Redis | None = None
+
+
+# Keyed weakly so a loop that is garbage-collected without a clean shutdown
+# does not pin its resources forever.
+_resources: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopResources]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _worker_engine_kwargs() -> dict[str, Any]:
+    """The app's pool settings, sized for one event at a time per worker."""
+    kwargs = _engine_kwargs()
+    if "pool_size" in kwargs:
+        kwargs["pool_size"] = settings.WORKER_DB_POOL_SIZE
+    return kwargs
+
+
+def _loop_resources() -> _LoopResources:
+    loop = asyncio.get_running_loop()
+    resources = _resources.get(loop)
+    if resources is None:
+        engine = create_async_engine(
+            _async_url(str(settings.POSTGRES_URI)), echo=False, **_worker_engine_kwargs()
+        )
+        resources = _LoopResources(
+            engine=engine,
+            session_maker=async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
+        )
+        _resources[loop] = resources
+    return resources
 
 
 @asynccontextmanager
 async def worker_session() -> AsyncIterator[AsyncSession]:
-    """Yield an AsyncSession backed by a fresh, disposed-after engine."""
-    engine = create_async_engine(_async_url(str(settings.POSTGRES_URI)), echo=False)
-    session_maker = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
-    try:
-        async with session_maker() as session:
-            yield session
-    finally:
-        await engine.dispose()
+    """Yield an AsyncSession from the current loop's pooled worker engine."""
+    async with _loop_resources().session_maker() as session:
+        yield session
+
+
+def worker_redis() -> aredis.Redis:
+    """Return the current loop's asyncio Redis client.
+
+    Shared by every handler on the loop: callers must not ``aclose()`` it.
+    """
+    resources = _loop_resources()
+    if resources.redis is None:
+        resources.redis = get_async_redis_client()
+    return resources.redis
+
+
+async def close_worker_resources() -> None:
+    """Dispose the current loop's engine, Redis clients and Redis pool."""
+    await close_publisher()
+    resources = _resources.pop(asyncio.get_running_loop(), None)
+    if resources is not None:
+        if resources.redis is not None:
+            await resources.redis.aclose()
+        await resources.engine.dispose()
+    await close_async_pool()
@@ -14,7 +14,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.badges import BadgeAward, evaluate_result
-from app.crud.crud_rally_settings import rally_settings
 from app.events import (
     BadgeAwardedEvent,
     BadgeAwardedPayload,
@@ -24,6 +23,7 @@ from app.events import (
 )
 from app.models.activity import ActivityResult
 from app.services import badge_service
+from app.services.settings_snapshot import current_settings
 from app.workers.base import BaseWorker
 from app.workers.session import worker_session
 
@@ -49,7 +49,7 @@ class BadgesWorker(BaseWorker):
             return
 
         async with worker_session() as session:
-            settings = await rally_settings.get_or_create(session)
+            settings = await current_settings(session)
             if not settings.badges_enabled:
                 # Feature switched off: stop auto-awarding entirely.
                 return
@@ -1,44 +1,109 @@
 """Leaderboard worker.
 
-Listens for any change that affects team standings, recomputes the global
-ranking from Postgres and caches the rendered result in Redis, then publishes a
-refresh signal so connected SSE clients can push the update.
+Listens for any change that affects team standings and keeps the cached
+leaderboard (a Redis sorted set, see ``app.services.leaderboard_cache``) in
+sync, then records what changed as a versioned delta (see
+``leaderboard_cache.record_delta``) and publishes it so the SSE stream pushes
+the changed rows to clients instead of having each one refetch the board. Every
+handled event also bumps the rankings version behind the ranking ETags
+(``app.api.conditional``).
+
+Events naming a team only refresh that team's standing (one small aggregate
+query plus a ``ZADD``). The full ranking is recomputed from Postgres just to
+seed a cold cache, or for an event that does not name a single team (such as
+the batched ``team.scores_updated`` after an activity-wide rescore, where one
+re-rank beats a query per team). Switching the current event also rebuilds it,
+so the previous event's teams leave the board instead of staying in the warm
+set, and so does a route edit; both bump the rankings version like any other
+handled event.
+
+Events are coalesced per team (and all team-less events under one key), so a
+burst of writes for the same team costs one refresh.
 """
 
 import logging
+from collections.abc import Hashable
 from typing import Any
 
+import redis.asyncio as aredis
+
+from app.core.config import settings
 from app.core.observability import traced
-from app.core.redis import get_async_redis_client
+from app.crud._event_scope import invalidate_current_event
 from app.events.channels import Channels
 from app.services import leaderboard_cache
 from app.services.scoring_service import ScoringService
 from app.workers.base import BaseWorker
-from app.workers.session import worker_session
+from app.workers.session import worker_redis, worker_session
 
 logger = logging.getLogger(__name__)
 
+# Coalescing key shared by every event that triggers a full rebuild.
+_REBUILD_KEY = "rebuild"
+
+# Events that change which teams or activities the board is built from.
+_BOARD_CHANNELS = (Channels.EVENT_CURRENT_CHANGED, Channels.ROUTE_CHANGED)
+
+
+def _team_id(channel: str, data: dict[str, Any]) -> Any:
+    """The single team an event is about, or None when it needs a full rebuild."""
+    if channel in _BOARD_CHANNELS:
+        return None
+    return (data.get("payload") or {}).get("team_id")
+
 
 class LeaderboardWorker(BaseWorker):
     """Keep the cached global leaderboard in sync with scoring changes."""
 
+    channels = list(_BOARD_CHANNELS)
     patterns = [
         Channels.ALL_ACTIVITY_RESULT_EVENTS,
         Channels.ALL_TEAM_EVENTS,
     ]
 
+    def coalesce_key(self, channel: str, data: dict[str, Any]) -> Hashable | None:
+        team_id = _team_id(channel, data)
+        return _REBUILD_KEY if team_id is None else ("team", team_id)
+
     async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
-        logger.info("[LeaderboardWorker] Rebuilding leaderboard after %s", channel)
-        await self._rebuild()
+        team_id = _team_id(channel, data)
+        client = worker_redis()
+        before = await leaderboard_cache.read_global_leaderboard(client) or []
+        if team_id is None or not await leaderboard_cache.is_warm(client):
+            logger.info("[LeaderboardWorker] Rebuilding leaderboard after %s", channel)
+            await self._rebuild(client)
+        else:
+            logger.info("[LeaderboardWorker] Updating team %s after %s", team_id, channel)
+            await self._update_team(client, int(team_id))
+        after = await leaderboard_cache.read_global_leaderboard(client) or []
+        # The write behind this event is committed and the board is current,
+        # so ranking reads tagged with the old version are now stale.
+        await leaderboard_cache.bump_rankings_version(client)
+        changed, removed = leaderboard_cache.diff_rankings(before, after)
+        if not changed and not removed:
+            return
+        delta = await leaderboard_cache.record_delta(
+            client, changed, removed, history=settings.LEADERBOARD_DELTA_HISTORY
+        )
+        await client.publish(Channels.LEADERBOARD_REFRESHED, delta)
 
-    async def _rebuild(self) -> None:
+    async def _rebuild(self, client: aredis.Redis) -> None:
+        # A standalone worker runs no invalidation watcher, and an event switch
+        # may be folded into a later rebuild, so every rebuild re-reads the
+        # current event rather than ranking a cached (possibly old) one.
+        invalidate_current_event()
         with traced("leaderboard.rebuild"):
             async with worker_session() as session:
                 ranking = await ScoringService(session).get_team_ranking()
+            await leaderboard_cache.write_global_leaderboard(client, ranking)
 
-            client = get_async_redis_client()
-            try:
-                await leaderboard_cache.write_global_leaderboard(client, ranking)
-                await client.publish(Channels.LEADERBOARD_REFRESHED, "1")
-            finally:
-                await client.aclose()
+    async def _update_team(self, client: aredis.Redis, team_id: int) -> None:
+        with traced("leaderboard.update_team"):
+            async with worker_session() as session:
+                entry = await ScoringService(session).get_team_ranking_entry(team_id)
+            if entry is None:
+                # Team deleted: it must drop off the board, not linger at its
+                # last known score.
+                await leaderboard_cache.remove_team(client, team_id)
+            else:
+                await leaderboard_cache.upsert_team(client, entry)
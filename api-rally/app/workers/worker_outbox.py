@@ -0,0 +1,44 @@
+"""Outbox relay worker.
+
+With ``EVENTS_OUTBOX`` on, scoring writes stage their events in the
+``event_outbox`` table inside their own transaction (``app.events.outbox``).
+This worker drains it: every ``EVENTS_OUTBOX_POLL_SECONDS`` it publishes the
+oldest pending events in pipelines of up to ``EVENTS_OUTBOX_BATCH_SIZE`` and
+deletes them, until the table is empty. It is leader-elected like every
+periodic worker, so one relay runs however many processes embed it and the id
+order of the rows is the order they are published in. It subscribes to
+nothing; ``on_interval`` does all the work.
+"""
+
+import logging
+from typing import Any
+
+from app.core.config import settings
+from app.events.outbox import relay_outbox
+from app.workers.base import BaseWorker
+from app.workers.session import worker_redis, worker_session
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelayWorker(BaseWorker):
+    """Publish the events staged in the transactional outbox."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.interval_seconds = settings.EVENTS_OUTBOX_POLL_SECONDS
+        self.batch_size = settings.EVENTS_OUTBOX_BATCH_SIZE
+
+    async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
+        """No subscriptions: the relay is time-driven."""
+
+    async def on_interval(self) -> None:
+        relayed = 0
+        async with worker_session() as session:
+            while True:
+                count = await relay_outbox(session, worker_redis(), limit=self.batch_size)
+                relayed += count
+                if count < self.batch_size:
+                    break
+        if relayed:
+            logger.debug("[OutboxRelayWorker] Relayed %d event(s)", relayed)
@@ -0,0 +1,50 @@
+"""Score ledger worker.
+
+Score writes keep team totals current by appending deltas to the score ledger
+(``app.services.score_ledger_service``) instead of re-summing every result. This
+worker is the safety net for that: every ``SCORE_RECONCILE_INTERVAL_SECONDS`` it
+checks each team of the current event against a full recompute from the results
+and awards tables, appends corrections for any drift (a write that bypassed the
+ledger, a crash between two commits) and publishes ``team.scores_updated`` for
+the teams it fixed. It subscribes to nothing; ``on_interval`` does all the work.
+"""
+
+import logging
+from typing import Any
+
+from app.core.config import settings
+from app.core.metrics import record_score_ledger_corrections
+from app.services.scoring_service import ScoringService
+from app.workers.base import BaseWorker
+from app.workers.session import worker_session
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreLedgerWorker(BaseWorker):
+    """Periodically reconcile the score ledger against a full recompute."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.interval_seconds = settings.SCORE_RECONCILE_INTERVAL_SECONDS
+
+    async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
+        """No subscriptions: reconciliation is time-driven."""
+
+    async def on_interval(self) -> None:
+        async with worker_session() as session:
+            service = ScoringService(session)
+            report = await service.reconcile_score_ledger()
+            if not report.drifted:
+                # Nothing to write; release the team row locks.
+                await session.rollback()
+                return
+            logger.warning(
+                "[ScoreLedgerWorker] Ledger drift for teams %s, appended %d correction(s)",
+                report.drifted,
+                report.corrections,
+            )
+            record_score_ledger_corrections(report.corrections)
+            await service._commit_and_publish_team_scores(
+                {team_id: report.totals[team_id] for team_id in report.drifted}
+            )
@@ -4,18 +4,26 @@ When ``RECOMPUTE_OFF_PATH`` is enabled, write routes persist the raw activity
 result and return immediately, leaving the expensive recompute to this worker.
 It listens for activity-result changes and, off the request path, rescores the
 affected activity (time-based rank shifts) and refreshes the affected team's
-totals — which in turn publishes ``team.score_updated`` so the leaderboard
-worker rebuilds the cached standings.
+totals — which in turn publishes ``team.scores_updated`` / ``team.score_updated``
+so the leaderboard worker refreshes the cached standings.
+
+Events are coalesced per activity: a burst of evaluations for one activity is
+rescored once, and every team named along the way has its totals refreshed in
+one batch — a single commit and a single ``team.scores_updated`` event.
 
 The recompute primitives it calls (``_recalculate_all_results_for_activity``,
-``update_team_scores``) are not gated by the off-path flag, so the worker always
-does the full work regardless of the flag's value.
+``update_all_team_scores``) are not gated by the off-path flag, so the worker
+always does the full work regardless of the flag's value.
 """
 
 import logging
+from collections.abc import Hashable
 from typing import Any
 
+from sqlalchemy import select
+
 from app.events import Channels
+from app.models.team import Team
 from app.services.scoring_service import ScoringService
 from app.workers.base import BaseWorker
 from app.workers.session import worker_session
@@ -30,26 +38,48 @@ class ScoringWorker(BaseWorker):
     # drives a recompute.
     patterns = [Channels.ALL_ACTIVITY_RESULT_EVENTS]
 
+    def coalesce_key(self, channel: str, data: dict[str, Any]) -> Hashable | None:
+        return (data.get("payload") or {}).get("activity_id")
+
+    def merge_events(self, pending: dict[str, Any], incoming: dict[str, Any]) -> dict[str, Any]:
+        # One rescore covers the activity, but every team touched by the burst
+        # still needs its totals refreshed.
+        payload = dict(incoming.get("payload") or {})
+        payload["team_ids"] = sorted(set(_team_ids(pending)) | set(_team_ids(incoming)))
+        return {**incoming, "payload": payload}
+
     async def handle_event(self, channel: str, data: dict[str, Any]) -> None:
         payload = data.get("payload") or {}
         activity_id = payload.get("activity_id")
-        team_id = payload.get("team_id")
-        if activity_id is None or team_id is None:
+        team_ids = _team_ids(data)
+        if activity_id is None or not team_ids:
             logger.warning("[ScoringWorker] Missing ids in %s payload: %s", channel, payload)
             return
 
         logger.info(
-            "[ScoringWorker] Recomputing activity %s / team %s after %s",
+            "[ScoringWorker] Recomputing activity %s / teams %s after %s",
             activity_id,
-            team_id,
+            team_ids,
             channel,
         )
         async with worker_session() as session:
             service = ScoringService(session)
             # Time-based activities couple every team's score through ranking, so
             # rescore the whole activity (no-op for other activity types).
-            await service._recalculate_all_results_for_activity(activity_id)
-            # Always refresh the directly-affected team: covers non-time-based
-            # activities and deletions, where the team may no longer appear in
-            # the activity's result set above.
-            await service.update_team_scores(team_id)
+            totals = await service._recalculate_all_results_for_activity(activity_id, commit=False)
+            # Always refresh the directly-affected teams: covers non-time-based
+            # activities and deletions, where a team may no longer appear in
+            # the activity's result set above. Deleted teams simply don't load.
+            teams = list((await session.scalars(select(Team).where(Team.id.in_(team_ids)))).all())
+            totals.update(await service.update_all_team_scores(teams))
+            if totals:
+                await service._commit_and_publish_team_scores(totals)
+
+
+def _team_ids(data: dict[str, Any]) -> list[int]:
+    """Teams an event (or a merged burst of them) touched."""
+    payload = data.get("payload") or {}
+    if "team_ids" in payload:
+        return list(payload["team_ids"])
+    team_id = payload.get("team_id")
+    return [] if team_id is None else [team_id]
@@ -10,13 +10,14 @@ const RALLY_EVENT_NAMES = [
   "rally.activity_result.updated",
   "rally.activity_result.deleted",
   "rally.team.score_updated",
+  "rally.team.scores_updated",
   "rally.team.checkpoint_advanced",
 ] as const;
 
 /**
  * Subscribe to the raw rally events SSE stream (activity_result/team changes).
  *
- * Unlike useScoreboardStream (which only signals "leaderboard changed"), this
+ * Unlike useScoreboardStream (which only carries leaderboard deltas), this
  * forwards every activity_result/team event so staff-evaluation, admin, and
  * team-progress views can invalidate their queries as soon as an evaluation
  * is submitted anywhere, instead of waiting on a manual refresh or a slow poll.
@@ -1,6 +1,13 @@
 import { useEffect } from "react";
 import { useQueryClient } from "@tanstack/react-query";
 import config from "@/config";
+import {
+  applyRankingDelta,
+  applyRankingSnapshot,
+  type RankedTeam,
+  type RankingDelta,
+  type RankingSnapshot,
+} from "@/lib/scoreboardDelta";
 
 const STREAM_URL = "/api/rally/v1/scoreboard/stream";
 
@@ -8,12 +15,19 @@ const STREAM_URL = "/api/rally/v1/scoreboard/stream";
  * Subscribe to the live scoreboard SSE stream.
  *
  * When the realtime subsystem is enabled, opens a Server-Sent Events
- * connection and invalidates the cached queries on every "refresh" push so the
- * leaderboard updates without polling. A no-op when EVENTS_ENABLED is off, and
- * it closes the connection on error (the endpoint returns 503 when the backend
- * subsystem is disabled) to avoid a reconnect loop.
+ * connection and patches the cached team listings in place: a "refresh" push
+ * (a leaderboard delta) updates the changed teams' total and classification
+ * and drops the removed ones, a "snapshot" (sent instead of the missed deltas
+ * when a reconnect is too far behind) replaces the ranking. A listing that
+ * cannot be patched (a team it does not hold yet) is refetched instead.
  *
- * @param queryKeys - React Query keys to invalidate on each refresh.
+ * A dropped connection is left to the browser, which reconnects with
+ * Last-Event-ID so the server replays what was missed. The connection is only
+ * closed once the browser gives up on it, which is what a non-stream response
+ * such as the 503 sent when the backend subsystem is disabled does. A no-op
+ * when EVENTS_ENABLED is off.
+ *
+ * @param queryKeys - React Query keys holding team listings to keep current.
  */
 export default function useScoreboardStream(
   queryKeys: readonly (readonly unknown[])[] = [["teams"]],
@@ -27,17 +41,41 @@ export default function useScoreboardStream(
 
     const source = new EventSource(STREAM_URL);
 
-    const handleRefresh = () => {
+    const patchListings = (apply: (teams: RankedTeam[]) => RankedTeam[] | null) => {
       for (const queryKey of queryKeys) {
-        void queryClient.invalidateQueries({ queryKey: [...queryKey] });
+        const teams = queryClient.getQueryData<RankedTeam[]>([...queryKey]);
+        // Nothing cached yet: the listing's own fetch brings the current ranking.
+        if (!Array.isArray(teams)) continue;
+        const patched = apply(teams);
+        if (patched === null) {
+          void queryClient.invalidateQueries({ queryKey: [...queryKey] });
+        } else {
+          queryClient.setQueryData([...queryKey], patched);
+        }
       }
     };
 
+    const handleRefresh = (event: MessageEvent<string>) => {
+      const delta = JSON.parse(event.data) as RankingDelta;
+      patchListings((teams) => applyRankingDelta(teams, delta));
+    };
+
+    const handleSnapshot = (event: MessageEvent<string>) => {
+      const snapshot = JSON.parse(event.data) as RankingSnapshot;
+      patchListings((teams) => applyRankingSnapshot(teams, snapshot));
+    };
+
     source.addEventListener("refresh", handleRefresh);
-    source.onerror = () => source.close();
+    source.addEventListener("snapshot", handleSnapshot);
+    source.onerror = () => {
+      // CONNECTING means the browser is already retrying; CLOSED means it
+      // will not (e.g. a 503), so release the connection for good.
+      if (source.readyState === EventSource.CLOSED) source.close();
+    };
 
     return () => {
       source.removeEventListener("refresh", handleRefresh);
+      source.removeEventListener("snapshot", handleSnapshot);
       source.close();
     };
     // queryKeys is intentionally not in deps: callers pass an inline literal
@@ -0,0 +1,88 @@
+import { describe, it, expect } from "vitest";
+import { applyRankingDelta, applyRankingSnapshot } from "./scoreboardDelta";
+
+const teams = [
+  { id: 1, name: "Alfa", total: 30, classification: 1, num_members: 4 },
+  { id: 2, name: "Bravo", total: 20, classification: 2, num_members: 5 },
+  { id: 3, name: "Charlie", total: 10, classification: 3, num_members: 3 },
+];
+
+describe("applyRankingDelta", () => {
+  it("updates the changed teams and keeps their other fields", () => {
+    const patched = applyRankingDelta(teams, {
+      version: 7,
+      changed: [
+        { team_id: 3, team_name: "Charlie", total_score: 40, rank: 1 },
+        { team_id: 1, team_name: "Alfa", total_score: 30, rank: 2 },
+        { team_id: 2, team_name: "Bravo", total_score: 20, rank: 3 },
+      ],
+      removed: [],
+    });
+    expect(patched?.find((t) => t.id === 3)).toEqual({
+      id: 3,
+      name: "Charlie",
+      total: 40,
+      classification: 1,
+      num_members: 3,
+    });
+    expect(patched?.map((t) => [t.id, t.classification])).toEqual([
+      [1, 2],
+      [2, 3],
+      [3, 1],
+    ]);
+  });
+
+  it("drops the removed teams", () => {
+    const patched = applyRankingDelta(teams, {
+      version: 8,
+      changed: [{ team_id: 3, team_name: "Charlie", total_score: 10, rank: 2 }],
+      removed: [2],
+    });
+    expect(patched?.map((t) => t.id)).toEqual([1, 3]);
+  });
+
+  it("does not mutate the cached teams", () => {
+    applyRankingDelta(teams, {
+      version: 9,
+      changed: [{ team_id: 1, team_name: "Alfa", total_score: 99, rank: 1 }],
+      removed: [3],
+    });
+    expect(teams[0].total).toBe(30);
+    expect(teams).toHaveLength(3);
+  });
+
+  it("returns null for a team the cache does not hold", () => {
+    expect(
+      applyRankingDelta(teams, {
+        version: 10,
+        changed: [{ team_id: 4, team_name: "Delta", total_score: 5, rank: 4 }],
+        removed: [],
+      }),
+    ).toBeNull();
+  });
+});
+
+describe("applyRankingSnapshot", () => {
+  it("keeps exactly the ranked teams", () => {
+    const replaced = applyRankingSnapshot(teams, {
+      version: 12,
+      ranking: [
+        { team_id: 2, team_name: "Bravo", total_score: 50, rank: 1 },
+        { team_id: 1, team_name: "Alfa", total_score: 30, rank: 2 },
+      ],
+    });
+    expect(replaced).toEqual([
+      { id: 2, name: "Bravo", total: 50, classification: 1, num_members: 5 },
+      { id: 1, name: "Alfa", total: 30, classification: 2, num_members: 4 },
+    ]);
+  });
+
+  it("returns null for a team the cache does not hold", () => {
+    expect(
+      applyRankingSnapshot(teams, {
+        version: 13,
+        ranking: [{ team_id: 9, team_name: "India", total_score: 1, rank: 1 }],
+      }),
+    ).toBeNull();
+  });
+});
@@ -0,0 +1,84 @@
+// Applies the live scoreboard stream (api-rally /scoreboard/stream) to a
+// cached team listing, so a leaderboard change patches the ["teams"] cache
+// instead of refetching the whole listing.
+
+/** A ranking row as the stream sends it (leaderboard_cache's entries). */
+export interface RankingRow {
+  team_id: number;
+  team_name: string;
+  total_score: number;
+  rank: number;
+}
+
+/** A "refresh" frame: the rows that changed and the teams that left the board. */
+export interface RankingDelta {
+  version: number;
+  changed: RankingRow[];
+  removed: number[];
+}
+
+/** A "snapshot" frame: the whole board, sent when a reconnect is too far behind. */
+export interface RankingSnapshot {
+  version: number;
+  ranking: RankingRow[];
+}
+
+/** The part of a listed team the ranking decides. */
+export interface RankedTeam {
+  id: number;
+  name: string;
+  total: number;
+  classification: number;
+}
+
+function withRow<T extends RankedTeam>(team: T, row: RankingRow): T {
+  return {
+    ...team,
+    name: row.team_name,
+    total: Math.round(row.total_score),
+    classification: row.rank,
+  };
+}
+
+/**
+ * The cached teams with a delta applied: changed rows update their team's
+ * total and classification, removed ids are dropped.
+ *
+ * Returns null when a changed row is a team the cache does not hold (the
+ * listing carries more than the ranking does, so it has to be refetched).
+ */
+export function applyRankingDelta<T extends RankedTeam>(
+  teams: readonly T[],
+  delta: RankingDelta,
+): T[] | null {
+  const byId = new Map(teams.map((team) => [team.id, team]));
+  for (const row of delta.changed) {
+    const team = byId.get(row.team_id);
+    if (team === undefined) return null;
+    byId.set(row.team_id, withRow(team, row));
+  }
+  for (const teamId of delta.removed) {
+    byId.delete(teamId);
+  }
+  return [...byId.values()];
+}
+
+/**
+ * The cached teams replaced by a snapshot: exactly the ranked teams, with
+ * their snapshot total and classification.
+ *
+ * Returns null when the snapshot ranks a team the cache does not hold.
+ */
+export function applyRankingSnapshot<T extends RankedTeam>(
+  teams: readonly T[],
+  snapshot: RankingSnapshot,
+): T[] | null {
+  const byId = new Map(teams.map((team) => [team.id, team]));
+  const replaced: T[] = [];
+  for (const row of snapshot.ranking) {
+    const team = byId.get(row.team_id);
+    if (team === undefined) return null;
+    replaced.push(withRow(team, row));
+  }
+  return replaced;
+}